@@ -27,6 +27,11 @@ SANDBOX_PIDS_LIMIT = 100    # Prevent fork bombs
 SANDBOX_USER_UID = "1000:1000"  # Non-root user for Docker
 SANDBOX_CPU_LIMIT = "1"
 SANDBOX_IMAGE_DIGEST = "sha256:f2c125a3328cd4dc8bbe2afee07e7870028e34fed6440f9c3d6ffaea2f8898477" # Canonical PROD digest
+SANDBOX_BACKEND = "docker"  # docker | docker_pool | local_namespace
+SANDBOX_WARM_POOL_SIZE = 4  # Paused containers kept by the docker_pool backend
+SANDBOX_WARM_POOL_WORKSPACE_DIR = "/var/lib/coo-sandbox/workspace"  # Slot dirs (RO mounts)
+SANDBOX_WARM_POOL_OUTPUT_DIR = "/var/lib/coo-sandbox/output"  # Slot dirs (RW mounts), distinct FS
+SANDBOX_LOCAL_TMPFS_SIZE = "64m"  # Private /dev/shm scratch for the local_namespace backend
 MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB limit
 MANIFEST_PATH_REGEX = r"^[A-Za-z0-9._ -]+(/[A-Za-z0-9._ -]+)*$"
 CHECKSUM_FORMAT_REGEX = r"^sha256:[0-9a-f]{64}$"
@@ -0,0 +1,227 @@
+"""
+Trigger-maintained per-mission counters for backpressure (Spec §10.5).
+
+mission_counters holds, per mission, the task count and the pending task and
+pending message counts. SQLite triggers on mission_tasks and messages keep it
+exact inside the writer's own transaction, so readers get the counts with a
+single primary-key lookup instead of COUNT(*) scans.
+
+The messages table belongs to the COO core schema, not schema.sql, so its
+triggers are installed whenever it is present; installing any missing trigger
+recomputes every counter from the base tables.
+"""
+import sqlite3
+
+_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS mission_counters (
+    mission_id TEXT PRIMARY KEY,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    pending_tasks INTEGER NOT NULL DEFAULT 0,
+    pending_messages INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+_IS_PENDING_TASK = "({row}.status IN ('pending', 'repair_retry'))"
+_IS_PENDING_MESSAGE = "({row}.status = 'pending')"
+
+_TASK_TRIGGERS = {
+    'mission_counters_task_insert': f"""
+CREATE TRIGGER IF NOT EXISTS mission_counters_task_insert
+AFTER INSERT ON mission_tasks
+BEGIN
+    INSERT OR IGNORE INTO mission_counters (mission_id) VALUES (NEW.mission_id);
+    UPDATE mission_counters
+    SET task_count = task_count + 1,
+        pending_tasks = pending_tasks + {_IS_PENDING_TASK.format(row='NEW')}
+    WHERE mission_id = NEW.mission_id;
+END
+""",
+    'mission_counters_task_delete': f"""
+CREATE TRIGGER IF NOT EXISTS mission_counters_task_delete
+AFTER DELETE ON mission_tasks
+BEGIN
+    UPDATE mission_counters
+    SET task_count = task_count - 1,
+        pending_tasks = pending_tasks - {_IS_PENDING_TASK.format(row='OLD')}
+    WHERE mission_id = OLD.mission_id;
+END
+""",
+    'mission_counters_task_update': f"""
+CREATE TRIGGER IF NOT EXISTS mission_counters_task_update
+AFTER UPDATE OF status, mission_id ON mission_tasks
+WHEN OLD.status IS NOT NEW.status OR OLD.mission_id IS NOT NEW.mission_id
+BEGIN
+    UPDATE mission_counters
+    SET task_count = task_count - 1,
+        pending_tasks = pending_tasks - {_IS_PENDING_TASK.format(row='OLD')}
+    WHERE mission_id = OLD.mission_id;
+    INSERT OR IGNORE INTO mission_counters (mission_id) VALUES (NEW.mission_id);
+    UPDATE mission_counters
+    SET task_count = task_count + 1,
+        pending_tasks = pending_tasks + {_IS_PENDING_TASK.format(row='NEW')}
+    WHERE mission_id = NEW.mission_id;
+END
+""",
+}
+
+_MESSAGE_TRIGGERS = {
+    'mission_counters_message_insert': f"""
+CREATE TRIGGER IF NOT EXISTS mission_counters_message_insert
+AFTER INSERT ON messages
+WHEN {_IS_PENDING_MESSAGE.format(row='NEW')}
+BEGIN
+    INSERT OR IGNORE INTO mission_counters (mission_id) VALUES (NEW.mission_id);
+    UPDATE mission_counters SET pending_messages = pending_messages + 1
+    WHERE mission_id = NEW.mission_id;
+END
+""",
+    'mission_counters_message_delete': f"""
+CREATE TRIGGER IF NOT EXISTS mission_counters_message_delete
+AFTER DELETE ON messages
+WHEN {_IS_PENDING_MESSAGE.format(row='OLD')}
+BEGIN
+    UPDATE mission_counters SET pending_messages = pending_messages - 1
+    WHERE mission_id = OLD.mission_id;
+END
+""",
+    'mission_counters_message_update': f"""
+CREATE TRIGGER IF NOT EXISTS mission_counters_message_update
+AFTER UPDATE OF status, mission_id ON messages
+WHEN {_IS_PENDING_MESSAGE.format(row='OLD')} OR {_IS_PENDING_MESSAGE.format(row='NEW')}
+BEGIN
+    UPDATE mission_counters
+    SET pending_messages = pending_messages - {_IS_PENDING_MESSAGE.format(row='OLD')}
+    WHERE mission_id = OLD.mission_id;
+    INSERT OR IGNORE INTO mission_counters (mission_id) VALUES (NEW.mission_id);
+    UPDATE mission_counters
+    SET pending_messages = pending_messages + {_IS_PENDING_MESSAGE.format(row='NEW')}
+    WHERE mission_id = NEW.mission_id;
+END
+""",
+}
+
+_COUNTER_COLUMNS = ('task_count', 'pending_tasks', 'pending_messages')
+
+
+def _schema_names(conn: sqlite3.Connection) -> set[str]:
+    names = ['mission_counters', 'messages', *_TASK_TRIGGERS, *_MESSAGE_TRIGGERS]
+    placeholders = ', '.join('?' for _ in names)
+    cur = conn.execute(
+        f"SELECT name FROM sqlite_master WHERE name IN ({placeholders})", names
+    )
+    return {row[0] for row in cur.fetchall()}
+
+
+def ensure_mission_counters(conn: sqlite3.Connection) -> bool:
+    """
+    Migration: installs mission_counters and its triggers where missing.
+
+    Cheap when everything is already installed (one sqlite_master lookup).
+    Returns True if anything was installed, in which case every counter
+    was recomputed from the base tables. The install runs in a savepoint, so
+    it never commits a caller's open transaction: inside one it becomes part
+    of it, otherwise releasing the savepoint commits it.
+    """
+    present = _schema_names(conn)
+    wanted = {'mission_counters', *_TASK_TRIGGERS}
+    if 'messages' in present:
+        wanted.update(_MESSAGE_TRIGGERS)
+    if wanted <= present:
+        return False
+
+    conn.execute("SAVEPOINT mission_counters_install")
+    try:
+        conn.execute(_TABLE_DDL)
+        for ddl in _TASK_TRIGGERS.values():
+            conn.execute(ddl)
+        if 'messages' in present:
+            for ddl in _MESSAGE_TRIGGERS.values():
+                conn.execute(ddl)
+        rebuild_mission_counters(conn, commit=False)
+    except BaseException:
+        conn.execute("ROLLBACK TO mission_counters_install")
+        conn.execute("RELEASE mission_counters_install")
+        raise
+    conn.execute("RELEASE mission_counters_install")
+    return True
+
+
+def _recompute_sql(has_messages: bool) -> str:
+    messages = (
+        "SELECT mission_id, 0, 0, COUNT(*) FROM messages "
+        "WHERE status = 'pending' GROUP BY mission_id"
+        if has_messages else
+        "SELECT NULL, 0, 0, 0 WHERE 0"
+    )
+    return f"""
+        SELECT mission_id, SUM(t), SUM(p), SUM(m) FROM (
+            SELECT mission_id AS mission_id, COUNT(*) AS t,
+                   SUM(status IN ('pending', 'repair_retry')) AS p, 0 AS m
+            FROM mission_tasks GROUP BY mission_id
+            UNION ALL
+            {messages}
+        ) GROUP BY mission_id
+    """
+
+
+def _has_messages(conn: sqlite3.Connection) -> bool:
+    cur = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages'")
+    return cur.fetchone() is not None
+
+
+def recompute_mission_counters(conn: sqlite3.Connection) -> dict[str, tuple[int, int, int]]:
+    """Counts from the base tables: mission_id -> (task_count, pending_tasks, pending_messages)."""
+    cur = conn.execute(_recompute_sql(_has_messages(conn)))
+    return {row[0]: (int(row[1]), int(row[2]), int(row[3])) for row in cur.fetchall()}
+
+
+def rebuild_mission_counters(conn: sqlite3.Connection, commit: bool = True) -> None:
+    """Replaces every counter row with freshly recomputed values."""
+    conn.execute("DELETE FROM mission_counters")
+    conn.executemany(
+        "INSERT INTO mission_counters (mission_id, task_count, pending_tasks, pending_messages) "
+        "VALUES (?, ?, ?, ?)",
+        [(mid, *counts) for mid, counts in recompute_mission_counters(conn).items()],
+    )
+    if commit:
+        conn.commit()
+
+
+def check_mission_counters(conn: sqlite3.Connection, repair: bool = False) -> list[dict]:
+    """
+    Consistency checker: compares mission_counters with recomputed counts.
+
+    Returns one entry per drifted mission ({mission_id, column: (stored,
+    actual)}); an empty list means the counters are exact. With repair=True
+    drifted counters are rebuilt.
+    """
+    expected = recompute_mission_counters(conn)
+    cur = conn.execute(
+        "SELECT mission_id, task_count, pending_tasks, pending_messages FROM mission_counters"
+    )
+    stored = {row[0]: tuple(row[1:]) for row in cur.fetchall()}
+
+    drift = []
+    for mission_id in sorted(set(expected) | set(stored)):
+        have = stored.get(mission_id, (0, 0, 0))
+        want = expected.get(mission_id, (0, 0, 0))
+        if have != want:
+            entry = {'mission_id': mission_id}
+            for column, h, w in zip(_COUNTER_COLUMNS, have, want, strict=True):
+                if h != w:
+                    entry[column] = (h, w)
+            drift.append(entry)
+    if drift and repair:
+        rebuild_mission_counters(conn)
+    return drift
+
+
+def read_mission_counters(conn: sqlite3.Connection, mission_id: str) -> tuple[int, int, int]:
+    """(task_count, pending_tasks, pending_messages) for one mission; zeros if none recorded."""
+    cur = conn.execute(
+        "SELECT task_count, pending_tasks, pending_messages FROM mission_counters "
+        "WHERE mission_id = ?",
+        (mission_id,),
+    )
+    row = cur.fetchone()
+    return tuple(row) if row else (0, 0, 0)
@@ -1,5 +1,6 @@
 import sqlite3
 import os
+from project_builder.database.counters import ensure_mission_counters
 
 def apply_schema(conn: sqlite3.Connection) -> None:
     """
@@ -11,6 +12,26 @@ def apply_schema(conn: sqlite3.Connection) -> None:
     
     conn.executescript(schema_sql)
     conn.commit()
+    _add_timeline_seq_columns(conn)
+    ensure_mission_counters(conn)
+
+def _add_timeline_seq_columns(conn: sqlite3.Connection) -> None:
+    """
+    Migration: persisted timeline counters for databases created before
+    timeline_seq existed. Seeded from the events already recorded so new
+    event ids continue the sequence.
+    """
+    for table, seed in (
+        ('mission_tasks', "SELECT COUNT(*) FROM timeline_events WHERE task_id = mission_tasks.id"),
+        ('missions', "SELECT COUNT(*) FROM timeline_events"
+                     " WHERE mission_id = missions.id AND task_id IS NULL"),
+    ):
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if 'timeline_seq' in columns:
+            continue
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN timeline_seq INTEGER NOT NULL DEFAULT 0")
+        conn.execute(f"UPDATE {table} SET timeline_seq = ({seed})")
+    conn.commit()
 
 def init_db(db_path: str) -> None:
     """
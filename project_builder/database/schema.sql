@@ -29,7 +29,9 @@ CREATE TABLE IF NOT EXISTS missions (
 
     -- v1.1 additions
     repair_budget_usd REAL NOT NULL DEFAULT 0.0,   -- CAP for repair spend
-    plan_revision_count INTEGER NOT NULL DEFAULT 0 -- CEO/Planner revision attempts
+    plan_revision_count INTEGER NOT NULL DEFAULT 0, -- CEO/Planner revision attempts
+
+    timeline_seq INTEGER NOT NULL DEFAULT 0 -- next timeline event counter for task-less events
 );
 
 CREATE INDEX IF NOT EXISTS idx_missions_status ON missions(status);
@@ -65,6 +67,8 @@ CREATE TABLE IF NOT EXISTS mission_tasks (
     locked_at DATETIME,
     locked_by TEXT,
 
+    timeline_seq INTEGER NOT NULL DEFAULT 0, -- next timeline event counter for this task
+
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME,
     completed_at DATETIME
@@ -76,6 +80,10 @@ CREATE UNIQUE INDEX IF NOT EXISTS idx_mission_tasks_mission_order
 CREATE INDEX IF NOT EXISTS idx_mission_tasks_status
     ON mission_tasks(mission_id, status, task_order);
 
+-- Stale-lock reclaim sweep
+CREATE INDEX IF NOT EXISTS idx_mission_tasks_locked
+    ON mission_tasks(status, locked_at);
+
 -- Table: artifacts
 CREATE TABLE IF NOT EXISTS artifacts (
     id TEXT PRIMARY KEY,
@@ -127,3 +135,27 @@ CREATE INDEX IF NOT EXISTS idx_timeline_mission
 
 CREATE INDEX IF NOT EXISTS idx_timeline_task
   ON timeline_events(task_id, created_at);
+
+-- Table: budget_leases
+-- Escrowed budget slices (orchestrator/budget_txn.py). An active lease's
+-- reserved_usd counts against max_cost_usd (and, for repair leases, the task's
+-- repair budget) until it is settled with its actual spend or reclaimed.
+CREATE TABLE IF NOT EXISTS budget_leases (
+    id TEXT PRIMARY KEY,
+    mission_id TEXT NOT NULL REFERENCES missions(id),
+    task_id TEXT REFERENCES mission_tasks(id),
+    holder TEXT NOT NULL,                 -- worker PID, same convention as mission_tasks.locked_by
+    is_repair INTEGER NOT NULL DEFAULT 0, -- 0=false, 1=true
+    reserved_usd REAL NOT NULL,
+    used_usd REAL,                        -- set when settled/reclaimed
+    status TEXT NOT NULL DEFAULT 'active',
+    -- allowed: 'active','settled','reclaimed'
+    leased_at DATETIME NOT NULL,
+    settled_at DATETIME
+);
+
+CREATE INDEX IF NOT EXISTS idx_budget_leases_mission_active
+    ON budget_leases(mission_id, status);
+
+CREATE INDEX IF NOT EXISTS idx_budget_leases_task_active
+    ON budget_leases(task_id, status);
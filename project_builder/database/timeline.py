@@ -6,14 +6,14 @@ from datetime import datetime
 # Fixed namespace from Packet §4.3
 TIMELINE_NAMESPACE = uuid.UUID('00000000-0000-0000-0000-000000000001')
 
-# Per-task monotonic counter maintained in memory
-# Note: In a real distributed system this might need to be more robust,
-# but for this single-process agent, a global dict is a reasonable start,
-# or we rely on the caller to provide the counter.
-# The packet says "maintained in memory".
-_task_counters: dict[str, int] = {}
-
-def _get_next_counter(task_id: str) -> int:
+# Per-task monotonic counter. log_event draws it from the persisted
+# timeline_seq column (mission_tasks for task events, missions for task-less
+# events), incremented inside the caller's write transaction, so ids stay
+# unique across processes and restarts. The in-memory counters below are
+# only the fallback when no counter is passed (and the row is unknown).
+_task_counters: dict[str | None, int] = {}
+
+def _get_next_counter(task_id: str | None) -> int:
     count = _task_counters.get(task_id, 0)
     _task_counters[task_id] = count + 1
     return count
@@ -25,30 +25,75 @@ def reset_counters_for_testing() -> None:
     global _task_counters
     _task_counters = {}
 
-def generate_timeline_event_id(mission_id: str, task_id: str, event_type: str, created_at: datetime) -> str:
+def generate_timeline_event_id(mission_id: str, task_id: str | None, event_type: str,
+                               created_at: datetime, counter: int | None = None) -> str:
     """
     Generates a deterministic UUIDv5 for a timeline event.
+    `counter` is the event's per-task sequence number; when omitted the
+    process-local counter is used.
     """
     # Truncate created_at to milliseconds
     # ISO format with milliseconds: YYYY-MM-DDTHH:MM:SS.mmm
     created_at_str = created_at.isoformat(timespec='milliseconds')
     
-    counter = _get_next_counter(task_id)
+    if counter is None:
+        counter = _get_next_counter(task_id)
     
     name = f"{mission_id}:{task_id}:{event_type}:{created_at_str}:{counter}"
     return str(uuid.uuid5(TIMELINE_NAMESPACE, name))
 
-def log_event(conn: sqlite3.Connection, mission_id: str, task_id: str, event_type: str, metadata: dict, created_at: datetime) -> None:
+def next_timeline_sequence(
+    conn: sqlite3.Connection, mission_id: str, task_id: str | None
+) -> int | None:
+    """
+    Claims the next persisted counter for a task (or, for task-less events,
+    the mission). The UPDATE takes the write lock, so concurrent writers are
+    serialized until the caller commits. None if neither row exists.
+    """
+    for table, key in (('mission_tasks', task_id), ('missions', mission_id)):
+        if key is None:
+            continue
+        cur = conn.execute(
+            f"UPDATE {table} SET timeline_seq = timeline_seq + 1 WHERE id = ?", (key,)
+        )
+        if cur.rowcount == 1:
+            row = conn.execute(
+                f"SELECT timeline_seq - 1 FROM {table} WHERE id = ?", (key,)
+            ).fetchone()
+            return row[0]
+    return None
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO timeline_events (id, mission_id, task_id, event_type, event_json, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+def log_event(conn: sqlite3.Connection, mission_id: str, task_id: str | None, event_type: str,
+              metadata: dict, created_at: datetime) -> None:
     """
     Logs a timeline event to the database.
     """
-    event_id = generate_timeline_event_id(mission_id, task_id, event_type, created_at)
+    counter = next_timeline_sequence(conn, mission_id, task_id)
+    event_id = generate_timeline_event_id(mission_id, task_id, event_type, created_at, counter)
     event_json = json.dumps(metadata)
     
-    conn.execute("""
-        INSERT INTO timeline_events (id, mission_id, task_id, event_type, event_json, created_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (event_id, mission_id, task_id, event_type, event_json, created_at))
+    conn.execute(
+        _INSERT_EVENT_SQL, (event_id, mission_id, task_id, event_type, event_json, created_at)
+    )
+
+def log_events(conn: sqlite3.Connection,
+               events: list[tuple[str, str | None, str, dict, datetime, int]]) -> None:
+    """
+    Logs many timeline events with one executemany. Each event is
+    (mission_id, task_id, event_type, metadata, created_at, counter), where
+    counter was already claimed by the caller (e.g. by bumping timeline_seq
+    in the same statement that updates the task).
+    """
+    conn.executemany(_INSERT_EVENT_SQL, [
+        (generate_timeline_event_id(mid, tid, etype, created_at, counter), mid, tid, etype,
+         json.dumps(metadata), created_at)
+        for mid, tid, etype, metadata, created_at, counter in events
+    ])
 
 def log_task_repair_requested(conn: sqlite3.Connection, mission_id: str, task_id: str, reason: str, created_at: datetime) -> None:
     log_event(conn, mission_id, task_id, 'task_repair_requested', {'reason': reason}, created_at)
@@ -59,5 +104,5 @@ def log_repair_context_truncated(conn: sqlite3.Connection, mission_id: str, task
 def log_required_artifact_ids_limit_exceeded(conn: sqlite3.Connection, mission_id: str, task_id: str, count: int, created_at: datetime) -> None:
     log_event(conn, mission_id, task_id, 'required_artifact_ids_limit_exceeded', {'count': count, 'limit': 3}, created_at)
 
-def log_task_reclaim_skipped_alive_or_unknown(conn: sqlite3.Connection, mission_id: str, task_id: str, locked_by: str, created_at: datetime) -> None:
+def log_task_reclaim_skipped_alive_or_unknown(conn: sqlite3.Connection, mission_id: str, task_id: str | None, locked_by: str, created_at: datetime) -> None:
     log_event(conn, mission_id, task_id, 'task_reclaim_skipped_alive_or_unknown', {'locked_by': locked_by}, created_at)
@@ -1,4 +1,18 @@
+import os
 import sqlite3
+import uuid
+from datetime import datetime
+
+# Budget held by active escrow leases counts as committed spend: every guard
+# below compares spent + active reservations + new amount against the cap.
+_MISSION_RESERVED_SQL = """
+    (SELECT COALESCE(SUM(reserved_usd), 0) FROM budget_leases
+     WHERE mission_id = :mid AND status = 'active')
+"""
+_TASK_REPAIR_RESERVED_SQL = """
+    (SELECT COALESCE(SUM(reserved_usd), 0) FROM budget_leases
+     WHERE task_id = :tid AND is_repair = 1 AND status = 'active')
+"""
 
 def try_charge_budget(conn: sqlite3.Connection, mission_id: str, task_id: str | None, cost: float, is_repair_attempt: bool) -> bool:
     """
@@ -16,7 +30,7 @@ def try_charge_budget(conn: sqlite3.Connection, mission_id: str, task_id: str |
             UPDATE missions
             SET spent_cost_usd = spent_cost_usd + :cost
             WHERE id = :mid
-              AND spent_cost_usd + :cost <= max_cost_usd;
+              AND spent_cost_usd + :cost + """ + _MISSION_RESERVED_SQL + """ <= max_cost_usd;
             """,
             {"cost": cost, "mid": mission_id},
         )
@@ -30,7 +44,7 @@ def try_charge_budget(conn: sqlite3.Connection, mission_id: str, task_id: str |
                 UPDATE mission_tasks
                 SET repair_budget_spent_usd = repair_budget_spent_usd + :cost
                 WHERE id = :tid
-                  AND repair_budget_spent_usd + :cost <= (
+                  AND repair_budget_spent_usd + :cost + """ + _TASK_REPAIR_RESERVED_SQL + """ <= (
                       SELECT repair_budget_usd FROM missions WHERE id = :mid
                   );
                 """,
@@ -49,3 +63,202 @@ def try_charge_budget(conn: sqlite3.Connection, mission_id: str, task_id: str |
     except Exception:
         conn.rollback()
         raise
+
+
+class BudgetLease:
+    """
+    An escrowed budget slice reserved by one worker.
+
+    Charges against the lease are local (no database access) until the lease
+    is settled, so many small charges cost one write transaction per slice
+    instead of one each.
+    """
+
+    def __init__(self, lease_id: str, mission_id: str, task_id: str | None,
+                 is_repair: bool, reserved: float):
+        self.id = lease_id
+        self.mission_id = mission_id
+        self.task_id = task_id
+        self.is_repair = is_repair
+        self.reserved = reserved
+        self.used = 0.0
+
+    @property
+    def remaining(self) -> float:
+        return self.reserved - self.used
+
+    def try_charge(self, cost: float) -> bool:
+        """Charges `cost` locally; False if the slice cannot cover it."""
+        if self.used + cost > self.reserved:
+            return False
+        self.used += cost
+        return True
+
+
+def _reserve_in_txn(cur: sqlite3.Cursor, mission_id: str, task_id: str | None, amount: float,
+                    is_repair_attempt: bool, holder: str) -> BudgetLease | None:
+    params = {"mid": mission_id, "tid": task_id, "amount": amount}
+    cur.execute(
+        "SELECT spent_cost_usd + :amount + " + _MISSION_RESERVED_SQL + " <= max_cost_usd,"
+        " repair_budget_usd FROM missions WHERE id = :mid",
+        params,
+    )
+    row = cur.fetchone()
+    if not row or not row[0]:
+        return None
+    if is_repair_attempt and task_id:
+        cur.execute(
+            "SELECT repair_budget_spent_usd + :amount + " + _TASK_REPAIR_RESERVED_SQL
+            + " <= :cap FROM mission_tasks WHERE id = :tid",
+            {**params, "cap": row[1]},
+        )
+        task_row = cur.fetchone()
+        if not task_row or not task_row[0]:
+            return None
+
+    lease_id = str(uuid.uuid4())
+    is_repair = bool(is_repair_attempt and task_id)
+    cur.execute(
+        """
+        INSERT INTO budget_leases
+            (id, mission_id, task_id, holder, is_repair, reserved_usd, status, leased_at)
+        VALUES (?, ?, ?, ?, ?, ?, 'active', ?)
+        """,
+        (lease_id, mission_id, task_id, holder, int(is_repair), amount, datetime.utcnow()),
+    )
+    return BudgetLease(lease_id, mission_id, task_id, is_repair, amount)
+
+
+def _settle_in_txn(cur: sqlite3.Cursor, lease: BudgetLease, used: float, status: str) -> bool:
+    cur.execute(
+        """
+        UPDATE budget_leases
+        SET status = ?, used_usd = ?, settled_at = ?
+        WHERE id = ? AND status = 'active'
+        """,
+        (status, used, datetime.utcnow(), lease.id),
+    )
+    if cur.rowcount != 1:
+        return False  # already settled or reclaimed
+    cur.execute(
+        "UPDATE missions SET spent_cost_usd = spent_cost_usd + ? WHERE id = ?",
+        (used, lease.mission_id),
+    )
+    if lease.is_repair:
+        cur.execute(
+            "UPDATE mission_tasks SET repair_budget_spent_usd = repair_budget_spent_usd + ?"
+            " WHERE id = ?",
+            (used, lease.task_id),
+        )
+    return True
+
+
+def reserve_budget(conn: sqlite3.Connection, mission_id: str, task_id: str | None, amount: float,
+                   is_repair_attempt: bool, holder: str | None = None) -> BudgetLease | None:
+    """
+    Reserves an `amount` slice of the mission budget (and, if
+    is_repair_attempt, of the task repair budget) in one transaction.
+    Returns the lease, or None if the reservation would exceed a cap.
+    `holder` defaults to this process's PID (the reclaim liveness key).
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute("BEGIN IMMEDIATE;")
+        lease = _reserve_in_txn(cur, mission_id, task_id, amount, is_repair_attempt,
+                                holder or str(os.getpid()))
+        conn.commit()
+        return lease
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def settle_lease(conn: sqlite3.Connection, lease: BudgetLease) -> bool:
+    """
+    Charges the lease's actual spend and returns the remainder to the
+    budget. Returns False if the lease was already settled or reclaimed
+    (a reclaimed lease was charged in full).
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute("BEGIN IMMEDIATE;")
+        settled = _settle_in_txn(cur, lease, lease.used, 'settled')
+        conn.commit()
+        return settled
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def reclaim_lease_in_txn(cur: sqlite3.Cursor, lease_id: str) -> bool:
+    """
+    Reclaims an active lease inside the caller's write transaction. The
+    holder's local spend is unknown, so the whole reservation is charged:
+    this can only over-count, never exceed the cap.
+    """
+    cur.execute(
+        "SELECT mission_id, task_id, is_repair, reserved_usd FROM budget_leases"
+        " WHERE id = ? AND status = 'active'",
+        (lease_id,),
+    )
+    row = cur.fetchone()
+    if not row:
+        return False
+    mission_id, task_id, is_repair, reserved = row
+    lease = BudgetLease(lease_id, mission_id, task_id, bool(is_repair), reserved)
+    return _settle_in_txn(cur, lease, reserved, 'reclaimed')
+
+
+class BudgetEscrow:
+    """
+    Per-worker charging front end over budget leases.
+
+    charge() draws from the current lease locally; when the slice cannot
+    cover a charge, the lease is settled and a new slice reserved in the
+    same transaction. Call close() (or use as a context manager) on
+    completion to return the unused remainder.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, mission_id: str, task_id: str | None,
+                 is_repair_attempt: bool, slice_usd: float, holder: str | None = None):
+        self.conn = conn
+        self.mission_id = mission_id
+        self.task_id = task_id
+        self.is_repair_attempt = is_repair_attempt
+        self.slice_usd = slice_usd
+        self.holder = holder or str(os.getpid())
+        self.lease: BudgetLease | None = None
+
+    def charge(self, cost: float) -> bool:
+        """Charges `cost`; False if the budget cannot cover it (nothing charged)."""
+        if self.lease is not None and self.lease.try_charge(cost):
+            return True
+        cur = self.conn.cursor()
+        try:
+            cur.execute("BEGIN IMMEDIATE;")
+            if self.lease is not None:
+                _settle_in_txn(cur, self.lease, self.lease.used, 'settled')
+                self.lease = None
+            # Full slice if it fits, else just enough for this charge
+            for amount in dict.fromkeys((max(self.slice_usd, cost), cost)):
+                self.lease = _reserve_in_txn(cur, self.mission_id, self.task_id, amount,
+                                             self.is_repair_attempt, self.holder)
+                if self.lease is not None:
+                    break
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return self.lease is not None and self.lease.try_charge(cost)
+
+    def close(self) -> None:
+        """Settles the current lease, returning its unused remainder."""
+        if self.lease is not None:
+            settle_lease(self.conn, self.lease)
+            self.lease = None
+
+    def __enter__(self) -> "BudgetEscrow":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
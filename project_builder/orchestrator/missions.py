@@ -1,12 +1,14 @@
-import sqlite3
 """
 This module requires the COO core schema (messages table).
 Project Builder schema alone is insufficient.
 """
+import sqlite3
 from datetime import datetime
+
 from project_builder.config.settings import BASE_PENDING_LIMIT, MAX_PENDING_PER_TASK
 from project_builder.database.timeline import log_event
 
+
 def compute_backpressure_thresholds(task_count: int) -> tuple[int, int]:
     """Returns (max_pending, resume_threshold) based on Spec §10.5"""
     max_pending = max(BASE_PENDING_LIMIT, task_count * MAX_PENDING_PER_TASK)
@@ -19,40 +21,32 @@ def check_and_apply_backpressure(conn: sqlite3.Connection, mission_id: str) -> N
     Transitions mission to 'paused_error' if limit exceeded.
     Transitions mission back to 'executing' (or previous) if below resume threshold.
     """
+    # Counters are trigger-maintained (database/counters.py): one primary-key
+    # read instead of COUNT(*) scans over mission_tasks and messages. They are
+    # installed once at setup by apply_schema, or by ensure_mission_counters
+    # when the messages table is created afterwards.
     cur = conn.cursor()
-    
-    # 1. Get task count
-    cur.execute("SELECT COUNT(*) FROM mission_tasks WHERE mission_id = ?", (mission_id,))
-    task_count = cur.fetchone()[0]
-    
-    max_pending, resume_threshold = compute_backpressure_thresholds(task_count)
-    
-    # 2. Get pending count (tasks + messages)
-    # Pending tasks: status IN ('pending', 'repair_retry')
     cur.execute(
-        "SELECT COUNT(*) FROM mission_tasks WHERE mission_id = ? AND status IN ('pending', 'repair_retry')",
+        """
+        SELECT m.status, m.previous_status,
+               COALESCE(c.task_count, 0), COALESCE(c.pending_tasks, 0),
+               COALESCE(c.pending_messages, 0)
+        FROM missions m
+        LEFT JOIN mission_counters c ON c.mission_id = m.id
+        WHERE m.id = ?
+        """,
         (mission_id,)
     )
-    pending_tasks = cur.fetchone()[0]
-    
-    # Pending messages
-    cur.execute(
-        "SELECT COUNT(*) FROM messages WHERE mission_id = ? AND status = 'pending'",
-        (mission_id,)
-    )
-    pending_messages = cur.fetchone()[0]
-    
-    total_pending = pending_tasks + pending_messages
-    
-    # 3. Check Mission Status
-    cur.execute("SELECT status, previous_status FROM missions WHERE id = ?", (mission_id,))
     row = cur.fetchone()
     if not row:
         return
     
-    current_status, previous_status = row
+    current_status, previous_status, task_count, pending_tasks, pending_messages = row
+    max_pending, resume_threshold = compute_backpressure_thresholds(task_count)
+    # Pending = tasks in ('pending', 'repair_retry') + messages in 'pending'
+    total_pending = pending_tasks + pending_messages
     
-    # 4. Apply Logic
+    # Apply Logic
     if current_status not in ('paused_error', 'completed', 'failed'):
         # Check for PAUSE
         if total_pending > max_pending:
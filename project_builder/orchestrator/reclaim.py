@@ -2,14 +2,24 @@ import os
 import sqlite3
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from typing import Iterable
 from project_builder.config.settings import TASK_LOCK_TIMEOUT_SECONDS
-from project_builder.database.timeline import log_event, log_task_reclaim_skipped_alive_or_unknown
+from project_builder.database.timeline import (
+    log_event,
+    log_events,
+    log_task_reclaim_skipped_alive_or_unknown,
+)
+from project_builder.orchestrator.budget_txn import reclaim_lease_in_txn
 
 class WorkerRegistry(ABC):
     @abstractmethod
     def is_alive(self, pid: int) -> bool:
         pass
 
+    def filter_alive(self, pids: Iterable[int]) -> set[int]:
+        """Bulk liveness probe; returns the subset of `pids` that is alive."""
+        return {pid for pid in set(pids) if self.is_alive(pid)}
+
 class PosixWorkerRegistry(WorkerRegistry):
     def is_alive(self, pid: int) -> bool:
         try:
@@ -18,6 +28,15 @@ class PosixWorkerRegistry(WorkerRegistry):
         except OSError:
             return False
 
+    def filter_alive(self, pids: Iterable[int]) -> set[int]:
+        # One /proc listing instead of a kill(2) per PID where available. A
+        # PID listed there is alive even if signalling it would be refused.
+        try:
+            running = {int(name) for name in os.listdir('/proc') if name.isdigit()}
+        except OSError:
+            return super().filter_alive(pids)
+        return set(pids) & running
+
 class WindowsWorkerRegistry(WorkerRegistry):
     def is_alive(self, pid: int) -> bool:
         # Spec Patch 2: "If liveness cannot be established... reclaim MUST NOT proceed."
@@ -25,21 +44,26 @@ class WindowsWorkerRegistry(WorkerRegistry):
         # as a safety measure until a proper Windows implementation is added.
         return True 
 
-def attempt_reclaim_task(conn: sqlite3.Connection, task_id: str, worker_registry: WorkerRegistry) -> bool:
+def _is_reclaimable(conn: sqlite3.Connection, mission_id: str, task_id: str | None, locked_by,
+                    locked_at, worker_registry: WorkerRegistry) -> bool:
     """
-    Attempts to reclaim a stale-locked task.
-    Returns True if reclaim performed, False otherwise.
+    Stale-lock rule shared by tasks and budget leases: held for at least
+    TASK_LOCK_TIMEOUT_SECONDS by a worker known to be dead.
     """
-    cur = conn.cursor()
-    cur.execute("SELECT mission_id, locked_by, locked_at FROM mission_tasks WHERE id = ?", (task_id,))
-    row = cur.fetchone()
-    if not row:
+    if not _lock_expired(locked_at, datetime.utcnow()):
         return False
         
-    mission_id, locked_by, locked_at = row
-    if not locked_by or not locked_at:
-        return False
+    # Check liveness
+    pid = _holder_pid(locked_by)
+    is_alive = True if pid is None else worker_registry.is_alive(pid)
         
+    if is_alive:
+        log_task_reclaim_skipped_alive_or_unknown(conn, mission_id, task_id, str(locked_by), datetime.utcnow())
+        return False
+    
+    return True
+
+def _lock_expired(locked_at, now: datetime) -> bool:
     # Check timeout
     if isinstance(locked_at, str):
         try:
@@ -53,19 +77,35 @@ def attempt_reclaim_task(conn: sqlite3.Connection, task_id: str, worker_registry
     else:
         locked_at_dt = locked_at
         
-    if datetime.utcnow() - locked_at_dt < timedelta(seconds=TASK_LOCK_TIMEOUT_SECONDS):
-        return False # Not stale
-        
-    # Check liveness
+    return now - locked_at_dt >= timedelta(seconds=TASK_LOCK_TIMEOUT_SECONDS)
+
+def _holder_pid(locked_by) -> int | None:
+    """PID of a lock holder; None if locked_by is not an integer PID (unknown/invalid)."""
     try:
-        pid = int(locked_by)
-        is_alive = worker_registry.is_alive(pid)
+        return int(locked_by)
     except (ValueError, TypeError):
-        # locked_by is not an integer PID -> Unknown/Invalid
-        is_alive = True # Treat as alive/unknown
+        return None
+
+def attempt_reclaim_task(conn: sqlite3.Connection, task_id: str, worker_registry: WorkerRegistry) -> bool:
+    """
+    Attempts to reclaim a stale-locked task. Only executing tasks hold a
+    worker lock; a task in any other status is left alone.
+    Returns True if reclaim performed, False otherwise.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT mission_id, locked_by, locked_at, status FROM mission_tasks WHERE id = ?",
+        (task_id,),
+    )
+    row = cur.fetchone()
+    if not row:
+        return False
         
-    if is_alive:
-        log_task_reclaim_skipped_alive_or_unknown(conn, mission_id, task_id, str(locked_by), datetime.utcnow())
+    mission_id, locked_by, locked_at, status = row
+    if status != 'executing' or not locked_by or not locked_at:
+        return False
+        
+    if not _is_reclaimable(conn, mission_id, task_id, locked_by, locked_at, worker_registry):
         return False
         
     # Reclaim
@@ -76,8 +116,19 @@ def attempt_reclaim_task(conn: sqlite3.Connection, task_id: str, worker_registry
             SET status = 'pending',
                 locked_at = NULL,
                 locked_by = NULL
-            WHERE id = :tid
+            WHERE id = :tid AND status = 'executing'
         """, {"tid": task_id})
+        if cur.rowcount != 1:
+            conn.rollback()
+            return False
+        
+        # Budget leases the dead worker held for this task go with it
+        cur.execute(
+            "SELECT id FROM budget_leases WHERE task_id = ? AND holder = ? AND status = 'active'",
+            (task_id, str(locked_by)),
+        )
+        for (lease_id,) in cur.fetchall():
+            reclaim_lease_in_txn(cur, lease_id)
         
         log_event(conn, mission_id, task_id, 'task_reclaimed', {}, datetime.utcnow())
         conn.commit()
@@ -86,3 +137,105 @@ def attempt_reclaim_task(conn: sqlite3.Connection, task_id: str, worker_registry
     except Exception:
         conn.rollback()
         return False
+
+def attempt_reclaim_lease(conn: sqlite3.Connection, lease_id: str,
+                          worker_registry: WorkerRegistry) -> bool:
+    """
+    Attempts to reclaim a stale budget lease (holder dead, lease older than
+    the task lock timeout). The whole reservation is charged; see
+    budget_txn.reclaim_lease_in_txn. Returns True if reclaim performed.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT mission_id, task_id, holder, leased_at FROM budget_leases"
+        " WHERE id = ? AND status = 'active'",
+        (lease_id,),
+    )
+    row = cur.fetchone()
+    if not row:
+        return False
+    
+    mission_id, task_id, holder, leased_at = row
+    if not _is_reclaimable(conn, mission_id, task_id, holder, leased_at, worker_registry):
+        return False
+    
+    try:
+        cur.execute("BEGIN IMMEDIATE;")
+        reclaimed = reclaim_lease_in_txn(cur, lease_id)
+        if reclaimed:
+            log_event(conn, mission_id, task_id, 'budget_lease_reclaimed',
+                      {'lease_id': lease_id, 'holder': str(holder)}, datetime.utcnow())
+        conn.commit()
+        return reclaimed
+    except Exception:
+        conn.rollback()
+        return False
+
+def reclaim_stale_tasks(conn: sqlite3.Connection, worker_registry: WorkerRegistry,
+                        now: datetime | None = None) -> list[str]:
+    """
+    Sweep: reclaims every stale-locked task whose worker is dead, in one
+    transaction. Same rule as attempt_reclaim_task, applied in bulk:
+    expired locks are selected through idx_mission_tasks_locked, owner PIDs
+    are probed with one worker_registry.filter_alive() call, and the reclaimed
+    / skipped timeline events are inserted with one executemany.
+    Locks whose holder is not a PID (e.g. 'orchestrator') can never be
+    reclaimed, so the sweep skips them without logging an event every run.
+    Returns the reclaimed task ids.
+    """
+    now = now or datetime.utcnow()
+    # locked_at is compared as text; bound by the following day so every
+    # timestamp format sorts below it, then apply the exact rule per row.
+    upper = (now - timedelta(seconds=TASK_LOCK_TIMEOUT_SECONDS) + timedelta(days=1)).date()
+    cur = conn.cursor()
+    try:
+        cur.execute("BEGIN IMMEDIATE;")
+        cur.execute("""
+            SELECT id, mission_id, locked_by, locked_at, timeline_seq
+            FROM mission_tasks
+            WHERE status = 'executing' AND locked_at < :upper AND locked_by IS NOT NULL
+        """, {"upper": upper.isoformat()})
+        stale = [row for row in cur.fetchall() if _lock_expired(row[3], now)]
+        
+        pids = {row[0]: _holder_pid(row[2]) for row in stale}
+        alive = worker_registry.filter_alive(pid for pid in pids.values() if pid is not None)
+        dead = [row for row in stale if pids[row[0]] is not None and pids[row[0]] not in alive]
+        skipped = [row for row in stale if pids[row[0]] in alive]
+        
+        cur.executemany("""
+            UPDATE mission_tasks
+            SET status = 'pending',
+                locked_at = NULL,
+                locked_by = NULL,
+                timeline_seq = timeline_seq + 1
+            WHERE id = ?
+        """, [(row[0],) for row in dead])
+        cur.executemany(
+            "UPDATE mission_tasks SET timeline_seq = timeline_seq + 1 WHERE id = ?",
+            [(row[0],) for row in skipped],
+        )
+        
+        # Budget leases the dead workers held for these tasks go with them
+        owners = {(row[0], str(row[2])) for row in dead}
+        if owners:
+            cur.execute(
+                "SELECT id, task_id, holder FROM budget_leases"
+                " WHERE status = 'active' AND task_id IS NOT NULL"
+            )
+            for lease_id, task_id, holder in cur.fetchall():
+                if (task_id, holder) in owners:
+                    reclaim_lease_in_txn(cur, lease_id)
+        
+        # Counters are the timeline_seq values read before the bump above
+        log_events(conn, [
+            (row[1], row[0], 'task_reclaimed', {}, now, row[4]) for row in dead
+        ] + [
+            (row[1], row[0], 'task_reclaim_skipped_alive_or_unknown', {'locked_by': str(row[2])},
+             now, row[4])
+            for row in skipped
+        ])
+        conn.commit()
+        return [row[0] for row in dead]
+    except Exception:
+        conn.rollback()
+        raise
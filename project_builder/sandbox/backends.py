@@ -0,0 +1,406 @@
+"""
+Pluggable execution backends for run_sandbox.
+
+Every backend runs one entrypoint against a read-only workspace and a
+writable output directory, with no network and the SANDBOX_* resource
+limits. The security checks around an execution (governance, symlink guard,
+output scan, manifest verification) stay in the caller and see the same
+host paths whichever backend ran the task.
+
+- DockerRunBackend: one `docker run --rm` per execution (canonical default).
+- DockerWarmPoolBackend: N pre-started, paused containers; a task unpauses
+  one, copies its workspace into the slot's freshly emptied bind mounts,
+  `docker exec`s the entrypoint and pauses the container again.
+- LocalNamespaceBackend: user/mount/pid/net namespaces via util-linux
+  `unshare` plus rlimits (applied by `prlimit`), for hosts without Docker.
+
+get_backend() hands out one shared instance per backend name, so a warm
+pool is started once per process and closed at interpreter exit.
+
+The entrypoint finds its directories in $SANDBOX_WORKSPACE and
+$SANDBOX_OUTPUT (/workspace and /output inside containers).
+"""
+import atexit
+import os
+import queue
+import shutil
+import signal
+import subprocess
+import threading
+from pathlib import Path
+
+from project_builder.config import settings
+
+from . import SandboxError
+from .security import scan_for_symlinks
+from .workspace import verify_hardlink_defense
+
+_UNITS = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+
+
+def parse_memory_limit(limit: str) -> int:
+    """Docker-style memory limit ("512m", "1g") in bytes."""
+    limit = limit.strip().lower()
+    if limit and limit[-1] in _UNITS:
+        return int(float(limit[:-1]) * _UNITS[limit[-1]])
+    return int(limit)
+
+
+def _image_ref() -> str:
+    return f"coo-sandbox@{settings.SANDBOX_IMAGE_DIGEST}"
+
+
+def _container_limits() -> list[str]:
+    """docker run/create flags shared by the Docker backends."""
+    return [
+        "--network=none",
+        "--user", settings.SANDBOX_USER_UID,
+        "--cap-drop=ALL",
+        "--security-opt=no-new-privileges",
+        # Default seccomp profile is used (secure default)
+        "--pids-limit", str(settings.SANDBOX_PIDS_LIMIT),
+        "--memory", settings.SANDBOX_MEMORY_LIMIT,
+        "--memory-swap", settings.SANDBOX_MEMORY_SWAP,
+        "--cpus", settings.SANDBOX_CPU_LIMIT,
+        "-e", "SANDBOX_WORKSPACE=/workspace",
+        "-e", "SANDBOX_OUTPUT=/output",
+    ]
+
+
+class SandboxBackend:
+    """
+    Interface for sandbox executors.
+
+    run() blocks until the entrypoint exits and returns its exit code;
+    it raises subprocess.TimeoutExpired after killing the execution when
+    timeout_seconds elapses. kill() may be called from another thread
+    (the inotify guard) with the execution_id passed to run().
+    """
+    name = "abstract"
+
+    def run(self, workspace_root: Path, output_root: Path, entrypoint: str,
+            timeout_seconds: int, execution_id: str) -> int:
+        raise NotImplementedError
+
+    def kill(self, execution_id: str) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Releases any pre-warmed resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class DockerRunBackend(SandboxBackend):
+    """One throwaway container per execution."""
+    name = "docker"
+
+    def run(self, workspace_root, output_root, entrypoint, timeout_seconds, execution_id):
+        # Construct canonical Docker command using list (NO string interpolation of manifest fields)
+        cmd = [
+            "docker", "run", "--rm",
+            "--name", execution_id,
+            *_container_limits(),
+            "-v", f"{workspace_root.resolve()}:/workspace:ro",  # RO Workspace
+            "-v", f"{output_root.resolve()}:/output:rw",        # RW Output
+            "-w", "/workspace",                                 # Working Directory
+            _image_ref(),
+            # Entrypoint is passed as arg, not interpolated into shell string
+            "bash", "-c", entrypoint,
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout_seconds, check=False)
+        except subprocess.TimeoutExpired:
+            # Killing the client does not stop the container
+            self.kill(execution_id)
+            raise
+        return result.returncode
+
+    def kill(self, execution_id):
+        subprocess.run(["docker", "kill", execution_id], capture_output=True, check=False)
+
+
+def _empty_dir(path: Path) -> None:
+    for child in path.iterdir():
+        if child.is_dir() and not child.is_symlink():
+            shutil.rmtree(child)
+        else:
+            child.unlink()
+
+
+class DockerWarmPoolBackend(SandboxBackend):
+    """
+    Keeps `size` paused containers and execs tasks into them.
+
+    Docker cannot attach new bind mounts to a running container, so each
+    container is created with its own slot directories mounted at
+    /workspace (RO) and /output (RW). A task gets a slot whose directories
+    were emptied, receives a copy of its workspace, and has the slot's
+    output moved into output_root afterwards. Stray processes are killed
+    before the container is paused again; a container that timed out or
+    was killed by the guard is replaced rather than reused.
+
+    workspace_dir and output_dir must be on distinct filesystems
+    (verify_hardlink_defense runs on every slot at start-up).
+    """
+    name = "docker_pool"
+
+    def __init__(self, size: int | None = None, workspace_dir: Path | None = None,
+                 output_dir: Path | None = None, prefix: str | None = None):
+        self.size = size or settings.SANDBOX_WARM_POOL_SIZE
+        self.workspace_dir = Path(workspace_dir or settings.SANDBOX_WARM_POOL_WORKSPACE_DIR)
+        self.output_dir = Path(output_dir or settings.SANDBOX_WARM_POOL_OUTPUT_DIR)
+        self.prefix = prefix or f"coo-sandbox-pool-{os.getpid()}"
+        self._idle: queue.Queue[int] = queue.Queue()
+        self._busy: dict[str, int] = {}  # execution_id -> slot index
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _container(self, slot: int) -> str:
+        return f"{self.prefix}-{slot}"
+
+    def _slot_dirs(self, slot: int) -> tuple[Path, Path]:
+        return self.workspace_dir / f"slot-{slot}", self.output_dir / f"slot-{slot}"
+
+    def _docker(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+        result = subprocess.run(["docker", *args], capture_output=True, check=False)
+        if check and result.returncode != 0:
+            raise SandboxError(
+                f"docker {args[0]} failed: {result.stderr.decode(errors='replace').strip()}"
+            )
+        return result
+
+    def _create(self, slot: int) -> None:
+        ws, out = self._slot_dirs(slot)
+        verify_hardlink_defense(ws, out)
+        name = self._container(slot)
+        self._docker("rm", "-f", name, check=False)
+        self._docker(
+            "create", "--name", name,
+            *_container_limits(),
+            "-v", f"{ws.resolve()}:/workspace:ro",
+            "-v", f"{out.resolve()}:/output:rw",
+            "-w", "/workspace",
+            _image_ref(),
+            "sleep", "infinity",
+        )
+        self._docker("start", name)
+        self._docker("pause", name)
+
+    def start(self) -> None:
+        """Creates and pauses the pool's containers (idempotent)."""
+        with self._lock:
+            if self._started:
+                return
+            for slot in range(self.size):
+                self._create(slot)
+                self._idle.put(slot)
+            self._started = True
+
+    def run(self, workspace_root, output_root, entrypoint, timeout_seconds, execution_id):
+        self.start()
+        scan_for_symlinks(workspace_root)
+        slot = self._idle.get()
+        with self._lock:
+            self._busy[execution_id] = slot
+        ws, out = self._slot_dirs(slot)
+        name = self._container(slot)
+        recycle = True
+        try:
+            _empty_dir(ws)
+            _empty_dir(out)
+            shutil.copytree(workspace_root, ws, dirs_exist_ok=True)
+            self._docker("unpause", name)
+            cmd = ["docker", "exec", "--user", settings.SANDBOX_USER_UID, "-w", "/workspace",
+                   name, "bash", "-c", entrypoint]
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout_seconds, check=False)
+            # kill -1 reaches every process the task left behind except PID 1 (sleep)
+            cleanup = self._docker(
+                "exec", "--user", settings.SANDBOX_USER_UID, name,
+                "sh", "-c", "kill -9 -1 2>/dev/null; true", check=False,
+            )
+            if cleanup.returncode == 0:
+                self._docker("pause", name)
+                recycle = False
+            scan_for_symlinks(out)
+            output_root.mkdir(parents=True, exist_ok=True)
+            for child in out.iterdir():
+                shutil.move(str(child), str(output_root / child.name))
+            return result.returncode
+        finally:
+            with self._lock:
+                self._busy.pop(execution_id, None)
+            if recycle:
+                self._create(slot)
+            self._idle.put(slot)
+
+    def kill(self, execution_id):
+        with self._lock:
+            slot = self._busy.get(execution_id)
+        if slot is not None:
+            self._docker("kill", self._container(slot), check=False)
+
+    def close(self):
+        with self._lock:
+            if not self._started:
+                return
+            for slot in range(self.size):
+                self._docker("rm", "-f", self._container(slot), check=False)
+            self._idle = queue.Queue()
+            self._started = False
+
+
+# Runs as root of a fresh user namespace: private binds for output (RW) and
+# workspace (RO), a private tmpfs on /dev/shm, every other mount remounted
+# read-only, then all capabilities dropped before the entrypoint starts.
+# The separate output mount also makes workspace->output hardlinks fail
+# with EXDEV. Paths and entrypoint arrive as positional arguments.
+_NAMESPACE_SCRIPT = r"""
+set -e
+ws=$1; out=$2; tmpfs_size=$3; entrypoint=$4
+mount --bind "$out" "$out"
+mount --bind "$ws" "$ws"
+mount -o remount,ro,bind "$ws"
+mount -t tmpfs -o "size=$tmpfs_size,mode=1777" tmpfs /dev/shm
+sed -e 's/^[^ ]* \([^ ]*\) .*/\1/' /proc/self/mounts | while read -r m; do
+    m=$(printf '%b' "$m")
+    [ "$m" = "$out" ] && continue
+    [ "$m" = /dev/shm ] && continue
+    mount -o remount,ro,bind "$m" 2>/dev/null || true
+done
+cd "$ws"
+exec setpriv --no-new-privs --bounding-set=-all --inh-caps=-all bash -c "$entrypoint"
+"""
+
+
+class LocalNamespaceBackend(SandboxBackend):
+    """
+    Runs entrypoints under unshare(1) on the local host.
+
+    New user, mount, pid and network namespaces (loopback only, down) with
+    a read-only view of the host except the output directory, no
+    capabilities, no_new_privs, and rlimits derived from the SANDBOX_*
+    settings: RLIMIT_AS from SANDBOX_MEMORY_LIMIT, RLIMIT_NPROC from
+    SANDBOX_PIDS_LIMIT (counted per uid), RLIMIT_FSIZE from
+    MAX_FILE_SIZE_BYTES, RLIMIT_CPU from the timeout. The rlimits are set
+    by prlimit(1) exec'ing unshare rather than a preexec_fn, which is not
+    safe to run in a child forked while other threads (the inotify guard)
+    are live. Files stay readable with the invoking user's permissions, so
+    run it as an unprivileged account.
+    """
+    name = "local_namespace"
+
+    def __init__(self) -> None:
+        self._procs: dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available() -> bool:
+        """True if this host allows unprivileged user+net namespaces."""
+        if not (shutil.which("unshare") and shutil.which("setpriv") and shutil.which("prlimit")):
+            return False
+        try:
+            probe = subprocess.run(["unshare", "-rnm", "true"], capture_output=True, timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return probe.returncode == 0
+
+    @staticmethod
+    def _limits(timeout_seconds: int) -> list[str]:
+        """prlimit(1) prefix setting soft and hard rlimits before exec."""
+        return [
+            "prlimit",
+            f"--as={parse_memory_limit(settings.SANDBOX_MEMORY_LIMIT)}",
+            f"--nproc={settings.SANDBOX_PIDS_LIMIT}",
+            f"--fsize={settings.MAX_FILE_SIZE_BYTES}",
+            f"--cpu={max(1, int(timeout_seconds))}",
+            "--core=0",
+            "--",
+        ]
+
+    def run(self, workspace_root, output_root, entrypoint, timeout_seconds, execution_id):
+        ws, out = str(workspace_root.resolve()), str(output_root.resolve())
+        cmd = [
+            *self._limits(timeout_seconds),
+            "unshare", "--user", "--map-root-user", "--mount", "--net", "--pid", "--fork",
+            "--kill-child", "--mount-proc",
+            "sh", "-c", _NAMESPACE_SCRIPT, "sandbox",
+            ws, out, settings.SANDBOX_LOCAL_TMPFS_SIZE, entrypoint,
+        ]
+        env = {
+            "PATH": os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin"),
+            "HOME": out,
+            "TMPDIR": "/dev/shm",
+            "LANG": "C.UTF-8",
+            "SANDBOX_WORKSPACE": ws,
+            "SANDBOX_OUTPUT": out,
+        }
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL,
+            env=env, start_new_session=True,
+        )
+        with self._lock:
+            self._procs[execution_id] = proc
+        try:
+            proc.communicate(timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            self.kill(execution_id)
+            proc.communicate()
+            raise
+        finally:
+            with self._lock:
+                self._procs.pop(execution_id, None)
+        return proc.returncode
+
+    def kill(self, execution_id):
+        with self._lock:
+            proc = self._procs.get(execution_id)
+        if proc is not None and proc.poll() is None:
+            # --kill-child takes the whole pid namespace down with unshare
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+
+BACKENDS = {
+    DockerRunBackend.name: DockerRunBackend,
+    DockerWarmPoolBackend.name: DockerWarmPoolBackend,
+    LocalNamespaceBackend.name: LocalNamespaceBackend,
+}
+
+
+_shared: dict[str, SandboxBackend] = {}
+_shared_lock = threading.Lock()
+
+
+def get_backend(name: str | None = None) -> SandboxBackend:
+    """
+    Returns the process-wide backend named by `name` or
+    settings.SANDBOX_BACKEND, creating it on first use. Callers must not
+    close it; close_backends() does at interpreter exit.
+    """
+    name = name or settings.SANDBOX_BACKEND
+    if name not in BACKENDS:
+        raise SandboxError(f"unknown sandbox backend: {name}")
+    with _shared_lock:
+        backend = _shared.get(name)
+        if backend is None:
+            backend = _shared[name] = BACKENDS[name]()
+        return backend
+
+
+def close_backends() -> None:
+    """Closes every shared backend (test isolation, interpreter exit)."""
+    with _shared_lock:
+        shared = list(_shared.values())
+        _shared.clear()
+    for backend in shared:
+        backend.close()
+
+
+atexit.register(close_backends)
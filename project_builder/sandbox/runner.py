@@ -1,9 +1,7 @@
-import subprocess
-import threading
-import time
+import itertools
 import os
 from pathlib import Path
-from project_builder.config import settings
+from typing import Callable, Optional
 
 # Try importing watchdog for inotify support (Linux only usually, but good for structure)
 try:
@@ -14,15 +12,19 @@ except ImportError:
     WATCHDOG_AVAILABLE = False
 
 from . import SecurityViolation
+from .backends import SandboxBackend, get_backend
+from .security import scan_for_symlinks
 from project_builder.config.governance import enforce_governance
 
+_EXECUTION_IDS = itertools.count()
+
 class InotifyGuard(FileSystemEventHandler if WATCHDOG_AVAILABLE else object):
     """
     Monitors output directory for symlink creation.
-    Kills container if detected.
+    Kills the execution if detected.
     """
-    def __init__(self, container_name: str):
-        self.container_name = container_name
+    def __init__(self, kill: Callable[[], None]):
+        self.kill = kill
         self.violation_detected = False
 
     def on_created(self, event):
@@ -31,77 +33,56 @@ class InotifyGuard(FileSystemEventHandler if WATCHDOG_AVAILABLE else object):
         # Check if created file is a symlink
         if os.path.islink(event.src_path):
             self.violation_detected = True
-            # Kill container immediately
-            subprocess.run(["docker", "kill", self.container_name], check=False)
+            # Kill execution immediately
+            self.kill()
 
-def run_sandbox(workspace_root: Path, output_root: Path, entrypoint: str, timeout_seconds: int) -> int:
+def run_sandbox(workspace_root: Path, output_root: Path, entrypoint: str, timeout_seconds: int,
+                backend: Optional[SandboxBackend] = None) -> int:
     """
-    Execute entrypoint script inside Docker container with security constraints.
+    Execute entrypoint script inside the sandbox with security constraints.
     
     Args:
         workspace_root: Path to workspace directory (RO)
         output_root: Path to output directory (RW)
         entrypoint: Shell command to execute
         timeout_seconds: Timeout in seconds
+        backend: Executor to use; defaults to the shared settings.SANDBOX_BACKEND
+            instance, which stays open (warm) across calls
         
     Returns:
-        Exit code from container
+        Exit code from the sandboxed entrypoint
     """
     # Enforce Governance
     enforce_governance()
 
-    # Verify Image Digest
-    image_ref = f"coo-sandbox@{settings.SANDBOX_IMAGE_DIGEST}"
-    
-    # Verify digest exists (mock check for now as we don't have the image locally)
-    # subprocess.run(["docker", "inspect", image_ref], check=True)
+    if backend is None:
+        backend = get_backend()
 
     # Ensure output directory exists
     output_root.mkdir(parents=True, exist_ok=True)
 
     # Inotify Guard (Linux Only)
     observer = None
-    container_name = f"coo-sandbox-{os.getpid()}"
+    execution_id = f"coo-sandbox-{os.getpid()}-{next(_EXECUTION_IDS)}"
     
     if WATCHDOG_AVAILABLE and os.name != 'nt':
-        guard = InotifyGuard(container_name)
+        guard = InotifyGuard(lambda: backend.kill(execution_id))
         observer = Observer()
         observer.schedule(guard, str(output_root), recursive=True)
         observer.start()
 
     try:
-        # Construct canonical Docker command using list (NO string interpolation of manifest fields)
-        cmd = [
-            "docker", "run", "--rm",
-            "--name", container_name,
-            "--network=none",
-            "--user", settings.SANDBOX_USER_UID,
-            "--cap-drop=ALL",
-            "--security-opt=no-new-privileges",
-            # Default seccomp profile is used (secure default)
-            "--pids-limit", str(settings.SANDBOX_PIDS_LIMIT),
-            "--memory", settings.SANDBOX_MEMORY_LIMIT,
-            "--memory-swap", settings.SANDBOX_MEMORY_SWAP,
-            "--cpus", settings.SANDBOX_CPU_LIMIT,
-            "-v", f"{workspace_root.resolve()}:/workspace:ro", # RO Workspace
-            "-v", f"{output_root.resolve()}:/output:rw",       # RW Output
-            "-w", "/workspace",                                # Working Directory
-            image_ref,
-            "bash", "-c", entrypoint # Entrypoint is passed as arg, not interpolated into shell string
-        ]
-        
-        # Execute with timeout
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            timeout=timeout_seconds,
-            check=False
+        returncode = backend.run(
+            workspace_root, output_root, entrypoint, timeout_seconds, execution_id
         )
         
         if observer and guard.violation_detected:
             raise SecurityViolation("inotify_guard_triggered: symlink creation detected in output/")
+
+        # Backstop for hosts without inotify and for links created just before exit
+        scan_for_symlinks(output_root)
             
-        return result.returncode
+        return returncode
 
     finally:
         if observer:
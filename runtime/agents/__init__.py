@@ -54,6 +54,8 @@ from .logging import (
     HASH_CHAIN_GENESIS,
     AgentCallLogEntry,
     AgentCallLogger,
+    default_call_logger,
+    get_call_logger,
 )
 
 # Model resolution
@@ -74,9 +76,20 @@ from .opencode_client import (
     OpenCodeClient,
     OpenCodeError,
     OpenCodeServerError,
+    OpenCodeStreamError,
     OpenCodeTimeoutError,
 )
 
+# Streaming
+from .streaming import (
+    EnvelopeDecision,
+    EnvelopeDetector,
+    iter_sse_events,
+)
+
+# Usage rollups
+from .usage_rollups import UsageRollups
+
 __all__ = [
     # api.py
     "canonical_json",
@@ -95,6 +108,8 @@ __all__ = [
     "HASH_CHAIN_GENESIS",
     "AgentCallLogEntry",
     "AgentCallLogger",
+    "default_call_logger",
+    "get_call_logger",
     # fixtures.py
     "ReplayMissError",
     "CachedResponse",
@@ -128,5 +143,12 @@ __all__ = [
     "LLMResponse",
     "OpenCodeError",
     "OpenCodeServerError",
+    "OpenCodeStreamError",
     "OpenCodeTimeoutError",
+    # streaming.py
+    "EnvelopeDecision",
+    "EnvelopeDetector",
+    "iter_sse_events",
+    # usage_rollups.py
+    "UsageRollups",
 ]
@@ -14,19 +14,22 @@ import warnings
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import yaml
 
 from runtime.errors import EnvelopeViolation
 from runtime.receipts.invocation_receipt import record_invocation_receipt
+from runtime.util import yaml_io
 from runtime.util.canonical import canonical_json
 
 from .models import ModelConfig, load_model_config, resolve_model_auto
+from .streaming import DECISION_COMPLETE, complete_usage
 
 if TYPE_CHECKING:
     from .cli_dispatch import CLIDispatchResult
     from .logging import AgentCallLogger
+    from .streaming import EnvelopeDetector
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -108,6 +111,7 @@ class AgentResponse:
     usage: dict = field(default_factory=dict)
     latency_ms: int = 0
     timestamp: str = ""  # Metadata only
+    aborted: bool = False  # Streamed call stopped early; content is partial
 
 
 class AgentAPIError(Exception):
@@ -340,7 +344,7 @@ def _parse_response_packet(content: str) -> Optional[dict]:
 
     # 1. Try full content
     try:
-        packet = yaml.safe_load(content)
+        packet = yaml_io.safe_load(content)
         if isinstance(packet, dict):
             return packet
     except Exception:
@@ -353,7 +357,7 @@ def _parse_response_packet(content: str) -> Optional[dict]:
     if match:
         block_content = match.group(1)
         try:
-            packet = yaml.safe_load(block_content)
+            packet = yaml_io.safe_load(block_content)
             if isinstance(packet, dict):
                 return packet
         except Exception:
@@ -367,6 +371,8 @@ def call_agent(
     run_id: str = "",
     logger_instance: Optional["AgentCallLogger"] = None,
     config: Optional[ModelConfig] = None,
+    on_delta: Optional[Callable[[str], Any]] = None,
+    envelope: Optional["EnvelopeDetector"] = None,
 ) -> AgentResponse:
     """
     Invoke an LLM via OpenRouter with role-specific system prompt.
@@ -380,11 +386,21 @@ def call_agent(
     6. Log to hash chain
     7. Return AgentResponse
 
+    Passing on_delta and/or envelope streams the call. Each text delta goes
+    to on_delta (a truthy return stops the stream) and to envelope, which
+    stops the stream once it reaches a decision. A stopped call comes back
+    with aborted=True: usage is completed with estimates for what the
+    provider never reported, the log entry has status "aborted", the packet
+    is the envelope's (only when it decided "complete"), and nothing is
+    written to the replay cache.
+
     Args:
         call: AgentCall specification
         run_id: Deterministic run ID for logging (empty string if not in a run)
         logger_instance: Optional AgentCallLogger for hash chain logging
         config: Optional ModelConfig (loads from file if None)
+        on_delta: Optional callback receiving streamed text deltas
+        envelope: Optional EnvelopeDetector fed with the streamed deltas
 
     Returns:
         AgentResponse with parsed content and metadata
@@ -395,7 +411,7 @@ def call_agent(
         AgentResponseInvalid: If response fails validation
     """
     from .fixtures import get_cached_response, is_replay_mode
-    from .logging import AgentCallLogger
+    from .logging import default_call_logger
 
     invocation_start_ts = datetime.now(timezone.utc).isoformat()
     resolved_model = call.model
@@ -472,7 +488,7 @@ def call_agent(
 
     # [HARDENING] Use OpenCodeClient for robust protocol and provider handling.
     # It handles both OpenRouter (OpenAI style) and Zen (Anthropic style) logic.
-    from .opencode_client import LLMCall, OpenCodeClient
+    from .opencode_client import LLMCall, LLMResponse, OpenCodeClient
 
     # Build client with role for key selection
     client = OpenCodeClient(
@@ -493,19 +509,43 @@ def call_agent(
         )
 
         # Execute call via client (handles retry and fallback internally)
-        response = client.call(llm_request)
-        normalized_usage = _normalize_usage(getattr(response, "usage", {}))
-        if call.require_usage and not normalized_usage:
+        llm_response: LLMResponse
+        if on_delta is None and envelope is None:
+            llm_response = client.call(llm_request)
+        else:
+
+            def _sink(delta: str) -> bool:
+                stop = bool(on_delta(delta)) if on_delta is not None else False
+                if envelope is not None and envelope.feed(delta) is not None:
+                    stop = True
+                return stop
+
+            llm_response = client.call(llm_request, on_delta=_sink)
+        aborted = bool(getattr(llm_response, "aborted", False))
+        normalized_usage = _normalize_usage(getattr(llm_response, "usage", {}))
+        if aborted:
+            # A stopped stream never gets the final usage report (and an
+            # Anthropic-style output count before it is a placeholder)
+            reported = {k: v for k, v in normalized_usage.items() if k == "input_tokens"}
+            normalized_usage = complete_usage(
+                reported, system_prompt + prompt, llm_response.content
+            )
+        elif call.require_usage and not normalized_usage:
             raise AgentAPIError("TOKEN_ACCOUNTING_UNAVAILABLE: upstream usage missing")
 
         latency_ms = int((time.monotonic() - start_time) * 1000)
 
         # Parse response
-        content = response.content
-        model_version = response.model_used
-
-        # Parse response as packet if possible
-        packet = _parse_response_packet(content)
+        content = llm_response.content
+        model_version = llm_response.model_used
+
+        # Parse response as packet if possible; a partial one only via the envelope
+        if not aborted:
+            packet = _parse_response_packet(content)
+        elif envelope is not None and (decision := envelope.finish()).status == DECISION_COMPLETE:
+            packet = decision.packet
+        else:
+            packet = None
         output_packet_hash = (
             f"sha256:{hashlib.sha256(canonical_json(packet)).hexdigest()}" if packet else ""
         )
@@ -514,13 +554,11 @@ def call_agent(
 
         # Log to hash chain if logger provided
         if logger_instance is None:
-            from .logging import AgentCallLogger
-
-            logger_instance = AgentCallLogger()
+            logger_instance = default_call_logger()
 
         logger_instance.log_call(
             call_id_deterministic=call_id,
-            call_id_audit=response.call_id,
+            call_id_audit=llm_response.call_id,
             role=call.role,
             model_requested=call.model,
             model_used=model,
@@ -531,12 +569,13 @@ def call_agent(
             output_tokens=normalized_usage.get("output_tokens", 0),
             latency_ms=latency_ms,
             output_packet_hash=output_packet_hash,
-            status="success",
+            status="aborted" if aborted else "success",
+            run_id=run_id,
         )
 
         agent_response = AgentResponse(
             call_id=call_id,
-            call_id_audit=response.call_id,
+            call_id_audit=llm_response.call_id,
             role=call.role,
             model_used=model,
             model_version=model_version,
@@ -545,6 +584,7 @@ def call_agent(
             usage=normalized_usage,
             latency_ms=latency_ms,
             timestamp=timestamp,
+            aborted=aborted,
         )
         _record_agent_receipt(
             run_id=run_id,
@@ -555,14 +595,19 @@ def call_agent(
             end_ts=timestamp,
             exit_status=0,
             output_content=content,
-            schema_validation="pass" if packet is not None else "n/a",
+            schema_validation=(
+                "pass" if packet is not None else "fail" if aborted and envelope else "n/a"
+            ),
             token_usage=_receipt_token_usage(normalized_usage),
+            truncation={"input_truncated": False, "output_truncated": True} if aborted else None,
             input_hash=packet_hash,  # Phase 4A: capture input prompt hash
         )
 
         # Phase 3C: Write response to replay cache keyed by deterministic call_id.
         # Same inputs → same call_id → cache hit on retry/recovery.
-        _write_replay_cache(call_id, content, model_version)
+        # Partial (aborted) content must not be replayed as a full response.
+        if not aborted:
+            _write_replay_cache(call_id, content, model_version)
 
         return agent_response
 
@@ -659,7 +704,7 @@ def call_agent_cli(
     Returns:
         AgentResponse with parsed content and metadata
     """
-    from .logging import AgentCallLogger
+    from .logging import default_call_logger
     from .models import get_agent_config, is_cli_dispatch
 
     invocation_start_ts = datetime.now(timezone.utc).isoformat()
@@ -756,7 +801,7 @@ def call_agent_cli(
     model_version = f"{used_provider}/default"
 
     if logger_instance is None:
-        logger_instance = AgentCallLogger()
+        logger_instance = default_call_logger()
 
     logger_instance.log_call(
         call_id_deterministic=call_id,
@@ -772,6 +817,7 @@ def call_agent_cli(
         latency_ms=result.latency_ms,
         output_packet_hash=output_packet_hash,
         status="success" if result.success else "partial",
+        run_id=run_id,
     )
 
     agent_response = AgentResponse(
@@ -0,0 +1,458 @@
+"""
+Durable segment store and query index for the agent call hash chain.
+
+Entries are appended as JSON lines to numbered segments
+<root>/segments/calls-<n>.jsonl, rolled once a segment passes
+SEGMENT_MAX_BYTES. Every append holds an flock on <root>/.lock, so all
+processes sharing a root extend a single chain: an entry whose
+prev_log_hash is not the on-disk tip (another process appended since it
+was hashed) is relinked onto the tip before it is written. A torn last
+line left by a crash is cut off under the same lock.
+
+<root>/index.sqlite3 holds one compact row per call (ts, role, model,
+run_id, status, tokens, latency) plus running totals per (role, model),
+so the totals for any time range come from two indexed lookups per key
+rather than a scan. The index records the segment position it covers;
+lines a crash left unindexed are indexed by the next append, and
+rebuild_index() recreates it from the segments.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from runtime.util.file_lock import FileLock
+
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+LOCK_TIMEOUT = 30.0
+TAIL_READ_BYTES = 64 * 1024
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS labels (
+        id INTEGER PRIMARY KEY,
+        kind TEXT NOT NULL,
+        name TEXT NOT NULL,
+        UNIQUE (kind, name)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS calls (
+        seq INTEGER PRIMARY KEY,
+        ts INTEGER NOT NULL,
+        role INTEGER NOT NULL,
+        model INTEGER NOT NULL,
+        run INTEGER NOT NULL,
+        status INTEGER NOT NULL,
+        input_tokens INTEGER NOT NULL,
+        output_tokens INTEGER NOT NULL,
+        latency_ms INTEGER NOT NULL,
+        cum_calls INTEGER NOT NULL,
+        cum_input INTEGER NOT NULL,
+        cum_output INTEGER NOT NULL,
+        cum_latency INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS calls_key_ts ON calls (role, model, ts)",
+    """
+    CREATE TABLE IF NOT EXISTS call_keys (
+        role INTEGER NOT NULL,
+        model INTEGER NOT NULL,
+        PRIMARY KEY (role, model)
+    ) WITHOUT ROWID
+    """,
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+)
+
+
+class CallLogStoreError(Exception):
+    """Raised when the call log store cannot be written."""
+
+    pass
+
+
+def _to_micros(timestamp: str) -> int:
+    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _segment_number(path: Path) -> int:
+    return int(path.stem.rsplit("-", 1)[1])
+
+
+def segment_paths(root: str | Path) -> List[Path]:
+    """Segments of the store at root, oldest first."""
+    return sorted((Path(root) / "segments").glob("calls-*.jsonl"), key=_segment_number)
+
+
+class CallLogStore:
+    """Append-only JSONL segments of chained call records, with a SQLite index."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        genesis: str,
+        rehash: Callable[[Dict[str, Any]], str],
+        segment_max_bytes: int = SEGMENT_MAX_BYTES,
+        fsync: bool = True,
+    ):
+        """
+        Args:
+            root: Store directory (created if missing).
+            genesis: prev_log_hash of the first record.
+            rehash: Computes a record's entry_hash (used when relinking).
+            segment_max_bytes: Size after which a new segment is started.
+            fsync: fsync each appended batch (one fsync per group commit).
+        """
+        self.root = Path(root)
+        self.segments_dir = self.root / "segments"
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.root / "index.sqlite3"
+        self.genesis = genesis
+        self.rehash = rehash
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        self._lock = FileLock(str(self.root / ".lock"), timeout=LOCK_TIMEOUT)
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(self.index_path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._labels: Dict[Tuple[str, str], int] = {}
+        # (segment number, size) after our last append, and the tip it ended with
+        self._known_end: Optional[Tuple[int, int]] = None
+        self._known_tip: Optional[str] = None
+
+    def close(self) -> None:
+        with self._db_lock:
+            self._db.close()
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def segments(self) -> List[Path]:
+        return segment_paths(self.root)
+
+    def _segment_path(self, number: int) -> Path:
+        return self.segments_dir / f"calls-{number:08d}.jsonl"
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """All complete records, oldest first."""
+        for _, _, record in self._iter_lines(self.segments(), 1, 0):
+            yield record
+
+    def _iter_lines(
+        self, segments: List[Path], from_number: int, from_offset: int
+    ) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """(segment number, end offset, record) for complete lines after a position."""
+        for path in segments:
+            number = _segment_number(path)
+            if number < from_number:
+                continue
+            offset = from_offset if number == from_number else 0
+            with open(path, "rb") as handle:
+                handle.seek(offset)
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break  # torn tail; trimmed by the next append
+                    offset += len(line)
+                    yield number, offset, json.loads(line)
+
+    def _last_line(self, path: Path, size: int) -> Optional[bytes]:
+        if size == 0:
+            return None
+        with open(path, "rb") as handle:
+            start = max(0, size - TAIL_READ_BYTES)
+            while True:
+                handle.seek(start)
+                data = handle.read(size - start)
+                cut = data.rfind(b"\n", 0, len(data) - 1)
+                if cut >= 0 or start == 0:
+                    return data[cut + 1 :]
+                start = max(0, start - TAIL_READ_BYTES)
+
+    def _trim_torn_tail(self, path: Path) -> int:
+        """Cut an unterminated last line (crashed writer); returns the new size."""
+        size = path.stat().st_size
+        if size == 0:
+            return 0
+        with open(path, "rb+") as handle:
+            handle.seek(size - 1)
+            if handle.read(1) == b"\n":
+                return size
+            start = max(0, size - TAIL_READ_BYTES)
+            while True:
+                handle.seek(start)
+                cut = handle.read(size - start).rfind(b"\n")
+                if cut >= 0 or start == 0:
+                    handle.truncate(start + cut + 1)
+                    return start + cut + 1
+                start = max(0, start - TAIL_READ_BYTES)
+
+    def _tail(self) -> Tuple[int, int, Optional[str]]:
+        """(newest segment number, its size, chain tip) as found on disk."""
+        segments = self.segments()
+        if not segments:
+            return 1, 0, None
+        newest = segments[-1]
+        number = _segment_number(newest)
+        size = self._trim_torn_tail(newest)
+        if self._known_end == (number, size):
+            return number, size, self._known_tip
+        for path in reversed(segments):
+            line = self._last_line(path, path.stat().st_size if path != newest else size)
+            if line:
+                return number, size, json.loads(line)["entry_hash"]
+        return number, size, None
+
+    def tip(self) -> Optional[str]:
+        """entry_hash of the last record on disk (None if the store is empty)."""
+        return self._tail()[2]
+
+    # ------------------------------------------------------------------
+    # Appends
+    # ------------------------------------------------------------------
+
+    def append(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Append records as one locked, group-committed write.
+
+        Records are relinked in place where they do not chain onto the
+        on-disk tip. Returns True if any record was relinked.
+        """
+        if not records:
+            return False
+        with self._lock.acquire_ctx() as acquired:
+            if not acquired:
+                raise CallLogStoreError(f"Timed out locking call log store {self.root}")
+            number, size, tip = self._tail()
+            self._catch_up_index(number, size)
+
+            relinked = False
+            tip = tip or self.genesis
+            for record in records:
+                if record["prev_log_hash"] != tip:
+                    record["prev_log_hash"] = tip
+                    record["entry_hash"] = self.rehash(record)
+                    relinked = True
+                tip = record["entry_hash"]
+
+            data = b"".join(
+                json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode() + b"\n"
+                for record in records
+            )
+            if size and size + len(data) > self.segment_max_bytes:
+                number, size = number + 1, 0
+            fd = os.open(self._segment_path(number), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+                if self.fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._index(records, number, size + len(data))
+            self._known_end, self._known_tip = (number, size + len(data)), tip
+        return relinked
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _meta(self) -> Dict[str, int]:
+        return dict(self._db.execute("SELECT name, value FROM meta").fetchall())
+
+    def _catch_up_index(self, number: int, size: int) -> None:
+        """Index lines written by a writer that died before indexing them."""
+        with self._db_lock:
+            meta = self._meta()
+        position = (meta.get("segment", 1), meta.get("offset", 0))
+        if position >= (number, size):
+            return
+        pending: List[Dict[str, Any]] = []
+        end = position
+        for seg, offset, record in self._iter_lines(self.segments(), *position):
+            pending.append(record)
+            end = (seg, offset)
+            if len(pending) >= 10_000:
+                self._index(pending, *end)
+                pending = []
+        if pending or end != position:
+            self._index(pending, *end)
+
+    def rebuild_index(self) -> int:
+        """Recreate the index from the segments; returns the rows indexed."""
+        with self._lock.acquire_ctx() as acquired:
+            if not acquired:
+                raise CallLogStoreError(f"Timed out locking call log store {self.root}")
+            with self._db_lock:
+                self._db.execute("BEGIN IMMEDIATE")
+                for table in ("labels", "calls", "call_keys", "meta"):
+                    self._db.execute(f"DELETE FROM {table}")  # noqa: S608
+                self._db.execute("COMMIT")
+                self._labels.clear()
+            number, size, _ = self._tail()
+            self._catch_up_index(number, size)
+        return self.count()
+
+    def _label(self, kind: str, name: str) -> int:
+        key = (kind, name)
+        label = self._labels.get(key)
+        if label is None:
+            self._db.execute("INSERT OR IGNORE INTO labels (kind, name) VALUES (?, ?)", key)
+            label = self._db.execute(
+                "SELECT id FROM labels WHERE kind = ? AND name = ?", key
+            ).fetchone()[0]
+            self._labels[key] = label
+        return label
+
+    def _index(self, records: List[Dict[str, Any]], number: int, offset: int) -> None:
+        with self._db_lock:
+            db = self._db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                meta = self._meta()
+                last_ts = meta.get("last_ts", 0)
+                totals: Dict[Tuple[int, int], List[int]] = {}
+                rows = []
+                for record in records:
+                    # ts never decreases, so running totals follow ts order
+                    last_ts = max(last_ts, _to_micros(record["timestamp"]))
+                    key = (
+                        self._label("role", record["role"]),
+                        self._label("model", record["model_used"]),
+                    )
+                    running = totals.get(key)
+                    if running is None:
+                        previous = db.execute(
+                            "SELECT cum_calls, cum_input, cum_output, cum_latency FROM calls "
+                            "WHERE role = ? AND model = ? ORDER BY ts DESC, seq DESC LIMIT 1",
+                            key,
+                        ).fetchone()
+                        if previous is None:
+                            db.execute("INSERT INTO call_keys (role, model) VALUES (?, ?)", key)
+                        running = totals[key] = list(previous or (0, 0, 0, 0))
+                    input_tokens = int(record.get("input_tokens") or 0)
+                    output_tokens = int(record.get("output_tokens") or 0)
+                    latency_ms = int(record.get("latency_ms") or 0)
+                    running[0] += 1
+                    running[1] += input_tokens
+                    running[2] += output_tokens
+                    running[3] += latency_ms
+                    rows.append(
+                        (
+                            last_ts,
+                            *key,
+                            self._label("run", record.get("run_id") or ""),
+                            self._label("status", record.get("status") or ""),
+                            input_tokens,
+                            output_tokens,
+                            latency_ms,
+                            *running,
+                        )
+                    )
+                db.executemany(
+                    "INSERT INTO calls (ts, role, model, run, status, input_tokens, "
+                    "output_tokens, latency_ms, cum_calls, cum_input, cum_output, cum_latency) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                db.executemany(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)",
+                    [("segment", number), ("offset", offset), ("last_ts", last_ts)],
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                self._labels.clear()  # ids minted in the rolled-back transaction
+                raise
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        with self._db_lock:
+            return self._db.execute("SELECT count(*) FROM calls").fetchone()[0]
+
+    def usage(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Per (role, model) totals for calls with since <= ts < until.
+
+        Each key costs two index lookups (its running totals just before
+        each bound), independent of how many calls the range holds.
+        """
+        lo = int(since.timestamp() * 1_000_000) if since else None
+        hi = int(until.timestamp() * 1_000_000) if until else None
+        before = (
+            "SELECT cum_calls, cum_input, cum_output, cum_latency FROM calls "
+            "WHERE role = ? AND model = ? AND ts < ? ORDER BY ts DESC, seq DESC LIMIT 1"
+        )
+        results = []
+        with self._db_lock:
+            keys = self._db.execute(
+                "SELECT k.role, k.model, r.name, m.name FROM call_keys k "
+                "JOIN labels r ON r.id = k.role JOIN labels m ON m.id = k.model"
+            ).fetchall()
+            for role_id, model_id, role, model in keys:
+                if hi is None:
+                    upper = self._db.execute(
+                        "SELECT cum_calls, cum_input, cum_output, cum_latency FROM calls "
+                        "WHERE role = ? AND model = ? ORDER BY ts DESC, seq DESC LIMIT 1",
+                        (role_id, model_id),
+                    ).fetchone()
+                else:
+                    upper = self._db.execute(before, (role_id, model_id, hi)).fetchone()
+                lower = (
+                    self._db.execute(before, (role_id, model_id, lo)).fetchone()
+                    if lo is not None
+                    else None
+                )
+                upper, lower = upper or (0, 0, 0, 0), lower or (0, 0, 0, 0)
+                calls, input_tokens, output_tokens, latency = (
+                    a - b for a, b in zip(upper, lower, strict=True)
+                )
+                if calls:
+                    results.append(
+                        {
+                            "role": role,
+                            "model": model,
+                            "calls": calls,
+                            "input_tokens": input_tokens,
+                            "output_tokens": output_tokens,
+                            "total_latency_ms": latency,
+                        }
+                    )
+        return sorted(results, key=lambda row: (row["role"], row["model"]))
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+
+    def verify_chain(self) -> Tuple[bool, List[str]]:
+        """Recompute every record's hash and link; returns (is_valid, breaks)."""
+        breaks = []
+        expected_prev: Optional[str] = self.genesis
+        for i, record in enumerate(self.iter_records()):
+            if record.get("prev_log_hash") != expected_prev:
+                breaks.append(
+                    f"Entry {i}: expected prev_log_hash={expected_prev}, "
+                    f"got {record.get('prev_log_hash')}"
+                )
+            computed = self.rehash(record)
+            if record.get("entry_hash") != computed:
+                breaks.append(
+                    f"Entry {i}: entry_hash mismatch. "
+                    f"Stored={record.get('entry_hash')}, computed={computed}"
+                )
+            expected_prev = record.get("entry_hash")
+        return len(breaks) == 0, breaks
@@ -5,20 +5,50 @@ Per LifeOS_Autonomous_Build_Loop_Architecture_v0.3.md §5.1.4
 
 This is the CANONICAL logging module per spec. The agent_logging.py file
 is a compatibility shim that re-exports from this module.
+
+A logger created with persist=True writes its entries to a CallLogStore
+under log_dir: the chain continues across processes and restarts, and
+usage over any time range is answered from the store's index. Entries are
+queued (bounded) and written by a background flusher thread, one locked
+append and fsync per batch.
+
+call_agent/call_agent_cli log to the shared persistent logger for
+logs/agent_calls, or for $LIFEOS_AGENT_CALL_LOG_DIR when set (see
+default_call_logger()).
 """
 
 from __future__ import annotations
 
+import atexit
 import hashlib
-from dataclasses import asdict, dataclass
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Optional
 
 from .api import canonical_json
+from .call_log_store import CallLogStore
+
+logger = logging.getLogger(__name__)
 
 # Per v0.3 spec §5.1.4 - Hash Chain Genesis
 HASH_CHAIN_GENESIS = hashlib.sha256(b"LIFEOS_LOG_CHAIN_GENESIS_V1").hexdigest()
 
+# Bound on entries awaiting the flusher; log_call blocks when it is full
+DEFAULT_QUEUE_SIZE = 10_000
+# Most entries written by one group commit
+GROUP_COMMIT_MAX = 4096
+# Default store directory for call_agent's shared logger
+DEFAULT_CALL_LOG_DIR = "logs/agent_calls"
+# Overrides DEFAULT_CALL_LOG_DIR (tests point it at a temporary directory)
+CALL_LOG_DIR_ENV = "LIFEOS_AGENT_CALL_LOG_DIR"
+
+_STOP = object()
+
 
 @dataclass
 class AgentCallLogEntry:
@@ -37,11 +67,18 @@ class AgentCallLogEntry:
     output_tokens: int
     latency_ms: int
     output_packet_hash: str
-    status: str  # "success", "error", "timeout", "invalid_response"
+    status: str  # "success", "error", "timeout", "invalid_response", "aborted"
     prev_log_hash: str
+    run_id: str = ""
     entry_hash: str = ""  # Computed after creation
 
 
+def _record_hash(record: dict[str, Any]) -> str:
+    """SHA-256 of a record's canonical JSON, excluding entry_hash."""
+    content = {k: v for k, v in record.items() if k != "entry_hash"}
+    return hashlib.sha256(canonical_json(content)).hexdigest()
+
+
 class AgentCallLogger:
     """
     Append-only hash chain logger for agent calls.
@@ -49,18 +86,28 @@ class AgentCallLogger:
     Per v0.3 spec §5.1.4 and §5.8 (Evidence Integrity).
     """
 
-    def __init__(self, log_dir: str = "logs/agent_calls"):
+    def __init__(
+        self,
+        log_dir: str = "logs/agent_calls",
+        persist: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self._prev_hash: str = HASH_CHAIN_GENESIS
         self._entries: list[AgentCallLogEntry] = []
+        self._store: Optional[CallLogStore] = None
+        if persist:
+            self._store = CallLogStore(self.log_dir, HASH_CHAIN_GENESIS, _record_hash)
+            self._prev_hash = self._store.tip() or HASH_CHAIN_GENESIS
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._flusher: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
 
     def _compute_entry_hash(self, entry: AgentCallLogEntry) -> str:
         """Compute SHA-256 hash of entry including prev_log_hash."""
-        entry_dict = asdict(entry)
-        entry_dict.pop("entry_hash", None)  # Exclude entry_hash from computation
-        content = canonical_json(entry_dict)
-        return hashlib.sha256(content).hexdigest()
+        return _record_hash(vars(entry))
 
     def log_call(
         self,
@@ -77,36 +124,103 @@ class AgentCallLogger:
         latency_ms: int,
         output_packet_hash: str,
         status: str,
+        run_id: str = "",
     ) -> AgentCallLogEntry:
         """
         Log an agent call with hash chain integrity.
 
-        Returns the logged entry with computed hashes.
+        Returns the logged entry with computed hashes. For a persistent
+        logger the entry is written asynchronously; if another process
+        extended the chain first, its prev_log_hash and entry_hash are
+        relinked onto the stored tip when written (see flush()).
         """
-        entry = AgentCallLogEntry(
-            call_id_deterministic=call_id_deterministic,
-            call_id_audit=call_id_audit,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            role=role,
-            model_requested=model_requested,
-            model_used=model_used,
-            model_version=model_version,
-            input_packet_hash=input_packet_hash,
-            prompt_hash=prompt_hash,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            latency_ms=latency_ms,
-            output_packet_hash=output_packet_hash,
-            status=status,
-            prev_log_hash=self._prev_hash,
-        )
-
-        entry.entry_hash = self._compute_entry_hash(entry)
-        self._prev_hash = entry.entry_hash
-        self._entries.append(entry)
+        with self._lock:
+            entry = AgentCallLogEntry(
+                call_id_deterministic=call_id_deterministic,
+                call_id_audit=call_id_audit,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                role=role,
+                model_requested=model_requested,
+                model_used=model_used,
+                model_version=model_version,
+                input_packet_hash=input_packet_hash,
+                prompt_hash=prompt_hash,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                latency_ms=latency_ms,
+                output_packet_hash=output_packet_hash,
+                status=status,
+                prev_log_hash=self._prev_hash,
+                run_id=run_id,
+            )
+
+            entry.entry_hash = self._compute_entry_hash(entry)
+            self._prev_hash = entry.entry_hash
+            if self._store is None:
+                self._entries.append(entry)
+                return entry
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="agent-call-log-flusher", daemon=True
+                )
+                self._flusher.start()
+                atexit.register(self.close)
 
+        self._queue.put(entry)
         return entry
 
+    def _flush_loop(self) -> None:
+        assert self._store is not None
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < GROUP_COMMIT_MAX:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = batch[-1] is _STOP
+            entries = [e for e in batch if e is not _STOP]
+            try:
+                records = [dict(vars(e)) for e in entries]
+                if self._store.append(records):
+                    with self._lock:
+                        if self._prev_hash == entries[-1].entry_hash:
+                            self._prev_hash = records[-1]["entry_hash"]
+                        for entry, record in zip(entries, records, strict=True):
+                            entry.prev_log_hash = record["prev_log_hash"]
+                            entry.entry_hash = record["entry_hash"]
+            except Exception as exc:  # also re-raised by flush()
+                logger.error(
+                    "Agent call log write to %s failed (%d entries): %s",
+                    self.log_dir,
+                    len(entries),
+                    exc,
+                )
+                self._error = exc
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self) -> None:
+        """Wait until every logged entry is on disk; re-raise a write failure."""
+        if self._flusher is not None:
+            self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self) -> None:
+        """Flush and stop the flusher thread (the logger may be used again)."""
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._queue.put(_STOP)
+            flusher.join()
+            atexit.unregister(self.close)
+        self.flush()
+
     def verify_chain(self) -> tuple[bool, list[str]]:
         """
         Verify integrity of the log chain.
@@ -114,6 +228,10 @@ class AgentCallLogger:
         Returns:
             (is_valid, list_of_breaks)
         """
+        if self._store is not None:
+            self.flush()
+            return self._store.verify_chain()
+
         breaks = []
         expected_prev = HASH_CHAIN_GENESIS
 
@@ -134,12 +252,42 @@ class AgentCallLogger:
 
         return len(breaks) == 0, breaks
 
+    @property
+    def store(self) -> Optional[CallLogStore]:
+        """The backing store of a persistent logger (None when in-memory)."""
+        return self._store
+
     @property
     def entries(self) -> list[AgentCallLogEntry]:
-        """Return all logged entries."""
+        """Return all logged entries (for a persistent logger, all stored entries)."""
+        if self._store is not None:
+            self.flush()
+            return [AgentCallLogEntry(**record) for record in self._store.iter_records()]
         return list(self._entries)
 
     @property
     def prev_hash(self) -> str:
         """Return current chain tip hash."""
         return self._prev_hash
+
+
+_shared_loggers: dict[Path, AgentCallLogger] = {}
+_shared_lock = threading.Lock()
+
+
+def get_call_logger(log_dir: str = DEFAULT_CALL_LOG_DIR) -> AgentCallLogger:
+    """Shared persistent logger for log_dir (one per directory per process)."""
+    key = Path(log_dir).resolve()
+    with _shared_lock:
+        call_logger = _shared_loggers.get(key)
+        if call_logger is None:
+            call_logger = _shared_loggers[key] = AgentCallLogger(str(key), persist=True)
+        return call_logger
+
+
+def default_call_logger() -> AgentCallLogger:
+    """
+    Logger for calls made without one: the shared persistent logger for
+    $LIFEOS_AGENT_CALL_LOG_DIR, or for DEFAULT_CALL_LOG_DIR when unset.
+    """
+    return get_call_logger(os.environ.get(CALL_LOG_DIR_ENV, "").strip() or DEFAULT_CALL_LOG_DIR)
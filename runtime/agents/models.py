@@ -16,7 +16,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import yaml
+from runtime.util.yaml_io import load_yaml_file
 
 # =============================================================================
 # CONFIG-DRIVEN DEFAULTS (Single Source of Truth: config/models.yaml)
@@ -231,8 +231,7 @@ def load_model_config(config_path: Optional[str] = None) -> ModelConfig:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml_file(path)
 
     if not data:
         raise ValueError(f"Config file is empty or invalid: {path}")
@@ -49,7 +49,9 @@ import tempfile
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
+
+from .streaming import iter_sse_events
 
 logger = logging.getLogger(__name__)
 
@@ -144,6 +146,16 @@ class OpenCodeSessionError(OpenCodeError):
     pass
 
 
+class OpenCodeStreamError(OpenCodeError):
+    """Stream broke after deltas were delivered; not retried on a fallback model."""
+
+    pass
+
+
+# Receives each streamed text delta; a truthy return stops the stream
+DeltaCallback = Callable[[str], Any]
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
@@ -178,6 +190,9 @@ class LLMResponse:
         model_used: The model that was actually used.
         latency_ms: Time taken for the call in milliseconds.
         timestamp: ISO timestamp of when the call completed.
+        streamed: True if content arrived as deltas over a streamed call.
+        aborted: True if the caller stopped a streamed call early; content
+            and usage then cover only what was received.
     """
 
     call_id: str
@@ -186,6 +201,8 @@ class LLMResponse:
     latency_ms: int
     timestamp: str
     usage: Dict[str, int] = field(default_factory=dict)
+    streamed: bool = False
+    aborted: bool = False
 
 
 # ============================================================================
@@ -547,9 +564,17 @@ class OpenCodeClient:
     # CALL INTERFACE
     # ========================================================================
 
-    def call(self, request: LLMCall) -> LLMResponse:
+    def call(self, request: LLMCall, on_delta: Optional[DeltaCallback] = None) -> LLMResponse:
         """
         Make an LLM call with automatic fallback support.
+
+        With on_delta, OpenRouter and Zen (Anthropic-style) REST calls are
+        streamed and each text delta is passed to on_delta as it arrives; a
+        truthy return closes the stream and the response comes back with
+        aborted=True. Routes that cannot stream deliver the whole content
+        as a single delta once it has arrived; nothing is cut short there, so
+        aborted stays False. Fallback models are only tried while nothing has
+        been delivered.
         """
         # 1. Determine Primary Model
         primary_model = request.model
@@ -599,7 +624,14 @@ class OpenCodeClient:
                 print(f"  [TRACE] Attempt {i + 1}/{len(attempts)}: {model} {phase}")
 
             try:
-                return self._execute_attempt(model, request, provider=attempt.get("provider"))
+                response = self._execute_attempt(
+                    model, request, provider=attempt.get("provider"), on_delta=on_delta
+                )
+                if on_delta is not None and not response.streamed and response.content:
+                    on_delta(response.content)
+                return response
+            except OpenCodeStreamError:
+                raise
             except Exception as e:
                 # Log warning but continue
                 print(f"  [WARNING] Call to {model} failed: {e}")
@@ -610,7 +642,11 @@ class OpenCodeClient:
         raise last_error or OpenCodeError("All execution attempts failed")
 
     def _execute_attempt(
-        self, model: str, request: LLMCall, provider: Optional[str] = None
+        self,
+        model: str,
+        request: LLMCall,
+        provider: Optional[str] = None,
+        on_delta: Optional[DeltaCallback] = None,
     ) -> LLMResponse:
         """Execute a single LLM attempt with specific model and dynamic key swapping."""
         # Deterministic call_id: content-addressable from model + prompt
@@ -726,25 +762,36 @@ class OpenCodeClient:
                     messages.append({"role": "system", "content": request.system_prompt})
                 messages.append({"role": "user", "content": request.prompt})
 
-                payload = {
+                payload: Dict[str, Any] = {
                     "model": api_model,
                     "messages": messages,
                 }
+                if on_delta is not None:
+                    payload["stream"] = True
+                    payload["stream_options"] = {"include_usage": True}
 
                 try:
                     import requests
 
                     response = requests.post(
-                        or_url, headers=headers, json=payload, timeout=self.timeout
+                        or_url,
+                        headers=headers,
+                        json=payload,
+                        timeout=self.timeout,
+                        stream=on_delta is not None,
                     )
 
                     if response.status_code == 200:
-                        data = response.json()
-                        text = ""
-                        for choice in data.get("choices", []):
-                            delta = choice.get("message", {}).get("content", "")
-                            if delta:
-                                text += delta
+                        aborted = False
+                        if on_delta is not None:
+                            text, data, aborted = self._consume_stream(response, on_delta, "openai")
+                        else:
+                            data = response.json()
+                            text = ""
+                            for choice in data.get("choices", []):
+                                delta = choice.get("message", {}).get("content", "")
+                                if delta:
+                                    text += delta
 
                         llm_response = LLMResponse(
                             call_id=call_id,
@@ -753,6 +800,8 @@ class OpenCodeClient:
                             latency_ms=int((time.time() - start_time) * 1000),
                             timestamp=datetime.now().isoformat(),  # AUDIT-ONLY: wall-clock metadata
                             usage=_normalize_usage(data.get("usage")),
+                            streamed=on_delta is not None,
+                            aborted=aborted,
                         )
 
                         # Log the call
@@ -766,6 +815,8 @@ class OpenCodeClient:
                             response.status_code,
                             response.text[:200],
                         )
+                except OpenCodeStreamError:
+                    raise
                 except Exception as e:
                     import traceback
 
@@ -885,6 +936,8 @@ class OpenCodeClient:
                     }
                     if request.system_prompt:
                         payload["system"] = request.system_prompt
+                    if on_delta is not None:
+                        payload["stream"] = True
 
                     try:
                         import requests
@@ -895,15 +948,25 @@ class OpenCodeClient:
                             zen_url = zen_url.rstrip("/") + "/messages"
 
                         response = requests.post(
-                            zen_url, headers=headers, json=payload, timeout=self.timeout
+                            zen_url,
+                            headers=headers,
+                            json=payload,
+                            timeout=self.timeout,
+                            stream=on_delta is not None,
                         )
 
                         if response.status_code == 200:
-                            data = response.json()
-                            text = ""
-                            for content_part in data.get("content", []):
-                                if content_part.get("type") == "text":
-                                    text += content_part.get("text")
+                            aborted = False
+                            if on_delta is not None:
+                                text, data, aborted = self._consume_stream(
+                                    response, on_delta, "anthropic"
+                                )
+                            else:
+                                data = response.json()
+                                text = ""
+                                for content_part in data.get("content", []):
+                                    if content_part.get("type") == "text":
+                                        text += content_part.get("text")
 
                             llm_response = LLMResponse(
                                 call_id=call_id,
@@ -913,6 +976,8 @@ class OpenCodeClient:
                                 # AUDIT-ONLY: wall-clock metadata
                                 timestamp=datetime.now().isoformat(),
                                 usage=_normalize_usage(data.get("usage")),
+                                streamed=on_delta is not None,
+                                aborted=aborted,
                             )
 
                             # Log the call
@@ -926,6 +991,8 @@ class OpenCodeClient:
                                 response.status_code,
                                 response.text[:200],
                             )
+                    except OpenCodeStreamError:
+                        raise
                     except Exception as e:
                         import traceback
 
@@ -987,7 +1054,7 @@ class OpenCodeClient:
             latency_ms = int((time.time() - start_time) * 1000)
             timestamp = datetime.utcnow().isoformat() + "Z"
 
-            response = LLMResponse(
+            llm_response = LLMResponse(
                 call_id=call_id,
                 content=content,
                 model_used=model,
@@ -998,9 +1065,9 @@ class OpenCodeClient:
 
             # Log the call
             if self.log_calls:
-                self._log_call(request, response)
+                self._log_call(request, llm_response)
 
-            return response
+            return llm_response
         except subprocess.TimeoutExpired as e:
             raise OpenCodeTimeoutError(f"opencode run timed out after {self.timeout}s") from e
         except Exception as e:
@@ -1008,6 +1075,75 @@ class OpenCodeClient:
                 raise
             raise OpenCodeError(f"Failed to execute opencode run: {e}") from e
 
+    # ========================================================================
+    # STREAMING
+    # ========================================================================
+
+    @staticmethod
+    def _consume_stream(
+        response: Any, on_delta: DeltaCallback, dialect: str
+    ) -> tuple[str, Dict[str, Any], bool]:
+        """
+        Read an SSE response, passing text deltas to on_delta.
+
+        dialect is "openai" (choices[].delta.content, usage on the final
+        chunk) or "anthropic" (content_block_delta events, usage split over
+        message_start and message_delta). Returns (text, data, aborted),
+        where data carries whatever "model" and "usage" the stream reported
+        before it ended or was stopped. The connection is always closed.
+        """
+        parts: list[str] = []
+        usage: Dict[str, Any] = {}
+        data: Dict[str, Any] = {}
+        aborted = False
+        try:
+            for _event, raw in iter_sse_events(response.iter_lines()):
+                if raw == "[DONE]":
+                    break
+                chunk = json.loads(raw)
+                deltas = []
+                if dialect == "openai":
+                    if chunk.get("model"):
+                        data["model"] = chunk["model"]
+                    usage.update(chunk.get("usage") or {})
+                    for choice in chunk.get("choices") or []:
+                        deltas.append((choice.get("delta") or {}).get("content") or "")
+                else:
+                    kind = chunk.get("type")
+                    if kind == "message_start":
+                        message = chunk.get("message") or {}
+                        if message.get("model"):
+                            data["model"] = message["model"]
+                        usage.update(message.get("usage") or {})
+                    elif kind == "message_delta":
+                        usage.update(chunk.get("usage") or {})
+                    elif kind == "content_block_delta":
+                        delta = chunk.get("delta") or {}
+                        if delta.get("type") == "text_delta":
+                            deltas.append(delta.get("text") or "")
+                    elif kind == "message_stop":
+                        break
+                    elif kind == "error":
+                        raise OpenCodeError(f"Stream error: {chunk.get('error')}")
+                for text in deltas:
+                    if not text:
+                        continue
+                    parts.append(text)
+                    if on_delta(text):
+                        aborted = True
+                        break
+                if aborted:
+                    break
+        except Exception as e:
+            if parts:
+                raise OpenCodeStreamError(f"Stream failed after partial output: {e}") from e
+            raise
+        finally:
+            response.close()
+        if usage:
+            data["usage"] = usage
+        return "".join(parts), data, aborted
+
     # ========================================================================
     # LOGGING
     # ========================================================================
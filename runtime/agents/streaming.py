@@ -0,0 +1,332 @@
+"""
+Streaming support for agent calls.
+
+Two pieces:
+
+- iter_sse_events() turns the raw lines of a text/event-stream body into
+  (event, data) pairs, as sent by OpenAI-compatible (OpenRouter) and
+  Anthropic-style (Zen) endpoints when a request sets "stream": true.
+- EnvelopeDetector consumes text deltas and recognises the response
+  envelope (bare YAML, a JSON object, or either inside a ```yaml/```json
+  fence) incrementally. It reports a decision as soon as every required
+  top-level field has been seen complete ("complete"), or as soon as the
+  output cannot become a valid envelope ("invalid"), so a caller can stop
+  reading the stream instead of waiting for the model to finish.
+
+A top-level field counts as complete once the next top-level field starts
+or the envelope closes; only completed fields are parsed and checked, so a
+half-streamed value is never judged.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from runtime.util import yaml_io
+
+# Same heuristic as call_agent_cli's estimated usage
+CHARS_PER_TOKEN = 4
+
+DECISION_COMPLETE = "complete"
+DECISION_INVALID = "invalid"
+
+# check_field(name, value) -> error message, or None when the value is acceptable
+FieldCheck = Callable[[str, Any], Optional[str]]
+
+_FENCE_OPEN = re.compile(r"^```(?:yaml|yml|json)?[ \t]*\r?$", re.MULTILINE)
+_YAML_KEY = re.compile(r"""^(?:"[^"]*"|'[^']*'|[^\s#\-?:'"{}\[\],&*!|>%@`][^:#]*?)\s*:(?:\s|$)""")
+
+
+def iter_sse_events(lines: Iterable[Union[str, bytes]]) -> Iterator[tuple[str, str]]:
+    """
+    Yield (event, data) pairs from server-sent event lines.
+
+    Multi-line data fields are joined with newlines; comment lines and
+    fields other than event/data are ignored. Events without data are
+    skipped. The event name defaults to "message".
+    """
+    event = ""
+    data: list[str] = []
+    for raw in lines:
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        line = line.rstrip("\r\n")
+        if not line:
+            if data:
+                yield event or "message", "\n".join(data)
+            event, data = "", []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            data.append(value)
+        elif name == "event":
+            event = value
+    if data:
+        yield event or "message", "\n".join(data)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for text a provider did not account for."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def complete_usage(usage: dict[str, int], prompt: str, content: str) -> dict[str, Any]:
+    """
+    Fill the gaps in provider-reported usage with estimates.
+
+    Aborted streams never receive the provider's final usage chunk, so the
+    output side (and, for providers that only report at the end, the input
+    side) is estimated from the text. token_source records the mix.
+    """
+    completed: dict[str, Any] = {
+        k: usage[k] for k in ("input_tokens", "output_tokens") if k in usage
+    }
+    estimated = 0
+    if "input_tokens" not in completed:
+        completed["input_tokens"] = estimate_tokens(prompt)
+        estimated += 1
+    if "output_tokens" not in completed:
+        completed["output_tokens"] = estimate_tokens(content)
+        estimated += 1
+    completed["total_tokens"] = completed["input_tokens"] + completed["output_tokens"]
+    completed["token_source"] = {0: "actual", 1: "mixed", 2: "estimated"}[estimated]
+    return completed
+
+
+@dataclass
+class EnvelopeDecision:
+    """Outcome of incremental envelope detection."""
+
+    status: str  # DECISION_COMPLETE | DECISION_INVALID
+    packet: dict[str, Any]
+    errors: list[str] = field(default_factory=list)
+    chars_consumed: int = 0
+
+
+class EnvelopeDetector:
+    """
+    Incremental YAML/JSON envelope recogniser for streamed model output.
+
+    feed() returns an EnvelopeDecision once one is reached (and None until
+    then), so a bound feed can be passed straight to call_agent's on_delta
+    to stop the stream at the first decision. finish() decides on whatever
+    has arrived when the stream ends without one.
+
+    optional_fields are waited for like required ones, but only until the
+    envelope closes: their absence is not an error, it just means reading
+    to the end of the envelope.
+    """
+
+    def __init__(
+        self,
+        required_fields: Iterable[str],
+        check_field: Optional[FieldCheck] = None,
+        optional_fields: Iterable[str] = (),
+    ):
+        self.required = frozenset(required_fields)
+        self.optional = frozenset(optional_fields) - self.required
+        self.check_field = check_field
+        self.decision: Optional[EnvelopeDecision] = None
+        self.packet: dict[str, Any] = {}
+        self._text = ""
+        self._format: Optional[str] = None  # "yaml" | "json"
+        self._fenced = False
+        self._body = 0  # offset of the envelope body in _text
+        self._scan = 0  # next offset to scan
+        # YAML: start of the most recent top-level key line
+        self._last_key: Optional[int] = None
+        # JSON scanner state
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._checked: set[str] = set()
+        self._errors: list[str] = []
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def feed(self, delta: str) -> Optional[EnvelopeDecision]:
+        if self.decision is None and delta:
+            self._text += delta
+            if self._format is None:
+                self._locate_body()
+            if self._format == "yaml":
+                self._scan_yaml()
+            elif self._format == "json":
+                self._scan_json()
+        return self.decision
+
+    def finish(self) -> EnvelopeDecision:
+        if self.decision is not None:
+            return self.decision
+        if self._format is None:
+            self._locate_body(final=True)
+        if self._format == "yaml":
+            self._scan_yaml()
+            if self.decision is None:
+                self._settle(self._parse_yaml(len(self._text)), closed=True)
+        elif self._format == "json":
+            self._scan_json()
+            if self.decision is None:
+                self._decide(DECISION_INVALID, ["JSON parse error: envelope not closed"])
+        else:
+            self._decide(DECISION_INVALID, ["no YAML or JSON envelope found"])
+        assert self.decision is not None
+        return self.decision
+
+    # ------------------------------------------------------------------
+    # Envelope location
+    # ------------------------------------------------------------------
+
+    def _locate_body(self, final: bool = False) -> None:
+        text = self._text
+        start = len(text) - len(text.lstrip())
+        if start == len(text):
+            return
+        if text.startswith("```", start):
+            newline = text.find("\n", start)
+            if newline < 0:
+                return
+            self._open_fenced(newline + 1)
+        elif text[start] == "{":
+            self._format, self._body, self._scan = "json", start, start
+        else:
+            line_end = text.find("\n", start)
+            if line_end < 0 and not final:
+                return
+            first = text[start : len(text) if line_end < 0 else line_end]
+            if first.rstrip() == "---" or _YAML_KEY.match(first) or first.startswith("- "):
+                self._format, self._body, self._scan = "yaml", start, start
+                return
+            # Prose before the envelope: wait for a fence
+            match = _FENCE_OPEN.search(text, start)
+            if match and text.find("\n", match.end()) >= 0:
+                self._open_fenced(text.index("\n", match.end()) + 1)
+
+    def _open_fenced(self, body: int) -> None:
+        rest = self._text[body:].lstrip()
+        if not rest:
+            return
+        self._fenced = True
+        if rest[0] == "{":
+            self._format = "json"
+            self._body = self._scan = len(self._text) - len(rest)
+        else:
+            self._format, self._body, self._scan = "yaml", body, body
+
+    # ------------------------------------------------------------------
+    # YAML
+    # ------------------------------------------------------------------
+
+    def _scan_yaml(self) -> None:
+        text = self._text
+        while self.decision is None:
+            line_end = text.find("\n", self._scan)
+            if line_end < 0:
+                return
+            start, self._scan = self._scan, line_end + 1
+            line = text[start:line_end].rstrip("\r")
+            if self._fenced and line.strip() == "```":
+                self._settle(self._parse_yaml(start), closed=True)
+            elif start == self._body and line.startswith("- "):
+                self._decide(DECISION_INVALID, ["Expected mapping at top level, got list"])
+            elif _YAML_KEY.match(line):
+                if self._last_key is not None:
+                    self._settle(self._parse_yaml(start), closed=False)
+                self._last_key = start
+
+    def _parse_yaml(self, end: int) -> Optional[dict[str, Any]]:
+        try:
+            parsed = yaml_io.safe_load(self._text[self._body : end])
+        except Exception as exc:
+            self._decide(DECISION_INVALID, [f"YAML parse error: {exc}"])
+            return None
+        if parsed is None:
+            parsed = {}
+        if not isinstance(parsed, dict):
+            message = f"Expected mapping at top level, got {type(parsed).__name__}"
+            self._decide(DECISION_INVALID, [message])
+            return None
+        return parsed
+
+    # ------------------------------------------------------------------
+    # JSON
+    # ------------------------------------------------------------------
+
+    def _scan_json(self) -> None:
+        text = self._text
+        i = self._scan
+        while i < len(text) and self.decision is None:
+            ch = text[i]
+            i += 1
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._settle(self._parse_json(text[self._body : i]), closed=True)
+            elif ch == "," and self._depth == 1:
+                self._settle(self._parse_json(text[self._body : i - 1] + "}"), closed=False)
+        self._scan = i
+
+    def _parse_json(self, document: str) -> Optional[dict[str, Any]]:
+        try:
+            parsed = json.loads(document)
+        except ValueError as exc:
+            self._decide(DECISION_INVALID, [f"JSON parse error: {exc}"])
+            return None
+        if not isinstance(parsed, dict):
+            message = f"Expected mapping at top level, got {type(parsed).__name__}"
+            self._decide(DECISION_INVALID, [message])
+            return None
+        return parsed
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
+    def _settle(self, packet: Optional[dict[str, Any]], closed: bool) -> None:
+        """Check fields completed since the last call; decide if possible."""
+        if packet is None:
+            return
+        self.packet = packet
+        for name in packet:
+            if name in self._checked:
+                continue
+            self._checked.add(name)
+            error = self.check_field(name, packet[name]) if self.check_field else None
+            if error:
+                self._errors.append(error)
+        if self._errors:
+            self._decide(DECISION_INVALID, list(self._errors))
+        elif self.required <= self._checked and (closed or self.optional <= self._checked):
+            self._decide(DECISION_COMPLETE, [])
+        elif closed:
+            missing = sorted(self.required - self._checked)
+            self._decide(
+                DECISION_INVALID, [f"missing required field: {name!r}" for name in missing]
+            )
+
+    def _decide(self, status: str, errors: list[str]) -> None:
+        self.decision = EnvelopeDecision(
+            status=status,
+            packet=dict(self.packet),
+            errors=errors,
+            chars_consumed=len(self._text),
+        )
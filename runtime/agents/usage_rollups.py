@@ -0,0 +1,465 @@
+"""
+Incremental usage rollups over the agent call log.
+
+UsageRollups keeps hourly, daily and monthly buckets per (role, model) in
+a small SQLite file next to the call log store (<log_dir>/rollups.sqlite3):
+call count, input/output tokens, cost, latency sum and a latency sketch.
+ingest() reads only the segment bytes appended since the last checkpoint,
+which is kept per segment as (inode, offset) and committed in the same
+transaction as the buckets it produced, so an interrupted ingest is never
+counted twice. A segment whose inode changed or that shrank below its checkpoint
+was rewritten, and the rollups are rebuilt from scratch.
+
+Reports are answered from the buckets: whole calendar months inside the
+range from the monthly rows, the remaining whole days from the daily rows
+and the partial days at either end from the hourly rows. A report reads
+the months in its range plus at most ~60 daily and 46 hourly rows per
+(role, model), however long the history. Ranges are widened to whole
+hours.
+
+The latency sketch is a log-bucketed histogram (bucket i holds latencies
+in (GAMMA**(i-1), GAMMA**i] ms), so sketches merge by adding counts and
+quantiles are within SKETCH_RELATIVE_ACCURACY of the true value.
+
+Cost is computed from each bucket's token totals with the pricing passed
+in (USD per million tokens, per model); changing the pricing recomputes
+the stored costs without reading the logs again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .call_log_store import segment_paths
+
+HOUR = 3600
+DAY = 86400
+MONTH = 31 * DAY  # calendar month; the value only labels the grain
+GAMMA = 1.04
+SKETCH_RELATIVE_ACCURACY = (GAMMA - 1) / (GAMMA + 1)
+ROLLUP_FILE = "rollups.sqlite3"
+
+# Open range bounds (bucket starts are epoch seconds)
+_MIN_START = -(2**62)
+_MAX_START = 2**62
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS rollups (
+        grain INTEGER NOT NULL,
+        start INTEGER NOT NULL,
+        role TEXT NOT NULL,
+        model TEXT NOT NULL,
+        calls INTEGER NOT NULL,
+        input_tokens INTEGER NOT NULL,
+        output_tokens INTEGER NOT NULL,
+        cost_usd REAL NOT NULL,
+        latency_ms_sum INTEGER NOT NULL,
+        latency_sketch TEXT NOT NULL,
+        PRIMARY KEY (grain, start, role, model)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        segment TEXT PRIMARY KEY,
+        inode INTEGER NOT NULL,
+        offset INTEGER NOT NULL
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+# (grain, bucket start, role, model)
+BucketKey = Tuple[int, int, str, str]
+
+
+def sketch_index(latency_ms: int) -> int:
+    """Sketch bucket of a latency (latencies up to 1 ms share bucket 0)."""
+    return math.ceil(math.log(latency_ms, GAMMA)) if latency_ms > 1 else 0
+
+
+def sketch_quantile(sketch: Mapping[int, int], q: float) -> float:
+    """Estimate the q-quantile (0..1) of the latencies counted in a sketch."""
+    total = sum(sketch.values())
+    if not total:
+        return 0.0
+    rank = q * (total - 1)
+    seen = 0
+    for index in sorted(sketch):
+        seen += sketch[index]
+        if seen > rank:
+            return 2 * GAMMA**index / (GAMMA + 1)
+    return 2 * GAMMA ** max(sketch) / (GAMMA + 1)
+
+
+class _Bucket:
+    __slots__ = ("calls", "input_tokens", "output_tokens", "latency_ms_sum", "sketch")
+
+    def __init__(self) -> None:
+        self.calls = self.input_tokens = self.output_tokens = self.latency_ms_sum = 0
+        self.sketch: Dict[int, int] = {}
+
+    def add(self, input_tokens: int, output_tokens: int, latency_ms: int) -> None:
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        self.latency_ms_sum += latency_ms
+        index = sketch_index(latency_ms)
+        self.sketch[index] = self.sketch.get(index, 0) + 1
+
+    def merge(self, other: "_Bucket") -> None:
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.latency_ms_sum += other.latency_ms_sum
+        for index, count in other.sketch.items():
+            self.sketch[index] = self.sketch.get(index, 0) + count
+
+
+@lru_cache(maxsize=4096)
+def _month_start(seconds: int) -> int:
+    """Start of the calendar month (UTC) containing an epoch second."""
+    dt = datetime.fromtimestamp(seconds, timezone.utc)
+    return int(datetime(dt.year, dt.month, 1, tzinfo=timezone.utc).timestamp())
+
+
+def _next_month(month_start: int) -> int:
+    return _month_start(month_start + MONTH)
+
+
+def _aggregate(lines: Iterable[bytes], buckets: Dict[BucketKey, _Bucket]) -> int:
+    """Fold JSONL call records into hourly, daily and monthly buckets; returns the count."""
+    count = 0
+    for line in lines:
+        record = json.loads(line)
+        seconds = int(
+            datetime.fromisoformat(record["timestamp"].replace("Z", "+00:00")).timestamp()
+        )
+        role, model = record["role"], record["model_used"]
+        input_tokens = int(record.get("input_tokens") or 0)
+        output_tokens = int(record.get("output_tokens") or 0)
+        latency_ms = int(record.get("latency_ms") or 0)
+        day = seconds - seconds % DAY
+        for grain, start in (
+            (HOUR, seconds - seconds % HOUR),
+            (DAY, day),
+            (MONTH, _month_start(day)),
+        ):
+            key = (grain, start, role, model)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = _Bucket()
+            bucket.add(input_tokens, output_tokens, latency_ms)
+        count += 1
+    return count
+
+
+def _bound(value: Optional[datetime], round_up: bool) -> Optional[int]:
+    if value is None:
+        return None
+    seconds = value.timestamp()
+    hours = math.ceil(seconds / HOUR) if round_up else math.floor(seconds / HOUR)
+    return hours * HOUR
+
+
+class UsageRollups:
+    """Hourly/daily usage buckets maintained incrementally from the call log."""
+
+    def __init__(
+        self,
+        log_dir: str | Path = "logs/agent_calls",
+        pricing: Optional[Mapping[str, Mapping[str, float]]] = None,
+        db_path: Optional[str | Path] = None,
+    ):
+        """
+        Args:
+            log_dir: Directory of the call log store (segments/ underneath).
+            pricing: model -> {"input_per_mtok": usd, "output_per_mtok": usd}.
+            db_path: Rollup database (default <log_dir>/rollups.sqlite3).
+        """
+        self.log_dir = Path(log_dir)
+        self.db_path = Path(db_path) if db_path else self.log_dir / ROLLUP_FILE
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pricing = {model: dict(prices) for model, prices in (pricing or {}).items()}
+        self._db = sqlite3.connect(self.db_path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("PRAGMA busy_timeout = 30000")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._apply_pricing()
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ------------------------------------------------------------------
+    # Cost
+    # ------------------------------------------------------------------
+
+    def cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """USD for the given tokens at this instance's pricing (0.0 if unpriced)."""
+        prices = self.pricing.get(model)
+        if not prices:
+            return 0.0
+        return (
+            input_tokens * prices.get("input_per_mtok", 0.0)
+            + output_tokens * prices.get("output_per_mtok", 0.0)
+        ) / 1_000_000
+
+    def _apply_pricing(self) -> None:
+        """Recompute stored costs when the pricing differs from the one they used."""
+        fingerprint = hashlib.sha256(json.dumps(self.pricing, sort_keys=True).encode()).hexdigest()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'pricing'").fetchone()
+            if row is None or row[0] != fingerprint:
+                rows = self._db.execute(
+                    "SELECT grain, start, role, model, input_tokens, output_tokens FROM rollups"
+                ).fetchall()
+                self._db.executemany(
+                    "UPDATE rollups SET cost_usd = ? "
+                    "WHERE grain = ? AND start = ? AND role = ? AND model = ?",
+                    [(self.cost(r[3], r[4], r[5]), *r[:4]) for r in rows],
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('pricing', ?)",
+                    (fingerprint,),
+                )
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def ingest(self) -> int:
+        """
+        Fold call records appended since the last checkpoint into the buckets.
+
+        Returns the number of records ingested. Rebuilds from scratch if a
+        checkpointed segment was replaced or truncated.
+        """
+        total = 0
+        for path in segment_paths(self.log_dir):
+            ingested = self._ingest_segment(path)
+            if ingested is None:
+                return self.rebuild()
+            total += ingested
+        return total
+
+    def rebuild(self) -> int:
+        """Drop all buckets and checkpoints and ingest the whole log again."""
+        self._db.execute("BEGIN IMMEDIATE")
+        self._db.execute("DELETE FROM rollups")
+        self._db.execute("DELETE FROM checkpoints")
+        self._db.execute("COMMIT")
+        return self.ingest()
+
+    def _ingest_segment(self, path: Path) -> Optional[int]:
+        """Ingest one segment's new lines; None if its checkpoint is stale."""
+        db = self._db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            with open(path, "rb") as handle:
+                stat = os.fstat(handle.fileno())
+                row = db.execute(
+                    "SELECT inode, offset FROM checkpoints WHERE segment = ?", (path.name,)
+                ).fetchone()
+                offset = 0
+                if row is not None:
+                    inode, offset = row
+                    if inode != stat.st_ino or stat.st_size < offset:
+                        db.execute("ROLLBACK")
+                        return None
+                if stat.st_size == offset:
+                    db.execute("ROLLBACK")
+                    return 0
+                handle.seek(offset)
+                data = handle.read(stat.st_size - offset)
+            end = data.rfind(b"\n") + 1  # stop before a line still being written
+            buckets: Dict[BucketKey, _Bucket] = {}
+            count = _aggregate(data[:end].splitlines(), buckets)
+            self._merge(buckets)
+            db.execute(
+                "INSERT OR REPLACE INTO checkpoints (segment, inode, offset) VALUES (?, ?, ?)",
+                (path.name, stat.st_ino, offset + end),
+            )
+            db.execute("COMMIT")
+            return count
+        except BaseException:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            raise
+
+    def _merge(self, buckets: Dict[BucketKey, _Bucket]) -> None:
+        rows = []
+        for key, bucket in buckets.items():
+            existing = self._db.execute(
+                "SELECT calls, input_tokens, output_tokens, latency_ms_sum, latency_sketch "
+                "FROM rollups WHERE grain = ? AND start = ? AND role = ? AND model = ?",
+                key,
+            ).fetchone()
+            if existing is not None:
+                stored = _Bucket()
+                stored.calls, stored.input_tokens, stored.output_tokens = existing[:3]
+                stored.latency_ms_sum = existing[3]
+                stored.sketch = {int(i): n for i, n in json.loads(existing[4]).items()}
+                stored.merge(bucket)
+                bucket = stored
+            rows.append(
+                (
+                    *key,
+                    bucket.calls,
+                    bucket.input_tokens,
+                    bucket.output_tokens,
+                    self.cost(key[3], bucket.input_tokens, bucket.output_tokens),
+                    bucket.latency_ms_sum,
+                    json.dumps(bucket.sketch, separators=(",", ":")),
+                )
+            )
+        self._db.executemany(
+            "INSERT OR REPLACE INTO rollups (grain, start, role, model, calls, input_tokens, "
+            "output_tokens, cost_usd, latency_ms_sum, latency_sketch) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def _range_filter(self, lo: Optional[int], hi: Optional[int]) -> Tuple[str, List[int]]:
+        """
+        WHERE clause selecting [lo, hi) with as few rows as possible.
+
+        Whole calendar months come from monthly rows, the remaining whole
+        days from daily rows and the partial days at the ends from hourly rows.
+        """
+        day_lo = _MIN_START if lo is None else -(-lo // DAY) * DAY
+        day_hi = _MAX_START if hi is None else hi // DAY * DAY
+        lo = _MIN_START if lo is None else lo
+        hi = _MAX_START if hi is None else hi
+        if day_lo >= day_hi:
+            parts = [(HOUR, lo, hi)]
+        else:
+            month_lo = _MIN_START
+            if day_lo != _MIN_START:
+                month_lo = _month_start(day_lo)
+                month_lo = month_lo if month_lo == day_lo else _next_month(month_lo)
+            month_hi = _MAX_START if day_hi == _MAX_START else _month_start(day_hi)
+            if month_lo < month_hi:
+                parts = [
+                    (MONTH, month_lo, month_hi),
+                    (DAY, day_lo, month_lo),
+                    (DAY, month_hi, day_hi),
+                ]
+            else:
+                parts = [(DAY, day_lo, day_hi)]
+            parts += [(HOUR, lo, day_lo), (HOUR, day_hi, hi)]
+        parts = [part for part in parts if part[1] < part[2]]
+        clause = " OR ".join("(grain = ? AND start >= ? AND start < ?)" for _ in parts)
+        return clause, [value for part in parts for value in part]
+
+    def report(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Per (role, model) usage for calls in [since, until), widened to whole hours.
+
+        Rows carry calls, input_tokens, output_tokens, cost_usd,
+        total_latency_ms, latency_p50_ms and latency_p95_ms.
+        """
+        where, params = self._range_filter(
+            _bound(since, round_up=False), _bound(until, round_up=True)
+        )
+        sums = self._db.execute(
+            "SELECT role, model, SUM(calls), SUM(input_tokens), SUM(output_tokens), "
+            f"SUM(cost_usd), SUM(latency_ms_sum) FROM rollups WHERE {where} "
+            "GROUP BY role, model ORDER BY role, model",
+            params,
+        ).fetchall()
+        sketches: Dict[Tuple[str, str], Dict[str, int]] = {}
+        for role, model, sketch in self._db.execute(
+            f"SELECT role, model, latency_sketch FROM rollups WHERE {where}", params
+        ):
+            merged = sketches.setdefault((role, model), {})
+            for index, count in json.loads(sketch).items():
+                merged[index] = merged.get(index, 0) + count
+
+        rows = []
+        for role, model, calls, tin, tout, cost, latency in sums:
+            bucket = _Bucket()
+            bucket.calls, bucket.input_tokens, bucket.output_tokens = calls, tin, tout
+            bucket.latency_ms_sum = latency
+            bucket.sketch = {int(i): n for i, n in sketches.get((role, model), {}).items()}
+            rows.append(_report_row(role, model, bucket, cost))
+        return rows
+
+    def check(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Compare report() against a full rescan of the log; returns mismatches.
+
+        Only meaningful once ingest() has caught up, and while every
+        ingested segment is still on disk.
+        """
+        lo, hi = _bound(since, round_up=False), _bound(until, round_up=True)
+        buckets: Dict[BucketKey, _Bucket] = {}
+        for path in segment_paths(self.log_dir):
+            with open(path, "rb") as handle:
+                data = handle.read()
+            _aggregate(data[: data.rfind(b"\n") + 1].splitlines(), buckets)
+        totals: Dict[Tuple[str, str], _Bucket] = {}
+        for (grain, start, role, model), bucket in buckets.items():
+            if grain == HOUR and (lo is None or start >= lo) and (hi is None or start < hi):
+                totals.setdefault((role, model), _Bucket()).merge(bucket)
+        expected = {
+            key: _report_row(
+                *key, bucket, self.cost(key[1], bucket.input_tokens, bucket.output_tokens)
+            )
+            for key, bucket in totals.items()
+        }
+        actual = {(row["role"], row["model"]): row for row in self.report(since, until)}
+
+        mismatches = []
+        for key in sorted(set(expected) | set(actual)):
+            want, got = expected.get(key), actual.get(key)
+            if want is None or got is None:
+                mismatches.append(f"{key[0]} -> {key[1]}: rescan={want} rollup={got}")
+                continue
+            for name, value in want.items():
+                equal = (
+                    math.isclose(value, got[name], rel_tol=1e-9, abs_tol=1e-9)
+                    if isinstance(value, float)
+                    else value == got[name]
+                )
+                if not equal:
+                    mismatches.append(
+                        f"{key[0]} -> {key[1]}: {name} rescan={value} rollup={got[name]}"
+                    )
+        return mismatches
+
+
+def _report_row(role: str, model: str, bucket: _Bucket, cost_usd: float) -> Dict[str, Any]:
+    return {
+        "role": role,
+        "model": model,
+        "calls": bucket.calls,
+        "input_tokens": bucket.input_tokens,
+        "output_tokens": bucket.output_tokens,
+        "cost_usd": cost_usd,
+        "total_latency_ms": bucket.latency_ms_sum,
+        "latency_p50_ms": sketch_quantile(bucket.sketch, 0.5),
+        "latency_p95_ms": sketch_quantile(bucket.sketch, 0.95),
+    }
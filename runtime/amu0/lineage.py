@@ -1,16 +1,33 @@
 """
 FP-4.x CND-2: Hash-Chained AMU₀ Lineage
 Linear hash chain for AMU₀ entries with parent references.
+
+Storage is an append-only JSONL log at lineage_path: a header line, one
+record per entry, and every CHECKPOINT_INTERVAL entries a checkpoint
+record holding (entries, offset, running_hash). The running hash folds in
+each entry_hash, so a checkpoint pins the whole prefix before it.
+
+Side files, both rebuildable from the log:
+  <lineage_path>.idx       JSONL of [entry_id, offset, running_hash]
+  <lineage_path>.verified  last checkpoint verify_chain() accepted
+
+Legacy single-document JSON lineages are migrated on open; the original
+is kept as <lineage_path>.legacy.json.
 """
 
+import hashlib
 import json
+import os
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from runtime.governance.HASH_POLICY_v1 import hash_json
 from runtime.util.atomic_write import atomic_write_json
 
+LINEAGE_FORMAT = "amu0-lineage-jsonl/v2"
+CHECKPOINT_INTERVAL = 1000
+
 
 class LineageError(Exception):
     """Raised when lineage operations fail."""
@@ -61,42 +78,205 @@ def compute_entry_hash(entry_data: dict, parent_hash: Optional[str]) -> str:
     return hash_json(hash_input)
 
 
+def _running_hash(previous: str, entry_hash: str) -> str:
+    return hashlib.sha256((previous + entry_hash).encode("utf-8")).hexdigest()
+
+
+def _record_line(record: Dict[str, Any]) -> bytes:
+    # "type" stays the first key so readers can classify lines by prefix
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _entry_data(entry: LineageEntry) -> dict:
+    return {
+        "entry_id": entry.entry_id,
+        "timestamp": entry.timestamp,
+        "artefact_hash": entry.artefact_hash,
+        "attestation": entry.attestation,
+        "state_delta": entry.state_delta,
+    }
+
+
 class AMU0Lineage:
     """
     Hash-chained AMU₀ lineage manager.
 
     Maintains a strictly linear hash chain where each entry
-    references its parent via parent_hash.
+    references its parent via parent_hash. Appends write one line;
+    lookups by id seek straight to the record via the side index.
     """
 
-    def __init__(self, lineage_path: str):
+    def __init__(self, lineage_path: str, checkpoint_interval: int = CHECKPOINT_INTERVAL):
         """
         Initialize lineage manager.
 
         Args:
-            lineage_path: Path to the lineage JSON file.
+            lineage_path: Path to the lineage log (legacy JSON is migrated).
+            checkpoint_interval: Entries between checkpoint records.
         """
         self.lineage_path = Path(lineage_path)
-        self._entries: List[LineageEntry] = []
+        self.index_path = Path(f"{lineage_path}.idx")
+        self.verified_path = Path(f"{lineage_path}.verified")
+        self.checkpoint_interval = checkpoint_interval
+        self._offsets: Dict[str, int] = {}
+        self._count = 0
+        self._running = ""
+        self._last: Optional[LineageEntry] = None
+        self._last_offset: Optional[int] = None
 
         if self.lineage_path.exists():
             self._load()
 
-    def _load(self) -> None:
-        """Load existing lineage from file."""
+    # ---- storage ---------------------------------------------------------
+
+    def _header(self) -> Dict[str, Any]:
+        return {"type": "header", "format": LINEAGE_FORMAT}
+
+    def _is_legacy(self) -> bool:
+        with open(self.lineage_path, "rb") as f:
+            first = f.readline()
+        if not first.strip():
+            return False
+        try:
+            return json.loads(first).get("type") != "header"
+        except ValueError:
+            return True  # multi-line legacy JSON document
+
+    def _migrate_legacy(self) -> None:
+        """Rewrites a legacy {"entries": [...]} file as a segment log, hashes untouched."""
         with open(self.lineage_path, "r") as f:
             data = json.load(f)
+        entries = [LineageEntry.from_dict(e) for e in data.get("entries", [])]
+
+        tmp_path = Path(f"{self.lineage_path}.migrating")
+        with open(tmp_path, "wb") as f:
+            f.write(_record_line(self._header()))
+            running = ""
+            for count, entry in enumerate(entries, start=1):
+                f.write(_record_line({"type": "entry", **entry.to_dict()}))
+                running = _running_hash(running, entry.entry_hash)
+                if count % self.checkpoint_interval == 0:
+                    f.write(self._checkpoint_line(count, f.tell(), running, entry.entry_hash))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.lineage_path, f"{self.lineage_path}.legacy.json")
+        os.replace(tmp_path, self.lineage_path)
+        self.index_path.unlink(missing_ok=True)
+        self.verified_path.unlink(missing_ok=True)
+
+    def _checkpoint_line(
+        self, entries: int, offset: int, running: str, last_entry_hash: str
+    ) -> bytes:
+        return _record_line(
+            {
+                "type": "checkpoint",
+                "entries": entries,
+                "offset": offset,
+                "running_hash": running,
+                "last_entry_hash": last_entry_hash,
+            }
+        )
 
-        self._entries = [LineageEntry.from_dict(e) for e in data.get("entries", [])]
+    def _iter_records(self, start: int = 0) -> Iterator[Tuple[int, Optional[dict]]]:
+        """(offset, record) for each complete line from start; record None if unreadable."""
+        with open(self.lineage_path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                yield offset, record
+                offset += len(line)
+
+    def _read_record(self, offset: int) -> Optional[dict]:
+        with open(self.lineage_path, "rb") as f:
+            f.seek(offset)
+            line = f.readline()
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
 
-    def _save(self) -> None:
-        """Save lineage to file atomically."""
-        data = {"version": "1.0", "entries": [e.to_dict() for e in self._entries]}
-        atomic_write_json(self.lineage_path, data)
+    def _load(self) -> None:
+        """Open the log: migrate legacy files, drop a torn tail, load and catch up the index."""
+        if self._is_legacy():
+            self._migrate_legacy()
+
+        size = self.lineage_path.stat().st_size
+        with open(self.lineage_path, "rb+") as f:
+            if size == 0:
+                f.write(_record_line(self._header()))
+            else:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    # Unacknowledged partial append from a crash
+                    f.seek(0)
+                    data = f.read()
+                    f.truncate(data.rfind(b"\n") + 1)
+
+        resume = self._load_index()
+        with open(self.index_path, "ab") as idx:
+            for offset, record in self._iter_records(resume):
+                if record and record.get("type") == "entry":
+                    idx.write(self._index_entry(record, offset))
+
+    def _load_index(self) -> int:
+        """Loads the side index; returns the log offset to scan from for unindexed entries."""
+        rows = []
+        good = 0
+        if self.index_path.exists():
+            with open(self.index_path, "rb") as f:
+                for line in f:
+                    try:
+                        entry_id, offset, running = json.loads(line)
+                    except ValueError:
+                        break
+                    rows.append((entry_id, offset, running))
+                    good += len(line)
+
+        last = self._read_record(rows[-1][1]) if rows else None
+        if rows and (not last or last.get("entry_id") != rows[-1][0]):
+            rows, good = [], 0  # index does not describe this log; rebuild
+        with open(self.index_path, "ab") as f:
+            f.truncate(good)
+
+        for entry_id, offset, _ in rows:
+            self._offsets.setdefault(entry_id, offset)
+        self._count = len(rows)
+        if not rows or last is None:
+            header = self._read_record(0) or {}
+            if header.get("format") != LINEAGE_FORMAT:
+                raise LineageError(f"Unsupported lineage format: {header.get('format')}")
+            return 0
+        self._running = rows[-1][2]
+        self._last_offset = rows[-1][1]
+        self._last = self._entry_from_record(last)
+        return self._last_offset
+
+    def _index_entry(self, record: dict, offset: int) -> bytes:
+        """Registers an entry record in memory; returns its side-index line."""
+        if offset == self._last_offset:
+            return b""
+        entry = self._entry_from_record(record)
+        self._running = _running_hash(self._running, entry.entry_hash)
+        self._count += 1
+        self._offsets.setdefault(entry.entry_id, offset)
+        self._last, self._last_offset = entry, offset
+        return (json.dumps([entry.entry_id, offset, self._running]) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _entry_from_record(record: dict) -> LineageEntry:
+        return LineageEntry.from_dict({k: v for k, v in record.items() if k != "type"})
+
+    # ---- public API ------------------------------------------------------
 
     def get_last_entry(self) -> Optional[LineageEntry]:
         """Get the most recent entry in the chain."""
-        return self._entries[-1] if self._entries else None
+        return self._last
 
     def get_last_hash(self) -> Optional[str]:
         """Get the hash of the most recent entry."""
@@ -110,6 +290,7 @@ class AMU0Lineage:
         artefact_hash: str,
         attestation: Dict[str, Any],
         state_delta: Optional[Dict[str, Any]] = None,
+        fsync: bool = True,
     ) -> LineageEntry:
         """
         Append a new entry to the lineage chain.
@@ -120,6 +301,7 @@ class AMU0Lineage:
             artefact_hash: Hash of the artefact being recorded.
             attestation: Attestation data (e.g., HumanAttestation).
             state_delta: Optional state changes.
+            fsync: Flush the log to disk before returning.
 
         Returns:
             The newly created LineageEntry.
@@ -146,22 +328,95 @@ class AMU0Lineage:
             entry_hash=entry_hash,
         )
 
-        self._entries.append(entry)
-        self._save()
+        if not self.lineage_path.exists():
+            self.lineage_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lineage_path, "wb") as f:
+                f.write(_record_line(self._header()))
+
+        record = {"type": "entry", **entry.to_dict()}
+        with open(self.lineage_path, "ab") as f:
+            offset = f.tell()
+            line = _record_line(record)
+            index_line = self._index_entry(record, offset)
+            if self._count % self.checkpoint_interval == 0:
+                line += self._checkpoint_line(
+                    self._count, offset + len(line), self._running, entry_hash
+                )
+            f.write(line)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        with open(self.index_path, "ab") as idx:
+            idx.write(index_line)
 
         return entry
 
-    def verify_chain(self) -> tuple[bool, List[str]]:
+    def _load_verified(self) -> Optional[Dict[str, Any]]:
+        """The last accepted checkpoint, if it still matches the log."""
+        if not self.verified_path.exists():
+            return None
+        try:
+            with open(self.verified_path, "r") as f:
+                state = json.load(f)
+        except ValueError:
+            return None
+        record = self._read_record(state.get("checkpoint_offset", -1)) if state else None
+        if not record or any(
+            record.get(k) != state.get(k)
+            for k in ("type", "entries", "offset", "running_hash", "last_entry_hash")
+        ):
+            return None
+        return state
+
+    def verify_chain(self, full: bool = False) -> tuple[bool, List[str]]:
         """
-        Verify the entire lineage chain integrity.
+        Verify the lineage chain integrity.
+
+        Starts after the last checkpoint a previous verification accepted
+        (if it still matches the log) unless full=True, which rehashes
+        every entry.
 
         Returns:
             Tuple of (is_valid, list of error messages).
         """
-        errors = []
-
-        for i, entry in enumerate(self._entries):
-            expected_parent = self._entries[i - 1].entry_hash if i > 0 else None
+        errors: List[str] = []
+        if not self.lineage_path.exists():
+            return (True, errors)
+
+        state = None if full else self._load_verified()
+        if state:
+            start, count = state["offset"], state["entries"]
+            running, expected_parent = state["running_hash"], state["last_entry_hash"]
+        else:
+            start, count, running, expected_parent = 0, 0, "", None
+        accepted = None
+
+        for offset, record in self._iter_records(start):
+            if not isinstance(record, dict):
+                errors.append(f"Record at offset {offset}: unreadable or unknown record")
+                continue
+            kind = record.get("type")
+            if kind == "header" and offset == 0:
+                continue
+            if kind == "checkpoint":
+                for key, have in (
+                    ("entries", count),
+                    ("offset", offset),
+                    ("running_hash", running),
+                ):
+                    if record.get(key) != have:
+                        errors.append(
+                            f"Checkpoint at offset {offset}: {key} mismatch. "
+                            f"Expected {have}, got {record.get(key)}"
+                        )
+                if not errors:
+                    accepted = {**record, "checkpoint_offset": offset}
+                continue
+            if kind != "entry":
+                errors.append(f"Record at offset {offset}: unreadable or unknown record")
+                continue
+
+            entry = self._entry_from_record(record)
 
             # Verify parent_hash matches previous entry
             if entry.parent_hash != expected_parent:
@@ -171,14 +426,7 @@ class AMU0Lineage:
                 )
 
             # Recompute and verify entry_hash
-            entry_data = {
-                "entry_id": entry.entry_id,
-                "timestamp": entry.timestamp,
-                "artefact_hash": entry.artefact_hash,
-                "attestation": entry.attestation,
-                "state_delta": entry.state_delta,
-            }
-            expected_hash = compute_entry_hash(entry_data, entry.parent_hash)
+            expected_hash = compute_entry_hash(_entry_data(entry), entry.parent_hash)
 
             if entry.entry_hash != expected_hash:
                 errors.append(
@@ -186,15 +434,31 @@ class AMU0Lineage:
                     f"Expected {expected_hash}, got {entry.entry_hash}"
                 )
 
+            count += 1
+            running = _running_hash(running, entry.entry_hash)
+            expected_parent = entry.entry_hash
+
+        if accepted and not errors:
+            atomic_write_json(self.verified_path, accepted)
         return (len(errors) == 0, errors)
 
     def get_entries(self) -> List[LineageEntry]:
         """Get all entries in the lineage."""
-        return self._entries.copy()
+        if not self.lineage_path.exists():
+            return []
+        return [
+            self._entry_from_record(record)
+            for _, record in self._iter_records()
+            if record and record.get("type") == "entry"
+        ]
 
     def get_entry_by_id(self, entry_id: str) -> Optional[LineageEntry]:
-        """Find an entry by its ID."""
-        for entry in self._entries:
-            if entry.entry_id == entry_id:
-                return entry
-        return None
+        """Find an entry by its ID (first occurrence) via the side index."""
+        offset = self._offsets.get(entry_id)
+        if offset is None:
+            return None
+        record = self._read_record(offset)
+        return self._entry_from_record(record) if record else None
+
+    def __len__(self) -> int:
+        return self._count
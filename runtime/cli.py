@@ -1,19 +1,52 @@
+from __future__ import annotations
+
 import argparse
+import importlib
 import json
+import os
 import subprocess
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
 
 from runtime.config import detect_repo_root, load_config
-from runtime.orchestration.ceo_queue import CEOQueue
-from runtime.orchestration.dispatch.engine import DispatchEngine
-from runtime.orchestration.orchestrator import OrchestrationResult, ValidationOrchestrator
 from runtime.util.canonical import canonical_json_str as _canonical_json
-from runtime.validation.core import JobSpec
-from runtime.validation.evidence import compute_manifest
-from runtime.validation.reporting import sha256_file
+
+if TYPE_CHECKING:
+    from runtime.orchestration.orchestrator import OrchestrationResult
+    from runtime.validation.core import JobSpec
+
+# Heavy collaborators are resolved on first use so that `--help` and light
+# subcommands do not pay for the orchestration import graph. They remain
+# attributes of this module (PEP 562), so `patch("runtime.cli.X")` still works.
+_LAZY_IMPORTS: Dict[str, tuple[str, str]] = {
+    "CEOQueue": ("runtime.orchestration.ceo_queue", "CEOQueue"),
+    "DispatchEngine": ("runtime.orchestration.dispatch.engine", "DispatchEngine"),
+    "ValidationOrchestrator": ("runtime.orchestration.orchestrator", "ValidationOrchestrator"),
+    "compute_manifest": ("runtime.validation.evidence", "compute_manifest"),
+    "sha256_file": ("runtime.validation.reporting", "sha256_file"),
+}
+
+
+# Warm mode: when set, commands are forwarded to `lifeos serve` on this socket
+WARM_SOCKET_ENV = "LIFEOS_WARM_SOCKET"
+DEFAULT_WARM_SOCKET = "artifacts/cli/warm.sock"
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(target[0]), target[1])
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    """Resolve a lazily imported collaborator (honours test patches)."""
+    value = globals().get(name)
+    return value if value is not None else __getattr__(name)
 
 
 def cmd_status(
@@ -348,7 +381,7 @@ def _write_mission_attempt_evidence(
         + "\n",
         encoding="utf-8",
     )
-    compute_manifest(evidence_root)
+    _lazy("compute_manifest")(evidence_root)
 
 
 def _verify_acceptance_proof(
@@ -401,7 +434,7 @@ def _verify_acceptance_proof(
     if record_token_path.resolve() != token_path.resolve():
         return proof, "Acceptance record token_path does not match orchestrator token path"
 
-    token_sha = sha256_file(token_path)
+    token_sha = _lazy("sha256_file")(token_path)
     if token_sha != record["acceptance_token_sha256"]:
         return proof, "Acceptance token sha256 mismatch"
 
@@ -409,7 +442,7 @@ def _verify_acceptance_proof(
     if not manifest_path.exists():
         return proof, f"Acceptance record manifest_path missing on disk: {manifest_path}"
 
-    manifest_sha = sha256_file(manifest_path)
+    manifest_sha = _lazy("sha256_file")(manifest_path)
     if manifest_sha != record["evidence_manifest_sha256"]:
         return proof, "Evidence manifest sha256 mismatch"
 
@@ -502,7 +535,7 @@ def _run_mission_with_acceptance(
             )
 
     try:
-        orchestration = ValidationOrchestrator(workspace_root=repo_root).run(
+        orchestration = _lazy("ValidationOrchestrator")(workspace_root=repo_root).run(
             mission_kind=mission_type,
             evidence_tier="light",
             agent_runner=_agent_runner,
@@ -820,9 +853,13 @@ def cmd_run_mission(args: argparse.Namespace, repo_root: Path) -> int:
     )
 
 
+def _open_ceo_queue(repo_root: Path) -> Any:
+    return _lazy("CEOQueue")(db_path=repo_root / "artifacts" / "queue" / "escalations.db")
+
+
 def cmd_queue_list(args: argparse.Namespace, repo_root: Path) -> int:
     """List pending escalations in JSON format."""
-    queue = CEOQueue(db_path=repo_root / "artifacts" / "queue" / "escalations.db")
+    queue = _open_ceo_queue(repo_root)
     pending = queue.get_pending()
 
     output = [
@@ -842,7 +879,7 @@ def cmd_queue_list(args: argparse.Namespace, repo_root: Path) -> int:
 
 def cmd_queue_show(args: argparse.Namespace, repo_root: Path) -> int:
     """Show full details of an escalation."""
-    queue = CEOQueue(db_path=repo_root / "artifacts" / "queue" / "escalations.db")
+    queue = _open_ceo_queue(repo_root)
     entry = queue.get_by_id(args.escalation_id)
 
     if entry is None:
@@ -867,7 +904,7 @@ def cmd_queue_show(args: argparse.Namespace, repo_root: Path) -> int:
 
 def cmd_queue_approve(args: argparse.Namespace, repo_root: Path) -> int:
     """Approve an escalation."""
-    queue = CEOQueue(db_path=repo_root / "artifacts" / "queue" / "escalations.db")
+    queue = _open_ceo_queue(repo_root)
     note = args.note if hasattr(args, "note") and args.note else "Approved via CLI"
 
     result = queue.approve(args.escalation_id, note=note, resolver="CEO")
@@ -882,7 +919,7 @@ def cmd_queue_approve(args: argparse.Namespace, repo_root: Path) -> int:
 
 def cmd_queue_reject(args: argparse.Namespace, repo_root: Path) -> int:
     """Reject an escalation with reason."""
-    queue = CEOQueue(db_path=repo_root / "artifacts" / "queue" / "escalations.db")
+    queue = _open_ceo_queue(repo_root)
 
     if not args.reason:
         print("Error: --reason is required for rejection")
@@ -898,6 +935,14 @@ def cmd_queue_reject(args: argparse.Namespace, repo_root: Path) -> int:
     return 0
 
 
+def cmd_queue_sweep_timeouts(args: argparse.Namespace, repo_root: Path) -> int:
+    """Time out every pending escalation older than --hours in one transaction."""
+    queue = _open_ceo_queue(repo_root)
+    timed_out = queue.mark_timeouts(older_than=timedelta(hours=args.hours))
+    print(json.dumps({"timed_out": timed_out}, indent=2))
+    return 0
+
+
 def cmd_dispatch_submit(args: argparse.Namespace, repo_root: Path) -> int:
     """
     Submit an ExecutionOrder YAML to the Dispatch Engine and execute it.
@@ -912,7 +957,7 @@ def cmd_dispatch_submit(args: argparse.Namespace, repo_root: Path) -> int:
         print(f"Error: Order file not found: {order_path}", file=sys.stderr)
         return 1
 
-    engine = DispatchEngine(repo_root=repo_root)
+    engine = _lazy("DispatchEngine")(repo_root=repo_root)
     engine.recover_crashed_runs()
 
     try:
@@ -943,7 +988,7 @@ def cmd_dispatch_submit(args: argparse.Namespace, repo_root: Path) -> int:
 
 def cmd_dispatch_status(args: argparse.Namespace, repo_root: Path) -> int:
     """Show Dispatch Engine inbox/active/completed counts."""
-    engine = DispatchEngine(repo_root=repo_root)
+    engine = _lazy("DispatchEngine")(repo_root=repo_root)
     status = engine.status()
 
     if args.json:
@@ -1122,7 +1167,115 @@ def cmd_spine_resume(args: argparse.Namespace, repo_root: Path) -> int:
         return 1
 
 
-def main() -> int:
+# =============================================================================
+# Lazy subcommand registry
+# =============================================================================
+
+# Subcommand path -> (implementation "module:function", calling convention).
+# Implementation modules are imported only when their subcommand is invoked.
+#   "config": handler(args, repo_root, config, config_path)
+#   "args":   handler(args)
+#   "repo":   handler(args, repo_root)
+_COO_COMMANDS = "runtime.orchestration.coo.commands"
+SUBCOMMANDS: Dict[tuple[str, ...], tuple[str, str]] = {
+    ("status",): ("runtime.cli:cmd_status", "config"),
+    ("config", "validate"): ("runtime.cli:cmd_config_validate", "config"),
+    ("config", "show"): ("runtime.cli:cmd_config_show", "config"),
+    ("mission", "list"): ("runtime.cli:cmd_mission_list", "args"),
+    ("mission", "run"): ("runtime.cli:cmd_mission_run", "repo"),
+    ("queue", "list"): ("runtime.cli:cmd_queue_list", "repo"),
+    ("queue", "show"): ("runtime.cli:cmd_queue_show", "repo"),
+    ("queue", "approve"): ("runtime.cli:cmd_queue_approve", "repo"),
+    ("queue", "reject"): ("runtime.cli:cmd_queue_reject", "repo"),
+    ("queue", "sweep-timeouts"): ("runtime.cli:cmd_queue_sweep_timeouts", "repo"),
+    ("run-mission",): ("runtime.cli:cmd_run_mission", "repo"),
+    ("dispatch", "submit"): ("runtime.cli:cmd_dispatch_submit", "repo"),
+    ("dispatch", "status"): ("runtime.cli:cmd_dispatch_status", "repo"),
+    ("certify", "pipeline"): ("runtime.cli:cmd_certify_pipeline", "repo"),
+    ("certify", "ops"): ("runtime.cli:cmd_certify_ops", "repo"),
+    ("intent-fidelity", "check"): ("runtime.cli:cmd_intent_fidelity_check", "repo"),
+    ("coo", "status"): (f"{_COO_COMMANDS}:cmd_coo_status", "repo"),
+    ("coo", "sync-check"): (f"{_COO_COMMANDS}:cmd_coo_sync_check", "repo"),
+    ("coo", "process-closures"): (f"{_COO_COMMANDS}:cmd_coo_process_closures", "repo"),
+    ("coo", "propose"): (f"{_COO_COMMANDS}:cmd_coo_propose", "repo"),
+    ("coo", "approve"): (f"{_COO_COMMANDS}:cmd_coo_approve", "repo"),
+    ("coo", "report"): (f"{_COO_COMMANDS}:cmd_coo_report", "repo"),
+    ("coo", "direct"): (f"{_COO_COMMANDS}:cmd_coo_direct", "repo"),
+    ("coo", "chat"): (f"{_COO_COMMANDS}:cmd_coo_chat", "repo"),
+    ("coo", "reject"): (f"{_COO_COMMANDS}:cmd_coo_reject", "repo"),
+    ("coo", "telegram", "run"): (f"{_COO_COMMANDS}:cmd_coo_telegram_run", "repo"),
+    ("coo", "telegram", "status"): (f"{_COO_COMMANDS}:cmd_coo_telegram_status", "repo"),
+    ("coo", "prompt-status"): (f"{_COO_COMMANDS}:cmd_coo_prompt_status", "repo"),
+    ("coo", "ea-dispatch"): (f"{_COO_COMMANDS}:cmd_coo_ea_dispatch", "repo"),
+    ("spine", "run"): ("runtime.cli:cmd_spine_run", "repo"),
+    ("spine", "resume"): ("runtime.cli:cmd_spine_resume", "repo"),
+    ("spine", "run-openclaw-job"): ("runtime.cli:cmd_spine_run_openclaw_job", "repo"),
+    ("serve",): ("runtime.cli_warm:cmd_serve", "repo"),
+}
+
+# Never forwarded to a warm server: long-running or interactive commands need
+# live output and a terminal, which a forwarded request does not get
+WARM_NEVER_FORWARD: frozenset[tuple[str, ...]] = frozenset(
+    {
+        ("serve",),
+        ("mission", "run"),
+        ("run-mission",),
+        ("certify", "pipeline"),
+        ("certify", "ops"),
+        ("coo", "telegram", "run"),
+        ("coo", "ea-dispatch"),
+        ("spine", "run"),
+        ("spine", "resume"),
+        ("spine", "run-openclaw-job"),
+    }
+)
+
+# argparse dest holding the next path segment below a given subcommand path
+_SUBCOMMAND_DESTS: Dict[tuple[str, ...], str] = {
+    ("config",): "config_command",
+    ("mission",): "mission_cmd",
+    ("queue",): "queue_cmd",
+    ("dispatch",): "dispatch_cmd",
+    ("certify",): "certify_cmd",
+    ("intent-fidelity",): "intent_fidelity_cmd",
+    ("coo",): "coo_cmd",
+    ("coo", "telegram"): "coo_telegram_cmd",
+    ("spine",): "spine_cmd",
+}
+
+
+def _subcommand_path(args: argparse.Namespace) -> tuple[str, ...]:
+    path: tuple[str, ...] = (args.subcommand,)
+    while path in _SUBCOMMAND_DESTS:
+        segment = getattr(args, _SUBCOMMAND_DESTS[path], None)
+        if segment is None:
+            break
+        path = path + (segment,)
+    return path
+
+
+def _resolve_subcommand(
+    args: argparse.Namespace,
+) -> Callable[[argparse.Namespace, Path, dict | None], int] | None:
+    """Import and return the handler for the parsed subcommand (None if unknown)."""
+    entry = SUBCOMMANDS.get(_subcommand_path(args))
+    if entry is None:
+        return None
+    target, convention = entry
+    module_name, func_name = target.split(":")
+    if module_name == __name__:
+        func = globals()[func_name]
+    else:
+        func = getattr(importlib.import_module(module_name), func_name)
+
+    if convention == "config":
+        return lambda a, repo_root, config: func(a, repo_root, config, a.config)
+    if convention == "args":
+        return lambda a, repo_root, config: func(a)
+    return lambda a, repo_root, config: func(a, repo_root)
+
+
+def main(argv: list[str] | None = None) -> int:
     # Use a custom parser that handles global options before subcommands
     # This is achieved by defining them on the main parser.
     parser = argparse.ArgumentParser(
@@ -1177,6 +1330,14 @@ def main() -> int:
     p_queue_reject.add_argument("escalation_id", help="Escalation ID")
     p_queue_reject.add_argument("--reason", required=True, help="Rejection reason")
 
+    # queue sweep-timeouts
+    p_queue_sweep = queue_subs.add_parser(
+        "sweep-timeouts", help="Time out stale pending escalations (maintenance)"
+    )
+    p_queue_sweep.add_argument(
+        "--hours", type=float, default=24.0, help="Age after which pending escalations time out"
+    )
+
     # run-mission command
     p_run = subparsers.add_parser("run-mission", help="Run a mission from backlog")
     p_run.add_argument("--from-backlog", required=True, help="Task ID from backlog to execute")
@@ -1433,9 +1594,31 @@ def main() -> int:
     )
     p_spine_run_openclaw.add_argument("--json", action="store_true", help="Output results as JSON")
 
+    # serve (warm mode): preloaded, forking server on a Unix socket
+    p_serve = subparsers.add_parser(
+        "serve", help="Run a warm, preloaded CLI server on a Unix socket"
+    )
+    p_serve.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help=f"Socket path (default: ${WARM_SOCKET_ENV} or <repo>/{DEFAULT_WARM_SOCKET})",
+    )
+
     # Parse args
     # Note: argparse by default allows flags before subcommands
-    args = parser.parse_args()
+    argv = list(sys.argv[1:] if argv is None else argv)
+    args = parser.parse_args(argv)
+
+    # Warm mode client: forward to a running server when one is configured,
+    # falling back to in-process execution if it is unreachable
+    warm_socket = os.environ.get(WARM_SOCKET_ENV)
+    if warm_socket and _subcommand_path(args) not in WARM_NEVER_FORWARD:
+        from runtime.cli_warm import forward
+
+        forwarded = forward(Path(warm_socket), argv)
+        if forwarded is not None:
+            return forwarded
 
     try:
         # P0.2 & P0.4 - Repo root detection
@@ -1447,88 +1630,9 @@ def main() -> int:
             config = load_config(args.config)
 
         # Dispatch
-        if args.subcommand == "status":
-            return cmd_status(args, repo_root, config, args.config)
-
-        if args.subcommand == "config":
-            if args.config_command == "validate":
-                return cmd_config_validate(args, repo_root, config, args.config)
-            if args.config_command == "show":
-                return cmd_config_show(args, repo_root, config, args.config)
-
-        if args.subcommand == "mission":
-            if args.mission_cmd == "list":
-                return cmd_mission_list(args)
-            elif args.mission_cmd == "run":
-                return cmd_mission_run(args, repo_root)
-
-        if args.subcommand == "queue":
-            if args.queue_cmd == "list":
-                return cmd_queue_list(args, repo_root)
-            elif args.queue_cmd == "show":
-                return cmd_queue_show(args, repo_root)
-            elif args.queue_cmd == "approve":
-                return cmd_queue_approve(args, repo_root)
-            elif args.queue_cmd == "reject":
-                return cmd_queue_reject(args, repo_root)
-
-        if args.subcommand == "run-mission":
-            return cmd_run_mission(args, repo_root)
-
-        if args.subcommand == "dispatch":
-            if args.dispatch_cmd == "submit":
-                return cmd_dispatch_submit(args, repo_root)
-            elif args.dispatch_cmd == "status":
-                return cmd_dispatch_status(args, repo_root)
-
-        if args.subcommand == "certify":
-            if args.certify_cmd == "pipeline":
-                return cmd_certify_pipeline(args, repo_root)
-            if args.certify_cmd == "ops":
-                return cmd_certify_ops(args, repo_root)
-
-        if args.subcommand == "intent-fidelity":
-            if args.intent_fidelity_cmd == "check":
-                return cmd_intent_fidelity_check(args, repo_root)
-
-        if args.subcommand == "coo":
-            from runtime.orchestration.coo import commands as coo_commands
-
-            if args.coo_cmd == "status":
-                return coo_commands.cmd_coo_status(args, repo_root)
-            elif args.coo_cmd == "sync-check":
-                return coo_commands.cmd_coo_sync_check(args, repo_root)
-            elif args.coo_cmd == "process-closures":
-                return coo_commands.cmd_coo_process_closures(args, repo_root)
-            elif args.coo_cmd == "propose":
-                return coo_commands.cmd_coo_propose(args, repo_root)
-            elif args.coo_cmd == "approve":
-                return coo_commands.cmd_coo_approve(args, repo_root)
-            elif args.coo_cmd == "report":
-                return coo_commands.cmd_coo_report(args, repo_root)
-            elif args.coo_cmd == "direct":
-                return coo_commands.cmd_coo_direct(args, repo_root)
-            elif args.coo_cmd == "chat":
-                return coo_commands.cmd_coo_chat(args, repo_root)
-            elif args.coo_cmd == "reject":
-                return coo_commands.cmd_coo_reject(args, repo_root)
-            elif args.coo_cmd == "telegram":
-                if args.coo_telegram_cmd == "run":
-                    return coo_commands.cmd_coo_telegram_run(args, repo_root)
-                elif args.coo_telegram_cmd == "status":
-                    return coo_commands.cmd_coo_telegram_status(args, repo_root)
-            elif args.coo_cmd == "prompt-status":
-                return coo_commands.cmd_coo_prompt_status(args, repo_root)
-            elif args.coo_cmd == "ea-dispatch":
-                return coo_commands.cmd_coo_ea_dispatch(args, repo_root)
-
-        if args.subcommand == "spine":
-            if args.spine_cmd == "run":
-                return cmd_spine_run(args, repo_root)
-            elif args.spine_cmd == "resume":
-                return cmd_spine_resume(args, repo_root)
-            elif args.spine_cmd == "run-openclaw-job":
-                return cmd_spine_run_openclaw_job(args, repo_root)
+        handler = _resolve_subcommand(args)
+        if handler is not None:
+            return handler(args, repo_root, config)
 
     except Exception as e:
         print(f"Error: {e}")
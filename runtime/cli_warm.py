@@ -0,0 +1,265 @@
+"""
+Warm mode for the lifeos CLI.
+
+`lifeos serve` preloads the orchestration import graph once and listens on a
+Unix socket. Each request forks a fresh child from the preloaded parent, so
+invocations share the warm module cache but no mutable state: the child
+adopts the client's cwd, environment and argv, runs `runtime.cli.main`, and
+returns exit code plus captured stdout/stderr.
+
+Clients opt in by setting LIFEOS_WARM_SOCKET; `runtime.cli.main` then
+forwards the invocation and falls back to in-process execution when the
+server is unreachable. Output is returned only when the command finishes
+and the child has no stdin, so long-running or interactive subcommands
+(runtime.cli.WARM_NEVER_FORWARD) always run in-process.
+
+Each child runs in its own process group and is killed, along with any
+processes it started, when the client disconnects before the response.
+
+Protocol (one request per connection, UTF-8 JSON):
+    request:  {"argv": [...], "cwd": "...", "env": {...}}\\n
+    response: {"exit_code": int, "stdout": str, "stderr": str}
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Sequence
+
+# Modules imported once in the server before it starts accepting requests
+PRELOAD_MODULES: Sequence[str] = (
+    "runtime.orchestration.ceo_queue",
+    "runtime.orchestration.dispatch.engine",
+    "runtime.orchestration.orchestrator",
+    "runtime.orchestration.coo.commands",
+    "runtime.validation.evidence",
+    "runtime.validation.reporting",
+)
+
+# Bound on a single request line (argv + env); responses are unbounded
+MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+
+def preload(modules: Sequence[str] = PRELOAD_MODULES) -> list[str]:
+    """Import modules ahead of requests; returns those that failed to import."""
+    failed = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            failed.append(name)
+    # Resolve runtime.cli's lazy collaborators so children inherit them
+    import runtime.cli as cli
+
+    for name in cli._LAZY_IMPORTS:
+        try:
+            getattr(cli, name)
+        except Exception:
+            failed.append(name)
+    return failed
+
+
+def _recv_request(conn: socket.socket) -> dict:
+    chunks = []
+    size = 0
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        if chunk.endswith(b"\n") or size > MAX_REQUEST_BYTES:
+            break
+    if size > MAX_REQUEST_BYTES:
+        raise ValueError("request too large")
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def _kill_on_disconnect(conn: socket.socket, finished: threading.Event) -> None:
+    """Terminate this child's process group if the client goes away first."""
+    try:
+        conn.recv(1)  # the client sends nothing after its request: EOF means it left
+    except OSError:
+        pass
+    if not finished.is_set():
+        os.killpg(os.getpid(), signal.SIGTERM)
+
+
+def _run_child(conn: socket.socket) -> None:
+    """Handle one request inside a forked child; never returns."""
+    exit_code = 1
+    response: dict = {"exit_code": 1, "stdout": "", "stderr": ""}
+    finished = threading.Event()
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        os.setpgid(0, 0)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.close(devnull)
+        request = _recv_request(conn)
+        threading.Thread(target=_kill_on_disconnect, args=(conn, finished), daemon=True).start()
+        os.environ.clear()
+        os.environ.update(request.get("env") or {})
+        os.environ.pop("LIFEOS_WARM_SOCKET", None)
+        os.chdir(request.get("cwd") or "/")
+
+        import runtime.cli as cli
+
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(out.fileno(), 1)
+            os.dup2(err.fileno(), 2)
+            try:
+                exit_code = cli.main(list(request.get("argv") or []))
+            except SystemExit as exc:
+                if isinstance(exc.code, int):
+                    exit_code = exc.code
+                elif exc.code is None:
+                    exit_code = 0
+                else:
+                    print(exc.code, file=sys.stderr)
+                    exit_code = 1
+            except BaseException as exc:  # pragma: no cover - defensive
+                print(f"Error: {type(exc).__name__}: {exc}", file=sys.stderr)
+                exit_code = 1
+            sys.stdout.flush()
+            sys.stderr.flush()
+            out.seek(0)
+            err.seek(0)
+            response = {
+                "exit_code": int(exit_code or 0),
+                "stdout": out.read().decode("utf-8", errors="replace"),
+                "stderr": err.read().decode("utf-8", errors="replace"),
+            }
+    except BaseException as exc:
+        response = {"exit_code": 1, "stdout": "", "stderr": f"warm server error: {exc}\n"}
+    finished.set()
+    try:
+        conn.sendall(json.dumps(response).encode("utf-8"))
+        conn.shutdown(socket.SHUT_WR)
+    finally:
+        os._exit(0)
+
+
+def serve(socket_path: Path, preload_modules: Sequence[str] = PRELOAD_MODULES) -> int:
+    """Preload, then serve requests on socket_path until SIGINT/SIGTERM."""
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists() or socket_path.is_symlink():
+        # Refuse to clobber a live server; remove a stale socket file
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+        else:
+            probe.close()
+            print(f"Error: warm server already listening on {socket_path}", file=sys.stderr)
+            return 1
+
+    failed = preload(preload_modules)
+    if failed:
+        print(f"warning: preload failed for {', '.join(failed)}", file=sys.stderr)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is owner-only (0600)
+    try:
+        server.bind(str(socket_path))
+    finally:
+        os.umask(old_umask)
+    server.listen(64)
+
+    def _stop(_signum, _frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+    # Children are reaped automatically; they report through the socket
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"lifeos warm server listening on {socket_path}", flush=True)
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except InterruptedError:
+                continue
+            pid = os.fork()
+            if pid == 0:
+                server.close()
+                _run_child(conn)
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        try:
+            socket_path.unlink()
+        except FileNotFoundError:
+            pass
+    return 0
+
+
+def forward(socket_path: Path, argv: Sequence[str], timeout: Optional[float] = None) -> int | None:
+    """
+    Run argv on the warm server at socket_path.
+
+    Returns:
+        The command's exit code, or None when no server is reachable (the
+        caller should then execute in-process). A connection that breaks or
+        returns an unreadable response yields exit code 1 with an error on
+        stderr: the command may already have run, so it is not retried.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(str(socket_path))
+    except OSError:
+        client.close()
+        return None
+
+    try:
+        request = {"argv": list(argv), "cwd": os.getcwd(), "env": dict(os.environ)}
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        chunks = []
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+        if not isinstance(response, dict):
+            raise ValueError("response is not an object")
+    except (OSError, ValueError) as exc:
+        print(
+            f"Error: warm server at {socket_path} failed ({exc}); "
+            "unset LIFEOS_WARM_SOCKET to run in-process",
+            file=sys.stderr,
+        )
+        return 1
+    finally:
+        client.close()
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return int(response.get("exit_code", 1))
+
+
+def cmd_serve(args: argparse.Namespace, repo_root: Path) -> int:
+    """Run the warm CLI server (`lifeos serve`)."""
+    from runtime.cli import DEFAULT_WARM_SOCKET, WARM_SOCKET_ENV
+
+    socket_path = args.socket or os.environ.get(WARM_SOCKET_ENV) or repo_root / DEFAULT_WARM_SOCKET
+    return serve(Path(socket_path))
@@ -2,6 +2,9 @@ from pathlib import Path
 
 import yaml
 
+# config is leaf-tier (may not import runtime.util), so pick the C loader here
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config(config_path: Path) -> dict:
     """
@@ -21,7 +24,7 @@ def load_config(config_path: Path) -> dict:
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Malformed YAML in {config_path}: {e}") from e
 
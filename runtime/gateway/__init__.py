@@ -7,6 +7,7 @@ from .deterministic_call import (
     DeterministicGateway,
     deterministic_call,
 )
+from .ledger import CallLedger, read_ledger
 
 __all__ = [
     "DeterministicGateway",
@@ -14,4 +15,6 @@ __all__ = [
     "CallSpec",
     "CallResult",
     "deterministic_call",
+    "CallLedger",
+    "read_ledger",
 ]
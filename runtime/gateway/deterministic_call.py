@@ -2,15 +2,29 @@
 FP-4.x CND-1: Deterministic Call Gateway
 Central gateway for subprocess and network operations.
 All external calls must route through this gateway for determinism.
+
+Modes:
+    stub    Tier-1 behaviour: validate and log, never execute (default).
+    live    Execute through the kind's executor and record the result in the
+            ledger, keyed by CallSpec.compute_hash().
+    replay  Serve results recorded by an earlier live run without executing;
+            a call with no recording is an error.
 """
 
 import hashlib
 import json
+import os
+import subprocess
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Callable, Dict, Literal, Optional, Tuple
+
+from .ledger import DEFAULT_FSYNC_EVERY, CallLedger, read_ledger
 
-from runtime.util.atomic_write import atomic_write_json
+# (success, output, error)
+ExecutionOutcome = Tuple[bool, Any, Optional[str]]
+
+DEFAULT_TIMEOUT_S = 60.0
 
 
 class DeterministicCallError(Exception):
@@ -44,6 +58,111 @@ class CallResult:
     output: Any
     error: Optional[str]
     call_hash: str
+    replayed: bool = False
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _require_keys(spec: "CallSpec", allowed: frozenset) -> None:
+    unknown = sorted(set(spec.args) - allowed)
+    if unknown:
+        raise DeterministicCallError(
+            f"Unsupported {spec.kind} args: {unknown}. Allowed: {sorted(allowed)}"
+        )
+
+
+_SUBPROCESS_ARGS = frozenset(["argv", "input", "cwd", "env", "timeout_s"])
+_HTTP_ARGS = frozenset(["method", "headers", "body", "json", "timeout_s"])
+
+
+def execute_subprocess(spec: CallSpec) -> ExecutionOutcome:
+    """
+    Run ``[spec.target, *args["argv"]]`` without a shell.
+
+    Supported args: argv (list), input (stdin text), cwd, env (overlay on the
+    current environment), timeout_s. Output is {returncode, stdout, stderr};
+    success means returncode 0.
+    """
+    _require_keys(spec, _SUBPROCESS_ARGS)
+    args = spec.args
+    argv = [spec.target, *(str(a) for a in args.get("argv", []))]
+    env = None
+    if args.get("env"):
+        env = {**os.environ, **{str(k): str(v) for k, v in args["env"].items()}}
+    timeout_s = float(args.get("timeout_s", DEFAULT_TIMEOUT_S))
+    try:
+        proc = subprocess.run(
+            argv,
+            input=args.get("input"),
+            capture_output=True,
+            text=True,
+            cwd=args.get("cwd"),
+            env=env,
+            timeout=timeout_s,
+        )
+    except subprocess.TimeoutExpired:
+        return False, None, f"timed out after {timeout_s}s"
+    except OSError as e:
+        return False, None, f"failed to start {spec.target}: {e}"
+    output = {"returncode": proc.returncode, "stdout": proc.stdout, "stderr": proc.stderr}
+    if proc.returncode != 0:
+        return False, output, f"exit status {proc.returncode}"
+    return True, output, None
+
+
+def execute_http(spec: CallSpec) -> ExecutionOutcome:
+    """
+    Perform an HTTP request to ``spec.target``.
+
+    Supported args: method (default GET, or POST when a body is given),
+    headers, body (text) or json (serialized canonically), timeout_s.
+    Output is {status, headers, body}; success means a status below 400.
+    """
+    # Imported here so the Tier-1 envelope check does not see network modules
+    # loaded by merely importing the gateway.
+    import http.client
+    import urllib.error
+    import urllib.request
+
+    _require_keys(spec, _HTTP_ARGS)
+    args = spec.args
+    headers = {str(k): str(v) for k, v in (args.get("headers") or {}).items()}
+    data = None
+    if "json" in args:
+        data = json.dumps(args["json"], sort_keys=True).encode("utf-8")
+        headers.setdefault("Content-Type", "application/json")
+    elif args.get("body") is not None:
+        data = str(args["body"]).encode("utf-8")
+    method = args.get("method") or ("POST" if data is not None else "GET")
+    timeout_s = float(args.get("timeout_s", DEFAULT_TIMEOUT_S))
+    try:
+        request = urllib.request.Request(spec.target, data=data, headers=headers, method=method)
+    except ValueError as e:
+        return False, None, f"invalid URL {spec.target!r}: {e}"
+    try:
+        with urllib.request.urlopen(request, timeout=timeout_s) as response:
+            status, resp_headers, body = response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        status, resp_headers, body = e.code, e.headers, e.read()
+    except (urllib.error.URLError, OSError, http.client.HTTPException) as e:
+        # HTTPException covers URLs that only fail once opened (InvalidURL for
+        # a bad port) and malformed responses
+        return False, None, f"request failed: {getattr(e, 'reason', e)}"
+    output = {
+        "status": status,
+        "headers": {k.lower(): v for k, v in sorted(resp_headers.items())},
+        "body": body.decode("utf-8", errors="replace"),
+    }
+    if status >= 400:
+        return False, output, f"HTTP {status}"
+    return True, output, None
+
+
+DEFAULT_EXECUTORS: Dict[str, Callable[[CallSpec], ExecutionOutcome]] = {
+    "subprocess": execute_subprocess,
+    "http": execute_http,
+}
 
 
 class DeterministicGateway:
@@ -53,22 +172,57 @@ class DeterministicGateway:
     All subprocess and network operations must route through
     this gateway to maintain determinism guarantees.
 
-    Currently stubbed for Tier-1. Actual execution will be
-    added in Tier-2 with full determinism validation.
+    In "stub" mode (the Tier-1 default) calls are validated and logged
+    but not executed. "live" executes and records results; "replay" serves
+    recorded results by call hash without executing.
     """
 
     ALLOWED_KINDS = frozenset(["subprocess", "http"])
-
-    def __init__(self, ledger_path: Optional[str] = None):
+    MODES = frozenset(["stub", "live", "replay"])
+
+    def __init__(
+        self,
+        ledger_path: Optional[str] = None,
+        mode: str = "stub",
+        replay_path: Optional[str] = None,
+        executors: Optional[Dict[str, Callable[[CallSpec], ExecutionOutcome]]] = None,
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+    ):
         """
         Initialize the gateway.
 
         Args:
-            ledger_path: Path to write call ledger (for audit).
+            ledger_path: Path to write call ledger (for audit), JSONL.
+            mode: "stub", "live" or "replay".
+            replay_path: Ledger to serve recorded results from (defaults to
+                ledger_path).
+            executors: Per-kind executors overriding DEFAULT_EXECUTORS.
+            fsync_every: Ledger appends between fsyncs.
         """
+        if mode not in self.MODES:
+            raise DeterministicCallError(f"Invalid gateway mode: {mode}. Allowed: {self.MODES}")
         self.ledger_path = Path(ledger_path) if ledger_path else None
+        self.mode = mode
+        self.replay_path = Path(replay_path) if replay_path else self.ledger_path
+        if mode == "replay" and self.replay_path is None:
+            raise DeterministicCallError("Replay mode requires a replay_path or ledger_path")
+        self.executors = {**DEFAULT_EXECUTORS, **(executors or {})}
+        self._ledger = CallLedger(self.ledger_path, fsync_every) if self.ledger_path else None
+        self._recordings: Optional[Dict[str, dict]] = None
         self._call_count = 0
 
+    def _load_recordings(self) -> Dict[str, dict]:
+        """Index recorded results by call hash (first recording wins)."""
+        if self._recordings is None:
+            recordings: Dict[str, dict] = {}
+            if self.replay_path is not None:
+                for entry in read_ledger(self.replay_path):
+                    result = entry.get("result")
+                    if isinstance(result, dict) and "call_hash" in entry:
+                        recordings.setdefault(entry["call_hash"], result)
+            self._recordings = recordings
+        return self._recordings
+
     def validate_spec(self, spec: CallSpec) -> None:
         """
         Validate a call specification.
@@ -97,48 +251,93 @@ class DeterministicGateway:
         """
         Execute a deterministic call.
 
-        For Tier-1, this is a stub that validates and logs
-        but does not execute actual subprocess/network calls.
+        In stub mode this validates and logs but does not execute actual
+        subprocess/network calls.
 
         Args:
             spec: The call specification.
 
         Returns:
-            CallResult with stubbed output.
+            CallResult (stubbed, executed, or replayed depending on mode).
 
         Raises:
-            DeterministicCallError: If spec is invalid.
+            DeterministicCallError: If spec is invalid, or in replay mode
+                when no result was recorded for it.
         """
         self.validate_spec(spec)
 
         call_hash = spec.compute_hash()
         self._call_count += 1
 
-        # Log to ledger if configured
-        if self.ledger_path:
-            self._log_call(spec, call_hash)
-
-        # Tier-1: Stub execution
-        # In Tier-2, this will route to actual deterministic executors
-        return CallResult(
-            success=True,
-            output={"stub": True, "message": "Tier-1 stub - no actual execution"},
-            error=None,
-            call_hash=call_hash,
-        )
-
-    def _log_call(self, spec: CallSpec, call_hash: str) -> None:
-        """Log call to the ledger file."""
-        entry = {"call_number": self._call_count, "call_hash": call_hash, "spec": spec.to_dict()}
-
-        # Append to ledger (load existing + append + write)
-        ledger = []
-        if self.ledger_path.exists():
-            with open(self.ledger_path, "r") as f:
-                ledger = json.load(f)
-
-        ledger.append(entry)
-        atomic_write_json(self.ledger_path, ledger)
+        if self.mode == "stub":
+            result = CallResult(
+                success=True,
+                output={"stub": True, "message": "Tier-1 stub - no actual execution"},
+                error=None,
+                call_hash=call_hash,
+            )
+            if self._ledger:
+                self._log_call(spec, call_hash)
+            return result
+
+        if self.mode == "replay":
+            recorded = self._load_recordings().get(call_hash)
+            if recorded is None:
+                raise DeterministicCallError(
+                    f"No recorded result for call {call_hash[:12]} ({spec.kind} {spec.target})"
+                )
+            result = CallResult(
+                success=bool(recorded.get("success")),
+                output=recorded.get("output"),
+                error=recorded.get("error"),
+                call_hash=call_hash,
+                replayed=True,
+            )
+        else:
+            success, output, error = self.executors[spec.kind](spec)
+            result = CallResult(success=success, output=output, error=error, call_hash=call_hash)
+            if self._recordings is not None:
+                self._recordings.setdefault(call_hash, self._recorded(result))
+
+        if self._ledger:
+            self._log_call(spec, call_hash, result)
+        return result
+
+    @staticmethod
+    def _recorded(result: CallResult) -> dict:
+        return {"success": result.success, "output": result.output, "error": result.error}
+
+    def _log_call(
+        self, spec: CallSpec, call_hash: str, result: Optional[CallResult] = None
+    ) -> None:
+        """Append the call (and its result, outside stub mode) to the ledger."""
+        if self._ledger is None:
+            return
+        entry: Dict[str, Any] = {
+            "call_number": self._call_count,
+            "call_hash": call_hash,
+            "spec": spec.to_dict(),
+        }
+        if result is not None:
+            entry["mode"] = self.mode
+            entry["result"] = self._recorded(result)
+        self._ledger.append(entry)
+
+    def flush(self) -> None:
+        """Force buffered ledger appends to disk."""
+        if self._ledger:
+            self._ledger.flush()
+
+    def close(self) -> None:
+        """Flush and close the ledger."""
+        if self._ledger:
+            self._ledger.close()
+
+    def __enter__(self) -> "DeterministicGateway":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
 def deterministic_call(
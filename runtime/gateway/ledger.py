@@ -0,0 +1,129 @@
+"""
+FP-4.x CND-1: Gateway call ledger.
+
+Append-only JSONL ledger for DeterministicGateway. One JSON object per line;
+appends are flushed immediately and fsync'd in batches (every
+``fsync_every`` entries and on flush/close), so logging a call is O(1)
+instead of rewriting the whole ledger.
+
+Ledgers written by earlier versions are a single JSON array. read_ledger()
+accepts both formats, and CallLedger converts a legacy file to JSONL in
+place (atomically) before its first append.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+from runtime.util.atomic_write import atomic_write_text
+
+DEFAULT_FSYNC_EVERY = 64
+
+
+def _is_legacy_array(text: str) -> bool:
+    return text.lstrip().startswith("[")
+
+
+def read_ledger(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Read every entry from a ledger file.
+
+    Accepts both the JSONL format and the legacy JSON-array format. A torn
+    final line (crash mid-append) is ignored; a missing file yields [].
+    """
+    path = Path(path)
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    if _is_legacy_array(text):
+        data = json.loads(text)
+        return [entry for entry in data if isinstance(entry, dict)]
+
+    entries: List[Dict[str, Any]] = []
+    lines = text.split("\n")
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            if i >= len(lines) - 2:
+                break  # torn tail
+            raise
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
+
+
+class CallLedger:
+    """Append-only JSONL writer with batched fsync."""
+
+    def __init__(self, path: Union[str, Path], fsync_every: int = DEFAULT_FSYNC_EVERY):
+        """
+        Args:
+            path: Ledger file (created on first append).
+            fsync_every: Number of appends between fsyncs (1 = every append).
+        """
+        self.path = Path(path)
+        self.fsync_every = max(1, fsync_every)
+        self._fh = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._migrate_legacy()
+            self._fh = open(self.path, "a", encoding="utf-8")
+        return self._fh
+
+    def _migrate_legacy(self) -> None:
+        try:
+            text = self.path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        if not _is_legacy_array(text):
+            if text and not text.endswith("\n"):
+                # Drop a torn final line so the next append starts cleanly
+                atomic_write_text(self.path, text[: text.rfind("\n") + 1])
+            return
+        lines = [json.dumps(entry, sort_keys=True) + "\n" for entry in read_ledger(self.path)]
+        atomic_write_text(self.path, "".join(lines))
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Append one entry; fsyncs once every ``fsync_every`` appends."""
+        line = json.dumps(entry, sort_keys=True) + "\n"
+        with self._lock:
+            fh = self._open()
+            fh.write(line)
+            fh.flush()
+            self._pending += 1
+            if self._pending >= self.fsync_every:
+                os.fsync(fh.fileno())
+                self._pending = 0
+
+    def flush(self) -> None:
+        """Force pending appends to stable storage."""
+        with self._lock:
+            if self._fh is not None and self._pending:
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+                self._pending = 0
+
+    def close(self) -> None:
+        """Flush and close the file handle (reopened on the next append)."""
+        self.flush()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Read back every entry written so far."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+        return read_ledger(self.path)
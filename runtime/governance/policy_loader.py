@@ -19,6 +19,7 @@ import yaml
 
 # Import centralized workspace resolution
 from runtime.util.workspace import resolve_workspace_root as _util_resolve_workspace_root
+from runtime.util.yaml_io import load_yaml_file
 
 try:
     from jsonschema import ValidationError, validate
@@ -125,8 +126,7 @@ class PolicyLoader:
     def _parse_yaml(self, path: Path) -> Any:
         """Parse YAML file with error handling."""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return load_yaml_file(path)
         except yaml.YAMLError as e:
             raise PolicyLoadError(f"YAML parse error in {path}: {e}") from e
         except FileNotFoundError as e:
@@ -1,15 +1,13 @@
 """
 FP-4.x CND-2: Index Updater with Atomic Writes
 Updates INDEX files using atomic write pattern and shared detsort.
+Scans and updates are incremental via runtime.index.snapshot.
 """
 
-import os
-import re
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import List, Optional
 
-from runtime.util.atomic_write import atomic_write_text
-from runtime.util.detsort import detsort_paths
+from runtime.index.snapshot import DirectorySnapshot, filter_entries, render_index
 
 
 class IndexUpdater:
@@ -19,16 +17,21 @@ class IndexUpdater:
     Uses shared detsort utilities for deterministic ordering.
     """
 
-    def __init__(self, index_path: str, root_dir: str):
+    def __init__(
+        self, index_path: str, root_dir: str, snapshot: Optional[DirectorySnapshot] = None
+    ):
         """
         Initialize Index Updater.
 
         Args:
             index_path: Path to the INDEX file.
             root_dir: Root directory to scan.
+            snapshot: Directory snapshot to reuse (e.g. DirectorySnapshot.load(path)
+                for persistence across runs); defaults to an in-memory one.
         """
         self.index_path = Path(index_path)
         self.root_dir = Path(root_dir).resolve()
+        self.snapshot = snapshot if snapshot is not None else DirectorySnapshot()
 
     def scan_directory(self, extensions: Optional[List[str]] = None) -> List[str]:
         """
@@ -43,25 +46,8 @@ class IndexUpdater:
         if extensions is None:
             extensions = [".md"]
 
-        files = []
-        index_name = self.index_path.name
-
-        for root, dirs, filenames in os.walk(self.root_dir):
-            # Sort dirs in-place for deterministic traversal
-            dirs.sort()
-
-            for fname in sorted(filenames):
-                # Skip index file itself
-                if fname == index_name:
-                    continue
-
-                if any(fname.endswith(ext) for ext in extensions):
-                    full_path = Path(root) / fname
-                    rel_path = full_path.relative_to(self.root_dir)
-                    # Normalize separators
-                    files.append(str(rel_path).replace("\\", "/"))
-
-        return detsort_paths(files)
+        files = self.snapshot.scan(self.root_dir)
+        return filter_entries(files, self.index_path.name, extensions)
 
     def generate_content(self, title: str = "Index", extensions: Optional[List[str]] = None) -> str:
         """
@@ -74,18 +60,12 @@ class IndexUpdater:
         Returns:
             Markdown content for the INDEX.
         """
-        files = self.scan_directory(extensions)
-
-        lines = [f"# {title}", ""]
-        for f in files:
-            lines.append(f"- [{f}](./{f})")
-        lines.append("")
-
-        return "\n".join(lines)
+        return render_index(title, self.scan_directory(extensions))
 
     def update(self, title: str = "Index", extensions: Optional[List[str]] = None) -> bool:
         """
-        Update INDEX file atomically.
+        Update INDEX file atomically, splicing in added/removed entries
+        when the INDEX is unchanged since this snapshot last wrote it.
 
         Args:
             title: Title for the index.
@@ -94,18 +74,12 @@ class IndexUpdater:
         Returns:
             True if INDEX was updated, False if no changes needed.
         """
-        new_content = self.generate_content(title, extensions)
-
-        # Check if update needed
-        if self.index_path.exists():
-            with open(self.index_path, "r", encoding="utf-8") as f:
-                existing = f.read()
-            if existing == new_content:
-                return False
-
-        # Atomic write
-        atomic_write_text(self.index_path, new_content)
-        return True
+        if extensions is None:
+            extensions = [".md"]
+        files = self.scan_directory(extensions)
+        changed = self.snapshot.update_index(self.index_path, files, title, extensions)
+        self.snapshot.save()
+        return changed
 
     def verify_coherence(self) -> tuple[bool, List[str], List[str]]:
         """
@@ -115,16 +89,7 @@ class IndexUpdater:
             Tuple of (is_coherent, missing_from_index, orphaned_in_index).
         """
         actual_files = set(self.scan_directory())
-        indexed_files: Set[str] = set()
-
-        if self.index_path.exists():
-            with open(self.index_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract paths from markdown links
-            pattern = r"\[([^\]]+)\]\(\./([^\)]+)\)"
-            for match in re.finditer(pattern, content):
-                indexed_files.add(match.group(2))
+        indexed_files = self.snapshot.indexed_links(self.index_path)
 
         missing = sorted(actual_files - indexed_files)
         orphaned = sorted(indexed_files - actual_files)
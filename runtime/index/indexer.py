@@ -1,11 +1,13 @@
 """
 FP-3.3: Index Reconciliation
 Automatic index file maintenance for DAP compliance.
+Scans and updates are incremental via runtime.index.snapshot.
 """
 
 import os
-import re
-from typing import List, Optional, Set
+from typing import List, Optional
+
+from runtime.index.snapshot import DirectorySnapshot, filter_entries, render_index
 
 
 class IndexReconciler:
@@ -16,16 +18,21 @@ class IndexReconciler:
     to reflect current state.
     """
 
-    def __init__(self, index_path: str, root_dir: str):
+    def __init__(
+        self, index_path: str, root_dir: str, snapshot: Optional[DirectorySnapshot] = None
+    ):
         """
         Initialize Index Reconciler.
 
         Args:
             index_path: Path to the INDEX file to maintain.
             root_dir: Root directory to scan for files.
+            snapshot: Directory snapshot to reuse (e.g. DirectorySnapshot.load(path)
+                for persistence across runs); defaults to an in-memory one.
         """
         self.index_path = index_path
         self.root_dir = os.path.abspath(root_dir)
+        self.snapshot = snapshot if snapshot is not None else DirectorySnapshot()
 
     def scan_directory(self, extensions: Optional[List[str]] = None) -> List[str]:
         """
@@ -40,21 +47,8 @@ class IndexReconciler:
         if extensions is None:
             extensions = [".md"]
 
-        files = []
-        index_basename = os.path.basename(self.index_path)
-        for root, _, filenames in os.walk(self.root_dir):
-            for fname in filenames:
-                # Skip the index file itself
-                if fname == index_basename:
-                    continue
-                if any(fname.endswith(ext) for ext in extensions):
-                    full_path = os.path.join(root, fname)
-                    rel_path = os.path.relpath(full_path, self.root_dir)
-                    # Normalize path separators
-                    rel_path = rel_path.replace("\\", "/")
-                    files.append(rel_path)
-
-        return sorted(files)
+        files = self.snapshot.scan(self.root_dir)
+        return filter_entries(files, os.path.basename(self.index_path), extensions)
 
     def generate_index_content(
         self, title: str = "Index", extensions: Optional[List[str]] = None
@@ -69,18 +63,13 @@ class IndexReconciler:
         Returns:
             Index content as markdown.
         """
-        files = self.scan_directory(extensions)
-
-        lines = [f"# {title}", ""]
-        for f in files:
-            lines.append(f"- [{f}](./{f})")
-        lines.append("")
-
-        return "\n".join(lines)
+        return render_index(title, self.scan_directory(extensions))
 
     def reconcile(self, title: str = "Index", extensions: Optional[List[str]] = None) -> bool:
         """
-        Reconcile index file with actual directory contents.
+        Reconcile index file with actual directory contents, splicing in
+        added/removed entries when the index is unchanged since this
+        snapshot last wrote it.
 
         Args:
             title: Title for the index.
@@ -89,21 +78,12 @@ class IndexReconciler:
         Returns:
             True if index was updated, False if no changes needed.
         """
-        new_content = self.generate_index_content(title, extensions)
-
-        # Check if update needed
-        if os.path.exists(self.index_path):
-            with open(self.index_path, "r", encoding="utf-8") as f:
-                existing_content = f.read()
-            if existing_content == new_content:
-                return False
-
-        # Write updated index
-        os.makedirs(os.path.dirname(os.path.abspath(self.index_path)), exist_ok=True)
-        with open(self.index_path, "w", encoding="utf-8") as f:
-            f.write(new_content)
-
-        return True
+        if extensions is None:
+            extensions = [".md"]
+        files = self.scan_directory(extensions)
+        changed = self.snapshot.update_index(self.index_path, files, title, extensions)
+        self.snapshot.save()
+        return changed
 
     def verify_coherence(self) -> tuple[bool, List[str], List[str]]:
         """
@@ -113,17 +93,7 @@ class IndexReconciler:
             Tuple of (is_coherent, missing_from_index, orphaned_in_index)
         """
         actual_files = set(self.scan_directory())
-
-        # Parse existing index
-        indexed_files: Set[str] = set()
-        if os.path.exists(self.index_path):
-            with open(self.index_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract paths from markdown links
-            pattern = r"\[([^\]]+)\]\(\./([^\)]+)\)"
-            for match in re.finditer(pattern, content):
-                indexed_files.add(match.group(2))
+        indexed_files = self.snapshot.indexed_links(self.index_path)
 
         missing = actual_files - indexed_files
         orphaned = indexed_files - actual_files
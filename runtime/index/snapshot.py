@@ -0,0 +1,360 @@
+"""
+Incremental INDEX maintenance.
+
+Persistent directory-state snapshot shared by IndexUpdater, IndexReconciler
+and reconcile_indexes().
+
+- DirectorySnapshot records, per directory, its mtime and entry names. A
+  directory whose mtime is unchanged is not listed again (adding, removing or
+  renaming an entry always bumps the containing directory's mtime); only a
+  stat per directory remains. Records whose mtime was within the filesystem
+  timestamp granularity of when they were listed are re-listed ("racy").
+- Each maintained INDEX is recorded with the file list it was rendered from
+  and its own stat. While the INDEX on disk still matches that stat, updates
+  are spliced into it from the added/removed paths, and coherence checks use
+  the recorded link set instead of re-parsing the file.
+- reconcile_indexes() serves every INDEX from one walk per outermost root.
+
+Output is byte-identical to a full regeneration (detsort_paths ordering).
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from runtime.util.atomic_write import atomic_write_json, atomic_write_text
+from runtime.util.detsort import detsort_paths
+
+SNAPSHOT_SCHEMA_VERSION = "index_snapshot.v1"
+
+# Directory records listed this close to their mtime are re-listed on reuse
+_RACY_WINDOW_NS = 2_000_000_000
+
+_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(\./([^\)]+)\)")
+
+
+def render_index(title: str, files: Sequence[str]) -> str:
+    """Render INDEX markdown for an already sorted file list."""
+    lines = [f"# {title}", ""]
+    for f in files:
+        lines.append(f"- [{f}](./{f})")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def parse_index_links(content: str) -> Set[str]:
+    """Return the ./-relative link targets listed in an INDEX."""
+    return {match.group(2) for match in _LINK_PATTERN.finditer(content)}
+
+
+def filter_entries(files: Iterable[str], index_name: str, extensions: Sequence[str]) -> List[str]:
+    """Select indexable files: matching extension, not named like the INDEX."""
+    exts = tuple(extensions)
+    return [f for f in files if f.endswith(exts) and f.rsplit("/", 1)[-1] != index_name]
+
+
+def splice_index(
+    existing: str, previous: Sequence[str], added: Sequence[str], removed: Set[str]
+) -> Tuple[str, List[str]]:
+    """Apply added/removed paths to INDEX text rendered from ``previous``.
+
+    Unchanged entry lines are reused as-is; returns (content, new file list).
+    """
+    lines = existing.split("\n")
+    header, body = lines[:2], lines[2:-1]
+    files = list(previous)
+    if removed:
+        keep = [i for i, f in enumerate(files) if f not in removed]
+        files = [files[i] for i in keep]
+        body = [body[i] for i in keep]
+    for f in sorted(added):
+        pos = bisect.bisect_left(files, f)
+        files.insert(pos, f)
+        body.insert(pos, f"- [{f}](./{f})")
+    return "\n".join(header + body + [""]), files
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+@dataclass
+class _DirRecord:
+    mtime_ns: int
+    listed_at_ns: int
+    files: List[str]
+    dirs: List[str]
+
+
+@dataclass
+class _IndexRecord:
+    title: str
+    extensions: List[str]
+    files: List[str]
+    stat: Optional[Tuple[int, int, int]]
+
+
+@dataclass
+class DirectorySnapshot:
+    """Directory listings and maintained-INDEX state, optionally persisted."""
+
+    path: Optional[str] = None
+    dirs: Dict[str, _DirRecord] = field(default_factory=dict)
+    indexes: Dict[str, _IndexRecord] = field(default_factory=dict)
+    dirs_listed: int = 0
+    dirs_reused: int = 0
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "DirectorySnapshot":
+        """Load a persisted snapshot; a missing or unreadable file yields an empty one."""
+        file_path = os.fspath(path)
+        snapshot = cls(path=file_path)
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return snapshot
+        if not isinstance(data, dict) or data.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+            return snapshot
+        try:
+            for d, rec in data.get("dirs", {}).items():
+                snapshot.dirs[d] = _DirRecord(
+                    rec["mtime_ns"], rec["listed_at_ns"], list(rec["files"]), list(rec["dirs"])
+                )
+            for p, rec in data.get("indexes", {}).items():
+                snapshot.indexes[p] = _IndexRecord(
+                    rec["title"],
+                    list(rec["extensions"]),
+                    list(rec["files"]),
+                    tuple(rec["stat"]) if rec.get("stat") else None,
+                )
+        except (KeyError, TypeError, AttributeError):
+            return cls(path=snapshot.path)
+        return snapshot
+
+    def save(self) -> None:
+        """Persist the snapshot (no-op for in-memory snapshots)."""
+        if self.path is None:
+            return
+        data = {
+            "schema_version": SNAPSHOT_SCHEMA_VERSION,
+            "dirs": {
+                d: {
+                    "mtime_ns": r.mtime_ns,
+                    "listed_at_ns": r.listed_at_ns,
+                    "files": r.files,
+                    "dirs": r.dirs,
+                }
+                for d, r in self.dirs.items()
+            },
+            "indexes": {
+                p: {
+                    "title": r.title,
+                    "extensions": r.extensions,
+                    "files": r.files,
+                    "stat": list(r.stat) if r.stat else None,
+                }
+                for p, r in self.indexes.items()
+            },
+        }
+        atomic_write_json(self.path, data, indent=None)
+
+    # -- directory state ---------------------------------------------------
+
+    def _list_dir(self, directory: str) -> Optional[_DirRecord]:
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self.dirs.pop(directory, None)
+            return None
+        record = self.dirs.get(directory)
+        if (
+            record is not None
+            and record.mtime_ns == mtime_ns
+            and record.listed_at_ns - mtime_ns >= _RACY_WINDOW_NS
+        ):
+            self.dirs_reused += 1
+            return record
+
+        files: List[str] = []
+        dirs: List[str] = []
+        listed_at_ns = time.time_ns()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Listed like os.walk: symlinked dirs are not descended
+                        if not entry.is_symlink():
+                            dirs.append(entry.name)
+                    else:
+                        files.append(entry.name)
+        except OSError:
+            self.dirs.pop(directory, None)
+            return None
+        files.sort()
+        dirs.sort()
+        record = _DirRecord(mtime_ns, listed_at_ns, files, dirs)
+        self.dirs[directory] = record
+        self.dirs_listed += 1
+        return record
+
+    def scan(self, root: str | os.PathLike) -> List[str]:
+        """Return every file under ``root`` as a sorted root-relative path."""
+        root = os.path.abspath(os.fspath(root))
+        out: List[str] = []
+        seen: Set[str] = set()
+        stack: List[Tuple[str, str]] = [(root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            seen.add(directory)
+            record = self._list_dir(directory)
+            if record is None:
+                continue
+            out.extend(prefix + name for name in record.files)
+            for name in reversed(record.dirs):
+                stack.append((os.path.join(directory, name), f"{prefix}{name}/"))
+        # Forget directories under root that no longer exist
+        root_prefix = root.rstrip(os.sep) + os.sep
+        for stale in [d for d in self.dirs if d.startswith(root_prefix) and d not in seen]:
+            del self.dirs[stale]
+        return detsort_paths(out)
+
+    def scan_many(self, roots: Iterable[str | os.PathLike]) -> Dict[str, List[str]]:
+        """Scan several roots with one walk per outermost root."""
+        wanted = sorted({os.path.abspath(os.fspath(r)) for r in roots})
+        outer: List[str] = []
+        for root in wanted:
+            if not any(root == o or root.startswith(o.rstrip(os.sep) + os.sep) for o in outer):
+                outer.append(root)
+        results: Dict[str, List[str]] = {}
+        for top in outer:
+            files = self.scan(top)
+            for root in wanted:
+                if root == top:
+                    results[root] = files
+                elif root.startswith(top.rstrip(os.sep) + os.sep):
+                    rel = os.path.relpath(root, top).replace("\\", "/") + "/"
+                    start = bisect.bisect_left(files, rel)
+                    end = bisect.bisect_left(files, rel[:-1] + "0")  # "0" sorts after "/"
+                    results[root] = [f[len(rel) :] for f in files[start:end]]
+        return results
+
+    # -- INDEX maintenance -------------------------------------------------
+
+    def update_index(
+        self,
+        index_path: str | os.PathLike,
+        files: List[str],
+        title: str,
+        extensions: Sequence[str],
+    ) -> bool:
+        """Bring one INDEX in line with ``files``; returns True if it was written."""
+        index_path = os.path.abspath(os.fspath(index_path))
+        record = self.indexes.get(index_path)
+        current_stat = _stat_key(index_path)
+        trusted = (
+            record is not None
+            and record.stat is not None
+            and record.stat == current_stat
+            and record.title == title
+            and record.extensions == list(extensions)
+        )
+
+        if trusted:
+            assert record is not None
+            if record.files == files:
+                return False
+            previous = set(record.files)
+            current = set(files)
+            with open(index_path, "r", encoding="utf-8") as f:
+                existing = f.read()
+            content, _ = splice_index(
+                existing, record.files, sorted(current - previous), previous - current
+            )
+        else:
+            content = render_index(title, files)
+            if current_stat is not None:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    existing = f.read()
+                if existing == content:
+                    self.indexes[index_path] = _IndexRecord(
+                        title, list(extensions), list(files), current_stat
+                    )
+                    return False
+
+        atomic_write_text(index_path, content)
+        self.indexes[index_path] = _IndexRecord(
+            title, list(extensions), list(files), _stat_key(index_path)
+        )
+        return True
+
+    def indexed_links(self, index_path: str | os.PathLike) -> Set[str]:
+        """Link targets in an INDEX, from the record while the file is unchanged."""
+        index_path = os.path.abspath(os.fspath(index_path))
+        current_stat = _stat_key(index_path)
+        if current_stat is None:
+            return set()
+        record = self.indexes.get(index_path)
+        if record is not None and record.stat == current_stat:
+            return set(record.files)
+        with open(index_path, "r", encoding="utf-8") as f:
+            return parse_index_links(f.read())
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """One INDEX to maintain: where it lives, what it covers, how it renders."""
+
+    index_path: str
+    root_dir: str
+    title: str = "Index"
+    extensions: Tuple[str, ...] = (".md",)
+
+
+def reconcile_indexes(
+    specs: Sequence[IndexSpec],
+    snapshot: Optional[DirectorySnapshot] = None,
+    snapshot_path: Optional[str | os.PathLike] = None,
+) -> Dict[str, bool]:
+    """
+    Reconcile every INDEX in ``specs`` from a single walk.
+
+    Args:
+        specs: INDEX files to maintain.
+        snapshot: Snapshot to reuse (default: loaded from ``snapshot_path``,
+            or a fresh in-memory one).
+        snapshot_path: Where to persist the snapshot afterwards.
+
+    Returns:
+        Mapping of index_path -> True if that INDEX was rewritten.
+    """
+    if snapshot is None:
+        snapshot = DirectorySnapshot.load(snapshot_path) if snapshot_path else DirectorySnapshot()
+    listings = snapshot.scan_many(spec.root_dir for spec in specs)
+    results: Dict[str, bool] = {}
+    for spec in specs:
+        files = filter_entries(
+            listings[os.path.abspath(spec.root_dir)],
+            Path(spec.index_path).name,
+            spec.extensions,
+        )
+        results[spec.index_path] = snapshot.update_index(
+            spec.index_path, files, spec.title, spec.extensions
+        )
+    snapshot.save()
+    return results
@@ -6,18 +6,56 @@ CEO approval before the autonomous loop can proceed.
 
 import json
 import logging
+import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from runtime.receipts.invocation_receipt import record_invocation_receipt
 from runtime.util.canonical import compute_sha256
 
 _log = logging.getLogger(__name__)
 
+# How long a statement waits for a competing writer before SQLITE_BUSY
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+
+# Resolution note recorded on timed-out escalations
+TIMEOUT_NOTE = "TIMEOUT_24H"
+
+_STATEMENT_CACHE_SIZE = 32
+
+# Statement text is kept constant so each connection's statement cache reuses it
+_SQL_COUNT = "SELECT COUNT(*) FROM escalations"
+_SQL_INSERT = """
+    INSERT INTO escalations
+    (id, type, status, context, run_id, created_at, resolved_at, resolution_note, resolver)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_PENDING = "SELECT * FROM escalations WHERE status = ? ORDER BY created_at ASC"
+_SQL_BY_ID = "SELECT * FROM escalations WHERE id = ?"
+_SQL_RUN_ID_IF_PENDING = "SELECT run_id, status FROM escalations WHERE id = ?"
+_SQL_RESOLVE = """
+    UPDATE escalations
+    SET status = ?, resolved_at = ?, resolution_note = ?, resolver = ?
+    WHERE id = ?
+"""
+_SQL_TIMEOUT_ONE = """
+    UPDATE escalations
+    SET status = ?, resolved_at = ?, resolution_note = ?
+    WHERE id = ?
+"""
+_SQL_STALE_IDS = "SELECT id FROM escalations WHERE status = ? AND created_at < ?"
+_SQL_TIMEOUT_STALE = """
+    UPDATE escalations
+    SET status = ?, resolved_at = ?, resolution_note = ?
+    WHERE status = ? AND created_at < ?
+"""
+
 
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -60,21 +98,80 @@ class EscalationEntry:
 
 
 class CEOQueue:
-    """Persistent queue for CEO approval escalations."""
+    """Persistent queue for CEO approval escalations.
 
-    def __init__(self, db_path: Path):
+    Each thread gets one long-lived SQLite connection (WAL journal, busy
+    timeout), so readers such as the COO context builder and the CLI never
+    block a writer, and statements are reused from the per-connection
+    statement cache instead of being re-prepared on every call.
+    """
+
+    def __init__(self, db_path: Path, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS):
         """Initialize the queue with a SQLite database.
 
         Args:
             db_path: Path to the SQLite database file
+            busy_timeout_ms: How long a statement waits on a locked database
         """
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._pid = os.getpid()
         self._init_schema()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        if self._pid != os.getpid():
+            # Connections must not cross fork(); the child starts afresh
+            self._local = threading.local()
+            with self._connections_lock:
+                self._connections = []
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._db_path,
+                timeout=self._busy_timeout_ms / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction that takes the write lock up front."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close every pooled connection (they reopen lazily on next use)."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
     def _init_schema(self) -> None:
-        """Create tables if they don't exist."""
-        with sqlite3.connect(self._db_path) as conn:
+        """Create tables and indexes if they don't exist."""
+        with self._write() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS escalations (
                     id TEXT PRIMARY KEY,
@@ -88,17 +185,23 @@ class CEOQueue:
                     resolver TEXT
                 )
             """)
-            conn.commit()
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_escalations_status_created "
+                "ON escalations (status, created_at)"
+            )
 
-    def _generate_id(self) -> str:
+    def _generate_id(self, conn: Optional[sqlite3.Connection] = None) -> str:
         """Generate a unique escalation ID in ESC-XXXX format.
 
+        Args:
+            conn: Connection to read from; pass the writer's connection so the
+                count and the insert happen in one transaction
+
         Returns:
             A unique escalation ID
         """
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM escalations")
-            count = cursor.fetchone()[0]
+        conn = conn or self._connect()
+        count = conn.execute(_SQL_COUNT).fetchone()[0]
         return f"ESC-{count + 1:04d}"
 
     def add_escalation(self, entry: EscalationEntry) -> str:
@@ -110,10 +213,6 @@ class CEOQueue:
         Returns:
             The generated escalation ID
         """
-        # Generate ID if not provided
-        if entry.id is None:
-            entry.id = self._generate_id()
-
         # Set created_at if not provided
         if entry.created_at is None:
             entry.created_at = datetime.utcnow()
@@ -126,16 +225,12 @@ class CEOQueue:
         context_json = json.dumps(entry.context)
 
         ts = _utc_now()
-        with sqlite3.connect(self._db_path) as conn:
+        with self._write() as conn:
+            # Generate ID inside the write lock so concurrent writers can't collide
+            if entry.id is None:
+                entry.id = self._generate_id(conn)
             conn.execute(
-                """
-                INSERT INTO escalations
-                (
-                    id, type, status, context, run_id, created_at, resolved_at,
-                    resolution_note, resolver
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT,
                 (
                     entry.id,
                     entry.type.value,
@@ -148,7 +243,6 @@ class CEOQueue:
                     None,
                 ),
             )
-            conn.commit()
 
         # Phase 4C: emit receipt for queue state change
         try:
@@ -175,18 +269,7 @@ class CEOQueue:
         Returns:
             List of pending escalation entries, ordered by created_at ascending
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT * FROM escalations
-                WHERE status = ?
-                ORDER BY created_at ASC
-                """,
-                (EscalationStatus.PENDING.value,),
-            )
-            rows = cursor.fetchall()
-
+        rows = self._connect().execute(_SQL_PENDING, (EscalationStatus.PENDING.value,)).fetchall()
         return [self._row_to_entry(row) for row in rows]
 
     def get_by_id(self, escalation_id: str) -> Optional[EscalationEntry]:
@@ -198,19 +281,28 @@ class CEOQueue:
         Returns:
             The escalation entry, or None if not found
         """
-        with sqlite3.connect(self._db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM escalations WHERE id = ?",
-                (escalation_id,),
-            )
-            row = cursor.fetchone()
-
+        row = self._connect().execute(_SQL_BY_ID, (escalation_id,)).fetchone()
         if row is None:
             return None
 
         return self._row_to_entry(row)
 
+    def _resolve(
+        self, escalation_id: str, status: EscalationStatus, note: str, resolver: str
+    ) -> Tuple[Optional[str], str]:
+        """Move a pending escalation to a resolved status in one transaction.
+
+        Returns:
+            (run_id, resolved_at); run_id is None if not found or not pending
+        """
+        ts = _utc_now()
+        with self._write() as conn:
+            row = conn.execute(_SQL_RUN_ID_IF_PENDING, (escalation_id,)).fetchone()
+            if row is None or row["status"] != EscalationStatus.PENDING.value:
+                return None, ts
+            conn.execute(_SQL_RESOLVE, (status.value, ts, note, resolver, escalation_id))
+        return row["run_id"], ts
+
     def approve(self, escalation_id: str, note: str, resolver: str) -> bool:
         """Approve an escalation.
 
@@ -222,33 +314,14 @@ class CEOQueue:
         Returns:
             True if approved successfully, False if not found or not pending
         """
-        # Check if entry exists and is pending
-        entry = self.get_by_id(escalation_id)
-        if entry is None or entry.status != EscalationStatus.PENDING:
+        run_id, ts = self._resolve(escalation_id, EscalationStatus.APPROVED, note, resolver)
+        if run_id is None:
             return False
 
-        ts = _utc_now()
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute(
-                """
-                UPDATE escalations
-                SET status = ?, resolved_at = ?, resolution_note = ?, resolver = ?
-                WHERE id = ?
-                """,
-                (
-                    EscalationStatus.APPROVED.value,
-                    ts,
-                    note,
-                    resolver,
-                    escalation_id,
-                ),
-            )
-            conn.commit()
-
         # Phase 4C: emit receipt for resolution state change
         try:
             record_invocation_receipt(
-                run_id=entry.run_id,
+                run_id=run_id,
                 provider_id="ceo_queue",
                 mode="cli",
                 seat_id="queue_approve",
@@ -274,33 +347,14 @@ class CEOQueue:
         Returns:
             True if rejected successfully, False if not found or not pending
         """
-        # Check if entry exists and is pending
-        entry = self.get_by_id(escalation_id)
-        if entry is None or entry.status != EscalationStatus.PENDING:
+        run_id, ts = self._resolve(escalation_id, EscalationStatus.REJECTED, reason, resolver)
+        if run_id is None:
             return False
 
-        ts = _utc_now()
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute(
-                """
-                UPDATE escalations
-                SET status = ?, resolved_at = ?, resolution_note = ?, resolver = ?
-                WHERE id = ?
-                """,
-                (
-                    EscalationStatus.REJECTED.value,
-                    ts,
-                    reason,
-                    resolver,
-                    escalation_id,
-                ),
-            )
-            conn.commit()
-
         # Phase 4C: emit receipt for resolution state change
         try:
             record_invocation_receipt(
-                run_id=entry.run_id,
+                run_id=run_id,
                 provider_id="ceo_queue",
                 mode="cli",
                 seat_id="queue_reject",
@@ -324,28 +378,46 @@ class CEOQueue:
         Returns:
             True if marked successfully, False if not found
         """
-        # Check if entry exists
-        entry = self.get_by_id(escalation_id)
-        if entry is None:
-            return False
-
-        with sqlite3.connect(self._db_path) as conn:
-            conn.execute(
-                """
-                UPDATE escalations
-                SET status = ?, resolved_at = ?, resolution_note = ?
-                WHERE id = ?
-                """,
+        with self._write() as conn:
+            cursor = conn.execute(
+                _SQL_TIMEOUT_ONE,
                 (
                     EscalationStatus.TIMEOUT.value,
                     datetime.utcnow().isoformat(),
-                    "TIMEOUT_24H",
+                    TIMEOUT_NOTE,
                     escalation_id,
                 ),
             )
-            conn.commit()
+        return cursor.rowcount > 0
 
-        return True
+    def mark_timeouts(self, older_than: timedelta, now: Optional[datetime] = None) -> List[str]:
+        """Time out every pending escalation older than a threshold in one transaction.
+
+        Args:
+            older_than: Age after which a pending escalation times out
+            now: Reference time (naive UTC, like created_at); defaults to utcnow
+
+        Returns:
+            IDs of the escalations that were timed out
+        """
+        now = now or datetime.utcnow()
+        cutoff = (now - older_than).isoformat()
+        pending = EscalationStatus.PENDING.value
+        with self._write() as conn:
+            # Both statements use the (status, created_at) index
+            ids = [row["id"] for row in conn.execute(_SQL_STALE_IDS, (pending, cutoff))]
+            if ids:
+                conn.execute(
+                    _SQL_TIMEOUT_STALE,
+                    (
+                        EscalationStatus.TIMEOUT.value,
+                        now.isoformat(),
+                        TIMEOUT_NOTE,
+                        pending,
+                        cutoff,
+                    ),
+                )
+        return sorted(ids)
 
     def _row_to_entry(self, row: sqlite3.Row) -> EscalationEntry:
         """Convert a database row to an EscalationEntry.
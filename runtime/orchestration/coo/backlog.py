@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional
 import yaml
 
 from runtime.util.atomic_write import atomic_write_text
+from runtime.util.yaml_io import load_yaml_file
 
 BACKLOG_SCHEMA_VERSION = "backlog.v1"
 
@@ -191,8 +192,7 @@ def _validate_task(raw: Dict[str, Any], index: int) -> TaskEntry:
 def load_backlog(path: Path) -> list[TaskEntry]:
     """Load and validate all tasks from a YAML backlog file."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        raw = load_yaml_file(path)
     except yaml.YAMLError as exc:
         raise BacklogValidationError(f"Invalid YAML in {path}: {exc}") from exc
 
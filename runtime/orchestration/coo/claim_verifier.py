@@ -9,13 +9,14 @@ against durable evidence sources.
 from __future__ import annotations
 
 import re
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import yaml
 
+from runtime.util.git_broker import get_broker
+
 
 @dataclass
 class EvidenceSnapshot:
@@ -159,17 +160,22 @@ def _find_order_for_task(task_id: str, evidence: EvidenceSnapshot) -> Optional[s
     return None
 
 
-def _sha_exists_in_git(sha: str, repo_root: Optional[Path] = None) -> bool:
-    """Return True if SHA exists in the git history."""
+def _shas_in_git(shas: Iterable[str], repo_root: Optional[Path] = None) -> set[str]:
+    """Return the subset of ``shas`` that exist in the git object store.
+
+    All SHAs are answered by one request to the repository's shared
+    ``git cat-file --batch-check`` process instead of one process per SHA.
+    """
     try:
-        cmd = ["git"]
-        if repo_root:
-            cmd += ["-C", str(repo_root)]
-        cmd += ["cat-file", "-e", sha]
-        result = subprocess.run(cmd, capture_output=True, timeout=5)
-        return result.returncode == 0
+        found = get_broker(repo_root).objects_exist(shas)
     except Exception:
-        return False
+        return set()
+    return {sha for sha, exists in found.items() if exists}
+
+
+def _sha_exists_in_git(sha: str, repo_root: Optional[Path] = None) -> bool:
+    """Return True if SHA exists in the git history."""
+    return sha in _shas_in_git([sha], repo_root)
 
 
 def verify_claims(
@@ -289,9 +295,10 @@ def verify_claims(
             )
 
     # Check commit SHA claims
-    for sha_match in _SHA_RE.finditer(coo_output):
-        sha = sha_match.group(1)
-        if repo_root and not _sha_exists_in_git(sha, repo_root):
+    claimed_shas = [m.group(1) for m in _SHA_RE.finditer(coo_output)]
+    known_shas = _shas_in_git(claimed_shas, repo_root) if repo_root and claimed_shas else set()
+    for sha in claimed_shas:
+        if repo_root and sha not in known_shas:
             violations.append(
                 ClaimViolation(
                     claim_text=sha,
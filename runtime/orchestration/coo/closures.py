@@ -10,6 +10,7 @@ import yaml
 
 from runtime.orchestration.coo.approval_refs import approval_ref_error
 from runtime.util.atomic_write import atomic_write_text
+from runtime.util.yaml_io import load_yaml_file
 
 SPRINT_CLOSE_SCHEMA_VERSION = "sprint_close_packet.v1"
 SESSION_CONTEXT_SCHEMA_VERSION = "session_context_packet.v1"
@@ -165,8 +166,7 @@ def validate_council_request_packet(payload: dict[str, Any]) -> None:
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     try:
-        with open(path, "r", encoding="utf-8") as handle:
-            payload = yaml.safe_load(handle)
+        payload = load_yaml_file(path)
     except yaml.YAMLError as exc:
         raise ClosureValidationError(f"Invalid YAML in {path}: {exc}") from exc
     if not isinstance(payload, dict):
@@ -12,9 +12,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from runtime.orchestration.coo.backlog import TaskEntry, filter_actionable, load_backlog
+from runtime.util.yaml_io import load_yaml_file
 
 _BACKLOG_RELATIVE_PATH = Path("config/tasks/backlog.yaml")
 _DELEGATION_RELATIVE_PATH = Path("config/governance/delegation_envelope.yaml")
@@ -70,8 +69,7 @@ def _load_yaml_mapping(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(path)
 
-    with open(path, "r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle)
+    raw = load_yaml_file(path)
 
     if not isinstance(raw, dict):
         raise ValueError(f"Expected YAML mapping in {path}, got {type(raw).__name__}")
@@ -286,8 +284,6 @@ def build_propose_context(repo_root: Path) -> dict[str, Any]:
 
 def _collect_dispatch_state(repo_root: Path) -> dict[str, Any]:
     """Read dispatch dirs to build a summary of current order state."""
-    import yaml as _yaml
-
     dispatch_base = repo_root / "artifacts" / "dispatch"
     inbox_dir = dispatch_base / "inbox"
     active_dir = dispatch_base / "active"
@@ -312,7 +308,7 @@ def _collect_dispatch_state(repo_root: Path) -> dict[str, Any]:
             if f.name.endswith(".tmp"):
                 continue
             try:
-                raw = _yaml.safe_load(f.read_text(encoding="utf-8"))
+                raw = load_yaml_file(f)
                 if isinstance(raw, dict):
                     dr = raw.get("dispatch_result", {})
                     if isinstance(dr, dict):
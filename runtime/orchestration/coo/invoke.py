@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import json
+import os
+import random
 import subprocess
 import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from runtime.receipts.invocation_receipt import record_invocation_receipt
 
+# Transport selection: "auto" (argv, or stdin above the argv limit), "argv"
+# or "stdin". "stdin" passes ``--message -`` and writes the message to the
+# agent's stdin
+COO_TRANSPORT_ENV = "LIFEOS_COO_TRANSPORT"
+TRANSPORTS = ("auto", "argv", "stdin")
+
+# Linux caps a single argv string at MAX_ARG_STRLEN (128 KiB); messages above
+# this size cannot be passed as --message and go over stdin instead
+_ARGV_MESSAGE_LIMIT = 96 * 1024
+_STDIN_MESSAGE_ARG = "-"
+
 
 class InvocationError(RuntimeError):
     """Raised when the OpenClaw subprocess fails, times out, or returns unusable output."""
@@ -102,7 +116,36 @@ def _thinking_level_for_mode(mode: str) -> str:
     return "high"
 
 
-def _estimate_token_usage(input_text: str, output_text: str = "") -> dict[str, int | str]:
+def _resolve_transport(transport: str | None, message: str) -> str:
+    kind = (transport or os.environ.get(COO_TRANSPORT_ENV) or "auto").strip().lower()
+    if kind not in TRANSPORTS:
+        raise InvocationError(f"unknown COO transport {kind!r}; expected one of {TRANSPORTS}")
+    if kind == "auto":
+        return "stdin" if len(message.encode("utf-8")) > _ARGV_MESSAGE_LIMIT else "argv"
+    return kind
+
+
+def _run_agent(
+    cmd: list[str], message: str, transport: str, timeout: float
+) -> subprocess.CompletedProcess:
+    """Execute one agent invocation over the selected transport."""
+    if transport == "stdin":
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, input=message)
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        stdin=subprocess.DEVNULL,
+    )
+
+
+def _backoff_delay(cap: float) -> float:
+    """Equal-jitter backoff: somewhere in [cap/2, cap] so retries do not align."""
+    return cap / 2 + random.uniform(0, cap / 2)
+
+
+def _estimate_token_usage(input_text: str, output_text: str = "") -> dict[str, Any]:
     prompt_tokens = max(0, len(input_text) // 4)
     completion_tokens = max(0, len(output_text) // 4)
     total_tokens = prompt_tokens + completion_tokens
@@ -122,6 +165,8 @@ def invoke_coo_reasoning(
     timeout_s: int = 120,
     run_id: str = "",
     agent: str = "main",
+    transport: str | None = None,
+    deadline_s: float | None = None,
     _retry_delays: tuple[float, ...] = (1.0, 3.0),
 ) -> str:
     """
@@ -135,6 +180,10 @@ def invoke_coo_reasoning(
     :param repo_root: Repository root path (unused in CLI invocation; kept for future SDK use).
     :param timeout_s: Subprocess timeout in seconds.
     :param run_id: Content-addressable run ID for receipt emission (empty = no receipt).
+    :param transport: "auto" | "argv" | "stdin"; defaults to $LIFEOS_COO_TRANSPORT, then
+        "auto" (argv, or stdin for a message too large for a single argument).
+    :param deadline_s: Total budget across attempts and backoff; defaults to
+        ``timeout_s`` per attempt. Each attempt's timeout is capped by what remains.
     """
     payload = dict(context)
     payload["mode"] = mode
@@ -252,6 +301,24 @@ def invoke_coo_reasoning(
     # and stops conversation history from accumulating across invocations.
     session_id = str(uuid.uuid4())
 
+    start_ts = _utc_now()
+    try:
+        transport_kind = _resolve_transport(transport, message)
+    except InvocationError as exc:
+        record_invocation_receipt(
+            run_id=run_id,
+            provider_id="openclaw",
+            mode="cli",
+            seat_id=f"coo_{mode}",
+            start_ts=start_ts,
+            end_ts=_utc_now(),
+            exit_status=-1,
+            output_content="",
+            schema_validation="n/a",
+            token_usage=_estimate_token_usage(message),
+            error=str(exc),
+        )
+        raise
     cmd = [
         "openclaw",
         "agent",
@@ -262,7 +329,7 @@ def invoke_coo_reasoning(
         "--thinking",
         _thinking_level_for_mode(mode),
         "--message",
-        message,
+        message if transport_kind == "argv" else _STDIN_MESSAGE_ARG,
         "--json",
     ]
 
@@ -270,21 +337,24 @@ def invoke_coo_reasoning(
     # propose mode, a missing binary is treated as a deterministic
     # configuration failure and should fail fast.
     _retry_schedule = list(_retry_delays) if mode in ("chat", "direct", "propose") else []
-    _last_transient_exc: BaseException | None = None
+    # Seeded as a timeout so a deadline that expires before any attempt
+    # completes is reported like one
+    _last_transient_exc: BaseException | None = subprocess.TimeoutExpired(cmd[:2], 0)
     result: subprocess.CompletedProcess | None = None
-    start_ts = _utc_now()
+    attempts = len(_retry_schedule) + 1
+    deadline = time.monotonic() + (deadline_s if deadline_s is not None else timeout_s * attempts)
 
-    for _retry_num in range(len(_retry_schedule) + 1):
+    for _retry_num in range(attempts):
         if _retry_num > 0:
-            time.sleep(_retry_schedule[_retry_num - 1])
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(_backoff_delay(_retry_schedule[_retry_num - 1]), remaining))
+        attempt_timeout = min(timeout_s, deadline - time.monotonic())
+        if attempt_timeout <= 0:
+            break
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout_s,
-                stdin=subprocess.DEVNULL,
-            )
+            result = _run_agent(cmd, message, transport_kind, attempt_timeout)
             _last_transient_exc = None
             break
         except subprocess.TimeoutExpired as exc:
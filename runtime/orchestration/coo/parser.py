@@ -18,6 +18,7 @@ from runtime.orchestration.ops.registry import (
     get_action_spec,
     validate_action,
 )
+from runtime.util import yaml_io
 
 PROPOSAL_SCHEMA_VERSION = "task_proposal.v1"
 OPERATION_PROPOSAL_SCHEMA_VERSION = "operation_proposal.v1"
@@ -67,7 +68,7 @@ def _extract_yaml_payload_with_stage(text: str) -> tuple[str, str]:
     schema_match = _SCHEMA_BLOCK_RE.search(stripped)
     if schema_match and schema_match.start() > 0:
         try:
-            candidate = yaml.safe_load(stripped)
+            candidate = yaml_io.safe_load(stripped)
         except yaml.YAMLError:
             candidate = None
         if not isinstance(candidate, dict):
@@ -80,7 +81,7 @@ def _extract_yaml_payload_with_stage(text: str) -> tuple[str, str]:
 def parse_proposal_response(text: str) -> list[TaskProposal]:
     payload = _extract_yaml_payload(text)
     try:
-        raw = yaml.safe_load(payload)
+        raw = yaml_io.safe_load(payload)
     except yaml.YAMLError as exc:
         raise ParseError(f"Failed to parse proposal YAML: {exc}") from exc
 
@@ -156,7 +157,7 @@ def parse_proposal_response(text: str) -> list[TaskProposal]:
 def parse_operation_proposal(text: str) -> dict[str, Any]:
     payload = _extract_yaml_payload(text)
     try:
-        raw = yaml.safe_load(payload)
+        raw = yaml_io.safe_load(payload)
     except yaml.YAMLError as exc:
         raise ParseError(f"Operation proposal YAML is not valid: {exc}") from exc
 
@@ -233,7 +234,7 @@ def parse_ntp(raw_output: str) -> dict[str, Any]:
     """Parse a nothing_to_propose.v1 YAML block. Raises ParseError if invalid."""
     payload = _extract_yaml_payload(raw_output.strip())
     try:
-        raw = yaml.safe_load(payload)
+        raw = yaml_io.safe_load(payload)
     except yaml.YAMLError as exc:
         raise ParseError(f"NTP output is not valid YAML: {exc}") from exc
     if not isinstance(raw, dict):
@@ -252,7 +253,7 @@ def parse_escalation_packet(raw_output: str) -> dict[str, Any]:
     """Parse an escalation_packet.v1 YAML block. Raises ParseError if invalid."""
     payload = _extract_yaml_payload(raw_output.strip())
     try:
-        raw = yaml.safe_load(payload)
+        raw = yaml_io.safe_load(payload)
     except yaml.YAMLError as exc:
         raise ParseError(f"Escalation packet is not valid YAML: {exc}") from exc
     if not isinstance(raw, dict):
@@ -8,9 +8,8 @@ import re
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from runtime.util.canonical import sha256_file
+from runtime.util.yaml_io import load_yaml_file
 
 
 def verify_delegation_ceiling(
@@ -86,7 +85,7 @@ def verify_approval_manifest(
 
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return load_yaml_file(path) or {}
 
 
 def full_promotion_guard(
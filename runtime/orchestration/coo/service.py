@@ -35,6 +35,7 @@ from runtime.orchestration.ops.queue import (
     save_proposal,
     save_receipt,
 )
+from runtime.util import yaml_io
 from runtime.util.canonical import compute_sha256
 
 _PROMPT_CANONICAL_RELATIVE_PATH = Path("config") / "coo" / "prompt_canonical.md"
@@ -104,7 +105,7 @@ def propose_coo(repo_root: Path, agent: str = "main") -> dict[str, Any]:
         violations = list(verify_claims(raw_output, evidence, repo_root=repo_root))
         normalized = _extract_yaml_payload(raw_output)
         try:
-            payload = yaml.safe_load(normalized)
+            payload = yaml_io.safe_load(normalized)
             if not isinstance(payload, dict):
                 payload = {"raw": raw_output}
         except yaml.YAMLError:
@@ -366,7 +367,7 @@ def chat_message(
         # false-positives when COO mentions "operation_proposal.v1" in prose.
         _payload = _extract_yaml_payload(raw_output)
         try:
-            _parsed = yaml.safe_load(_payload)
+            _parsed = yaml_io.safe_load(_payload)
             if (
                 isinstance(_parsed, dict)
                 and _parsed.get("schema_version") == OPERATION_PROPOSAL_SCHEMA_VERSION
@@ -6,12 +6,12 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from runtime.orchestration.coo.approval_refs import approval_ref_error
+from runtime.util.yaml_io import load_yaml_file
+
 
 def _load_yaml(path: Path) -> dict[str, Any]:
-    payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    payload = load_yaml_file(path) or {}
     if not isinstance(payload, dict):
         raise ValueError(f"Expected YAML mapping in {path}")
     return payload
@@ -14,6 +14,7 @@ from runtime.orchestration.workflow_runtime import (
     build_task_context,
     resolve_workflow_id_for_task_type,
 )
+from runtime.util.yaml_io import load_yaml_file
 
 TEMPLATE_SCHEMA_VERSION = "order_template.v1"
 
@@ -27,8 +28,7 @@ def load_template(template_name: str, repo_root: Path) -> dict[str, Any]:
     path = repo_root / "config" / "tasks" / "order_templates" / f"{template_name}.yaml"
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        raw = load_yaml_file(path)
     except yaml.YAMLError as exc:
         raise TemplateValidationError(f"Invalid YAML in {path}: {exc}") from exc
 
@@ -1,7 +1,7 @@
 """Policy-driven council runtime package."""
 
 from .compiler import compile_council_run_plan, compile_council_run_plan_v2
-from .convergence import ConvergenceResult, compute_convergence
+from .convergence import ConvergenceMatrix, ConvergenceResult, compute_convergence
 from .fsm import CouncilFSM, CouncilFSMv2
 from .models import (
     CouncilBlockedError,
@@ -41,6 +41,7 @@ __all__ = [
     "evaluate_expression",
     "load_council_policy",
     "resolve_model_family",
+    "ConvergenceMatrix",
     "ConvergenceResult",
     "compute_convergence",
     "build_multi_provider_executor",
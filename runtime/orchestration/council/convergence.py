@@ -11,40 +11,53 @@ Algorithm:
   - Average pairwise similarity = convergence score
   - Score >= threshold (default 0.8) = convergent (fast-path eligible)
 
+ConvergenceMatrix keeps this state across rounds: each output is tokenized
+once, its tokens are interned to integer ids and stored as a bitset (a
+Python int), so a pairwise intersection is one AND plus a popcount over
+machine words. Only the rows of lenses whose output changed are
+recomputed. The similarities are exact (tolerance 0): the same integer
+counts and float operations as _jaccard_similarity, so scores and pairwise
+values are identical to the set-based computation.
+
 This module is advisory — the FSM decides whether to act on convergence.
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Any, Mapping
+from typing import Any, Iterator, Mapping
 
 # Default convergence threshold (80% agreement)
 DEFAULT_THRESHOLD = 0.80
 
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
 
-def _extract_tokens(output: Any) -> set[str]:
-    """
-    Extract normalized text tokens from a lens output dict.
-
-    Recursively walks the dict, extracting string values and splitting
-    into lowercase word tokens. Ignores keys starting with '_' (metadata).
-    """
-    tokens: set[str] = set()
 
+def _iter_strings(output: Any) -> Iterator[str]:
+    """Yield the string values of a lens output, skipping '_' (metadata) keys."""
     if isinstance(output, str):
-        words = re.findall(r"[a-z0-9_]+", output.lower())
-        tokens.update(words)
+        yield output
     elif isinstance(output, dict):
         for key, value in output.items():
             if isinstance(key, str) and key.startswith("_"):
                 continue
-            tokens.update(_extract_tokens(value))
+            yield from _iter_strings(value)
     elif isinstance(output, (list, tuple)):
         for item in output:
-            tokens.update(_extract_tokens(item))
+            yield from _iter_strings(item)
 
-    return tokens
+
+def _extract_tokens(output: Any) -> set[str]:
+    """
+    Extract normalized text tokens from a lens output dict.
+
+    Recursively walks the dict, extracting string values and splitting
+    into lowercase word tokens. Ignores keys starting with '_' (metadata).
+    """
+    # The space separator never matches the token pattern, so one pass over
+    # the joined text yields the same tokens as one pass per string.
+    return set(_TOKEN_RE.findall(" ".join(_iter_strings(output)).lower()))
 
 
 def _jaccard_similarity(a: set[str], b: set[str]) -> float:
@@ -84,32 +97,133 @@ def compute_convergence(
             threshold=threshold,
         )
 
-    # Extract token sets per lens
-    token_sets = {name: _extract_tokens(output) for name, output in active.items()}
-
-    # Compute all pairwise similarities
-    names = sorted(token_sets.keys())
-    pairwise: dict[str, float] = {}
-    total_sim = 0.0
-    pair_count = 0
-
-    for i in range(len(names)):
-        for j in range(i + 1, len(names)):
-            key = f"{names[i]}|{names[j]}"
-            sim = _jaccard_similarity(token_sets[names[i]], token_sets[names[j]])
-            pairwise[key] = round(sim, 4)
-            total_sim += sim
-            pair_count += 1
-
-    avg_score = total_sim / pair_count if pair_count > 0 else 0.0
-
-    return ConvergenceResult(
-        score=round(avg_score, 4),
-        convergent=avg_score >= threshold,
-        lens_count=len(active),
-        pairwise=pairwise,
-        threshold=threshold,
-    )
+    matrix = ConvergenceMatrix()
+    matrix.update(active)
+    return matrix.result(threshold)
+
+
+def _fingerprint(output: Any) -> bytes:
+    """Cheap change detector for a lens output (a changed repr means retokenize)."""
+    return hashlib.blake2b(repr(output).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ConvergenceMatrix:
+    """
+    Pairwise Jaccard matrix over lens outputs, maintained across rounds.
+
+    Call update() with each round's lens results (same shape as
+    compute_convergence takes); lenses whose output is unchanged keep their
+    token bitset and intersections, so a round where one of k lenses
+    changed costs one tokenization and k-1 bitset intersections.
+    """
+
+    def __init__(self) -> None:
+        self._vocab: dict[str, int] = {}
+        self._fingerprints: dict[str, bytes] = {}
+        self._bits: dict[str, int] = {}
+        self._sizes: dict[str, int] = {}
+        self._inter: dict[str, dict[str, int]] = {}
+        self.tokenized = 0  # outputs tokenized so far (for callers measuring reuse)
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._bits)
+
+    def update(self, lens_results: Mapping[str, Any]) -> set[str]:
+        """
+        Sync the matrix with this round's lens results.
+
+        None (waived) or missing lenses are dropped. Returns the names of
+        lenses whose rows were (re)computed.
+        """
+        active = {name: output for name, output in lens_results.items() if output is not None}
+        for name in [name for name in self._bits if name not in active]:
+            self._remove(name)
+
+        changed: set[str] = set()
+        for name, output in active.items():
+            fingerprint = _fingerprint(output)
+            if self._fingerprints.get(name) == fingerprint:
+                continue
+            self._fingerprints[name] = fingerprint
+            self._bits[name] = self._bitset(_extract_tokens(output))
+            self._sizes[name] = self._bits[name].bit_count()
+            self.tokenized += 1
+            changed.add(name)
+
+        for name in changed:
+            bits = self._bits[name]
+            row = self._inter[name] = {}
+            for other, other_bits in self._bits.items():
+                if other != name:
+                    row[other] = self._inter.setdefault(other, {})[name] = (
+                        bits & other_bits
+                    ).bit_count()
+        return changed
+
+    def similarity(self, a: str, b: str) -> float:
+        """Jaccard similarity between two lenses' token sets."""
+        size_a, size_b = self._sizes[a], self._sizes[b]
+        if a == b or not size_a and not size_b:
+            return 1.0
+        if not size_a or not size_b:
+            return 0.0
+        intersection = self._inter[a][b]
+        return intersection / (size_a + size_b - intersection)
+
+    def matrix(self) -> list[list[float]]:
+        """Full symmetric similarity matrix, rows and columns in names order."""
+        names = self.names
+        return [[self.similarity(a, b) for b in names] for a in names]
+
+    def result(self, threshold: float = DEFAULT_THRESHOLD) -> ConvergenceResult:
+        """ConvergenceResult for the current round (as compute_convergence)."""
+        names = self.names
+        if len(names) < 2:
+            return ConvergenceResult(
+                score=1.0,
+                convergent=True,
+                lens_count=len(names),
+                pairwise={},
+                threshold=threshold,
+            )
+
+        pairwise: dict[str, float] = {}
+        total_sim = 0.0
+        pair_count = 0
+
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                sim = self.similarity(names[i], names[j])
+                pairwise[f"{names[i]}|{names[j]}"] = round(sim, 4)
+                total_sim += sim
+                pair_count += 1
+
+        avg_score = total_sim / pair_count
+
+        return ConvergenceResult(
+            score=round(avg_score, 4),
+            convergent=avg_score >= threshold,
+            lens_count=len(names),
+            pairwise=pairwise,
+            threshold=threshold,
+        )
+
+    def _bitset(self, tokens: set[str]) -> int:
+        vocab = self._vocab
+        ids = [vocab.setdefault(token, len(vocab)) for token in tokens]
+        if not ids:
+            return 0
+        buffer = bytearray(max(ids) // 8 + 1)
+        for token_id in ids:
+            buffer[token_id >> 3] |= 1 << (token_id & 7)
+        return int.from_bytes(buffer, "little")
+
+    def _remove(self, name: str) -> None:
+        for table in (self._fingerprints, self._bits, self._sizes, self._inter):
+            table.pop(name, None)
+        for row in self._inter.values():
+            row.pop(name, None)
 
 
 class ConvergenceResult:
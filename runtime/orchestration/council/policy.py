@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping
 
-import yaml
+from runtime.util.yaml_io import load_yaml_file
 
 from .models import CouncilRuntimeError
 
@@ -353,8 +353,7 @@ def load_council_policy(policy_path: str | Path | None = None) -> CouncilPolicy:
     path = Path(policy_path) if policy_path else _default_policy_path()
     if not path.exists():
         raise CouncilRuntimeError(f"Council policy not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        parsed = yaml.safe_load(handle)
+    parsed = load_yaml_file(path)
     if not isinstance(parsed, dict):
         raise CouncilRuntimeError(f"Council policy is invalid: {path}")
     return CouncilPolicy(raw=parsed)
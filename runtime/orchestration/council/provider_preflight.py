@@ -4,15 +4,30 @@ Provider preflight health checks for the council runner.
 Checks each configured provider before any seat prompt is sent.
 Classifies availability so the runner can block early on
 provider_unavailable rather than burning seat budget.
+
+Providers are probed concurrently under one global deadline. Results can be
+persisted to a provider health cache file whose entries expire per failure
+class (auth failures are sticky for the same credentials, rate limits expire
+quickly), so back-to-back council runs do not re-probe healthy providers.
+Concurrent preflights in one process share a single in-flight probe per
+provider.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import re
+import threading
 import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
 from typing import Any, Callable, Mapping
 
 from runtime.orchestration.council.models import ProviderHealthResult, SeatFailureClass
+from runtime.util.atomic_write import atomic_write_json
 
 # Default timeouts (seconds)
 DEFAULT_PREFLIGHT_TIMEOUT = 30
@@ -21,6 +36,25 @@ _ECHO_PROMPT = "Reply with the single word: ready"
 # Callable type for the echo-prompt function (injectable for tests)
 EchoProbe = Callable[[str, float], tuple[bool, str | None]]
 
+HEALTH_CACHE_SCHEMA_VERSION = "provider_health_cache.v1"
+
+# Seconds a cached result stays valid, by outcome
+DEFAULT_HEALTH_TTLS: dict[SeatFailureClass, float] = {
+    SeatFailureClass.seat_completed: 600.0,
+    SeatFailureClass.provider_quota: 60.0,
+    SeatFailureClass.seat_timeout: 120.0,
+    SeatFailureClass.provider_unavailable: 120.0,
+}
+# Missing/rejected credentials do not recover by waiting; the entry is keyed on
+# a credential fingerprint, so changing the key invalidates it immediately
+AUTH_FAILURE_TTL = 24 * 3600.0
+
+# Probe errors meaning the provider rejected the credentials (HTTP 401/403)
+_AUTH_REJECTED = re.compile(
+    r"\b40[13]\b|unauthori[sz]ed|forbidden|invalid[ _-]api[ _-]key|authentication failed",
+    re.IGNORECASE,
+)
+
 
 def _auth_check(provider: str) -> bool:
     """Return True if auth credentials are present for this provider."""
@@ -28,6 +62,14 @@ def _auth_check(provider: str) -> bool:
     return bool(os.environ.get("ZEN_REVIEWER_KEY"))
 
 
+def _auth_fingerprint() -> str:
+    """Short digest of the current credentials ("" when absent)."""
+    key = os.environ.get("ZEN_REVIEWER_KEY")
+    if not key:
+        return ""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
 def _make_api_echo_probe() -> EchoProbe:
     """Return an echo probe that calls the provider API via call_agent."""
 
@@ -64,18 +106,23 @@ def check_provider(
     timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
     echo_probe: EchoProbe | None = None,
     skip_echo: bool = False,
+    deadline: float | None = None,
 ) -> ProviderHealthResult:
     """
     Run a full health check for one provider/model combination.
 
     Auth is checked first; network/echo probe is skipped if auth is absent.
-    Echo probe is retried once on failure before classifying unavailable.
+    Echo probe is retried once on failure before classifying unavailable,
+    except when the provider rejects the credentials (401/403), which is
+    reported as an auth failure (auth_ok=False) straight away.
 
     Args:
         provider: Human-readable provider name (e.g. "openrouter/kimi-k2.5").
         model: Full model ID to probe.
         timeout: Seconds allowed for the echo prompt (each attempt).
         echo_probe: Injectable callable for testing; defaults to live API probe.
+        deadline: Absolute ``time.monotonic()`` cutoff; attempts are shortened
+            to fit and the retry is skipped once it has passed.
 
     Returns:
         ProviderHealthResult with status classified as one of SeatFailureClass.
@@ -104,8 +151,11 @@ def check_provider(
 
     # Attempt echo probe (up to 2 tries)
     for attempt in range(2):
+        attempt_timeout = timeout
+        if deadline is not None:
+            attempt_timeout = min(timeout, max(deadline - time.monotonic(), 0.0))
         t0 = time.monotonic()
-        ok, err = echo_probe(model, timeout)
+        ok, err = echo_probe(model, attempt_timeout)
         latency = time.monotonic() - t0
 
         if ok:
@@ -116,10 +166,20 @@ def check_provider(
                 status=SeatFailureClass.seat_completed,
                 latency_seconds=latency,
             )
+        if err and _AUTH_REJECTED.search(err):
+            return ProviderHealthResult(
+                provider=provider,
+                auth_ok=False,
+                echo_ok=False,
+                status=SeatFailureClass.provider_unavailable,
+                latency_seconds=latency,
+                error=err,
+            )
 
-        # Classify the error on the last attempt
-        if attempt == 1:
-            status = _classify_error(err or "", latency, timeout)
+        # Classify the error on the last attempt (or when out of time)
+        out_of_time = deadline is not None and time.monotonic() >= deadline
+        if attempt == 1 or out_of_time:
+            status = _classify_error(err or "", latency, attempt_timeout)
             return ProviderHealthResult(
                 provider=provider,
                 auth_ok=True,
@@ -148,30 +208,209 @@ def _classify_error(error: str, latency: float, timeout: float) -> SeatFailureCl
     return SeatFailureClass.provider_unavailable
 
 
+def _timed_out_on_deadline(result: ProviderHealthResult, timeout: float) -> bool:
+    """True for a seat_timeout whose attempt was cut short by the global deadline.
+
+    A provider timing out on its own takes (nearly) the full probe timeout;
+    a shorter timed-out attempt only ran out of preflight budget and says
+    nothing about the provider, so it must not be cached.
+    """
+    return (
+        result.status == SeatFailureClass.seat_timeout
+        and (result.latency_seconds or 0.0) < timeout * 0.95
+    )
+
+
+class ProviderHealthCache:
+    """
+    Persisted preflight results with a per-failure-class TTL.
+
+    Entries are keyed on (provider, model) and record the credential
+    fingerprint they were observed under; an entry is only reused while
+    the fingerprint matches and its TTL has not elapsed.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttls: Mapping[SeatFailureClass, float] | None = None,
+        auth_failure_ttl: float = AUTH_FAILURE_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self._ttls = dict(DEFAULT_HEALTH_TTLS if ttls is None else ttls)
+        self._auth_failure_ttl = auth_failure_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(provider: str, model: str) -> str:
+        return f"{provider}|{model}"
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("schema_version") != HEALTH_CACHE_SCHEMA_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _ttl(self, result: ProviderHealthResult) -> float:
+        if not result.auth_ok:
+            return self._auth_failure_ttl
+        return self._ttls.get(result.status, 0.0)
+
+    def get(self, provider: str, model: str) -> ProviderHealthResult | None:
+        """Return the cached result if still valid, else None."""
+        entry = self._load().get(self._key(provider, model))
+        if not isinstance(entry, dict):
+            return None
+        try:
+            result = ProviderHealthResult(
+                provider=provider,
+                auth_ok=bool(entry["auth_ok"]),
+                echo_ok=bool(entry["echo_ok"]),
+                status=SeatFailureClass(entry["status"]),
+                latency_seconds=entry.get("latency_seconds"),
+                error=entry.get("error"),
+            )
+            checked_at = float(entry["checked_at"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if entry.get("auth_fingerprint") != _auth_fingerprint():
+            return None
+        if self._clock() - checked_at >= self._ttl(result):
+            return None
+        return result
+
+    def put(self, model: str, result: ProviderHealthResult) -> None:
+        """Record a probe result (read-merge-write, atomic replace)."""
+        if self._ttl(result) <= 0:
+            return
+        entry = result.to_dict()
+        entry["checked_at"] = self._clock()
+        entry["auth_fingerprint"] = _auth_fingerprint()
+        with self._lock:
+            entries = self._load()
+            entries[self._key(result.provider, model)] = entry
+            atomic_write_json(
+                self.path, {"schema_version": HEALTH_CACHE_SCHEMA_VERSION, "entries": entries}
+            )
+
+
+# In-flight probes shared by concurrent preflights: (provider, model, probe) -> Future
+_inflight: dict[tuple[str, str, EchoProbe | None], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _probe_shared(
+    provider: str,
+    model: str,
+    *,
+    timeout: float,
+    echo_probe: EchoProbe | None,
+    deadline: float,
+    health_cache: ProviderHealthCache | None,
+) -> Future:
+    """Return a Future for this provider's probe, starting one if none is running.
+
+    Probes run on daemon threads so a provider that hangs past the deadline
+    cannot hold up interpreter exit; a late result still lands in the cache.
+    """
+    key = (provider, model, echo_probe)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future
+        future = Future()
+        _inflight[key] = future
+
+    def _run() -> None:
+        try:
+            result = check_provider(
+                provider, model, timeout=timeout, echo_probe=echo_probe, deadline=deadline
+            )
+            if health_cache is not None and not _timed_out_on_deadline(result, timeout):
+                try:
+                    health_cache.put(model, result)
+                except OSError:
+                    pass  # cache is best-effort
+            future.set_result(result)
+        except BaseException as exc:  # surface to every waiter
+            future.set_exception(exc)
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    threading.Thread(target=_run, name=f"preflight-{provider}", daemon=True).start()
+    return future
+
+
 def run_preflight(
     provider_models: Mapping[str, str],
     *,
     timeout: float = DEFAULT_PREFLIGHT_TIMEOUT,
     echo_probe: EchoProbe | None = None,
     skip_echo: bool = False,
+    deadline_seconds: float | None = None,
+    health_cache: ProviderHealthCache | None = None,
 ) -> dict[str, ProviderHealthResult]:
     """
-    Run preflight checks for all providers.
+    Run preflight checks for all providers concurrently.
 
     Args:
         provider_models: Mapping of provider_name → model_id.
         timeout: Per-provider echo-probe timeout in seconds.
         echo_probe: Injectable probe for testing.
+        skip_echo: Auth-only mode; no probes, cache neither read nor written.
+        deadline_seconds: Wall-clock budget for the whole preflight
+            (default: two probe attempts). Providers still unresolved when
+            it expires are reported as seat_timeout.
+        health_cache: Optional persisted cache consulted before probing.
 
     Returns:
         Dict mapping provider_name → ProviderHealthResult.
     """
+    if skip_echo:
+        return {
+            provider: check_provider(provider, model, timeout=timeout, skip_echo=True)
+            for provider, model in provider_models.items()
+        }
+
+    budget = 2 * timeout if deadline_seconds is None else deadline_seconds
+    deadline = time.monotonic() + budget
     results: dict[str, ProviderHealthResult] = {}
+    pending: dict[str, Future] = {}
     for provider, model in provider_models.items():
-        results[provider] = check_provider(
-            provider, model, timeout=timeout, echo_probe=echo_probe, skip_echo=skip_echo
+        cached = health_cache.get(provider, model) if health_cache is not None else None
+        if cached is not None:
+            results[provider] = cached
+            continue
+        pending[provider] = _probe_shared(
+            provider,
+            model,
+            timeout=timeout,
+            echo_probe=echo_probe,
+            deadline=deadline,
+            health_cache=health_cache,
         )
-    return results
+
+    for provider, future in pending.items():
+        try:
+            results[provider] = future.result(timeout=max(deadline - time.monotonic(), 0.0))
+        except FutureTimeoutError:
+            results[provider] = ProviderHealthResult(
+                provider=provider,
+                auth_ok=_auth_check(provider),
+                echo_ok=False,
+                status=SeatFailureClass.seat_timeout,
+                latency_seconds=budget,
+                error=f"preflight deadline exceeded ({budget:g}s)",
+            )
+    return {provider: results[provider] for provider in provider_models}
 
 
 def is_run_blocked(
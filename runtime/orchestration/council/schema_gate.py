@@ -9,7 +9,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Mapping
 
-import yaml
+from runtime.util import yaml_io
 
 from .policy import CouncilPolicy
 
@@ -51,7 +51,7 @@ def _normalize_packet(raw_output: dict[str, Any] | str) -> tuple[dict[str, Any]
             errors.append("Seat output is empty.")
             return None, errors
         try:
-            parsed = yaml.safe_load(text)
+            parsed = yaml_io.safe_load(text)
         except Exception as exc:
             errors.append(f"Seat output is not valid YAML/JSON: {exc}")
             return None, errors
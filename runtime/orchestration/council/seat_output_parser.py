@@ -4,6 +4,10 @@ Seat output parser for the council runner.
 Parses raw LLM seat output into NormalizedSeatOutput.
 On schema failure, issues one correction retry with error context prepended.
 If the retry also fails, marks the seat as seat_schema_invalid.
+
+seat_envelope_detector() applies the same field checks to a streamed seat
+call, so the stream can be stopped as soon as the required fields have
+parsed or one of them is already invalid.
 """
 
 from __future__ import annotations
@@ -13,7 +17,9 @@ from typing import Any, Callable, Mapping
 
 import yaml
 
+from runtime.agents.streaming import EnvelopeDetector
 from runtime.orchestration.council.models import NormalizedSeatOutput, SeatFailureClass
+from runtime.util import yaml_io
 
 logger = logging.getLogger(__name__)
 
@@ -21,13 +27,33 @@ logger = logging.getLogger(__name__)
 REQUIRED_FIELDS = frozenset(
     ["verdict", "findings", "risks", "fixes", "open_questions", "confidence", "assumptions"]
 )
+# Optional fields seats are asked for (seat_payload_builder); a streamed seat
+# call waits for them so they are not cut off by an early stop
+OPTIONAL_FIELDS = frozenset(["complexity_budget"])
 VALID_VERDICTS = {"Accept", "Revise", "Reject"}
 VALID_CONFIDENCE = {"low", "medium", "high"}
 
+LIST_FIELDS = ("findings", "risks", "fixes", "open_questions", "assumptions")
+
 # Type for the retry callable (injectable for tests)
 RetryCallable = Callable[[str, str], Any]
 
 
+def seat_envelope_detector() -> EnvelopeDetector:
+    """
+    Envelope detector for streamed seat output.
+
+    Pass it as call_agent(..., envelope=...): the stream stops once every
+    required and optional field has parsed and passed its check (without an
+    optional field, once the envelope closes), or at the first field that
+    fails one. A stopped response carries the detected packet, which
+    parse_seat_output() accepts like any other mapping.
+    """
+    return EnvelopeDetector(
+        REQUIRED_FIELDS, check_field=_field_error, optional_fields=OPTIONAL_FIELDS
+    )
+
+
 def parse_seat_output(
     raw: str | Mapping[str, Any],
     *,
@@ -107,7 +133,7 @@ def _parse_and_validate(raw: str | Mapping[str, Any]) -> tuple[dict[str, Any], l
         packet = dict(raw)
     else:
         try:
-            parsed = yaml.safe_load(str(raw))
+            parsed = yaml_io.safe_load(str(raw))
         except Exception as exc:
             return {}, [f"YAML parse error: {exc}"]
         if isinstance(parsed, Mapping):
@@ -125,25 +151,29 @@ def _parse_and_validate(raw: str | Mapping[str, Any]) -> tuple[dict[str, Any], l
     if errors:
         return packet, errors
 
-    # Validate verdict
-    verdict = str(packet.get("verdict", "")).strip()
-    if verdict not in VALID_VERDICTS:
-        errors.append(f"invalid verdict {verdict!r}; expected one of {sorted(VALID_VERDICTS)}")
+    for name in ("verdict", "confidence", *LIST_FIELDS):
+        error = _field_error(name, packet.get(name))
+        if error:
+            errors.append(error)
 
-    # Validate confidence
-    confidence = str(packet.get("confidence", "")).strip().lower()
-    if confidence not in VALID_CONFIDENCE:
-        errors.append(
-            f"invalid confidence {confidence!r}; expected one of {sorted(VALID_CONFIDENCE)}"
-        )
+    return packet, errors
 
-    # Ensure list fields are actually lists
-    for list_field in ("findings", "risks", "fixes", "open_questions", "assumptions"):
-        value = packet.get(list_field)
-        if value is not None and not isinstance(value, list):
-            errors.append(f"field {list_field!r} must be a list, got {type(value).__name__}")
 
-    return packet, errors
+def _field_error(name: str, value: Any) -> str | None:
+    """Validate a single top-level field; None if acceptable (or unchecked)."""
+    if name == "verdict":
+        verdict = str(value).strip()
+        if verdict not in VALID_VERDICTS:
+            return f"invalid verdict {verdict!r}; expected one of {sorted(VALID_VERDICTS)}"
+    elif name == "confidence":
+        confidence = str(value).strip().lower()
+        if confidence not in VALID_CONFIDENCE:
+            return f"invalid confidence {confidence!r}; expected one of {sorted(VALID_CONFIDENCE)}"
+    elif name in LIST_FIELDS:
+        # Ensure list fields are actually lists
+        if value is not None and not isinstance(value, list):
+            return f"field {name!r} must be a list, got {type(value).__name__}"
+    return None
 
 
 def _to_normalized(
@@ -5,7 +5,7 @@ Provides:
 - ExecutionOrder: YAML schema + validation
 - DispatchEngine: Order lifecycle management + execution delegation
 - RunManifest: Append-only JSONL canonical manifest
-- ProviderPool: Health-aware provider routing (Phase 1 stub)
+- ProviderPool: Health-aware provider routing (EWMA/p95, circuit breaker, hedging)
 - SupervisorPort, CuratorPort: Protocol interfaces for future COO Agent integration
 """
 
@@ -19,7 +19,11 @@ from runtime.orchestration.dispatch.order import (
     parse_order,
 )
 from runtime.orchestration.dispatch.ports import CuratorPort, SupervisorPort
-from runtime.orchestration.dispatch.provider_pool import ProviderHealth, ProviderPool
+from runtime.orchestration.dispatch.provider_pool import (
+    HedgedResult,
+    ProviderHealth,
+    ProviderPool,
+)
 
 __all__ = [
     "DispatchEngine",
@@ -35,4 +39,5 @@ __all__ = [
     "CuratorPort",
     "ProviderPool",
     "ProviderHealth",
+    "HedgedResult",
 ]
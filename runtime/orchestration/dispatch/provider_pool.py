@@ -2,22 +2,29 @@
 ProviderPool — health-aware provider routing.
 
 Phase 1: Stub with deterministic tie-break logic. No live health monitoring.
-Phase 2: Full health monitoring with latency tracking, failure rates, cost tiers.
+Phase 2: Health monitoring from record_call(): EWMA and p95 latency per
+provider and per role, sliding-window failure rate, circuit breaker
+(closed -> open -> half_open -> closed) and optional hedged calls.
 
 Deterministic tie-break for "auto" resolution:
-  1. available (True first)
+  1. available and circuit not open (True first)
   2. failure_rate ASC
-  3. latency_ms ASC
+  3. latency_ms ASC (EWMA; the role's EWMA when the role has samples)
   4. cost_tier ASC (free < low < medium < high)
   5. name ASC (lexicographic — guarantees determinism on ties)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from runtime.util.atomic_write import atomic_write_json
 
@@ -25,6 +32,59 @@ HEALTH_STATE_RELATIVE_PATH = Path("artifacts/health/provider_state.json")
 
 COST_TIER_ORDER = {"free": 0, "low": 1, "medium": 2, "high": 3}
 
+EWMA_ALPHA = 0.2
+LATENCY_WINDOW = 100  # samples kept per provider/role for p95
+FAILURE_WINDOW = 20  # most recent outcomes used for failure_rate
+BREAKER_MIN_CALLS = 5
+BREAKER_FAILURE_THRESHOLD = 0.5
+BREAKER_COOLDOWN_SECONDS = 30.0
+HEDGE_MIN_SAMPLES = 20  # p95 must rest on this many samples before hedging
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+@dataclass
+class LatencyStats:
+    """EWMA plus a bounded sample window for percentiles."""
+
+    ewma_ms: float = 0.0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def observe(self, latency_ms: float) -> None:
+        if not self.samples:
+            self.ewma_ms = latency_ms
+        else:
+            self.ewma_ms += EWMA_ALPHA * (latency_ms - self.ewma_ms)
+        self.samples.append(latency_ms)
+
+    def observe_censored(self, lower_bound_ms: float) -> bool:
+        """
+        Record a call cancelled after lower_bound_ms (its true latency is
+        at least that). Only a bound above both the EWMA and p95 is kept, so
+        a censored sample can raise the estimates but never lower them.
+        """
+        if lower_bound_ms <= max(self.ewma_ms, self.percentile(95)):
+            return False
+        self.observe(lower_bound_ms)
+        return True
+
+    def percentile(self, pct: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(pct / 100.0 * len(ordered)))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ewma_ms": self.ewma_ms, "samples": list(self.samples)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyStats":
+        stats = cls(ewma_ms=float(data.get("ewma_ms", 0.0)))
+        stats.samples.extend(float(x) for x in data.get("samples", []))
+        return stats
+
 
 @dataclass
 class ProviderHealth:
@@ -34,6 +94,22 @@ class ProviderHealth:
     failure_rate: float = 0.0
     cost_tier: str = "free"
     last_checked: Optional[str] = None
+    latency_p95_ms: float = 0.0
+    circuit_state: str = CIRCUIT_CLOSED
+    circuit_opened_at: Optional[float] = None
+    latency: LatencyStats = field(default_factory=LatencyStats, repr=False)
+    outcomes: Deque[bool] = field(default_factory=lambda: deque(maxlen=FAILURE_WINDOW), repr=False)
+    roles: Dict[str, LatencyStats] = field(default_factory=dict, repr=False)
+
+
+@dataclass
+class HedgedResult:
+    """Outcome of call_hedged(); hedged is True if a second provider was called."""
+
+    provider: str
+    value: Any
+    latency_ms: float
+    hedged: bool
 
 
 class ProviderPool:
@@ -41,12 +117,20 @@ class ProviderPool:
     Health-aware provider routing pool.
 
     Phase 1: Configured providers with deterministic tie-break.
-    Phase 2: Live health monitoring via record_call() + smoke_test().
+    Phase 2: Live health monitoring via record_call() + smoke_test();
+    call_hedged() for tail-latency hedging; persist()/load() round-trip
+    the health state.
     """
 
-    def __init__(self, repo_root: Path, providers: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        repo_root: Path,
+        providers: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         self.repo_root = Path(repo_root).resolve()
         self._health: Dict[str, ProviderHealth] = {}
+        self._clock = clock
 
         for name, conf in (providers or {}).items():
             conf = conf or {}
@@ -56,34 +140,52 @@ class ProviderPool:
                 cost_tier=str(conf.get("cost_tier", "free")),
             )
 
-    def resolve_provider(self, preference: str, role: str = "") -> str:
-        """
-        Resolve provider preference to a concrete provider name.
+    def _refresh_circuit(self, h: ProviderHealth) -> str:
+        """Moves an open circuit to half_open once its cooldown has passed."""
+        if (
+            h.circuit_state == CIRCUIT_OPEN
+            and h.circuit_opened_at is not None
+            and self._clock() - h.circuit_opened_at >= BREAKER_COOLDOWN_SECONDS
+        ):
+            h.circuit_state = CIRCUIT_HALF_OPEN
+        return h.circuit_state
 
-        Returns preference unchanged if it's not "auto".
-        For "auto", uses deterministic tie-break over available providers.
-        """
-        if preference != "auto":
-            return preference
+    def _usable(self, h: ProviderHealth) -> bool:
+        return h.available and self._refresh_circuit(h) != CIRCUIT_OPEN
 
-        if not self._health:
-            return "auto"
+    def _latency_for(self, h: ProviderHealth, role: str) -> LatencyStats:
+        stats = h.roles.get(role) if role else None
+        return stats if stats is not None and stats.samples else h.latency
 
+    def ranked_providers(self, role: str = "") -> List[str]:
+        """All providers in "auto" preference order for role."""
         candidates = sorted(
             self._health.values(),
             key=lambda p: (
-                not p.available,
+                not self._usable(p),
                 p.failure_rate,
-                p.latency_ms,
+                self._latency_for(p, role).ewma_ms,
                 COST_TIER_ORDER.get(p.cost_tier, 99),
                 p.name,
             ),
         )
+        return [c.name for c in candidates]
 
-        available = [c for c in candidates if c.available]
-        if available:
-            return available[0].name
-        return candidates[0].name
+    def resolve_provider(self, preference: str, role: str = "") -> str:
+        """
+        Resolve provider preference to a concrete provider name.
+
+        Returns preference unchanged if it's not "auto".
+        For "auto", uses deterministic tie-break over usable providers
+        (available, circuit not open); falls back to the best unusable one.
+        """
+        if preference != "auto":
+            return preference
+
+        if not self._health:
+            return "auto"
+
+        return self.ranked_providers(role)[0]
 
     def snapshot(self) -> Dict[str, Any]:
         """Return serializable, frozen snapshot of current health state for audit."""
@@ -94,18 +196,134 @@ class ProviderPool:
                 "failure_rate": h.failure_rate,
                 "cost_tier": h.cost_tier,
                 "last_checked": h.last_checked,
+                "latency_p95_ms": h.latency_p95_ms,
+                "circuit_state": self._refresh_circuit(h),
+                "circuit_opened_at": h.circuit_opened_at,
+                "window": {
+                    "latency": h.latency.to_dict(),
+                    "outcomes": list(h.outcomes),
+                    "roles": {role: s.to_dict() for role, s in sorted(h.roles.items())},
+                },
             }
             for name, h in self._health.items()
         }
 
-    def record_call(self, provider: str, latency_ms: int, success: bool) -> None:
-        """Update health state after a call. Phase 1: records latency only."""
+    def _observe_latency(self, h: ProviderHealth, latency_ms: float, role: str) -> None:
+        h.latency.observe(latency_ms)
+        h.latency_ms = h.latency.ewma_ms
+        h.latency_p95_ms = h.latency.percentile(95)
+        if role:
+            h.roles.setdefault(role, LatencyStats()).observe(latency_ms)
+
+    def _observe_censored(self, h: ProviderHealth, lower_bound_ms: float, role: str) -> None:
+        if h.latency.observe_censored(lower_bound_ms):
+            h.latency_ms = h.latency.ewma_ms
+            h.latency_p95_ms = h.latency.percentile(95)
+        if role:
+            h.roles.setdefault(role, LatencyStats()).observe_censored(lower_bound_ms)
+
+    def record_call(self, provider: str, latency_ms: float, success: bool, role: str = "") -> None:
+        """Update latency stats, failure window and circuit state after a call."""
         if provider not in self._health:
             return
         h = self._health[provider]
-        h.latency_ms = float(latency_ms)
+        self._observe_latency(h, float(latency_ms), role)
+        h.outcomes.append(bool(success))
+        h.failure_rate = h.outcomes.count(False) / len(h.outcomes)
         h.last_checked = datetime.now(timezone.utc).isoformat()
 
+        state = self._refresh_circuit(h)
+        if state == CIRCUIT_HALF_OPEN:
+            if success:
+                h.circuit_state, h.circuit_opened_at = CIRCUIT_CLOSED, None
+                h.outcomes.clear()
+                h.failure_rate = 0.0
+            else:
+                h.circuit_state, h.circuit_opened_at = CIRCUIT_OPEN, self._clock()
+        elif (
+            state == CIRCUIT_CLOSED
+            and len(h.outcomes) >= BREAKER_MIN_CALLS
+            and h.failure_rate >= BREAKER_FAILURE_THRESHOLD
+        ):
+            h.circuit_state, h.circuit_opened_at = CIRCUIT_OPEN, self._clock()
+
+    def hedge_delay_ms(self, provider: str, role: str = "") -> Optional[float]:
+        """p95 latency after which a call to provider is hedged; None if too few samples."""
+        h = self._health.get(provider)
+        if h is None:
+            return None
+        stats = self._latency_for(h, role)
+        if len(stats.samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return stats.percentile(95)
+
+    def call_hedged(
+        self,
+        fn: Callable[[str, threading.Event], Any],
+        role: str = "",
+        preference: str = "auto",
+        hedge: bool = True,
+    ) -> HedgedResult:
+        """
+        Call fn(provider, cancel_event) on the resolved provider.
+
+        With hedge=True, once the primary has run past its p95 a duplicate
+        goes to the next-best provider; the first success wins and the
+        loser's cancel_event is set (fn should poll it and give up). A
+        failing primary fails over to that provider immediately. Both
+        outcomes are recorded; a cancelled loser's elapsed time is only a
+        lower bound on its latency and is kept only where it raises the
+        estimate (LatencyStats.observe_censored).
+        """
+        primary = self.resolve_provider(preference, role)
+        ranked = [p for p in self.ranked_providers(role) if p != primary]
+        backup = next((p for p in ranked if self._usable(self._health[p])), None)
+        delay_ms = self.hedge_delay_ms(primary, role) if hedge and backup else None
+
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="provider-hedge")
+        attempts: Dict[Future, tuple] = {}
+
+        def launch(provider: str) -> Future:
+            cancel = threading.Event()
+            future = executor.submit(fn, provider, cancel)
+            attempts[future] = (provider, cancel, time.monotonic())
+            return future
+
+        def elapsed_ms(future: Future) -> float:
+            return (time.monotonic() - attempts[future][2]) * 1000.0
+
+        try:
+            pending = {launch(primary)}
+            timeout = delay_ms / 1000.0 if delay_ms is not None else None
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                timeout = None
+                for future in done:
+                    provider = attempts[future][0]
+                    if future.exception() is None:
+                        latency = elapsed_ms(future)
+                        self.record_call(provider, latency, True, role)
+                        for loser in pending:
+                            loser_name, cancel, _ = attempts[loser]
+                            cancel.set()
+                            loser.cancel()
+                            if loser_name in self._health:
+                                self._observe_censored(
+                                    self._health[loser_name], elapsed_ms(loser), role
+                                )
+                        return HedgedResult(provider, future.result(), latency, len(attempts) > 1)
+                    self.record_call(provider, elapsed_ms(future), False, role)
+                    last_error = future.exception()
+                if backup and len(attempts) == 1:
+                    # Primary passed its p95 (hedge) or failed (failover)
+                    pending.add(launch(backup))
+            if last_error is None:
+                raise RuntimeError(f"call_hedged: no attempt completed for {primary}")
+            raise last_error
+        finally:
+            executor.shutdown(wait=False)
+
     def smoke_test(self) -> Dict[str, ProviderHealth]:
         """Pre-cycle health check. Phase 1: returns current configured state."""
         return dict(self._health)
@@ -115,6 +333,33 @@ class ProviderPool:
         state_path = self.repo_root / HEALTH_STATE_RELATIVE_PATH
         atomic_write_json(state_path, self.snapshot())
 
+    def load(self) -> bool:
+        """
+        Restore health state written by persist() for configured providers.
+
+        Configuration (available, cost_tier) wins over persisted values.
+        Returns False if there is no state file.
+        """
+        state_path = self.repo_root / HEALTH_STATE_RELATIVE_PATH
+        if not state_path.exists():
+            return False
+        data = json.loads(state_path.read_text(encoding="utf-8"))
+        for name, saved in data.items():
+            h = self._health.get(name)
+            if h is None:
+                continue
+            window = saved.get("window", {})
+            h.latency = LatencyStats.from_dict(window.get("latency", {}))
+            h.latency_ms = float(saved.get("latency_ms", h.latency.ewma_ms))
+            h.latency_p95_ms = float(saved.get("latency_p95_ms", 0.0))
+            h.outcomes.extend(bool(x) for x in window.get("outcomes", []))
+            h.failure_rate = float(saved.get("failure_rate", 0.0))
+            h.roles = {r: LatencyStats.from_dict(s) for r, s in window.get("roles", {}).items()}
+            h.circuit_state = saved.get("circuit_state", CIRCUIT_CLOSED)
+            h.circuit_opened_at = saved.get("circuit_opened_at")
+            h.last_checked = saved.get("last_checked")
+        return True
+
     def all_providers(self) -> List[str]:
         """Return list of all configured provider names."""
         return list(self._health.keys())
@@ -16,6 +16,8 @@ from typing import Any, Dict
 
 import yaml
 
+from runtime.util.yaml_io import load_yaml_file
+
 
 class PolicyConfigLoadError(Exception):
     """Raised when policy config load fails."""
@@ -49,8 +51,7 @@ class PolicyConfigLoader:
             raise PolicyConfigLoadError(f"Config file not found: {self.config_path}")
 
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_file(self.config_path)
         except yaml.YAMLError as e:
             raise PolicyConfigLoadError(f"YAML parse error: {e}") from e
         except Exception as e:
@@ -241,7 +241,8 @@ class LoopSpine:
         self.run_id = self._generate_run_id()
         self.state = SpineState.RUNNING
         # Initialize collector so terminal packets can always reference an index.
-        get_or_create_collector(self.run_id)
+        # Receipts stream to disk so a crashed run keeps the ones recorded so far.
+        get_or_create_collector(self.run_id, output_dir=self.repo_root)
 
         # Acquire run-lock (fail-closed on contention)
         from runtime.orchestration.loop.run_lock import (
@@ -564,7 +565,7 @@ class LoopSpine:
         # Load checkpoint
         checkpoint = self._load_checkpoint(checkpoint_id)
         self.run_id = checkpoint.run_id
-        get_or_create_collector(self.run_id)
+        get_or_create_collector(self.run_id, output_dir=self.repo_root)
 
         from runtime.orchestration.loop.run_lock import (
             RunLockError,
@@ -13,6 +13,8 @@ from typing import Any, Dict, List
 import yaml
 from jsonschema import Draft7Validator
 
+from runtime.util.yaml_io import load_yaml_file
+
 # Schema location
 SCHEMA_ROOT = Path(__file__).resolve().parents[3] / "config" / "schemas"
 MISSION_SCHEMA_FILE = "mission.yaml"
@@ -45,8 +47,7 @@ def load_mission_schema() -> Dict[str, Any]:
         raise MissionSchemaError([f"Mission schema not found: {schema_path}"])
 
     try:
-        with open(schema_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return load_yaml_file(schema_path)
     except yaml.YAMLError as e:
         raise MissionSchemaError([f"Failed to parse mission schema: {e}"]) from e
 
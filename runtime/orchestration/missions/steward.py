@@ -24,6 +24,7 @@ from runtime.orchestration.missions.base import (
     MissionType,
     MissionValidationError,
 )
+from runtime.util.git_broker import GitBrokerError, get_broker
 
 SYSTEM_ARTIFACT_PREFIXES = (
     "artifacts/loop_state/",
@@ -313,21 +314,14 @@ class StewardMission(BaseMission):
         """
         try:
             # Check git status, filtering system artifacts
-            result = subprocess.run(
-                ["git", "status", "--porcelain", "--untracked-files=all"],
-                cwd=context.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode != 0:
-                return (False, f"git status failed: {result.stderr}")
+            try:
+                status_lines = get_broker(context.repo_root).status(untracked="all")
+            except GitBrokerError as e:
+                return (False, str(e))
 
             # Filter out system artifacts that are modified during loop execution
             dirty_files = []
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
+            for line in status_lines:
                 # Extract file path: git status --porcelain format is "XY filename"
                 # where X is index status, Y is worktree status
                 # Split on whitespace and take everything after status markers
@@ -365,16 +359,9 @@ class StewardMission(BaseMission):
             (ok: bool, result: str) - result is commit hash or error message
         """
         try:
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"],
-                cwd=context.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                return (True, result.stdout.strip())
-            return (False, f"git rev-parse failed: {result.stderr.strip()}")
+            return (True, get_broker(context.repo_root).head())
+        except GitBrokerError as e:
+            return (False, str(e))
         except subprocess.TimeoutExpired:
             return (False, "git rev-parse timed out")
         except Exception as e:
@@ -454,11 +441,7 @@ class StewardMission(BaseMission):
             subprocess.run(commit_cmd, cwd=context.repo_root, check=True, capture_output=True)
 
             # 3. Get hash
-            hash_cmd = ["git", "rev-parse", "HEAD"]
-            result = subprocess.run(
-                hash_cmd, cwd=context.repo_root, check=True, capture_output=True, text=True
-            )
-            commit_hash = result.stdout.strip()
+            commit_hash = get_broker(context.repo_root).head()
 
             # 4. Push (conditional on metadata.push flag)
             if context.metadata.get("push", False):
@@ -472,6 +455,8 @@ class StewardMission(BaseMission):
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.decode() if e.stderr else str(e)
             return (False, f"Git operation failed: {error_msg}")
+        except GitBrokerError as e:
+            return (False, f"Git operation failed: {e.stderr or e}")
         except Exception as e:
             return (False, f"Unexpected error during commit: {str(e)}")
 
@@ -499,23 +484,12 @@ class StewardMission(BaseMission):
             stage_cmd = ["git", "add"] + artifacts
             subprocess.run(stage_cmd, cwd=context.repo_root, check=True, capture_output=True)
 
-            # Get diff stats for staged changes
-            diff_cmd = ["git", "diff", "--cached", "--numstat"]
-            result = subprocess.run(
-                diff_cmd, cwd=context.repo_root, check=True, capture_output=True, text=True
+            # Get diff stats for staged changes (binary files count as 0)
+            total_delta = sum(
+                added + deleted
+                for added, deleted, _ in get_broker(context.repo_root).diffstat(cached=True)
             )
 
-            # Parse numstat output: "added\tdeleted\tfilename"
-            total_delta = 0
-            for line in result.stdout.strip().split("\n"):
-                if not line:
-                    continue
-                parts = line.split("\t")
-                if len(parts) >= 2:
-                    added = int(parts[0]) if parts[0] != "-" else 0
-                    deleted = int(parts[1]) if parts[1] != "-" else 0
-                    total_delta += added + deleted
-
             # Unstage (reset to restore original state)
             reset_cmd = ["git", "reset", "HEAD"] + artifacts
             subprocess.run(reset_cmd, cwd=context.repo_root, check=True, capture_output=True)
@@ -527,6 +501,8 @@ class StewardMission(BaseMission):
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr.decode() if e.stderr else str(e)
             return (False, -1, f"Git diff failed: {error_msg}")
+        except GitBrokerError as e:
+            return (False, -1, f"Git diff failed: {e.stderr or e}")
         except Exception as e:
             return (False, -1, f"Diff validation error: {str(e)}")
 
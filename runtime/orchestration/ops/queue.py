@@ -7,6 +7,7 @@ from typing import Any
 import yaml
 
 from runtime.util.atomic_write import atomic_write_text
+from runtime.util.yaml_io import load_yaml_file
 
 
 class OperationQueueError(ValueError):
@@ -39,7 +40,7 @@ def _persist_yaml(repo_root: Path, lane: str, record_id: str, payload: dict[str,
 def _load_yaml(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise OperationQueueError(f"Missing operations artifact: {path}")
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    raw = load_yaml_file(path)
     if not isinstance(raw, dict):
         raise OperationQueueError(f"Operations artifact must be a YAML mapping: {path}")
     return raw
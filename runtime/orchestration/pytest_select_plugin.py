@@ -0,0 +1,63 @@
+"""
+Pytest plugin restricting collection to a planned set of test files.
+
+Loaded by PytestExecutor (``-p runtime.orchestration.pytest_select_plugin``)
+when it shards a run or skips cached files. The selection is passed through
+the LIFEOS_PYTEST_SELECT environment variable, naming a JSON file:
+
+    {"include": ["/abs/path/test_a.py", ...], "include_unplanned": bool}
+
+Test modules outside "include" are ignored before import, so each shard only
+pays collection cost for its own files. Files that the executor did not plan
+for (e.g. created after planning) are kept only when include_unplanned is set,
+so exactly one shard picks them up. Conftest files and directories are never
+filtered, which keeps --ignore and rootdir semantics identical to a plain run.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+SELECT_ENV_VAR = "LIFEOS_PYTEST_SELECT"
+
+
+class _Selection:
+    def __init__(self, include: set, planned: set, include_unplanned: bool):
+        self.include = include
+        self.planned = planned
+        self.include_unplanned = include_unplanned
+
+
+_selection: Optional[_Selection] = None
+
+
+def pytest_configure(config):
+    global _selection
+    spec_path = os.environ.get(SELECT_ENV_VAR)
+    if not spec_path:
+        _selection = None
+        return
+    spec = json.loads(Path(spec_path).read_text(encoding="utf-8"))
+    _selection = _Selection(
+        include={os.path.realpath(p) for p in spec.get("include", [])},
+        planned={os.path.realpath(p) for p in spec.get("planned", [])},
+        include_unplanned=bool(spec.get("include_unplanned", False)),
+    )
+
+
+def pytest_ignore_collect(collection_path, config):
+    if _selection is None or not collection_path.is_file():
+        return None
+    patterns = config.getini("python_files") or ["test_*.py"]
+    if not any(fnmatch.fnmatch(collection_path.name, pat) for pat in patterns):
+        return None
+    real = os.path.realpath(collection_path)
+    if real in _selection.include:
+        return None
+    if real not in _selection.planned and _selection.include_unplanned:
+        return None
+    return True
@@ -5,16 +5,29 @@ Phase 3a capability for autonomous test execution within strict bounds:
 - Timeout enforcement (default 300s)
 - Output capture and truncation (50KB limit)
 - Structured result with exit code, status, and evidence
+- Results read from JUnit XML (stdout scraping is a fallback only)
+- Optional sharding across worker processes (xdist or duration-balanced split)
+- Optional per-file result cache keyed on the test's import closure
 """
 
 from __future__ import annotations
 
+import heapq
+import importlib.util
+import json
 import os
 import signal
 import subprocess
-from dataclasses import dataclass
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set
+
+from runtime.orchestration.pytest_select_plugin import SELECT_ENV_VAR
+from runtime.orchestration.test_result_cache import TestResultCache, selection_key
 
 # Maximum output size before truncation (50KB as per Phase 3a spec)
 MAX_OUTPUT_SIZE = 50 * 1024  # 50KB
@@ -22,6 +35,12 @@ MAX_OUTPUT_SIZE = 50 * 1024  # 50KB
 # Default timeout for pytest execution (5 minutes as per Phase 3a spec)
 DEFAULT_TIMEOUT_SECONDS = 300
 
+# Collection filter plugin used for sharded and cache-assisted runs
+SELECT_PLUGIN = "runtime.orchestration.pytest_select_plugin"
+
+# Directory containing the runtime package (prepended to shard PYTHONPATH)
+_PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
 
 @dataclass
 class PytestResult:
@@ -53,23 +72,182 @@ class PytestResult:
     error_messages: Optional[list] = None
 
 
+@dataclass
+class JUnitSummary:
+    """
+    Test outcomes parsed from a pytest JUnit XML report.
+
+    Attributes:
+        counts: dict with passed/failed/skipped/errors counts
+        passed_tests: node ids that passed
+        failed_tests: node ids that failed or errored
+        error_messages: "nodeid: message" for each failure (uncapped)
+        file_results: per test file {"tests": [...], "failed": bool, "duration": float}
+    """
+
+    counts: Dict[str, int] = field(
+        default_factory=lambda: {"passed": 0, "failed": 0, "skipped": 0, "errors": 0}
+    )
+    passed_tests: Set[str] = field(default_factory=set)
+    failed_tests: Set[str] = field(default_factory=set)
+    error_messages: List[str] = field(default_factory=list)
+    file_results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def merge(self, other: "JUnitSummary") -> None:
+        for key, value in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+        self.passed_tests |= other.passed_tests
+        self.failed_tests |= other.failed_tests
+        self.error_messages.extend(other.error_messages)
+        self.file_results.update(other.file_results)
+
+
+def _junit_nodeid(testcase: ET.Element) -> str:
+    """Rebuild a pytest node id from an xunit1 <testcase> element."""
+    name = testcase.get("name", "")
+    classname = testcase.get("classname", "")
+    file_attr = testcase.get("file")
+    if not file_attr:
+        return f"{classname}::{name}" if classname else name
+
+    module = file_attr[:-3].replace("/", ".") if file_attr.endswith(".py") else file_attr
+    parts = [file_attr]
+    if classname.startswith(module + "."):
+        parts.extend(classname[len(module) + 1 :].split("."))
+    parts.append(name)
+    return "::".join(parts)
+
+
+def parse_junit_xml(path: Path) -> Optional[JUnitSummary]:
+    """
+    Parse a pytest JUnit XML report (junit_family=xunit1).
+
+    Args:
+        path: Report path
+
+    Returns:
+        JUnitSummary, or None if the report is missing or unparseable
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+
+    summary = JUnitSummary()
+    for testcase in root.iter("testcase"):
+        nodeid = _junit_nodeid(testcase)
+        try:
+            duration = float(testcase.get("time", "0") or 0)
+        except ValueError:
+            duration = 0.0
+
+        failure = testcase.find("failure")
+        error = testcase.find("error")
+        problem = failure if failure is not None else error
+        if problem is not None:
+            summary.counts["failed" if failure is not None else "errors"] += 1
+            summary.failed_tests.add(nodeid)
+            message = (problem.get("message") or (problem.text or "")).strip()
+            summary.error_messages.append(f"{nodeid}: {message.splitlines()[0] if message else ''}")
+        elif testcase.find("skipped") is not None:
+            summary.counts["skipped"] += 1
+        else:
+            summary.counts["passed"] += 1
+            summary.passed_tests.add(nodeid)
+
+        file_attr = testcase.get("file")
+        if file_attr:
+            entry = summary.file_results.setdefault(
+                file_attr, {"tests": [], "failed": False, "duration": 0.0}
+            )
+            entry["tests"].append(nodeid)
+            entry["failed"] = entry["failed"] or problem is not None
+            entry["duration"] += duration
+
+    return summary
+
+
+def split_by_durations(
+    files: Sequence[Path], shards: int, durations: Dict[str, float]
+) -> List[List[Path]]:
+    """
+    Split test files into balanced shards (longest-processing-time first).
+
+    Args:
+        files: Test files to distribute
+        shards: Number of shards
+        durations: Known seconds per file, keyed by path string; unknown
+            files are assumed to take the median known duration (or 1s)
+
+    Returns:
+        Non-empty shards, each sorted for deterministic command lines
+    """
+    shards = max(1, min(shards, len(files)))
+    known = sorted(durations.get(str(f), -1.0) for f in files)
+    known = [d for d in known if d >= 0]
+    default = known[len(known) // 2] if known else 1.0
+
+    weighted = sorted(
+        ((durations.get(str(f), default), str(f), f) for f in files),
+        key=lambda item: (-item[0], item[1]),
+    )
+    heap = [(0.0, i) for i in range(shards)]
+    buckets: List[List[Path]] = [[] for _ in range(shards)]
+    for weight, _, path in weighted:
+        load, idx = heapq.heappop(heap)
+        buckets[idx].append(path)
+        heapq.heappush(heap, (load + weight, idx))
+    return [sorted(b) for b in buckets if b]
+
+
+def _xdist_available() -> bool:
+    return importlib.util.find_spec("xdist") is not None
+
+
 class PytestExecutor:
     """
     Executor for pytest with timeout and output capture.
 
+    Results are read from a JUnit XML report rather than scraped from stdout,
+    so failure details survive output truncation. Optionally the run is
+    sharded across worker processes (pytest-xdist when installed, otherwise a
+    built-in duration-balanced file splitter) and unchanged passing test files
+    are served from a TestResultCache.
+
     Usage:
         executor = PytestExecutor(timeout=300)
         result = executor.run("runtime/tests/test_example.py")
+
+        cache = TestResultCache(repo_root)
+        executor = PytestExecutor(workers=4, cache=cache, allow_cached=True)
+        result = executor.run("runtime/tests")
     """
 
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT_SECONDS):
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT_SECONDS,
+        workers: int = 1,
+        cache: Optional[TestResultCache] = None,
+        allow_cached: bool = False,
+        use_xdist: Optional[bool] = None,
+    ):
         """
         Initialize test executor.
 
         Args:
             timeout: Maximum seconds to allow for test execution
+            workers: Number of parallel pytest worker processes
+            cache: Optional result cache; outcomes are always recorded to it
+            allow_cached: Skip files whose cached verdict is PASS and whose
+                import closure is unchanged (requires cache)
+            use_xdist: Force (True) or forbid (False) pytest-xdist for
+                sharding; None auto-detects
         """
         self.timeout = timeout
+        self.workers = max(1, workers)
+        self.cache = cache
+        self.allow_cached = allow_cached
+        self.use_xdist = _xdist_available() if use_xdist is None else use_xdist
 
     def run(self, target: str, extra_args: Optional[list] = None) -> PytestResult:
         """
@@ -85,15 +263,132 @@ class PytestExecutor:
         Returns:
             PytestResult with captured output and status
         """
-        import time
-
         start_time = time.time()
+        extra_args = list(extra_args or [])
+        selection = selection_key(extra_args)
+
+        planned = self._expand_target(target)
+        cached_files: List[Path] = []
+        cached_tests: Set[str] = set()
+        to_run: List[Path] = planned if planned is not None else []
+        if planned is not None and self.cache is not None and self.allow_cached:
+            to_run = []
+            for path in planned:
+                hit = self.cache.lookup(path, selection)
+                if hit is None:
+                    to_run.append(path)
+                else:
+                    cached_files.append(path)
+                    cached_tests.update(hit)
+
+        with tempfile.TemporaryDirectory(prefix="lifeos_pytest_") as tmp:
+            tmp_dir = Path(tmp)
+            if planned is not None and not to_run:
+                runs: List[_ShardRun] = []
+            elif planned is None:
+                runs = [self._run_shard(target, extra_args, tmp_dir, 0, None, None)]
+            elif self.workers == 1 or len(to_run) == 1:
+                runs = [self._run_shard(target, extra_args, tmp_dir, 0, to_run, planned)]
+            elif self.use_xdist:
+                xdist_args = extra_args + ["-n", str(self.workers)]
+                runs = [self._run_shard(target, xdist_args, tmp_dir, 0, to_run, planned)]
+            else:
+                durations = self.cache.durations() if self.cache is not None else {}
+                rel_durations = {
+                    str(p): durations.get(self._cache_key(p), -1.0)
+                    for p in to_run
+                    if self._cache_key(p) in durations
+                }
+                shards = split_by_durations(to_run, self.workers, rel_durations)
+                with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                    futures = [
+                        pool.submit(self._run_shard, target, extra_args, tmp_dir, i, shard, planned)
+                        for i, shard in enumerate(shards)
+                    ]
+                    runs = [f.result() for f in futures]
+
+        duration = time.time() - start_time
+        return self._assemble(target, runs, cached_files, cached_tests, duration, selection)
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def _expand_target(self, target: str) -> Optional[List[Path]]:
+        """
+        Expand target into test files when sharding or caching applies.
 
-        # Build pytest command
+        Returns None when the run must be passed through verbatim (node ids,
+        missing paths, or a plain single-worker uncached run).
+        """
+        if self.workers == 1 and self.cache is None:
+            return None
+        if "::" in target:
+            return None
+        path = Path(target)
+        if path.is_file():
+            return [path.resolve()]
+        if path.is_dir():
+            return sorted(p.resolve() for p in path.rglob("test_*.py") if p.is_file())
+        return None
+
+    def _cache_key(self, path: Path) -> str:
+        if self.cache is None:
+            return str(path)
+        try:
+            return path.resolve().relative_to(self.cache.repo_root).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _run_shard(
+        self,
+        target: str,
+        extra_args: list,
+        tmp_dir: Path,
+        index: int,
+        include: Optional[List[Path]],
+        planned: Optional[List[Path]],
+    ) -> "_ShardRun":
+        """Run one pytest process, restricted to include when given."""
+        junit_path = tmp_dir / f"junit_{index}.xml"
+        env = os.environ.copy()
         cmd = ["pytest", target, "-v"]
-        if extra_args:
-            cmd.extend(extra_args)
+        cmd.extend(extra_args)
+        cmd.extend([f"--junitxml={junit_path}", "-o", "junit_family=xunit1"])
+
+        if include is not None:
+            select_path = tmp_dir / f"select_{index}.json"
+            select_path.write_text(
+                json.dumps(
+                    {
+                        "include": [str(p) for p in include],
+                        "planned": [str(p) for p in planned or []],
+                        "include_unplanned": index == 0,
+                    }
+                ),
+                encoding="utf-8",
+            )
+            env[SELECT_ENV_VAR] = str(select_path)
+            env["PYTHONPATH"] = os.pathsep.join(
+                [str(_PACKAGE_ROOT)] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+            )
+            cmd.extend(["-p", SELECT_PLUGIN])
+
+        stdout_raw, stderr_raw, exit_code, timed_out = self._spawn(cmd, env)
+        summary = None if timed_out else parse_junit_xml(junit_path)
+        return _ShardRun(include, stdout_raw, stderr_raw, exit_code, timed_out, summary)
 
+    def _spawn(self, cmd: list, env: Dict[str, str]) -> tuple:
+        """
+        Run cmd in its own process group with timeout enforcement.
+
+        Returns:
+            (stdout, stderr, exit_code, timed_out)
+        """
         # Start pytest in new process group (session)
         # This allows us to kill the entire process tree
         process = subprocess.Popen(
@@ -101,6 +396,7 @@ class PytestExecutor:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             cwd=Path.cwd(),
+            env=env,
             start_new_session=True,  # Create new process group
         )
 
@@ -154,7 +450,42 @@ class PytestExecutor:
         else:
             stderr_raw = stderr_bytes or ""
 
-        duration = time.time() - start_time
+        return stdout_raw, stderr_raw, exit_code, timeout_triggered
+
+    # ------------------------------------------------------------------
+    # Result assembly
+    # ------------------------------------------------------------------
+
+    def _assemble(
+        self,
+        target: str,
+        runs: List["_ShardRun"],
+        cached_files: List[Path],
+        cached_tests: Set[str],
+        duration: float,
+        selection: str = "",
+    ) -> PytestResult:
+        timeout_triggered = any(run.timed_out for run in runs)
+
+        if len(runs) == 1:
+            stdout_raw, stderr_raw = runs[0].stdout, runs[0].stderr
+        else:
+            stdout_raw = "".join(
+                f"=== shard {i + 1}/{len(runs)} ===\n{run.stdout}" for i, run in enumerate(runs)
+            )
+            stderr_raw = "".join(run.stderr for run in runs)
+
+        # Merge exit codes: first real failure wins; 5 (no tests) only if nothing ran
+        codes = [run.exit_code for run in runs]
+        failures = [c for c in codes if c not in (0, 5)]
+        if timeout_triggered:
+            exit_code = -signal.SIGTERM
+        elif failures:
+            exit_code = failures[0]
+        elif not codes or 0 in codes or cached_files:
+            exit_code = 0
+        else:
+            exit_code = 5
 
         # Determine status
         if timeout_triggered:
@@ -167,40 +498,9 @@ class PytestExecutor:
         # Truncate output if needed
         stdout = self._truncate_output(stdout_raw)
         stderr = self._truncate_output(stderr_raw)
+        truncated = len(stdout_raw) > MAX_OUTPUT_SIZE or len(stderr_raw) > MAX_OUTPUT_SIZE
 
-        if not timeout_triggered:
-            # Parse test results (only for non-timeout cases)
-            counts, passed_tests, failed_tests, error_messages = self._parse_pytest_output(
-                stdout_raw
-            )
-
-            # Build evidence
-            evidence = self._build_evidence(
-                target=target,
-                exit_code=exit_code,
-                status=status,
-                duration=duration,
-                stdout=stdout,
-                stderr=stderr,
-                counts=counts,
-                truncated=len(stdout_raw) > MAX_OUTPUT_SIZE or len(stderr_raw) > MAX_OUTPUT_SIZE,
-                timeout_triggered=False,
-            )
-
-            return PytestResult(
-                status=status,
-                exit_code=exit_code,
-                stdout=stdout,
-                stderr=stderr,
-                duration=duration,
-                evidence=evidence,
-                passed_tests=passed_tests,
-                failed_tests=failed_tests,
-                counts=counts,
-                error_messages=error_messages,
-            )
-        else:
-            # Timeout case
+        if timeout_triggered:
             evidence = self._build_evidence(
                 target=target,
                 exit_code=exit_code,
@@ -212,7 +512,7 @@ class PytestExecutor:
                 truncated=False,
                 timeout_triggered=True,
             )
-
+            evidence["shards"] = len(runs)
             return PytestResult(
                 status="TIMEOUT",
                 exit_code=exit_code,
@@ -222,6 +522,85 @@ class PytestExecutor:
                 evidence=evidence,
             )
 
+        summaries = [run.summary for run in runs]
+        if runs and all(s is not None for s in summaries):
+            merged = JUnitSummary()
+            for summary in summaries:
+                merged.merge(summary)  # type: ignore[arg-type]
+            counts = dict(merged.counts)
+            passed_tests = merged.passed_tests
+            failed_tests = merged.failed_tests
+            error_messages = merged.error_messages[:10]
+            result_source = "junit"
+        elif runs:
+            # No report (e.g. usage error before session start): scrape stdout
+            counts, passed_tests, failed_tests, error_messages = self._parse_pytest_output(
+                stdout_raw
+            )
+            result_source = "stdout"
+        else:
+            counts = {"passed": 0, "failed": 0, "skipped": 0, "errors": 0}
+            passed_tests, failed_tests, error_messages = set(), set(), []
+            result_source = "cache"
+
+        if cached_tests:
+            passed_tests = set(passed_tests) | cached_tests
+            counts["passed"] = counts.get("passed", 0) + len(cached_tests)
+        counts["cached"] = len(cached_tests)
+
+        self._record_cache(runs, selection)
+
+        evidence = self._build_evidence(
+            target=target,
+            exit_code=exit_code,
+            status=status,
+            duration=duration,
+            stdout=stdout,
+            stderr=stderr,
+            counts=counts,
+            truncated=truncated,
+            timeout_triggered=False,
+        )
+        evidence["result_source"] = result_source
+        evidence["shards"] = len(runs)
+        evidence["cached_files"] = sorted(self._cache_key(p) for p in cached_files)
+
+        return PytestResult(
+            status=status,
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            duration=duration,
+            evidence=evidence,
+            passed_tests=passed_tests,
+            failed_tests=failed_tests,
+            counts=counts,
+            error_messages=error_messages,
+        )
+
+    def _record_cache(self, runs: List["_ShardRun"], selection: str = "") -> None:
+        """Record per-file outcomes of completed shards under their test selection."""
+        if self.cache is None:
+            return
+        recorded = False
+        for run in runs:
+            if run.summary is None or run.include is None:
+                continue
+            for report_file, entry in run.summary.file_results.items():
+                path = _match_report_file(report_file, run.include)
+                if path is None:
+                    continue
+                self.cache.record(
+                    path,
+                    passed=not entry["failed"],
+                    tests=entry["tests"],
+                    duration=entry["duration"],
+                    selection=selection,
+                )
+                recorded = True
+        if recorded:
+            self.cache.save()
+
     def _truncate_output(self, output: str) -> str:
         """
         Truncate output at MAX_OUTPUT_SIZE boundary.
@@ -338,3 +717,22 @@ class PytestExecutor:
             "truncated": truncated,
             "timeout_triggered": timeout_triggered,
         }
+
+
+class _ShardRun(NamedTuple):
+    include: Optional[List[Path]]
+    stdout: str
+    stderr: str
+    exit_code: int
+    timed_out: bool
+    summary: Optional[JUnitSummary]
+
+
+def _match_report_file(report_file: str, candidates: List[Path]) -> Optional[Path]:
+    """Map a rootdir-relative report path back to one of the planned files."""
+    suffix = "/" + report_file.replace(os.sep, "/")
+    for candidate in candidates:
+        posix = candidate.as_posix()
+        if posix.endswith(suffix) or posix == report_file:
+            return candidate
+    return None
@@ -0,0 +1,300 @@
+"""
+Test Result Cache - Per-file pytest verdict cache keyed on import closure.
+
+A test file's cache key is the SHA-256 over the content of the file itself,
+every repo-local module it transitively imports, and the conftest.py files
+that apply to it. When the key is unchanged and the previous run passed, the
+file may be skipped (only when the caller explicitly allows cached results).
+
+Verdicts are also tied to the test selection they were recorded under
+(-k, -m, --deselect, ...): a file that passed with only some of its tests
+selected is not a hit for a run that selects all of them.
+
+The cache also records per-file durations, which drive the built-in
+duration-balanced shard splitter in test_executor.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from runtime.util.atomic_write import atomic_write_json
+
+# Default cache location (inside the already-ignored pytest cache dir)
+DEFAULT_CACHE_PATH = Path(".pytest_cache") / "lifeos" / "test_results.json"
+
+# Import roots mirrored from [tool.pytest.ini_options].pythonpath
+DEFAULT_IMPORT_ROOTS = (".", "project_builder", "runtime")
+
+CACHE_SCHEMA_VERSION = 1
+
+# pytest options that narrow which tests run, split by whether they take a value
+_SELECTION_VALUE_OPTS = frozenset({"-k", "-m", "--deselect", "--ignore", "--ignore-glob"})
+_SELECTION_FLAGS = frozenset(
+    {
+        "--lf",
+        "--last-failed",
+        "--sw",
+        "--stepwise",
+        "--sw-skip",
+        "--stepwise-skip",
+        "--co",
+        "--collect-only",
+    }
+)
+
+
+def selection_key(args: Sequence[str]) -> str:
+    """
+    Return a stable key for the test-selection arguments in args.
+
+    Empty when args select nothing beyond the target. Positional arguments
+    (extra paths or node ids) count as selection.
+    """
+    selected: List[str] = []
+    args = list(args)
+    i = 0
+    while i < len(args):
+        arg = str(args[i])
+        name = arg.split("=", 1)[0]
+        if name in _SELECTION_VALUE_OPTS:
+            if "=" in arg:
+                selected.append(arg)
+            elif i + 1 < len(args):
+                selected.append(f"{arg}={args[i + 1]}")
+                i += 1
+        elif arg[:2] in ("-k", "-m") and len(arg) > 2 and not arg.startswith("--"):
+            selected.append(f"{arg[:2]}={arg[2:]}")
+        elif name in _SELECTION_FLAGS or not arg.startswith("-"):
+            selected.append(arg)
+        i += 1
+    return json.dumps(selected) if selected else ""
+
+
+class ImportGraph:
+    """
+    Resolves repo-local transitive imports for Python source files.
+
+    Only modules that resolve to files under one of the import roots are
+    followed; stdlib and third-party imports are ignored. Per-module results
+    are memoized so hashing many test files shares the walk.
+    """
+
+    def __init__(self, repo_root: Path, import_roots: Sequence[str] = DEFAULT_IMPORT_ROOTS):
+        self.repo_root = Path(repo_root).resolve()
+        self.import_roots = [(self.repo_root / r).resolve() for r in import_roots]
+        self._direct: Dict[Path, Set[Path]] = {}
+        self._module_cache: Dict[str, Optional[Path]] = {}
+
+    def _resolve_module(self, module: str) -> Optional[Path]:
+        if module in self._module_cache:
+            return self._module_cache[module]
+        rel = Path(*module.split("."))
+        found: Optional[Path] = None
+        for root in self.import_roots:
+            candidate = root / rel
+            if candidate.with_suffix(".py").is_file():
+                found = candidate.with_suffix(".py")
+                break
+            if (candidate / "__init__.py").is_file():
+                found = candidate / "__init__.py"
+                break
+        self._module_cache[module] = found
+        return found
+
+    def _package_of(self, path: Path) -> Optional[str]:
+        for root in self.import_roots:
+            try:
+                rel = path.parent.relative_to(root)
+            except ValueError:
+                continue
+            return ".".join(rel.parts)
+        return None
+
+    def direct_imports(self, path: Path) -> Set[Path]:
+        """Return repo-local files imported directly by path."""
+        path = path.resolve()
+        if path in self._direct:
+            return self._direct[path]
+
+        deps: Set[Path] = set()
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except (OSError, SyntaxError, ValueError):
+            self._direct[path] = deps
+            return deps
+
+        package = self._package_of(path)
+        for node in ast.walk(tree):
+            names: List[str] = []
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level and package is not None:
+                    parts = package.split(".") if package else []
+                    keep = len(parts) - (node.level - 1)
+                    if keep < 0:
+                        continue
+                    base = ".".join([p for p in parts[:keep] if p] + ([base] if base else []))
+                if base:
+                    names.append(base)
+                # "from pkg import mod" may name submodules
+                names.extend(f"{base}.{a.name}" if base else a.name for a in node.names)
+            for name in names:
+                # Importing a.b.c also executes a/__init__ and a/b/__init__
+                parts = name.split(".")
+                for i in range(1, len(parts) + 1):
+                    resolved = self._resolve_module(".".join(parts[:i]))
+                    if resolved is not None and resolved != path:
+                        deps.add(resolved.resolve())
+
+        self._direct[path] = deps
+        return deps
+
+    def closure(self, path: Path) -> Set[Path]:
+        """Return path plus every repo-local file it transitively imports."""
+        seen: Set[Path] = set()
+        stack = [Path(path).resolve()]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            stack.extend(self.direct_imports(current) - seen)
+        return seen
+
+    def conftests(self, path: Path) -> List[Path]:
+        """Return conftest.py files from repo root down to path's directory."""
+        path = Path(path).resolve()
+        found = []
+        for parent in [path.parent, *path.parent.parents]:
+            conftest = parent / "conftest.py"
+            if conftest.is_file():
+                found.append(conftest)
+            if parent == self.repo_root:
+                break
+        return found
+
+    def digest(self, path: Path) -> str:
+        """Return the cache key for a test file (content of its full closure)."""
+        files: Set[Path] = set()
+        for root in [Path(path), *self.conftests(path)]:
+            files |= self.closure(root)
+
+        hasher = hashlib.sha256()
+        for dep in sorted(files):
+            try:
+                rel = dep.relative_to(self.repo_root).as_posix()
+            except ValueError:
+                rel = dep.as_posix()
+            hasher.update(rel.encode("utf-8") + b"\0")
+            try:
+                hasher.update(hashlib.sha256(dep.read_bytes()).digest())
+            except OSError:
+                hasher.update(b"<missing>")
+        return hasher.hexdigest()
+
+
+class TestResultCache:
+    """
+    Persistent per-file test verdict and duration cache.
+
+    Entries are keyed by repo-relative test file path:
+        {"digest": str, "selection": str, "passed": bool,
+         "tests": [nodeid...], "duration": float}
+    """
+
+    __test__ = False  # Not a pytest test class despite the name
+
+    def __init__(
+        self,
+        repo_root: Path,
+        path: Optional[Path] = None,
+        import_roots: Sequence[str] = DEFAULT_IMPORT_ROOTS,
+    ):
+        self.repo_root = Path(repo_root).resolve()
+        self.path = Path(path) if path else self.repo_root / DEFAULT_CACHE_PATH
+        self.graph = ImportGraph(self.repo_root, import_roots)
+        self._entries: Dict[str, Dict] = self._load()
+        self._digests: Dict[str, str] = {}
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_SCHEMA_VERSION:
+            return {}
+        entries = data.get("entries", {})
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self) -> None:
+        """Persist the cache atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_json(
+            self.path,
+            {"version": CACHE_SCHEMA_VERSION, "entries": self._entries},
+        )
+
+    def _key(self, test_file: Path) -> str:
+        path = Path(test_file)
+        if not path.is_absolute():
+            path = self.repo_root / path
+        try:
+            return path.resolve().relative_to(self.repo_root).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def digest(self, test_file: Path) -> str:
+        """Return (memoized) closure digest for a test file."""
+        key = self._key(test_file)
+        if key not in self._digests:
+            self._digests[key] = self.graph.digest(self.repo_root / key)
+        return self._digests[key]
+
+    def lookup(self, test_file: Path, selection: str = "") -> Optional[List[str]]:
+        """
+        Return cached passing test ids for an unchanged file, else None.
+
+        A file is a hit only if its closure digest matches, it was recorded
+        under the same selection (see selection_key) and every selected test
+        in it passed (or was skipped) on the recorded run.
+        """
+        entry = self._entries.get(self._key(test_file))
+        if not entry or not entry.get("passed"):
+            return None
+        if entry.get("selection", "") != selection:
+            return None
+        if entry.get("digest") != self.digest(test_file):
+            return None
+        return list(entry.get("tests", []))
+
+    def record(
+        self,
+        test_file: Path,
+        passed: bool,
+        tests: Iterable[str],
+        duration: float,
+        selection: str = "",
+    ) -> None:
+        """Record the outcome of running one test file under a selection."""
+        self._entries[self._key(test_file)] = {
+            "digest": self.digest(test_file),
+            "selection": selection,
+            "passed": passed,
+            "tests": sorted(tests),
+            "duration": round(duration, 4),
+        }
+
+    def durations(self) -> Dict[str, float]:
+        """Return last recorded duration per repo-relative test file."""
+        return {
+            key: float(entry.get("duration", 0.0))
+            for key, entry in self._entries.items()
+            if isinstance(entry, dict)
+        }
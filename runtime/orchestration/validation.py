@@ -4,9 +4,10 @@ Gate validation for mission and packet schemas.
 
 from pathlib import Path
 
-import yaml
 from jsonschema import Draft7Validator
 
+from runtime.util.yaml_io import load_yaml_file
+
 SCHEMA_ROOT = Path(__file__).resolve().parents[2] / "config" / "schemas"
 
 
@@ -18,8 +19,7 @@ def _load_schema(name: str) -> dict:
     path = SCHEMA_ROOT / name
     if not path.exists():
         raise GateValidationError(f"Schema not found: {name}")
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml_file(path)
 
 
 def gate_check(payload: dict, schema_name: str) -> None:
@@ -0,0 +1,288 @@
+"""Append-only segment log for a run's invocation receipts.
+
+Layout under artifacts/receipts/<run_id>/:
+
+    receipts.jsonl    one receipt per line, in seq order (append-only)
+    receipts.offsets  byte offset of each line, little-endian uint64
+    index.json        seal written by finalize (invocation_index_v2)
+
+InvocationSegmentWriter queues receipts and a background flusher
+group-commits them: each batch is one append and one fsync of the segment,
+so a receipt is durable within one batch write of being recorded, and a
+crash loses at most the batch in flight. The offsets file is derived data;
+it is fsynced only at seal time and regenerated from the segment when a
+writer reopens a run after a crash (a torn last line is cut off then).
+
+Sealing writes index.json with the receipt count, segment size and SHA-256
+(kept incrementally by the flusher), so its cost does not depend on the
+number of receipts.
+
+InvocationReceiptReader reads complete lines only, so it can follow a run
+while it is still being written, and also reads legacy
+invocation_index_v1 directories (receipts repeated in index.json).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import queue
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from runtime.util.atomic_write import atomic_write_json
+
+SEGMENT_FILE = "receipts.jsonl"
+OFFSETS_FILE = "receipts.offsets"
+INDEX_FILE = "index.json"
+INDEX_SCHEMA_VERSION = "invocation_index_v2"
+
+DEFAULT_QUEUE_SIZE = 10_000
+GROUP_COMMIT_MAX = 1024
+
+_OFFSET = struct.Struct("<Q")
+_STOP = object()
+
+
+def run_receipts_dir(output_dir: Path, run_id: str) -> Path:
+    """Directory holding a run's receipts under output_dir."""
+    return Path(output_dir) / "artifacts" / "receipts" / run_id
+
+
+def _encode(receipt: Dict[str, Any]) -> bytes:
+    return json.dumps(receipt, sort_keys=True, separators=(",", ":")).encode() + b"\n"
+
+
+class InvocationSegmentWriter:
+    """Group-committing writer of one run's receipt segment."""
+
+    def __init__(self, run_dir: Path, run_id: str, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.run_dir = Path(run_dir)
+        self.run_id = run_id
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_path = self.run_dir / SEGMENT_FILE
+        self.offsets_path = self.run_dir / OFFSETS_FILE
+        self.index_path = self.run_dir / INDEX_FILE
+        self._segment_fd = os.open(self.segment_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        self._offsets_fd = os.open(self.offsets_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._flusher: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._recover()
+
+    def _recover(self) -> None:
+        """Resume after a previous writer: cut a torn tail, rebuild offsets and hash."""
+        self.count = 0
+        self.size = 0
+        self._sha = hashlib.sha256()
+        offsets = bytearray()
+        with open(self.segment_path, "rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                offsets += _OFFSET.pack(self.size)
+                self._sha.update(line)
+                self.size += len(line)
+                self.count += 1
+        if os.fstat(self._segment_fd).st_size != self.size:
+            os.ftruncate(self._segment_fd, self.size)
+            os.fsync(self._segment_fd)
+        os.ftruncate(self._offsets_fd, 0)
+        os.pwrite(self._offsets_fd, bytes(offsets), 0)
+
+    def append(self, receipt: Dict[str, Any]) -> None:
+        """Queue a receipt for the next group commit (blocks while the queue is full)."""
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"receipt log for run {self.run_id} is sealed")
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name=f"receipt-flusher-{self.run_id}", daemon=True
+                )
+                self._flusher.start()
+        self._queue.put(receipt)
+
+    def _flush_loop(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < GROUP_COMMIT_MAX:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            receipts = [item for item in batch if item is not _STOP]
+            try:
+                if receipts:
+                    self._write(receipts)
+            except Exception as exc:  # surfaced by flush()
+                self._error = exc
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is _STOP:
+                return
+
+    def _write(self, receipts: List[Dict[str, Any]]) -> None:
+        lines = [_encode(receipt) for receipt in receipts]
+        offsets = bytearray()
+        position = self.size
+        for line in lines:
+            offsets += _OFFSET.pack(position)
+            position += len(line)
+        data = b"".join(lines)
+        os.write(self._segment_fd, data)
+        os.fsync(self._segment_fd)
+        os.pwrite(self._offsets_fd, bytes(offsets), self.count * _OFFSET.size)
+        self._sha.update(data)
+        self.size = position
+        self.count += len(lines)
+
+    def flush(self) -> None:
+        """Wait until every queued receipt is durable; re-raise a write failure."""
+        self._queue.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def seal(self) -> Path:
+        """Flush, stop the flusher and write index.json; returns its path."""
+        with self._lock:
+            self._closed = True
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._queue.put(_STOP)
+            flusher.join()
+        self.flush()
+        os.fsync(self._offsets_fd)
+        atomic_write_json(
+            self.index_path,
+            {
+                "schema_version": INDEX_SCHEMA_VERSION,
+                "run_id": self.run_id,
+                "receipt_count": self.count,
+                "segment": SEGMENT_FILE,
+                "segment_bytes": self.size,
+                "segment_sha256": self._sha.hexdigest(),
+                "offsets": OFFSETS_FILE,
+            },
+        )
+        self.close()
+        return self.index_path
+
+    def close(self) -> None:
+        """Release the files (without sealing); queued receipts are flushed first."""
+        with self._lock:
+            self._closed = True
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._queue.put(_STOP)
+            flusher.join()
+        for name in ("_segment_fd", "_offsets_fd"):
+            fd = getattr(self, name)
+            if fd is not None:
+                os.close(fd)
+                setattr(self, name, None)
+
+
+class InvocationReceiptReader:
+    """Reads a run's receipts, sealed or still being written."""
+
+    def __init__(self, run_dir: Path):
+        self.run_dir = Path(run_dir)
+        self.segment_path = self.run_dir / SEGMENT_FILE
+        self.offsets_path = self.run_dir / OFFSETS_FILE
+        self.index_path = self.run_dir / INDEX_FILE
+        self._position = 0
+
+    def index(self) -> Optional[Dict[str, Any]]:
+        """The seal (or legacy v1 index), or None while the run is live."""
+        if not self.index_path.exists():
+            return None
+        return json.loads(self.index_path.read_text("utf-8"))
+
+    @property
+    def sealed(self) -> bool:
+        return self.index_path.exists()
+
+    def _legacy(self) -> Optional[List[Dict[str, Any]]]:
+        index = self.index()
+        if index is not None and "receipts" in index:
+            return list(index["receipts"])
+        return None
+
+    def _limit(self) -> Optional[int]:
+        index = self.index()
+        return index.get("segment_bytes") if index else None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        legacy = self._legacy()
+        if legacy is not None:
+            yield from legacy
+            return
+        if not self.segment_path.exists():
+            return
+        limit = self._limit()
+        with open(self.segment_path, "rb") as handle:
+            consumed = 0
+            for line in handle:
+                if not line.endswith(b"\n") or (limit is not None and consumed >= limit):
+                    break
+                consumed += len(line)
+                yield json.loads(line)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Receipts completed since the previous poll (for following a live run)."""
+        if not self.segment_path.exists():
+            return []
+        with open(self.segment_path, "rb") as handle:
+            handle.seek(self._position)
+            data = handle.read()
+        end = data.rfind(b"\n") + 1
+        self._position += end
+        return [json.loads(line) for line in data[:end].splitlines()]
+
+    def count(self) -> int:
+        """Number of receipts (from the seal when sealed)."""
+        index = self.index()
+        if index is not None:
+            return int(index["receipt_count"])
+        return sum(1 for _ in self)
+
+    def get(self, seq: int) -> Optional[Dict[str, Any]]:
+        """Receipt with the given seq (1-based), located through the offsets file."""
+        legacy = self._legacy()
+        if legacy is not None:
+            return next((r for r in legacy if r.get("seq") == seq), None)
+        if seq < 1 or not self.offsets_path.exists():
+            return None
+        with open(self.offsets_path, "rb") as offsets:
+            offsets.seek((seq - 1) * _OFFSET.size)
+            raw = offsets.read(_OFFSET.size)
+        if len(raw) == _OFFSET.size:
+            with open(self.segment_path, "rb") as handle:
+                handle.seek(_OFFSET.unpack(raw)[0])
+                line = handle.readline()
+            if line.endswith(b"\n"):
+                return json.loads(line)
+        # Offsets lag the segment until the flusher writes them
+        return next((r for r in self if r.get("seq") == seq), None)
+
+    def verify(self) -> List[str]:
+        """Check a sealed segment against its seal; returns problems found."""
+        index = self.index()
+        if index is None or "receipts" in index:
+            return []
+        problems = []
+        data = self.segment_path.read_bytes()[: index["segment_bytes"]]
+        if len(data) != index["segment_bytes"]:
+            problems.append(f"segment shorter than sealed size {index['segment_bytes']}")
+        if hashlib.sha256(data).hexdigest() != index["segment_sha256"]:
+            problems.append("segment_sha256 mismatch")
+        if data.count(b"\n") != index["receipt_count"]:
+            problems.append(f"expected {index['receipt_count']} receipts")
+        return problems
@@ -1,20 +1,30 @@
 """Per-invocation receipt collector for build loop runs.
 
 Records each LLM/CLI agent invocation with timing, hashes, and validation status.
-Finalizes to an index.json under artifacts/receipts/<run_id>/.
+Receipts go to an append-only segment under artifacts/receipts/<run_id>/
+(see invocation_log); finalize seals it with a compact index.json.
+
+A collector given an output_dir streams receipts to disk as they are
+recorded, so a crashed run keeps everything flushed before the crash and
+can be read while live. A collector created without one buffers receipts
+in memory and writes them in a single batch at finalize.
 """
 
 from __future__ import annotations
 
-import re
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from threading import Lock
 from typing import Dict, List, Optional
 
-from runtime.util.atomic_write import atomic_write_json
 from runtime.util.canonical import compute_sha256
 
+from .invocation_log import (
+    InvocationReceiptReader,
+    InvocationSegmentWriter,
+    run_receipts_dir,
+)
+
 
 @dataclass
 class InvocationReceipt:
@@ -37,10 +47,38 @@ class InvocationReceipt:
 class InvocationReceiptCollector:
     """Collects invocation receipts during a run and finalizes to index.json."""
 
-    def __init__(self, run_id: str):
+    def __init__(self, run_id: str, output_dir: Optional[Path] = None):
         self.run_id = run_id
         self._receipts: List[InvocationReceipt] = []
         self._seq_counter = 0
+        self._lock = Lock()
+        self._writer: Optional[InvocationSegmentWriter] = None
+        if output_dir is not None:
+            self.stream_to(output_dir)
+
+    @property
+    def streaming(self) -> bool:
+        return self._writer is not None
+
+    def stream_to(self, output_dir: Path) -> None:
+        """
+        Start streaming receipts to output_dir/artifacts/receipts/<run_id>/.
+
+        Receipts buffered so far are written first. If the run already has
+        a segment there (a crashed or earlier process), it is resumed and
+        sequence numbers continue from it.
+        """
+        with self._lock:
+            if self._writer is not None:
+                return
+            writer = InvocationSegmentWriter(run_receipts_dir(output_dir, self.run_id), self.run_id)
+            offset = writer.count
+            for receipt in self._receipts:
+                receipt.seq += offset
+                writer.append(asdict(receipt))
+            self._seq_counter += offset
+            self._receipts = []
+            self._writer = writer
 
     def record(
         self,
@@ -58,78 +96,86 @@ class InvocationReceiptCollector:
         input_hash: Optional[str] = None,
     ) -> InvocationReceipt:
         """Record a single invocation and return its receipt."""
-        self._seq_counter += 1
         output_hash = compute_sha256(output_content)
-
-        receipt = InvocationReceipt(
-            seq=self._seq_counter,
-            run_id=self.run_id,
-            provider_id=provider_id,
-            mode=mode,
-            seat_id=seat_id,
-            start_ts=start_ts,
-            end_ts=end_ts,
-            exit_status=exit_status,
-            output_hash=output_hash,
-            schema_validation=schema_validation,
-            token_usage=token_usage,
-            truncation=truncation,
-            error=error,
-            input_hash=input_hash,
-        )
-        self._receipts.append(receipt)
+        # seq is assigned and queued under one lock so segment lines stay in seq order
+        with self._lock:
+            self._seq_counter += 1
+            receipt = InvocationReceipt(
+                seq=self._seq_counter,
+                run_id=self.run_id,
+                provider_id=provider_id,
+                mode=mode,
+                seat_id=seat_id,
+                start_ts=start_ts,
+                end_ts=end_ts,
+                exit_status=exit_status,
+                output_hash=output_hash,
+                schema_validation=schema_validation,
+                token_usage=token_usage,
+                truncation=truncation,
+                error=error,
+                input_hash=input_hash,
+            )
+            if self._writer is not None:
+                self._writer.append(asdict(receipt))
+            else:
+                self._receipts.append(receipt)
         return receipt
 
+    def flush(self) -> None:
+        """Block until every recorded receipt is durable on disk (streaming only)."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and release the segment without sealing the run."""
+        if self._writer is not None:
+            self._writer.close()
+
     def finalize(self, output_dir: Path) -> Path:
-        """Write receipts and index to output_dir/artifacts/receipts/<run_id>/.
+        """Seal the run's receipts under output_dir/artifacts/receipts/<run_id>/.
+
+        Writes any buffered receipts, waits for the flusher, then writes the
+        compact index.json (receipt count, segment size and hash). The cost
+        of the seal does not depend on the number of receipts.
 
         Args:
-            output_dir: Repository root or base output directory.
+            output_dir: Repository root or base output directory. Ignored
+                when the collector is already streaming elsewhere.
 
         Returns:
             Path to the written index.json file.
         """
-        receipts_dir = output_dir / "artifacts" / "receipts" / self.run_id
-        receipts_dir.mkdir(parents=True, exist_ok=True)
-        index_path = receipts_dir / "index.json"
-
-        for receipt in self._receipts:
-            receipt_path = receipts_dir / self._receipt_filename(receipt)
-            atomic_write_json(receipt_path, asdict(receipt))
-
-        index = {
-            "schema_version": "invocation_index_v1",
-            "run_id": self.run_id,
-            "receipt_count": len(self._receipts),
-            "receipts": [asdict(r) for r in self._receipts],
-        }
-
-        atomic_write_json(index_path, index)
-        return index_path
+        self.stream_to(output_dir)
+        assert self._writer is not None
+        return self._writer.seal()
 
     @property
     def receipts(self) -> List[InvocationReceipt]:
-        return list(self._receipts)
-
-    @staticmethod
-    def _receipt_filename(receipt: InvocationReceipt) -> str:
-        provider = re.sub(r"[^a-zA-Z0-9._-]+", "_", receipt.provider_id.strip())
-        provider = provider or "unknown"
-        return f"{receipt.seq:04d}_{provider}.json"
+        if self._writer is None:
+            return list(self._receipts)
+        self._writer.flush()
+        return [
+            InvocationReceipt(**record) for record in InvocationReceiptReader(self._writer.run_dir)
+        ]
 
 
 _COLLECTORS: Dict[str, InvocationReceiptCollector] = {}
 _COLLECTORS_LOCK = Lock()
 
 
-def get_or_create_collector(run_id: str) -> InvocationReceiptCollector:
-    """Get run collector, creating one if missing."""
+def get_or_create_collector(
+    run_id: str, output_dir: Optional[Path] = None
+) -> InvocationReceiptCollector:
+    """Get run collector, creating one if missing; streams to output_dir if given."""
     with _COLLECTORS_LOCK:
         collector = _COLLECTORS.get(run_id)
         if collector is None:
             collector = InvocationReceiptCollector(run_id=run_id)
             _COLLECTORS[run_id] = collector
-        return collector
+    if output_dir is not None:
+        collector.stream_to(output_dir)
+    return collector
 
 
 def record_invocation_receipt(
@@ -188,7 +234,15 @@ def finalize_run_receipts(
     return collector.finalize(output_dir=output_dir)
 
 
+def read_run_receipts(output_dir: Path, run_id: str) -> InvocationReceiptReader:
+    """Reader for a run's receipts under output_dir (live or sealed)."""
+    return InvocationReceiptReader(run_receipts_dir(output_dir, run_id))
+
+
 def reset_invocation_receipt_collectors() -> None:
     """Test helper: clear in-memory collector registry."""
     with _COLLECTORS_LOCK:
+        collectors = list(_COLLECTORS.values())
         _COLLECTORS.clear()
+    for collector in collectors:
+        collector.close()
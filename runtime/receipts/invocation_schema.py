@@ -52,7 +52,8 @@ INVOCATION_RECEIPT_SCHEMA = {
     },
 }
 
-INVOCATION_INDEX_SCHEMA = {
+# Legacy index: every receipt repeated inline (written before the segment log).
+INVOCATION_INDEX_V1_SCHEMA = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
     "additionalProperties": False,
@@ -67,3 +68,28 @@ INVOCATION_INDEX_SCHEMA = {
         },
     },
 }
+
+# Seal over the append-only receipts.jsonl segment (see invocation_log).
+INVOCATION_INDEX_SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "additionalProperties": False,
+    "required": [
+        "schema_version",
+        "run_id",
+        "receipt_count",
+        "segment",
+        "segment_bytes",
+        "segment_sha256",
+        "offsets",
+    ],
+    "properties": {
+        "schema_version": {"type": "string", "const": "invocation_index_v2"},
+        "run_id": {"type": "string", "minLength": 1},
+        "receipt_count": {"type": "integer", "minimum": 0},
+        "segment": {"type": "string", "minLength": 1},
+        "segment_bytes": {"type": "integer", "minimum": 0},
+        "segment_sha256": {"type": "string", "pattern": "^[0-9a-f]{64}$"},
+        "offsets": {"type": "string", "minLength": 1},
+    },
+}
@@ -24,6 +24,7 @@ _SCHEMA_MAP: dict[str, dict] = {
     "review_summary": _schemas.REVIEW_SUMMARY_SCHEMA,
     "invocation_receipt": _inv_schemas.INVOCATION_RECEIPT_SCHEMA,
     "invocation_index": _inv_schemas.INVOCATION_INDEX_SCHEMA,
+    "invocation_index_v1": _inv_schemas.INVOCATION_INDEX_V1_SCHEMA,
 }
 
 _FORMAT_CHECKER = FormatChecker()
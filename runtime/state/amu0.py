@@ -1,13 +1,20 @@
 """
 FP-3.2: AMU₀ Discipline & State Lineage
 Implements deterministic, reproducible state snapshot operations.
+
+Baseline contents live once in a content-addressed store
+(<state_root>/amu0_store); each baseline's files/ directory hardlinks
+into it, next to a manifest of path -> sha256.
 """
 
+import contextlib
 import hashlib
 import json
 import os
-import shutil
-from typing import Any, Dict
+
+from runtime.state.object_store import ObjectStore, clone_file, link_or_clone
+
+AMU0_STORE_DIRNAME = "amu0_store"
 
 
 class AMU0Error(Exception):
@@ -35,6 +42,7 @@ class AMU0Manager:
         """
         self.state_root = state_root
         os.makedirs(state_root, exist_ok=True)
+        self.store = ObjectStore(os.path.join(state_root, AMU0_STORE_DIRNAME))
 
     def create_amu0_baseline(
         self, baseline_name: str, source_paths: list[str], timestamp: str
@@ -66,25 +74,33 @@ class AMU0Manager:
         os.makedirs(baseline_dir)
 
         # Create manifest
+        manifest_files: list[dict] = []
         manifest = {
             "baseline_name": baseline_name,
             "created_at": timestamp,
             "source_paths": source_paths,
-            "files": [],
+            "files": manifest_files,
         }
 
-        # Copy files and compute checksums
         # Sort source paths for deterministic processing order
+        file_paths = []
         for source_path in sorted(source_paths):
             if os.path.isfile(source_path):
-                self._copy_file_to_baseline(source_path, baseline_dir, manifest)
+                file_paths.append(source_path)
             elif os.path.isdir(source_path):
                 for root, dirs, files in os.walk(source_path):
                     # Sort dirs and files for deterministic traversal
                     dirs.sort()
-                    for fname in sorted(files):
-                        fpath = os.path.join(root, fname)
-                        self._copy_file_to_baseline(fpath, baseline_dir, manifest)
+                    file_paths.extend(os.path.join(root, fname) for fname in sorted(files))
+
+        # Store contents once, then hardlink each object into the baseline
+        files_dir = os.path.join(baseline_dir, "files")
+        os.makedirs(files_dir, exist_ok=True)
+        stored = self.store.ingest_many(file_paths)
+        for fpath, (digest, size) in zip(file_paths, stored, strict=True):
+            rel_path = os.path.basename(fpath)
+            link_or_clone(self.store.object_path(digest), os.path.join(files_dir, rel_path))
+            manifest_files.append({"path": rel_path, "sha256": digest, "size": size})
 
         # Write manifest
         manifest_path = os.path.join(baseline_dir, "amu0_manifest.json")
@@ -100,25 +116,6 @@ class AMU0Manager:
 
         return baseline_dir
 
-    def _copy_file_to_baseline(
-        self, source_path: str, baseline_dir: str, manifest: Dict[str, Any]
-    ) -> None:
-        """Copy a file to baseline and update manifest."""
-        # Compute relative path
-        rel_path = os.path.basename(source_path)
-        dest_path = os.path.join(baseline_dir, "files", rel_path)
-
-        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-        shutil.copy2(source_path, dest_path)
-
-        # Compute checksum
-        with open(dest_path, "rb") as f:
-            checksum = hashlib.sha256(f.read()).hexdigest()
-
-        manifest["files"].append(
-            {"path": rel_path, "sha256": checksum, "size": os.path.getsize(dest_path)}
-        )
-
     def restore_from_amu0(self, baseline_name: str, target_dir: str) -> None:
         """
         Restore state from an AMU₀ baseline.
@@ -152,23 +149,23 @@ class AMU0Manager:
         with open(manifest_path, "r") as f:
             manifest = json.load(f)
 
-        # Restore files
-        os.makedirs(target_dir, exist_ok=True)
+        # Verify every file before restoring any
         files_dir = os.path.join(baseline_dir, "files")
+        failures = self.store.verify(
+            (os.path.join(files_dir, e["path"]), e["sha256"]) for e in manifest["files"]
+        )
+        if failures:
+            rel_path = os.path.relpath(failures[0], files_dir)
+            raise AMU0Error(f"File integrity check failed for {rel_path}")
 
+        # Restore files as independent copies (never links into the store)
+        os.makedirs(target_dir, exist_ok=True)
         for file_entry in manifest["files"]:
-            src = os.path.join(files_dir, file_entry["path"])
             dst = os.path.join(target_dir, file_entry["path"])
-
-            # Verify file integrity
-            with open(src, "rb") as f:
-                actual_checksum = hashlib.sha256(f.read()).hexdigest()
-
-            if actual_checksum != file_entry["sha256"]:
-                raise AMU0Error(f"File integrity check failed for {file_entry['path']}")
-
             os.makedirs(os.path.dirname(dst), exist_ok=True)
-            shutil.copy2(src, dst)
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(dst)
+            clone_file(os.path.join(files_dir, file_entry["path"]), dst)
 
     def promote_run_to_amu0(self, run_dir: str, new_baseline_name: str, timestamp: str) -> str:
         """
@@ -198,12 +195,15 @@ class AMU0Manager:
 
         return self.create_amu0_baseline(new_baseline_name, source_paths, timestamp)
 
-    def verify_baseline(self, baseline_name: str) -> bool:
+    def verify_baseline(self, baseline_name: str, fail_fast: bool = True) -> bool:
         """
         Verify integrity of an existing baseline.
 
+        Files are hashed in streamed chunks across a thread pool.
+
         Args:
             baseline_name: Name of the baseline to verify
+            fail_fast: Stop hashing at the first mismatch
 
         Returns:
             True if baseline is valid, False otherwise.
@@ -231,16 +231,11 @@ class AMU0Manager:
                 manifest = json.load(f)
 
             files_dir = os.path.join(baseline_dir, "files")
-            for file_entry in manifest["files"]:
-                fpath = os.path.join(files_dir, file_entry["path"])
-                if not os.path.exists(fpath):
-                    return False
-
-                with open(fpath, "rb") as f:
-                    if hashlib.sha256(f.read()).hexdigest() != file_entry["sha256"]:
-                        return False
-
-            return True
+            failures = self.store.verify(
+                ((os.path.join(files_dir, e["path"]), e["sha256"]) for e in manifest["files"]),
+                fail_fast=fail_fast,
+            )
+            return not failures
         except Exception:
             return False
 
@@ -0,0 +1,263 @@
+"""
+Content-addressed object store backing AMU₀ baselines.
+
+Objects live at <root>/objects/<digest[:2]>/<digest[2:]> and are made
+read-only. Ingest reflinks the source into the store (FICLONE, falling
+back to a streamed copy) and hashes the stored bytes, so the digest
+always describes what was kept. Baselines hardlink objects into place;
+restores clone or copy them out, so nothing mutable ever shares an inode
+with the store.
+
+A stat cache maps source paths to (dev, ino, size, mtime_ns, ctime_ns)
+and the digest last seen there; a source whose stat tuple is unchanged
+and whose object is still present is not read again.
+"""
+
+import contextlib
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CHUNK_SIZE = 1024 * 1024
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 1) + 2)
+BATCH_SIZE = 64  # files per pool task; keeps per-task overhead off small files
+# Files modified this close to a capture are not stat-cached: a write in the
+# same filesystem timestamp tick would leave the stat tuple unchanged
+RACY_WINDOW_NS = 100_000_000
+
+# Errors meaning "this filesystem pair cannot reflink/hardlink", not "I/O failed"
+_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EINVAL,
+    errno.EPERM,
+    errno.EMLINK,
+}
+
+
+class VerifyCancelled(Exception):
+    """Raised inside a verify worker once another worker found a mismatch."""
+
+
+def hash_file(path: str, stop: Optional[threading.Event] = None) -> str:
+    """Streamed sha256 of a file; checks `stop` between chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            if stop is not None and stop.is_set():
+                raise VerifyCancelled(path)
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_hashing(src, dst) -> str:
+    digest = hashlib.sha256()
+    while chunk := src.read(CHUNK_SIZE):
+        digest.update(chunk)
+        dst.write(chunk)
+    return digest.hexdigest()
+
+
+def clone_file(source_path: str, dest_path: str, writable: bool = True) -> bool:
+    """Copy source to dest, by reflink when the filesystem supports it. True if reflinked."""
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            cloned = True
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED:
+                raise
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            cloned = False
+    shutil.copystat(source_path, dest_path)
+    if writable:
+        os.chmod(dest_path, os.stat(dest_path).st_mode | 0o200)
+    return cloned
+
+
+def link_or_clone(source_path: str, dest_path: str) -> None:
+    """Hardlink source at dest (replacing dest), cloning instead across filesystems."""
+    try:
+        os.link(source_path, dest_path)
+    except FileExistsError:
+        os.unlink(dest_path)
+        os.link(source_path, dest_path)
+    except OSError as exc:
+        if exc.errno not in _UNSUPPORTED:
+            raise
+        clone_file(source_path, dest_path, writable=False)
+
+
+def _batches(items: list, size: int = BATCH_SIZE) -> List[list]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _stat_key(st: os.stat_result) -> List[int]:
+    return [st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns]
+
+
+class ObjectStore:
+    """sha256-addressed, deduplicating file store with a source stat cache."""
+
+    def __init__(self, root: str, workers: int = DEFAULT_WORKERS):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.stat_cache_path = os.path.join(root, "stat_cache.json")
+        self.workers = max(1, workers)
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._cache: Dict[str, List] = self._load_stat_cache()
+        self._cache_lock = threading.Lock()
+        self._fanout_dirs: set = set()
+        self.stats = {"hashed": 0, "cached": 0, "stored": 0, "reflinked": 0}
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self.object_path(digest))
+
+    def _load_stat_cache(self) -> Dict[str, List]:
+        try:
+            with open(self.stat_cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def save_stat_cache(self) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".stat_cache.")
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(self._cache, separators=(",", ":")))
+        os.replace(tmp, self.stat_cache_path)
+
+    def _bump(self, key: str) -> None:
+        with self._cache_lock:
+            self.stats[key] += 1
+
+    def ingest(self, source_path: str, not_after_ns: Optional[int] = None) -> Tuple[str, int]:
+        """
+        Store a file's content; returns (digest, size).
+
+        Stat-cache hits with an object present skip reading the source.
+        Sources modified at or after not_after_ns are stored but not
+        cached (see RACY_WINDOW_NS).
+        """
+        source_path = os.path.abspath(source_path)
+        st = os.stat(source_path)
+        key = _stat_key(st)
+        with self._cache_lock:
+            cached = self._cache.get(source_path)
+        if cached and cached[:-1] == key and self.has(cached[-1]):
+            self._bump("cached")
+            return cached[-1], st.st_size
+
+        fd, tmp = tempfile.mkstemp(dir=self.objects_dir, prefix=".ingest.")
+        try:
+            with open(source_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                    reflinked = True
+                except OSError as exc:
+                    if exc.errno not in _UNSUPPORTED:
+                        raise
+                    digest = _copy_hashing(src, dst)
+                    reflinked = False
+            if reflinked:
+                digest = hash_file(tmp)  # hash the clone: it cannot change under us
+                self._bump("reflinked")
+            self._bump("hashed")
+            size = os.path.getsize(tmp)
+            final = self.object_path(digest)
+            if os.path.exists(final):
+                os.unlink(tmp)
+            else:
+                fanout = os.path.dirname(final)
+                if fanout not in self._fanout_dirs:
+                    os.makedirs(fanout, exist_ok=True)
+                    self._fanout_dirs.add(fanout)
+                os.chmod(tmp, st.st_mode & 0o555)
+                os.replace(tmp, final)
+                self._bump("stored")
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
+            raise
+
+        if not_after_ns is None or st.st_mtime_ns < not_after_ns:
+            # Only cache if the source did not change while it was stored
+            if _stat_key(os.stat(source_path)) == key:
+                with self._cache_lock:
+                    self._cache[source_path] = [*key, digest]
+        return digest, size
+
+    def ingest_many(self, source_paths: Iterable[str]) -> List[Tuple[str, int]]:
+        """Ingest in parallel; results follow the input order. Saves the stat cache."""
+        not_after_ns = time.time_ns() - RACY_WINDOW_NS
+
+        def ingest_batch(batch: List[str]) -> List[Tuple[str, int]]:
+            return [self.ingest(path, not_after_ns) for path in batch]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            batches = pool.map(ingest_batch, _batches(list(source_paths)))
+            results = [result for batch in batches for result in batch]
+        self.save_stat_cache()
+        return results
+
+    def verify(self, items: Iterable[Tuple[str, str]], fail_fast: bool = True) -> List[str]:
+        """
+        Check (path, expected_digest) pairs by streamed parallel hashing.
+
+        Returns the paths that are missing or mismatched. Paths sharing an
+        inode (hardlinks of one object) are hashed once. With fail_fast,
+        outstanding work is cancelled at the first failure and at least
+        that failure is reported.
+        """
+        by_inode: Dict[Tuple[int, int], Tuple[str, List[Tuple[str, str]]]] = {}
+        failures: List[str] = []
+        for path, expected in items:
+            try:
+                st = os.stat(path)
+            except OSError:
+                failures.append(path)
+                if fail_fast:
+                    return failures
+                continue
+            by_inode.setdefault((st.st_dev, st.st_ino), (path, []))[1].append((path, expected))
+
+        stop = threading.Event()
+
+        def check(groups: List[Tuple[str, List[Tuple[str, str]]]]) -> List[str]:
+            bad: List[str] = []
+            for first, members in groups:
+                try:
+                    actual = hash_file(first, stop)
+                except VerifyCancelled:
+                    break
+                except OSError:
+                    actual = None
+                bad.extend(path for path, expected in members if expected != actual)
+                if bad and fail_fast:
+                    stop.set()
+                    break
+            return bad
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(check, b) for b in _batches(list(by_inode.values()))]
+            for future in futures:
+                failures.extend(future.result())
+                if failures and fail_fast:
+                    stop.set()
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        return failures
@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures for runtime/tests/.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+
+from runtime.agents.logging import CALL_LOG_DIR_ENV
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _agent_call_log_dir(tmp_path_factory: pytest.TempPathFactory) -> Iterator[None]:
+    """Send the default agent call log to a temporary store, not logs/agent_calls."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CALL_LOG_DIR_ENV, str(tmp_path_factory.mktemp("agent_calls")))
+        yield
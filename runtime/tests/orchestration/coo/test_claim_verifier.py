@@ -123,8 +123,8 @@ class TestVerifyClaimsCommitSHA:
         sha = "a" * 40
         output = f"The commit {sha} was created."
         with patch(
-            "runtime.orchestration.coo.claim_verifier._sha_exists_in_git",
-            return_value=False,
+            "runtime.orchestration.coo.claim_verifier._shas_in_git",
+            return_value=set(),
         ):
             violations = verify_claims(output, snapshot, repo_root=tmp_path)
         commit_violations = [v for v in violations if v.claim_type == "commit"]
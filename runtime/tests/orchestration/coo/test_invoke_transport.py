@@ -0,0 +1,106 @@
+"""Tests: COO invocation transports (argv / stdin) against a fake openclaw."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from runtime.orchestration.coo import invoke as invoke_mod
+from runtime.orchestration.coo.invoke import InvocationError, invoke_coo_reasoning
+from runtime.receipts.invocation_receipt import reset_invocation_receipt_collectors
+
+_FAKE_OPENCLAW = textwrap.dedent(
+    """\
+    #!{python}
+    import json, os, sys, time
+
+    args = sys.argv[1:]
+    message = args[args.index("--message") + 1]
+    if message == "-":
+        message = sys.stdin.read()
+    session = args[args.index("--session-id") + 1]
+    time.sleep(float(os.environ.get("FAKE_OPENCLAW_SLEEP", "0")))
+    text = (
+        "schema_version: task_proposal.v1\\n"
+        f"message_bytes: {{len(message.encode('utf-8'))}}\\n"
+        f"session: {{session}}\\n"
+    )
+    log = os.environ.get("FAKE_OPENCLAW_LOG")
+    if log:
+        with open(log, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps({{"argv_bytes": sum(len(a) for a in args)}}) + "\\n")
+    print(json.dumps({{"status": "ok", "result": {{"payloads": [{{"text": text}}]}}}}))
+    """
+)
+
+
+def _parse(text: str) -> dict[str, str]:
+    return dict(line.split(": ", 1) for line in text.strip().splitlines())
+
+
+@pytest.fixture
+def fake_openclaw(tmp_path: Path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "openclaw"
+    script.write_text(_FAKE_OPENCLAW.format(python=sys.executable), encoding="utf-8")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_OPENCLAW_LOG", str(tmp_path / "calls.jsonl"))
+    monkeypatch.delenv(invoke_mod.COO_TRANSPORT_ENV, raising=False)
+    reset_invocation_receipt_collectors()
+    yield script
+    reset_invocation_receipt_collectors()
+
+
+def _invoke(**kwargs) -> dict[str, str]:
+    kwargs.setdefault("context", {"backlog": []})
+    kwargs.setdefault("mode", "propose")
+    return _parse(invoke_coo_reasoning(repo_root=None, **kwargs))
+
+
+def _argv_bytes(tmp_path: Path) -> list[int]:
+    lines = (tmp_path / "calls.jsonl").read_text().splitlines()
+    return [json.loads(line)["argv_bytes"] for line in lines]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebang executable")
+class TestCliTransports:
+    def test_auto_keeps_small_messages_in_argv(self, fake_openclaw, tmp_path):
+        out = _invoke(context={"note": "x" * 1024})
+        assert int(out["message_bytes"]) > 1024
+        assert _argv_bytes(tmp_path)[0] > 1024
+
+    def test_auto_streams_large_messages_on_stdin(self, fake_openclaw, tmp_path):
+        # Larger than MAX_ARG_STRLEN: would fail with E2BIG as an argv string
+        out = _invoke(context={"note": "x" * (1024 * 1024)})
+        assert int(out["message_bytes"]) > 1024 * 1024
+        assert _argv_bytes(tmp_path)[0] < 1024
+
+    def test_explicit_stdin_transport(self, fake_openclaw, tmp_path):
+        out = _invoke(transport="stdin", context={"note": "x" * (1024 * 1024)})
+        assert int(out["message_bytes"]) > 1024 * 1024
+        assert _argv_bytes(tmp_path)[0] < 1024
+
+    def test_unknown_transport_rejected(self, fake_openclaw):
+        with pytest.raises(InvocationError, match="unknown COO transport"):
+            _invoke(transport="carrier-pigeon")
+
+    def test_retries_stop_at_the_deadline(self, fake_openclaw, monkeypatch):
+        monkeypatch.setenv("FAKE_OPENCLAW_SLEEP", "5")
+        start = time.monotonic()
+        with pytest.raises(InvocationError, match="timed out"):
+            _invoke(mode="chat", timeout_s=1, deadline_s=1.5, _retry_delays=(0.2, 0.2))
+        assert time.monotonic() - start < 3.0
+
+
+def test_backoff_delay_is_jittered_within_cap():
+    delays = {invoke_mod._backoff_delay(2.0) for _ in range(50)}
+    assert all(1.0 <= d <= 2.0 for d in delays)
+    assert len(delays) > 1
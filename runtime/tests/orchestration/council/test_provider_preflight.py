@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from unittest.mock import patch
 
 from runtime.orchestration.council.models import ProviderHealthResult, SeatFailureClass
 from runtime.orchestration.council.provider_preflight import (
+    DEFAULT_HEALTH_TTLS,
+    ProviderHealthCache,
     _classify_error,
     check_provider,
     is_run_blocked,
@@ -74,6 +78,16 @@ def test_check_provider_auth_failure():
     assert result.status == SeatFailureClass.provider_unavailable
 
 
+def test_check_provider_rejected_key_is_auth_failure():
+    """A present key the provider rejects (401) is an auth failure, not retried."""
+    probe = FakeEchoProbe(failures={"m": "HTTP 401: invalid api key"})
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "bad-key"}):
+        result = check_provider("p", "m", echo_probe=probe)
+    assert result.auth_ok is False
+    assert result.status == SeatFailureClass.provider_unavailable
+    assert probe.calls == ["m"]
+
+
 def test_check_provider_success():
     with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
         result = check_provider("openrouter/kimi", "openrouter/moonshotai/kimi-k2.5", echo_probe=_ok_probe)
@@ -205,3 +219,153 @@ def test_is_run_blocked_carry_forward_undeclared():
         carry_forward_providers=set(),
     )
     assert blocked
+
+
+# ---------------------------------------------------------------------------
+# Concurrency, deadline and health cache
+# ---------------------------------------------------------------------------
+
+
+class FakeEchoProbe:
+    """Echo probe with configurable per-model latency and failure modes."""
+
+    def __init__(self, latency: float = 0.0, failures: dict[str, str] | None = None):
+        self.latency = latency
+        self.failures = failures or {}
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, model: str, timeout: float) -> tuple[bool, str | None]:
+        with self._lock:
+            self.calls.append(model)
+        time.sleep(min(self.latency, timeout))
+        if model in self.failures:
+            return False, self.failures[model]
+        return True, None
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+_MODELS = {"model-a": "model-a", "model-b": "model-b", "model-c": "model-c"}
+
+
+def test_run_preflight_probes_concurrently():
+    probe = FakeEchoProbe(latency=0.2)
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        start = time.monotonic()
+        results = run_preflight(_MODELS, echo_probe=probe)
+        elapsed = time.monotonic() - start
+    assert all(r.status == SeatFailureClass.seat_completed for r in results.values())
+    assert list(results) == list(_MODELS)
+    assert elapsed < 0.5
+
+
+def test_run_preflight_global_deadline():
+    probe = FakeEchoProbe(latency=5.0)
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        start = time.monotonic()
+        results = run_preflight({"slow": "slow"}, echo_probe=probe, deadline_seconds=0.2)
+        elapsed = time.monotonic() - start
+    assert elapsed < 1.0
+    assert results["slow"].status == SeatFailureClass.seat_timeout
+    assert "deadline" in (results["slow"].error or "")
+
+
+def test_health_cache_skips_recent_success(tmp_path):
+    cache = ProviderHealthCache(tmp_path / "health.json", clock=_Clock())
+    probe = FakeEchoProbe()
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        run_preflight(_MODELS, echo_probe=probe, health_cache=cache)
+        again = run_preflight(_MODELS, echo_probe=probe, health_cache=cache)
+    assert sorted(probe.calls) == sorted(_MODELS)  # second run served from cache
+    assert all(r.status == SeatFailureClass.seat_completed for r in again.values())
+
+
+def test_health_cache_ttl_depends_on_failure_class(tmp_path):
+    clock = _Clock()
+    cache = ProviderHealthCache(tmp_path / "health.json", clock=clock)
+    probe = FakeEchoProbe(failures={"model-a": "rate limit (429)"})
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        run_preflight(
+            {"model-a": "model-a", "model-b": "model-b"}, echo_probe=probe, health_cache=cache
+        )
+        clock.now += DEFAULT_HEALTH_TTLS[SeatFailureClass.provider_quota] + 1
+        assert cache.get("model-a", "model-a") is None
+        assert cache.get("model-b", "model-b").status == SeatFailureClass.seat_completed
+
+
+def test_health_cache_auth_failure_sticky_per_credentials(tmp_path):
+    clock = _Clock()
+    cache = ProviderHealthCache(tmp_path / "health.json", clock=clock)
+    with patch.dict(os.environ, {}, clear=True):
+        run_preflight({"p": "m"}, echo_probe=_ok_probe, health_cache=cache)
+        clock.now += 3600
+        cached = cache.get("p", "m")
+    assert cached is not None and cached.auth_ok is False
+
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "new-key"}):
+        assert cache.get("p", "m") is None
+
+
+def test_health_cache_rejected_key_is_sticky(tmp_path):
+    clock = _Clock()
+    cache = ProviderHealthCache(tmp_path / "health.json", clock=clock)
+    probe = FakeEchoProbe(failures={"m": "403 Forbidden"})
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "bad-key"}):
+        run_preflight({"p": "m"}, echo_probe=probe, health_cache=cache)
+        clock.now += DEFAULT_HEALTH_TTLS[SeatFailureClass.provider_unavailable] + 1
+        cached = cache.get("p", "m")
+    assert cached is not None and cached.auth_ok is False
+
+
+def test_health_cache_skips_deadline_timeout(tmp_path):
+    cache = ProviderHealthCache(tmp_path / "health.json", clock=_Clock())
+    probe = FakeEchoProbe(latency=0.3, failures={"m": "timed out"})
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        results = run_preflight(
+            {"p": "m"}, echo_probe=probe, health_cache=cache, deadline_seconds=0.2
+        )
+        assert results["p"].status == SeatFailureClass.seat_timeout
+        time.sleep(0.3)  # let the abandoned probe finish and try to cache
+        assert cache.get("p", "m") is None
+
+
+def test_health_cache_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "health.json"
+    path.write_text("{not json")
+    cache = ProviderHealthCache(path)
+    assert cache.get("p", "m") is None
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        run_preflight({"p": "m"}, echo_probe=_ok_probe, health_cache=cache)
+        assert cache.get("p", "m").status == SeatFailureClass.seat_completed
+
+
+def test_skip_echo_does_not_touch_cache(tmp_path):
+    cache = ProviderHealthCache(tmp_path / "health.json")
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        run_preflight({"p": "m"}, skip_echo=True, health_cache=cache)
+    assert not cache.path.exists()
+
+
+def test_concurrent_preflights_share_in_flight_probe():
+    probe = FakeEchoProbe(latency=0.2)
+    outputs: list[dict] = []
+
+    def council() -> None:
+        outputs.append(run_preflight(_MODELS, echo_probe=probe))
+
+    with patch.dict(os.environ, {"ZEN_REVIEWER_KEY": "test-key"}):
+        threads = [threading.Thread(target=council) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert len(outputs) == 4
+    assert sorted(probe.calls) == sorted(_MODELS)
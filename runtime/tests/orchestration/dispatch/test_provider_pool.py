@@ -107,3 +107,175 @@ def test_all_providers(tmp_path):
     providers = {"a": {}, "b": {}, "c": {}}
     pool = _pool(providers, tmp_path)
     assert set(pool.all_providers()) == {"a", "b", "c"}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _warm(pool, provider, latency_ms, n, role=""):
+    for _ in range(n):
+        pool.record_call(provider, latency_ms, success=True, role=role)
+
+
+def test_single_outlier_does_not_flip_routing(tmp_path):
+    pool = _pool({"a": {}, "b": {}}, tmp_path)
+    _warm(pool, "a", 100, 10)
+    _warm(pool, "b", 400, 10)
+    pool.record_call("a", 600, success=True)
+    pool.record_call("b", 10, success=True)
+    assert pool.resolve_provider("auto") == "a"
+
+    _warm(pool, "a", 800, 10)
+    assert pool.resolve_provider("auto") == "b"
+
+
+def test_p95_and_sliding_failure_rate(tmp_path):
+    pool = _pool({"a": {}}, tmp_path)
+    for i in range(100):
+        pool.record_call("a", i + 1, success=True)
+    assert pool._health["a"].latency_p95_ms == 96.0
+
+    for _ in range(4):
+        pool.record_call("a", 10, success=False)
+    assert pool._health["a"].failure_rate == 4 / 20
+    _warm(pool, "a", 10, 20)
+    assert pool._health["a"].failure_rate == 0.0
+
+
+def test_role_latency_drives_role_routing(tmp_path):
+    pool = _pool({"a": {}, "b": {}}, tmp_path)
+    _warm(pool, "a", 100, 5, role="build")
+    _warm(pool, "b", 300, 5, role="build")
+    _warm(pool, "a", 900, 5, role="review")
+    _warm(pool, "b", 200, 5, role="review")
+    assert pool.resolve_provider("auto", role="build") == "a"
+    assert pool.resolve_provider("auto", role="review") == "b"
+
+
+def test_circuit_breaker_open_half_open_closed(tmp_path):
+    clock = _Clock()
+    pool = ProviderPool(repo_root=tmp_path, providers={"a": {}, "b": {}}, clock=clock)
+    _warm(pool, "b", 500, 5)
+    for _ in range(5):
+        pool.record_call("a", 50, success=False)
+    assert pool.snapshot()["a"]["circuit_state"] == "open"
+    assert pool.resolve_provider("auto") == "b"
+
+    clock.now += 31
+    assert pool.snapshot()["a"]["circuit_state"] == "half_open"
+    pool.record_call("a", 50, success=False)
+    assert pool.snapshot()["a"]["circuit_state"] == "open"
+
+    clock.now += 31
+    pool.record_call("a", 50, success=True)
+    snap = pool.snapshot()["a"]
+    assert snap["circuit_state"] == "closed"
+    assert snap["failure_rate"] == 0.0
+    assert pool.resolve_provider("auto") == "a"
+
+
+def test_persist_and_load_round_trip(tmp_path):
+    clock = _Clock()
+    pool = ProviderPool(repo_root=tmp_path, providers={"a": {}, "b": {}}, clock=clock)
+    _warm(pool, "a", 80, 30, role="build")
+    for _ in range(5):
+        pool.record_call("b", 40, success=False)
+    pool.persist()
+
+    restored = ProviderPool(repo_root=tmp_path, providers={"a": {}, "b": {}}, clock=clock)
+    assert restored.load() is True
+    assert restored.snapshot() == pool.snapshot()
+    assert restored.hedge_delay_ms("a", role="build") == 80.0
+    assert restored.resolve_provider("auto") == "a"
+
+
+def test_load_without_state_file(tmp_path):
+    assert _pool({"a": {}}, tmp_path).load() is False
+
+
+def test_hedged_call_sends_duplicate_after_p95_and_cancels_loser(tmp_path):
+    import time
+
+    pool = _pool({"slow": {}, "fast": {}}, tmp_path)
+    _warm(pool, "slow", 10, 30)
+    _warm(pool, "fast", 20, 30)
+    cancelled = []
+
+    def call(provider, cancel):
+        if provider == "slow":
+            cancelled.append(cancel.wait(2.0))
+            return "slow-result"
+        time.sleep(0.01)
+        return "fast-result"
+
+    result = pool.call_hedged(call)
+    assert (result.provider, result.value, result.hedged) == ("fast", "fast-result", True)
+    deadline = time.monotonic() + 2
+    while not cancelled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cancelled == [True]
+
+
+def test_cancelled_loser_never_lowers_latency_estimates(tmp_path):
+    import time
+
+    pool = _pool({"slow": {}, "fast": {}}, tmp_path)
+    _warm(pool, "slow", 10, 30)
+    _warm(pool, "fast", 1000, 30)
+    pool.hedge_delay_ms = lambda provider, role="": 0.0  # hedge at once
+
+    def call(provider, cancel):
+        if provider == "fast":
+            cancel.wait(2.0)  # cancelled after ~50 ms, far below its 1000 ms p95
+        else:
+            time.sleep(0.05)
+        return provider
+
+    result = pool.call_hedged(call)
+    assert (result.provider, result.hedged) == ("slow", True)
+    fast = pool._health["fast"]
+    assert (fast.latency_ms, fast.latency_p95_ms) == (1000.0, 1000.0)
+    assert len(fast.latency.samples) == 30
+
+
+def test_censored_sample_above_p95_raises_estimate():
+    from runtime.orchestration.dispatch.provider_pool import LatencyStats
+
+    stats = LatencyStats()
+    for _ in range(20):
+        stats.observe(100.0)
+    assert stats.observe_censored(50.0) is False
+    assert stats.observe_censored(400.0) is True
+    assert stats.ewma_ms > 100.0
+    assert list(stats.samples)[-1] == 400.0 and len(stats.samples) == 21
+
+
+def test_hedged_call_fails_over_on_error(tmp_path):
+    pool = _pool({"a": {}, "b": {}}, tmp_path)
+
+    def call(provider, cancel):
+        if provider == "a":
+            raise RuntimeError("boom")
+        return provider
+
+    result = pool.call_hedged(call)
+    assert result.provider == "b"
+    assert pool._health["a"].failure_rate == 1.0
+
+
+def test_hedged_call_without_enough_samples_does_not_hedge(tmp_path):
+    pool = _pool({"a": {}, "b": {}}, tmp_path)
+    seen = []
+
+    def call(provider, cancel):
+        seen.append(provider)
+        return provider
+
+    result = pool.call_hedged(call)
+    assert result.hedged is False
+    assert seen == ["a"]
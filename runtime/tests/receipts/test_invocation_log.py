@@ -0,0 +1,196 @@
+"""Tests for the streaming invocation receipt segment log."""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from runtime.receipts.invocation_log import (
+    InvocationReceiptReader,
+    InvocationSegmentWriter,
+    run_receipts_dir,
+)
+from runtime.receipts.invocation_receipt import (
+    InvocationReceiptCollector,
+    finalize_run_receipts,
+    get_or_create_collector,
+    read_run_receipts,
+    reset_invocation_receipt_collectors,
+)
+from runtime.receipts.validator import validate_artefact
+
+_REPO_ROOT = Path(__file__).parents[3]
+
+
+@pytest.fixture(autouse=True)
+def _reset_collectors() -> None:
+    reset_invocation_receipt_collectors()
+    yield
+    reset_invocation_receipt_collectors()
+
+
+def _record(collector: InvocationReceiptCollector, n: int, start: int = 0) -> None:
+    ts = datetime.now(timezone.utc).isoformat()
+    for i in range(start, start + n):
+        collector.record(
+            provider_id="zen",
+            mode="api",
+            seat_id=f"seat_{i}",
+            start_ts=ts,
+            end_ts=ts,
+            exit_status=0,
+            output_content=f"output {i}",
+        )
+
+
+def test_streaming_collector_is_readable_while_live(tmp_path):
+    collector = get_or_create_collector("run_live", output_dir=tmp_path)
+    reader = read_run_receipts(tmp_path, "run_live")
+    _record(collector, 3)
+    collector.flush()
+
+    assert not reader.sealed
+    assert [r["seq"] for r in reader.poll()] == [1, 2, 3]
+    assert reader.poll() == []
+    _record(collector, 2, start=3)
+    collector.flush()
+    assert [r["seat_id"] for r in reader.poll()] == ["seat_3", "seat_4"]
+    assert reader.get(4)["seat_id"] == "seat_3"
+
+    index_path = finalize_run_receipts("run_live", tmp_path)
+    assert reader.sealed
+    assert reader.count() == 5
+    assert reader.verify() == []
+    assert validate_artefact(json.loads(index_path.read_text("utf-8")), "invocation_index") == []
+
+
+def test_buffered_receipts_continue_an_existing_segment(tmp_path):
+    first = InvocationReceiptCollector("run_resume", output_dir=tmp_path)
+    _record(first, 2)
+    first.close()
+
+    second = InvocationReceiptCollector("run_resume")
+    _record(second, 1, start=2)
+    second.finalize(tmp_path)
+
+    receipts = list(read_run_receipts(tmp_path, "run_resume"))
+    assert [(r["seq"], r["seat_id"]) for r in receipts] == [
+        (1, "seat_0"),
+        (2, "seat_1"),
+        (3, "seat_2"),
+    ]
+
+
+def test_writer_cuts_torn_tail_and_rebuilds_offsets(tmp_path):
+    run_dir = run_receipts_dir(tmp_path, "run_torn")
+    writer = InvocationSegmentWriter(run_dir, "run_torn")
+    for seq in range(1, 4):
+        writer.append({"seq": seq})
+    writer.close()
+    with open(run_dir / "receipts.jsonl", "ab") as handle:
+        handle.write(b'{"seq":4,"prov')
+    (run_dir / "receipts.offsets").unlink()
+
+    assert [r["seq"] for r in InvocationReceiptReader(run_dir)] == [1, 2, 3]
+    writer = InvocationSegmentWriter(run_dir, "run_torn")
+    assert writer.count == 3
+    writer.append({"seq": 4})
+    writer.seal()
+
+    reader = InvocationReceiptReader(run_dir)
+    assert [reader.get(seq)["seq"] for seq in range(1, 5)] == [1, 2, 3, 4]
+    assert reader.verify() == []
+
+
+def test_seal_size_is_independent_of_receipt_count(tmp_path):
+    sizes = []
+    for n in (1, 5000):
+        collector = InvocationReceiptCollector(f"run_{n:05d}", output_dir=tmp_path)
+        _record(collector, n)
+        index_path = collector.finalize(tmp_path)
+        sizes.append(index_path.stat().st_size)
+        assert json.loads(index_path.read_text("utf-8"))["receipt_count"] == n
+    assert sizes[1] - sizes[0] <= 12  # only the digits of count and size grow
+
+
+def test_reader_stops_at_sealed_size(tmp_path):
+    collector = InvocationReceiptCollector("run_sealed", output_dir=tmp_path)
+    _record(collector, 2)
+    collector.finalize(tmp_path)
+
+    writer = InvocationSegmentWriter(run_receipts_dir(tmp_path, "run_sealed"), "run_sealed")
+    writer.append({"seq": 3})
+    writer.close()
+    reader = read_run_receipts(tmp_path, "run_sealed")
+    assert [r["seq"] for r in reader] == [1, 2]
+    assert reader.verify() == []
+
+
+def test_sealed_writer_rejects_appends(tmp_path):
+    writer = InvocationSegmentWriter(tmp_path / "run", "run")
+    writer.seal()
+    with pytest.raises(ValueError, match="sealed"):
+        writer.append({"seq": 1})
+
+
+def test_reader_accepts_legacy_v1_index(tmp_path):
+    collector = InvocationReceiptCollector("run_v1")
+    _record(collector, 2)
+    receipts = [r.__dict__ for r in collector.receipts]
+    index = {
+        "schema_version": "invocation_index_v1",
+        "run_id": "run_v1",
+        "receipt_count": 2,
+        "receipts": receipts,
+    }
+    assert validate_artefact(index, "invocation_index_v1") == []
+    run_dir = run_receipts_dir(tmp_path, "run_v1")
+    run_dir.mkdir(parents=True)
+    (run_dir / "index.json").write_text(json.dumps(index), encoding="utf-8")
+
+    reader = InvocationReceiptReader(run_dir)
+    assert list(reader) == receipts
+    assert reader.get(2)["seat_id"] == "seat_1"
+    assert reader.count() == 2
+
+
+def test_flushed_receipts_survive_sigkill(tmp_path):
+    """10k receipts flushed before a SIGKILL are all recovered and sealed."""
+    script = textwrap.dedent(
+        f"""
+        import os, signal, sys
+        sys.path.insert(0, {str(_REPO_ROOT)!r})
+        from runtime.receipts.invocation_receipt import get_or_create_collector
+
+        collector = get_or_create_collector("run_crash", output_dir={str(tmp_path)!r})
+        for i in range(12_000):
+            collector.record(
+                provider_id="zen", mode="api", seat_id=f"seat_{{i}}",
+                start_ts="t", end_ts="t", exit_status=0, output_content=str(i),
+            )
+            if i == 9_999:
+                collector.flush()
+        os.kill(os.getpid(), signal.SIGKILL)
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], timeout=120)
+    assert result.returncode == -signal.SIGKILL
+
+    reader = read_run_receipts(tmp_path, "run_crash")
+    seqs = [r["seq"] for r in reader]
+    assert len(seqs) >= 10_000
+    assert seqs == list(range(1, len(seqs) + 1))
+
+    index_path = finalize_run_receipts("run_crash", tmp_path, include_empty=True)
+    assert json.loads(index_path.read_text("utf-8"))["receipt_count"] == len(seqs)
+    assert reader.verify() == []
+    assert reader.get(10_000)["seat_id"] == "seat_9999"
+    assert os.path.getsize(index_path.parent / "receipts.offsets") == 8 * len(seqs)
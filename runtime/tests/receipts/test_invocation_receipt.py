@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 
 import pytest
 
+from runtime.receipts.invocation_log import InvocationReceiptReader
 from runtime.receipts.invocation_receipt import (
     InvocationReceiptCollector,
     finalize_run_receipts,
@@ -62,12 +63,17 @@ def test_collector_records_and_finalizes(tmp_path):
     assert "run_test_001" in str(index_path)
 
     index = json.loads(index_path.read_text("utf-8"))
-    assert index["schema_version"] == "invocation_index_v1"
+    assert index["schema_version"] == "invocation_index_v2"
     assert index["run_id"] == "run_test_001"
     assert index["receipt_count"] == 2
-    assert len(index["receipts"]) == 2
-    assert (index_path.parent / "0001_zen.json").exists()
-    assert (index_path.parent / "0002_claude_code.json").exists()
+    assert index["segment"] == "receipts.jsonl"
+    receipts = list(InvocationReceiptReader(index_path.parent))
+    assert [r["provider_id"] for r in receipts] == ["zen", "claude_code"]
+    assert sorted(p.name for p in index_path.parent.iterdir()) == [
+        "index.json",
+        "receipts.jsonl",
+        "receipts.offsets",
+    ]
 
 
 def test_receipt_schema_validation():
@@ -178,7 +184,7 @@ def test_run_level_finalize_writes_index_and_receipts(tmp_path):
     index_path = finalize_run_receipts("run_finalize", tmp_path)
     assert index_path is not None
     assert index_path.exists()
-    assert (index_path.parent / "0001_openai-codex.json").exists()
+    assert InvocationReceiptReader(index_path.parent).get(1)["provider_id"] == "openai-codex"
     assert finalize_run_receipts("run_finalize", tmp_path) is None
 
 
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 from runtime.agents.api import AgentCall, call_agent, call_agent_cli
 from runtime.agents.cli_dispatch import CLIDispatchResult, CLIProvider
 from runtime.agents.models import AgentConfig, CLIProviderConfig, ModelConfig
+from runtime.receipts.invocation_log import InvocationReceiptReader
 from runtime.receipts.invocation_receipt import (
     finalize_run_receipts,
     reset_invocation_receipt_collectors,
@@ -60,11 +61,10 @@ def test_call_agent_records_receipt(tmp_path) -> None:
 
     index_path = finalize_run_receipts("run_receipt_api", tmp_path)
     assert index_path is not None
-    assert (index_path.parent / "0001_openai-codex.json").exists()
 
     index = json.loads(index_path.read_text("utf-8"))
     assert index["receipt_count"] == 1
-    receipt = index["receipts"][0]
+    receipt = InvocationReceiptReader(index_path.parent).get(1)
     assert receipt["mode"] == "api"
     assert receipt["provider_id"] == "openai-codex"
     assert receipt["schema_validation"] == "pass"
@@ -122,11 +122,10 @@ def test_call_agent_cli_records_receipt(tmp_path) -> None:
 
     index_path = finalize_run_receipts("run_receipt_cli", tmp_path)
     assert index_path is not None
-    assert (index_path.parent / "0001_codex.json").exists()
 
     index = json.loads(index_path.read_text("utf-8"))
     assert index["receipt_count"] == 1
-    receipt = index["receipts"][0]
+    receipt = InvocationReceiptReader(index_path.parent).get(1)
     assert receipt["mode"] == "cli"
     assert receipt["provider_id"] == "codex"
     assert receipt["schema_validation"] == "pass"
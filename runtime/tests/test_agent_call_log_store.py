@@ -0,0 +1,264 @@
+"""Tests for the persistent agent call log store and batched AgentCallLogger."""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import textwrap
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from runtime.agents.call_log_store import CallLogStore
+from runtime.agents.logging import (
+    CALL_LOG_DIR_ENV,
+    HASH_CHAIN_GENESIS,
+    AgentCallLogger,
+    _record_hash,
+    default_call_logger,
+    get_call_logger,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+CALL = dict(
+    call_id_deterministic="sha256:call",
+    call_id_audit="uuid",
+    model_requested="auto",
+    model_version="v1",
+    input_packet_hash="sha256:in",
+    prompt_hash="sha256:prompt",
+    output_packet_hash="sha256:out",
+    status="success",
+)
+
+
+def _log(logger, n, role="designer", model="m1"):
+    return [
+        logger.log_call(
+            role=role, model_used=model, input_tokens=i, output_tokens=2, latency_ms=10, **CALL
+        )
+        for i in range(n)
+    ]
+
+
+def _store(root, **kwargs):
+    return CallLogStore(root, HASH_CHAIN_GENESIS, _record_hash, **kwargs)
+
+
+def _chained_records(n, seed=7):
+    """n chained records with increasing timestamps over about a year."""
+    rng = random.Random(seed)
+    ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    prev, records = HASH_CHAIN_GENESIS, []
+    for i in range(n):
+        ts += timedelta(seconds=rng.randint(0, 60_000))
+        record = {
+            **CALL,
+            "timestamp": ts.isoformat(),
+            "role": rng.choice(["designer", "builder", "reviewer"]),
+            "model_used": rng.choice(["m1", "m2"]),
+            "input_tokens": rng.randint(0, 5000),
+            "output_tokens": rng.randint(0, 2000),
+            "latency_ms": rng.randint(1, 9000),
+            "prev_log_hash": prev,
+            "run_id": f"run-{i % 5}",
+        }
+        record["entry_hash"] = prev = _record_hash(record)
+        records.append(record)
+    return records
+
+
+def test_chain_continues_across_logger_instances(tmp_path):
+    first = AgentCallLogger(str(tmp_path), persist=True)
+    logged = _log(first, 5)
+    first.close()
+
+    second = AgentCallLogger(str(tmp_path), persist=True)
+    assert second.prev_hash == logged[-1].entry_hash
+    more = _log(second, 5)
+    assert more[0].prev_log_hash == logged[-1].entry_hash
+    assert second.verify_chain() == (True, [])
+    entries = second.entries
+    assert [e.entry_hash for e in entries] == [e.entry_hash for e in logged + more]
+    assert entries[0].prev_log_hash == HASH_CHAIN_GENESIS
+    second.close()
+
+
+def test_concurrent_processes_share_one_chain(tmp_path):
+    code = """
+        import sys
+        from runtime.agents.logging import AgentCallLogger
+        logger = AgentCallLogger(sys.argv[1], persist=True, queue_size=8)
+        for i in range(60):
+            logger.log_call(
+                call_id_deterministic="d", call_id_audit="a", role=sys.argv[2],
+                model_requested="auto", model_used="m", model_version="v",
+                input_packet_hash="i", prompt_hash="p", input_tokens=i, output_tokens=1,
+                latency_ms=1, output_packet_hash="o", status="success",
+            )
+        logger.close()
+    """
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", textwrap.dedent(code), str(tmp_path), f"p{n}"], env=env
+        )
+        for n in range(4)
+    ]
+    assert all(p.wait(timeout=120) == 0 for p in procs)
+
+    store = _store(tmp_path)
+    assert store.verify_chain() == (True, [])
+    assert store.count() == 240
+    assert {row["role"]: row["calls"] for row in store.usage()} == {
+        "p0": 60,
+        "p1": 60,
+        "p2": 60,
+        "p3": 60,
+    }
+
+
+def test_relinked_entries_update_the_logger_tip(tmp_path):
+    a = AgentCallLogger(str(tmp_path), persist=True)
+    b = AgentCallLogger(str(tmp_path), persist=True)
+    _log(a, 3)
+    a.flush()
+    entries = _log(b, 3)  # hashed on the genesis tip, written after a's entries
+    b.flush()
+    assert entries[0].prev_log_hash == a.prev_hash
+    assert b.prev_hash == entries[-1].entry_hash == b.store.tip()
+    assert b.verify_chain() == (True, [])
+    a.close()
+    b.close()
+
+
+def test_torn_tail_and_unindexed_lines_recovered(tmp_path):
+    records = _chained_records(12)
+    store = _store(tmp_path)
+    store.append(records[:8])
+    # Crash after writing a batch but before indexing it, then a torn write
+    with mock.patch.object(CallLogStore, "_index", side_effect=OSError("killed")):
+        with pytest.raises(OSError):
+            store.append(records[8:10])
+    segment = store.segments()[-1]
+    with open(segment, "ab") as f:
+        f.write(json.dumps(records[10]).encode()[:40])
+    store.close()
+
+    reopened = _store(tmp_path)
+    assert reopened.tip() == records[9]["entry_hash"]
+    assert segment.read_bytes().endswith(b"\n")
+    reopened.append(records[10:])
+    assert reopened.count() == 12
+    assert reopened.verify_chain() == (True, [])
+    assert sum(row["calls"] for row in reopened.usage()) == 12
+
+
+def test_range_usage_matches_full_scan(tmp_path):
+    records = _chained_records(3000)
+    store = _store(tmp_path, fsync=False)
+    for start in range(0, len(records), 250):
+        store.append(records[start : start + 250])
+
+    def scan(since, until):
+        totals = {}
+        for r in records:
+            ts = datetime.fromisoformat(r["timestamp"])
+            if (since and ts < since) or (until and ts >= until):
+                continue
+            row = totals.setdefault(
+                (r["role"], r["model_used"]), {"calls": 0, "input_tokens": 0, "output_tokens": 0}
+            )
+            row["calls"] += 1
+            row["input_tokens"] += r["input_tokens"]
+            row["output_tokens"] += r["output_tokens"]
+        return totals
+
+    rng = random.Random(3)
+    first = datetime.fromisoformat(records[0]["timestamp"])
+    last = datetime.fromisoformat(records[-1]["timestamp"])
+    ranges = [(None, None), (first, None), (None, last), (first, last)]
+    for _ in range(20):
+        a, b = sorted(rng.uniform(0, (last - first).total_seconds()) for _ in range(2))
+        ranges.append((first + timedelta(seconds=a), first + timedelta(seconds=b)))
+    for since, until in ranges:
+        got = {
+            (row["role"], row["model"]): {
+                k: row[k] for k in ("calls", "input_tokens", "output_tokens")
+            }
+            for row in store.usage(since, until)
+        }
+        assert got == scan(since, until)
+
+
+def test_segments_roll_and_rebuild_index(tmp_path):
+    records = _chained_records(200)
+    store = _store(tmp_path, segment_max_bytes=8 * 1024, fsync=False)
+    for start in range(0, len(records), 20):
+        store.append(records[start : start + 20])
+    assert len(store.segments()) > 3
+    assert [r["entry_hash"] for r in store.iter_records()] == [r["entry_hash"] for r in records]
+
+    before = store.usage()
+    assert store.rebuild_index() == 200
+    assert store.usage() == before
+    assert store.verify_chain() == (True, [])
+
+
+def test_tampered_record_breaks_chain(tmp_path):
+    logger = AgentCallLogger(str(tmp_path), persist=True)
+    _log(logger, 4)
+    logger.close()
+    segment = logger.store.segments()[0]
+    lines = segment.read_text().splitlines(keepends=True)
+    record = json.loads(lines[1])
+    record["input_tokens"] = 999
+    lines[1] = json.dumps(record) + "\n"
+    segment.write_text("".join(lines))
+
+    is_valid, breaks = logger.verify_chain()
+    assert not is_valid
+    assert any("Entry 1" in b for b in breaks)
+
+
+def test_bounded_queue_flush_and_write_errors(tmp_path, caplog):
+    logger = AgentCallLogger(str(tmp_path), persist=True, queue_size=2)
+    _log(logger, 100)
+    logger.flush()
+    assert logger.store.count() == 100
+
+    with mock.patch.object(logger.store, "append", side_effect=OSError("disk full")):
+        _log(logger, 1)
+        logger._queue.join()
+        # Logged when the write fails, not only when someone flushes
+        assert "disk full" in caplog.text
+        with pytest.raises(OSError, match="disk full"):
+            logger.flush()
+    logger.flush()  # error reported once
+    logger.close()
+
+
+def test_in_memory_logger_writes_nothing(tmp_path):
+    logger = AgentCallLogger(str(tmp_path / "logs"))
+    _log(logger, 2)
+    assert logger.store is None
+    assert list((tmp_path / "logs").iterdir()) == []
+
+
+def test_default_logger_is_shared_and_persistent(tmp_path, monkeypatch):
+    monkeypatch.setenv(CALL_LOG_DIR_ENV, str(tmp_path / "calls"))
+    shared = default_call_logger()
+    assert shared is get_call_logger(str(tmp_path / "calls"))
+    assert shared.store is not None
+    assert shared.store.root == (tmp_path / "calls").resolve()
+
+
+def test_shared_logger_per_directory(tmp_path):
+    shared = get_call_logger(str(tmp_path / "a"))
+    assert get_call_logger(str(tmp_path / "a" / ".." / "a")) is shared
+    assert get_call_logger(str(tmp_path / "b")) is not shared
+    assert shared.store is not None
@@ -0,0 +1,371 @@
+"""Tests for streamed agent calls with early envelope decisions."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from runtime.agents.api import AgentCall, call_agent
+from runtime.agents.models import ModelConfig
+from runtime.agents.opencode_client import (
+    LLMCall,
+    LLMResponse,
+    OpenCodeClient,
+    OpenCodeStreamError,
+)
+from runtime.agents.streaming import EnvelopeDetector, complete_usage, iter_sse_events
+from runtime.orchestration.council.seat_output_parser import (
+    OPTIONAL_FIELDS,
+    REQUIRED_FIELDS,
+    parse_seat_output,
+    seat_envelope_detector,
+)
+from runtime.receipts.invocation_log import InvocationReceiptReader
+from runtime.receipts.invocation_receipt import (
+    finalize_run_receipts,
+    reset_invocation_receipt_collectors,
+)
+
+RECORDINGS = Path(__file__).parent / "fixtures" / "agent_streams"
+CHUNK_DELAY_S = 0.01
+
+OPENROUTER_PATH = "/openrouter/v1/chat/completions"
+ZEN_PATH = "/opencode.ai/zen/v1/messages"
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """Replays a recorded SSE body, one event per HTTP chunk."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        events = server.recording.split(b"\n\n")[:-1]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for event in events:
+                chunk = event + b"\n\n"
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.flush()
+                time.sleep(server.delay)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # client stopped reading
+        self.close_connection = True
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def sse_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ReplayHandler)
+    server.daemon_threads = True
+    server.delay = CHUNK_DELAY_S
+
+    def replay(name: str) -> str:
+        server.recording = (RECORDINGS / name).read_bytes()
+        return f"http://127.0.0.1:{server.server_port}"
+
+    server.replay = replay
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(OpenCodeClient, "_load_api_key_for_role", lambda *a, **k: "test-key")
+    reset_invocation_receipt_collectors()
+    yield
+    reset_invocation_receipt_collectors()
+
+
+def _recorded_text(name: str) -> str:
+    """Concatenated text deltas of a recording (what a full read returns)."""
+    parts = []
+    for _, data in iter_sse_events((RECORDINGS / name).read_bytes().splitlines()):
+        if data == "[DONE]":
+            continue
+        chunk = json.loads(data)
+        for choice in chunk.get("choices") or []:
+            parts.append(choice["delta"].get("content") or "")
+        if chunk.get("type") == "content_block_delta":
+            parts.append(chunk["delta"]["text"])
+    return "".join(parts)
+
+
+def _stream_call_agent(base_url: str, path: str, model: str, run_id: str, **kwargs):
+    logger = Mock()
+    with (
+        patch("runtime.agents.api._load_role_prompt", return_value=("system", "sha256:prompt")),
+        patch("runtime.agents.api._write_replay_cache") as replay_cache,
+        patch("runtime.agents.opencode_client.get_default_endpoint", return_value=base_url + path),
+    ):
+        response = call_agent(
+            AgentCall(role="designer", packet={"task_spec": "x"}, model=model),
+            run_id=run_id,
+            logger_instance=logger,
+            config=ModelConfig(timeout_seconds=10),
+            **kwargs,
+        )
+    return response, logger.log_call.call_args.kwargs, replay_cache
+
+
+class TestSSEParsing:
+    def test_events_data_lines_and_comments(self):
+        lines = [
+            b": keep-alive",
+            b"event: message_start",
+            b'data: {"a":',
+            b"data: 1}",
+            b"",
+            "data:no-space\r\n",
+            "",
+            "id: 7",
+            "",
+            "data: tail",
+        ]
+        assert list(iter_sse_events(lines)) == [
+            ("message_start", '{"a":\n1}'),
+            ("message", "no-space"),
+            ("message", "tail"),
+        ]
+
+
+class TestEnvelopeDetector:
+    def test_partial_value_is_not_judged(self):
+        detector = EnvelopeDetector({"verdict"}, check_field=lambda k, v: None)
+        assert detector.feed("verdict: Acc") is None
+        assert detector.feed("ept\n") is None  # last field: open until the envelope closes
+        decision = detector.finish()
+        assert decision.status == "complete"
+        assert decision.packet == {"verdict": "Accept"}
+
+    def test_fenced_yaml_after_prose_decides_before_trailing_fields(self):
+        text = (
+            "Review follows.\n```yaml\nverdict: Accept\nconfidence: high\n"
+            "notes: |\n  long tail\n```\n"
+        )
+        detector = EnvelopeDetector({"verdict", "confidence"})
+        decision = None
+        for ch in text:
+            decision = detector.feed(ch)
+            if decision:
+                break
+        assert decision.status == "complete"
+        assert decision.packet == {"verdict": "Accept", "confidence": "high"}
+        assert decision.chars_consumed == text.index("notes:") + len("notes: |\n")
+
+    def test_json_member_decisions(self):
+        def check(name, value):
+            return None if isinstance(value, list) else f"{name} must be a list"
+
+        detector = EnvelopeDetector({"a", "b"}, check_field=check)
+        assert detector.feed('{"a": ["x, }", {"y": [1, 2]}], "b"') is None
+        decision = detector.feed(': 3, "c": 1}')
+        assert decision.status == "invalid"
+        assert decision.errors == ["b must be a list"]
+
+    def test_missing_field_is_certain_only_at_close(self):
+        detector = EnvelopeDetector({"verdict", "risks"})
+        assert detector.feed("```yaml\nverdict: Accept\nother: 1\n") is None
+        decision = detector.feed("```\n")
+        assert decision.status == "invalid"
+        assert decision.errors == ["missing required field: 'risks'"]
+
+    def test_optional_field_is_waited_for_until_close(self):
+        detector = EnvelopeDetector({"verdict"}, optional_fields={"budget"})
+        assert detector.feed("verdict: Accept\nnotes: x\n") is None
+        decision = detector.feed("budget: low\nmore: y\n")
+        assert decision.status == "complete"
+        assert decision.packet["budget"] == "low"
+
+        detector = EnvelopeDetector({"verdict"}, optional_fields={"budget"})
+        assert detector.feed("```yaml\nverdict: Accept\nnotes: x\n") is None
+        decision = detector.feed("```\n")
+        assert decision.status == "complete"
+        assert "budget" not in decision.packet
+
+    def test_non_envelope_output(self):
+        assert EnvelopeDetector({"a"}).feed("- a\n- b\n").errors == [
+            "Expected mapping at top level, got list"
+        ]
+        detector = EnvelopeDetector({"a"})
+        detector.feed("I cannot help with that.")
+        assert detector.finish().errors == ["no YAML or JSON envelope found"]
+
+
+class TestCompleteUsage:
+    def test_estimates_only_missing_sides(self):
+        assert complete_usage({"input_tokens": 10}, "p" * 400, "c" * 40) == {
+            "input_tokens": 10,
+            "output_tokens": 10,
+            "total_tokens": 20,
+            "token_source": "mixed",
+        }
+        assert complete_usage({}, "p" * 8, "")["token_source"] == "estimated"
+
+
+class TestClientStreaming:
+    def test_full_stream_matches_recording(self, sse_server):
+        base = sse_server.replay("openrouter_seat.sse")
+        sse_server.delay = 0
+        client = OpenCodeClient(upstream_base_url=base + "/openrouter/v1", log_calls=False)
+        deltas = []
+        response = client.call(
+            LLMCall(prompt="review", model="openrouter/anthropic/claude-sonnet-4"),
+            on_delta=deltas.append,
+        )
+
+        assert response.streamed and not response.aborted
+        assert response.content == "".join(deltas) == _recorded_text("openrouter_seat.sse")
+        assert len(deltas) > 50
+        assert response.model_used == "OR:anthropic/claude-sonnet-4"
+        assert response.usage["input_tokens"] == 812
+
+    def test_non_streaming_route_delivers_one_delta(self):
+        client = OpenCodeClient(log_calls=False)
+        whole = LLMResponse("id", "verdict: Accept\n", "m", 1, "t")
+        deltas = []
+
+        def on_delta(delta: str) -> bool:
+            deltas.append(delta)
+            return True  # a stop request has nothing left to cut short
+
+        with patch.object(OpenCodeClient, "_execute_attempt", return_value=whole):
+            response = client.call(LLMCall(prompt="p", model="m"), on_delta=on_delta)
+        assert deltas == ["verdict: Accept\n"]
+        assert not response.aborted
+
+    def test_broken_stream_after_output_is_not_retried(self, sse_server):
+        base = sse_server.replay("zen_seat.sse")
+        events = sse_server.recording.split(b"\n\n")
+        events[8] = b"event: content_block_delta\ndata: {broken"  # after five text deltas
+        sse_server.recording = b"\n\n".join(events)
+        client = OpenCodeClient(upstream_base_url=base + ZEN_PATH, log_calls=False)
+        with (
+            patch.object(OpenCodeClient, "_execute_attempt", wraps=client._execute_attempt) as spy,
+            patch(
+                "runtime.agents.models.get_agent_config",
+                return_value=Mock(provider="zen", fallback=[{"model": "other"}]),
+            ),
+            pytest.raises(OpenCodeStreamError),
+        ):
+            client.call(LLMCall(prompt="p", model="claude-sonnet-4-5"), on_delta=lambda d: None)
+        assert spy.call_count == 1
+
+
+class TestCallAgentEarlyTermination:
+    def test_seat_envelope_stops_stream_and_records_partial_usage(self, sse_server):
+        base = sse_server.replay("zen_seat.sse")
+        full_text = _recorded_text("zen_seat.sse")
+        detector = seat_envelope_detector()
+        decided_at = []
+
+        def on_delta(_delta: str) -> None:
+            if detector.decision and not decided_at:
+                decided_at.append(time.perf_counter())
+
+        start = time.perf_counter()
+        response, logged, replay_cache = _stream_call_agent(
+            base, ZEN_PATH, "claude-sonnet-4-5", "run_stream", on_delta=on_delta, envelope=detector
+        )
+        decision = detector.decision
+        full_stream_s = sse_server.recording.count(b"\n\n") * CHUNK_DELAY_S
+        time_to_decision = (decided_at[0] if decided_at else time.perf_counter()) - start
+
+        assert decision.status == "complete"
+        assert response.aborted
+        assert set(response.packet) == REQUIRED_FIELDS | OPTIONAL_FIELDS
+        assert full_text.startswith(response.content)
+        assert decision.chars_consumed == len(response.content) < len(full_text) // 2
+        assert time_to_decision < full_stream_s / 2
+
+        # Input tokens as reported by message_start; output estimated from received text
+        assert response.usage["input_tokens"] == 812
+        assert response.usage["output_tokens"] == len(response.content) // 4
+        assert response.usage["token_source"] == "mixed"
+        assert logged["status"] == "aborted"
+        assert logged["output_tokens"] == response.usage["output_tokens"]
+        replay_cache.assert_not_called()
+
+        seat = parse_seat_output(response.packet, seat_name="architect")
+        assert seat.provider_status == "seat_completed"
+        assert seat.verdict == "Accept"
+        assert seat.complexity_budget == "low"
+
+        index = finalize_run_receipts("run_stream", Path.cwd())
+        receipt = next(iter(InvocationReceiptReader(index.parent)))
+        assert receipt["schema_validation"] == "pass"
+        assert receipt["truncation"]["output_truncated"] is True
+        assert receipt["token_usage"]["token_source"] == "mixed"
+
+    def test_schema_violation_stops_stream_early(self, sse_server):
+        base = sse_server.replay("openrouter_seat_invalid.sse")
+        detector = seat_envelope_detector()
+        response, logged, _ = _stream_call_agent(
+            base,
+            OPENROUTER_PATH,
+            "openrouter/anthropic/claude-sonnet-4",
+            "run_invalid",
+            envelope=detector,
+        )
+
+        assert detector.decision.status == "invalid"
+        assert detector.decision.errors[0].startswith("invalid verdict 'Approve'")
+        assert response.aborted and response.packet is None
+        assert len(response.content) < 100
+        # No usage chunk arrives before the stop: both sides estimated
+        assert response.usage["token_source"] == "estimated"
+        assert logged["status"] == "aborted"
+
+    def test_non_streaming_route_with_envelope_is_a_full_call(self):
+        text = _recorded_text("zen_seat.sse")
+        whole = LLMResponse("id", text, "gemini-3-pro", 1, "t", usage={"input_tokens": 5})
+        detector = seat_envelope_detector()
+        with patch.object(OpenCodeClient, "_execute_attempt", return_value=whole):
+            response, logged, replay_cache = _stream_call_agent(
+                "http://unused", ZEN_PATH, "gemini-3-pro", "run_whole", envelope=detector
+            )
+
+        assert detector.decision.status == "complete"
+        assert not response.aborted
+        assert response.content == text
+        assert response.packet["complexity_budget"] == "low"
+        assert "operator_view" in response.packet
+        assert logged["status"] == "success"
+        replay_cache.assert_called_once()
+
+    def test_unstopped_stream_behaves_like_plain_call(self, sse_server):
+        base = sse_server.replay("openrouter_seat.sse")
+        sse_server.delay = 0
+        detector = EnvelopeDetector(REQUIRED_FIELDS | {"operator_view"})
+        response, logged, replay_cache = _stream_call_agent(
+            base,
+            OPENROUTER_PATH,
+            "openrouter/anthropic/claude-sonnet-4",
+            "run_full",
+            envelope=detector,
+        )
+
+        assert not response.aborted
+        assert detector.decision is None
+        assert response.content == _recorded_text("openrouter_seat.sse")
+        assert "operator_view" in response.packet
+        assert response.usage["input_tokens"] == 812
+        assert logged["status"] == "success"
+        replay_cache.assert_called_once()
@@ -0,0 +1,152 @@
+"""Tests for incremental usage rollups over the agent call log."""
+
+import json
+import math
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from runtime.agents.usage_rollups import (
+    SKETCH_RELATIVE_ACCURACY,
+    UsageRollups,
+    sketch_index,
+    sketch_quantile,
+)
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+PRICING = {"m1": {"input_per_mtok": 3.0, "output_per_mtok": 15.0}}
+
+
+def _records(n, start=START, seed=11):
+    rng = random.Random(seed)
+    ts, records = start, []
+    for _ in range(n):
+        ts += timedelta(seconds=rng.randint(0, 3600))
+        records.append(
+            {
+                "timestamp": ts.isoformat(),
+                "role": rng.choice(["designer", "builder"]),
+                "model_used": rng.choice(["m1", "m2"]),
+                "input_tokens": rng.randint(0, 4000),
+                "output_tokens": rng.randint(0, 1000),
+                "latency_ms": rng.randint(0, 60_000),
+            }
+        )
+    return records
+
+
+def _append(log_dir, records, segment=1):
+    path = log_dir / "segments" / f"calls-{segment:08d}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+    return path
+
+
+@pytest.fixture
+def rollups(tmp_path):
+    rollups = UsageRollups(tmp_path, pricing=PRICING)
+    yield rollups
+    rollups.close()
+
+
+def test_ingest_reads_only_appended_lines(tmp_path, rollups):
+    records = _records(400)
+    _append(tmp_path, records[:250])
+    assert rollups.ingest() == 250
+    assert rollups.ingest() == 0
+
+    _append(tmp_path, records[250:300])
+    _append(tmp_path, records[300:], segment=2)
+    assert rollups.ingest() == 150
+    assert sum(row["calls"] for row in rollups.report()) == 400
+    assert rollups.check() == []
+
+
+def test_partial_line_waits_for_its_newline(tmp_path, rollups):
+    records = _records(3)
+    path = _append(tmp_path, records[:2])
+    line = json.dumps(records[2]) + "\n"
+    with open(path, "a") as f:
+        f.write(line[:20])
+    assert rollups.ingest() == 2
+    with open(path, "a") as f:
+        f.write(line[20:])
+    assert rollups.ingest() == 1
+    assert rollups.check() == []
+
+
+def test_replaced_segment_triggers_rebuild(tmp_path, rollups):
+    records = _records(100)
+    path = _append(tmp_path, records)
+    rollups.ingest()
+    path.unlink()
+    _append(tmp_path, records[:40])  # new inode, fewer records
+    assert rollups.ingest() == 40
+    assert sum(row["calls"] for row in rollups.report()) == 40
+
+
+def test_ranges_match_full_rescan(tmp_path, rollups):
+    records = _records(3000)
+    _append(tmp_path, records)
+    rollups.ingest()
+    first = datetime.fromisoformat(records[0]["timestamp"])
+    last = datetime.fromisoformat(records[-1]["timestamp"])
+    rng = random.Random(5)
+    ranges = [(None, None), (first + timedelta(days=3), None), (None, last - timedelta(days=3))]
+    for _ in range(15):
+        a, b = sorted(rng.uniform(0, (last - first).total_seconds()) for _ in range(2))
+        ranges.append((first + timedelta(seconds=a), first + timedelta(seconds=b)))
+    ranges.append((first + timedelta(minutes=10), first + timedelta(minutes=50)))  # one hour
+    for since, until in ranges:
+        assert rollups.check(since, until) == []
+
+
+def test_ranges_widen_to_whole_hours(tmp_path, rollups):
+    hour = START + timedelta(hours=5)
+    records = _records(1)
+    records[0]["timestamp"] = (hour + timedelta(minutes=45)).isoformat()
+    _append(tmp_path, records)
+    rollups.ingest()
+    assert rollups.report(hour + timedelta(minutes=50), hour + timedelta(minutes=55))
+    assert not rollups.report(hour + timedelta(hours=1), hour + timedelta(hours=2))
+
+
+def test_cost_follows_pricing_changes(tmp_path, rollups):
+    records = _records(200)
+    _append(tmp_path, records)
+    rollups.ingest()
+    m1 = [r for r in records if r["model_used"] == "m1"]
+    expected = sum(3.0 * r["input_tokens"] + 15.0 * r["output_tokens"] for r in m1) / 1e6
+    cost = sum(row["cost_usd"] for row in rollups.report() if row["model"] == "m1")
+    assert math.isclose(cost, expected)
+    assert all(row["cost_usd"] == 0 for row in rollups.report() if row["model"] == "m2")
+    rollups.close()
+
+    repriced = UsageRollups(tmp_path, pricing={"m1": {"input_per_mtok": 6.0}})
+    cost = sum(row["cost_usd"] for row in repriced.report() if row["model"] == "m1")
+    assert math.isclose(cost, sum(6.0 * r["input_tokens"] for r in m1) / 1e6)
+    assert repriced.check() == []
+    repriced.close()
+
+
+def test_check_reports_drift_and_rebuild_repairs(tmp_path, rollups):
+    _append(tmp_path, _records(300))
+    rollups.ingest()
+    rollups._db.execute("UPDATE rollups SET calls = calls + 1")
+    assert rollups.check()
+    assert rollups.rebuild() == 300
+    assert rollups.check() == []
+
+
+def test_latency_sketch_quantiles_within_accuracy():
+    rng = random.Random(1)
+    latencies = sorted(int(rng.lognormvariate(7, 1.2)) + 2 for _ in range(20_000))
+    sketch = {}
+    for latency in latencies:
+        index = sketch_index(latency)
+        sketch[index] = sketch.get(index, 0) + 1
+    for q in (0.5, 0.9, 0.95, 0.99):
+        true = latencies[int(q * (len(latencies) - 1))]
+        assert abs(sketch_quantile(sketch, q) - true) <= SKETCH_RELATIVE_ACCURACY * true + 1e-9
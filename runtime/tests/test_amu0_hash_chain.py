@@ -55,8 +55,11 @@ class TestAMU0HashChain(unittest.TestCase):
 
             lineage.append_entry("E1", "2025-01-01T00:00:00Z", "h1", {})
 
-            # Tamper with entry
-            lineage._entries[0].entry_hash = "TAMPERED"
+            # Tamper with entry on disk
+            with open(lineage_path, "r") as f:
+                content = f.read()
+            with open(lineage_path, "w") as f:
+                f.write(content.replace('"artefact_hash":"h1"', '"artefact_hash":"TAMPERED"'))
 
             is_valid, errors = lineage.verify_chain()
             self.assertFalse(is_valid)
@@ -0,0 +1,153 @@
+"""Tests for the append-only AMU0 lineage segment log."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from runtime.amu0 import AMU0Lineage, compute_entry_hash
+from runtime.safety import check_amu0_readability
+
+
+def _fill(lineage, n, start=0):
+    for i in range(start, start + n):
+        lineage.append_entry(f"E{i}", "2025-01-01T00:00:00Z", f"h{i}", {"n": i}, fsync=False)
+
+
+def _replace_in_file(path, old, new):
+    with open(path, "r") as f:
+        content = f.read()
+    assert old in content
+    with open(path, "w") as f:
+        f.write(content.replace(old, new, 1))
+
+
+class TestAMU0LineageLog(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "lineage.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _records(self):
+        with open(self.path, "r") as f:
+            return [json.loads(line) for line in f]
+
+    def test_log_layout_with_checkpoints(self):
+        lineage = AMU0Lineage(self.path, checkpoint_interval=4)
+        _fill(lineage, 10)
+
+        kinds = [r["type"] for r in self._records()]
+        self.assertEqual(kinds[0], "header")
+        self.assertEqual(kinds.count("entry"), 10)
+        checkpoints = [r for r in self._records() if r["type"] == "checkpoint"]
+        self.assertEqual([c["entries"] for c in checkpoints], [4, 8])
+        self.assertEqual(len(lineage), 10)
+
+    def test_reopen_restores_state_and_index(self):
+        lineage = AMU0Lineage(self.path, checkpoint_interval=4)
+        _fill(lineage, 10)
+        last_hash = lineage.get_last_hash()
+
+        reopened = AMU0Lineage(self.path, checkpoint_interval=4)
+        self.assertEqual(reopened.get_last_hash(), last_hash)
+        self.assertEqual(len(reopened), 10)
+        self.assertEqual(reopened.get_entry_by_id("E3").artefact_hash, "h3")
+        self.assertIsNone(reopened.get_entry_by_id("missing"))
+
+        entry = reopened.append_entry("E10", "2025-01-01T00:00:00Z", "h10", {})
+        self.assertEqual(entry.parent_hash, last_hash)
+        self.assertEqual(reopened.verify_chain(full=True), (True, []))
+
+    def test_torn_tail_and_lagging_index_recovered(self):
+        lineage = AMU0Lineage(self.path)
+        _fill(lineage, 5)
+        # Crash mid-append: half a record on the log, index one entry behind
+        with open(self.path, "a") as f:
+            f.write('{"type":"entry","entry_id":"E5"')
+        with open(lineage.index_path, "rb+") as f:
+            lines = f.readlines()
+            f.seek(0)
+            f.truncate()
+            f.writelines(lines[:-1])
+
+        reopened = AMU0Lineage(self.path)
+        self.assertEqual(len(reopened), 5)
+        self.assertEqual(reopened.get_entry_by_id("E4").artefact_hash, "h4")
+        reopened.append_entry("E5", "2025-01-01T00:00:00Z", "h5", {})
+        self.assertEqual(reopened.verify_chain(full=True), (True, []))
+
+    def test_missing_index_rebuilt(self):
+        lineage = AMU0Lineage(self.path)
+        _fill(lineage, 5)
+        os.remove(lineage.index_path)
+
+        reopened = AMU0Lineage(self.path)
+        self.assertEqual(reopened.get_entry_by_id("E2").artefact_hash, "h2")
+        self.assertEqual(reopened.get_last_hash(), lineage.get_last_hash())
+
+    def test_legacy_file_migrates_transparently(self):
+        entries, parent = [], None
+        for i in range(3):
+            data = {
+                "entry_id": f"L{i}",
+                "timestamp": "2024-01-01T00:00:00Z",
+                "artefact_hash": f"a{i}",
+                "attestation": {},
+                "state_delta": {},
+            }
+            entry_hash = compute_entry_hash(data, parent)
+            entries.append({**data, "parent_hash": parent, "entry_hash": entry_hash})
+            parent = entry_hash
+        with open(self.path, "w") as f:
+            json.dump({"version": "1.0", "entries": entries}, f, indent=2)
+
+        lineage = AMU0Lineage(self.path)
+        self.assertEqual([e.entry_id for e in lineage.get_entries()], ["L0", "L1", "L2"])
+        self.assertEqual(lineage.get_last_hash(), parent)
+        self.assertEqual(lineage.verify_chain(), (True, []))
+        self.assertTrue(os.path.exists(f"{self.path}.legacy.json"))
+        self.assertEqual(self._records()[0]["type"], "header")
+
+        status = check_amu0_readability(self.path)
+        self.assertTrue(status.ok)
+        self.assertEqual(status.details["entry_count"], 3)
+
+    def test_incremental_verify_resumes_from_checkpoint(self):
+        lineage = AMU0Lineage(self.path, checkpoint_interval=4)
+        _fill(lineage, 10)
+        self.assertEqual(lineage.verify_chain(), (True, []))
+        with open(lineage.verified_path) as f:
+            self.assertEqual(json.load(f)["entries"], 8)
+
+        # Entries after the accepted checkpoint are always rechecked
+        _replace_in_file(self.path, '"artefact_hash":"h9"', '"artefact_hash":"X9"')
+        valid, errors = lineage.verify_chain()
+        self.assertFalse(valid)
+        self.assertIn("E9", errors[0])
+
+    def test_full_verify_rechecks_verified_prefix(self):
+        lineage = AMU0Lineage(self.path, checkpoint_interval=4)
+        _fill(lineage, 10)
+        lineage.verify_chain()
+
+        _replace_in_file(self.path, '"artefact_hash":"h1"', '"artefact_hash":"X1"')
+        self.assertEqual(lineage.verify_chain(), (True, []))
+        valid, errors = lineage.verify_chain(full=True)
+        self.assertFalse(valid)
+        self.assertTrue(any("E1" in e for e in errors))
+
+    def test_checkpoint_tampering_detected(self):
+        lineage = AMU0Lineage(self.path, checkpoint_interval=4)
+        _fill(lineage, 6)
+        checkpoint = [r for r in self._records() if r["type"] == "checkpoint"][0]
+        _replace_in_file(self.path, checkpoint["running_hash"], "0" * 64)
+
+        valid, errors = lineage.verify_chain()
+        self.assertFalse(valid)
+        self.assertIn("running_hash mismatch", errors[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
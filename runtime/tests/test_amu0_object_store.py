@@ -0,0 +1,131 @@
+"""Tests for the content-addressed store behind AMU₀ baselines."""
+
+import errno
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from runtime.state.amu0 import AMU0Error, AMU0Manager
+from runtime.state.object_store import ObjectStore
+
+OLD_MTIME_NS = 1_700_000_000 * 10**9  # well outside the racy window
+
+
+class TestAMU0ObjectStore(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = AMU0Manager(os.path.join(self.temp_dir, "state"))
+        self.src_dir = os.path.join(self.temp_dir, "src")
+        os.makedirs(self.src_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.src_dir, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        return path
+
+    def _baseline(self, name: str) -> str:
+        return self.manager.create_amu0_baseline(name, [self.src_dir], "2025-01-01T00:00:00Z")
+
+    def test_baselines_share_objects_by_hardlink(self):
+        self._write("a.txt", b"alpha")
+        self._write("b.txt", b"alpha")
+        first = self._baseline("ONE")
+        second = self._baseline("TWO")
+
+        digest = hashlib.sha256(b"alpha").hexdigest()
+        obj = os.stat(self.manager.store.object_path(digest))
+        for baseline in (first, second):
+            for name in ("a.txt", "b.txt"):
+                st = os.stat(os.path.join(baseline, "files", name))
+                self.assertEqual((st.st_dev, st.st_ino), (obj.st_dev, obj.st_ino))
+        self.assertEqual(self.manager.store.stats["stored"], 1)
+
+    def test_unchanged_files_skip_rehash(self):
+        self._write("a.txt", b"alpha")
+        self._write("b.txt", b"beta")
+        self._baseline("ONE")
+        self.assertEqual(self.manager.store.stats["hashed"], 2)
+
+        # A fresh manager picks the stat cache up from disk
+        manager = AMU0Manager(self.manager.state_root)
+        self._write("b.txt", b"BETA")
+        manager.create_amu0_baseline("TWO", [self.src_dir], "2025-01-01T00:00:00Z")
+        self.assertEqual(manager.store.stats["cached"], 1)
+        self.assertEqual(manager.store.stats["hashed"], 1)
+        self.assertTrue(manager.verify_baseline("TWO"))
+
+    def test_recent_files_are_not_stat_cached(self):
+        path = os.path.join(self.src_dir, "fresh.txt")
+        with open(path, "wb") as f:
+            f.write(b"fresh")
+        self._baseline("ONE")
+        self._baseline("TWO")
+        self.assertEqual(self.manager.store.stats["cached"], 0)
+        self.assertEqual(self.manager.store.stats["hashed"], 2)
+
+    def test_corrupted_object_fails_verify_and_restore(self):
+        self._write("a.txt", b"alpha")
+        baseline = self._baseline("ONE")
+        stored = os.path.join(baseline, "files", "a.txt")
+        os.chmod(stored, 0o644)
+        with open(stored, "wb") as f:
+            f.write(b"alphX")
+
+        self.assertFalse(self.manager.verify_baseline("ONE"))
+        restore_dir = os.path.join(self.temp_dir, "restored")
+        with self.assertRaisesRegex(AMU0Error, "File integrity check failed for a.txt"):
+            self.manager.restore_from_amu0("ONE", restore_dir)
+        self.assertFalse(os.path.exists(os.path.join(restore_dir, "a.txt")))
+
+    def test_restore_is_independent_of_store(self):
+        self._write("a.txt", b"alpha")
+        baseline = self._baseline("ONE")
+        restore_dir = os.path.join(self.temp_dir, "restored")
+        self.manager.restore_from_amu0("ONE", restore_dir)
+
+        restored = os.path.join(restore_dir, "a.txt")
+        with open(restored, "ab") as f:
+            f.write(b" edited")
+        self.assertTrue(self.manager.verify_baseline("ONE"))
+        self.assertNotEqual(
+            os.stat(restored).st_ino, os.stat(os.path.join(baseline, "files", "a.txt")).st_ino
+        )
+
+    def test_verify_fail_fast_and_full_report(self):
+        store = ObjectStore(os.path.join(self.temp_dir, "store"), workers=4)
+        items = []
+        for i in range(20):
+            path = self._write(f"f{i}.bin", os.urandom(4096))
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            items.append((path, "0" * 64 if i % 5 == 0 else digest))
+
+        self.assertEqual(len(store.verify(items, fail_fast=False)), 4)
+        self.assertGreaterEqual(len(store.verify(items)), 1)
+        self.assertEqual(store.verify([(items[1][0], items[1][1])]), [])
+        self.assertEqual(store.verify([("/nonexistent", "0" * 64)]), ["/nonexistent"])
+
+    def test_ingest_falls_back_to_copy_without_reflink(self):
+        store = ObjectStore(os.path.join(self.temp_dir, "store"))
+        path = self._write("a.txt", b"alpha")
+        unsupported = OSError(errno.EOPNOTSUPP, "no reflink")
+        with mock.patch("runtime.state.object_store.fcntl.ioctl", side_effect=unsupported):
+            digest, size = store.ingest(path)
+
+        self.assertEqual(digest, hashlib.sha256(b"alpha").hexdigest())
+        self.assertEqual(size, 5)
+        with open(store.object_path(digest), "rb") as f:
+            self.assertEqual(f.read(), b"alpha")
+        self.assertEqual(store.stats["reflinked"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -70,9 +70,9 @@ def test_receipt_input_hash_defaults_to_none():
 
 def test_receipt_serializes_input_hash(tmp_path: Path):
     """input_hash survives finalize → JSON round-trip."""
-    import json
     from datetime import datetime, timezone
 
+    from runtime.receipts.invocation_log import InvocationReceiptReader
     from runtime.receipts.invocation_receipt import InvocationReceiptCollector
 
     collector = InvocationReceiptCollector(run_id="test-4a-serial")
@@ -88,8 +88,8 @@ def test_receipt_serializes_input_hash(tmp_path: Path):
         input_hash="sha256:deadbeef",
     )
     index_path = collector.finalize(tmp_path)
-    index = json.loads(index_path.read_text())
-    assert index["receipts"][0]["input_hash"] == "sha256:deadbeef"
+    receipts = list(InvocationReceiptReader(index_path.parent))
+    assert receipts[0]["input_hash"] == "sha256:deadbeef"
 
 
 # ===========================================================================
@@ -3,6 +3,7 @@ import sqlite3
 import pytest
 
 from project_builder.config.settings import BASE_PENDING_LIMIT
+from project_builder.database.counters import ensure_mission_counters
 from project_builder.database.migrations import apply_schema
 from project_builder.orchestrator.missions import (
     check_and_apply_backpressure,
@@ -23,6 +24,7 @@ def db_conn():
             created_at DATETIME NOT NULL
         )
     """)
+    ensure_mission_counters(conn)
     conn.execute(
         "INSERT INTO missions (id, status, description, max_cost_usd, max_loops, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",  # noqa: E501
         ("m1", "executing", "desc", 10.0, 5, "now", "now"),
@@ -1,11 +1,19 @@
+import os
 import sqlite3
+import subprocess
+import sys
 import threading
 from pathlib import Path
 
 import pytest
 
 from project_builder.database.migrations import apply_schema
-from project_builder.orchestrator.budget_txn import try_charge_budget
+from project_builder.orchestrator.budget_txn import (
+    BudgetEscrow,
+    reserve_budget,
+    settle_lease,
+    try_charge_budget,
+)
 
 
 @pytest.fixture
@@ -100,3 +108,95 @@ def test_budget_concurrent_access(tmp_path: Path):
     assert spent > 0
     assert spent <= 10.0
     assert spent % 1.0 == 0
+
+
+def test_lease_charges_locally_and_settles_remainder(db_conn):
+    lease = reserve_budget(db_conn, "m1", "t1", 4.0, False)
+    assert lease is not None
+    assert lease.try_charge(1.5)
+    assert lease.try_charge(2.5)
+    assert not lease.try_charge(0.5)
+
+    # Reserved budget is committed: a direct charge cannot use it
+    assert not try_charge_budget(db_conn, "m1", "t1", 6.5, False)
+    assert reserve_budget(db_conn, "m1", "t1", 6.5, False) is None
+
+    assert settle_lease(db_conn, lease)
+    assert not settle_lease(db_conn, lease)
+    cur = db_conn.execute("SELECT spent_cost_usd FROM missions WHERE id='m1'")
+    assert cur.fetchone()[0] == 4.0
+    assert try_charge_budget(db_conn, "m1", "t1", 6.0, False)
+
+
+def test_repair_lease_respects_task_repair_budget(db_conn):
+    assert reserve_budget(db_conn, "m1", "t1", 3.0, True) is None
+    lease = reserve_budget(db_conn, "m1", "t1", 1.5, True)
+    assert lease is not None
+    assert not try_charge_budget(db_conn, "m1", "t1", 1.0, True)
+
+    lease.try_charge(0.5)
+    settle_lease(db_conn, lease)
+    cur = db_conn.execute("SELECT repair_budget_spent_usd FROM mission_tasks WHERE id='t1'")
+    assert cur.fetchone()[0] == 0.5
+
+
+def test_escrow_refills_and_shrinks_final_slice(db_conn):
+    with BudgetEscrow(db_conn, "m1", "t1", False, slice_usd=4.0) as escrow:
+        accepted = sum(1 for _ in range(30) if escrow.charge(0.75))
+    # 13 * 0.75 = 9.75 fits, the 14th would exceed 10.0
+    assert accepted == 13
+    cur = db_conn.execute("SELECT spent_cost_usd FROM missions WHERE id='m1'")
+    assert cur.fetchone()[0] == 9.75
+    cur = db_conn.execute("SELECT COUNT(*) FROM budget_leases WHERE status = 'active'")
+    assert cur.fetchone()[0] == 0
+
+
+_ESCROW_WORKER = """
+import sqlite3, sys
+from project_builder.orchestrator.budget_txn import BudgetEscrow
+
+conn = sqlite3.connect(sys.argv[1], timeout=30.0)
+accepted = 0.0
+with BudgetEscrow(conn, "m1", None, False, slice_usd=1.0) as escrow:
+    while escrow.charge(0.125):
+        accepted += 0.125
+print(accepted)
+"""
+
+
+def _escrow_db(tmp_path: Path, max_cost: float) -> str:
+    db_path = str(tmp_path / "escrow.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    apply_schema(conn)
+    conn.execute(
+        "INSERT INTO missions (id, status, description, max_cost_usd, max_loops, created_at, updated_at) VALUES ('m1', 'executing', 'desc', ?, 5, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",  # noqa: E501
+        (max_cost,),
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+def test_escrow_multiprocess_never_exceeds_cap(tmp_path: Path):
+    db_path = _escrow_db(tmp_path, 25.0)
+    repo_root = Path(__file__).resolve().parents[2]
+    env = {**os.environ, "PYTHONPATH": str(repo_root)}
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", _ESCROW_WORKER, db_path],
+            stdout=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        for _ in range(4)
+    ]
+    accepted = [float(p.communicate(timeout=120)[0]) for p in procs]
+    assert all(p.returncode == 0 for p in procs)
+
+    conn = sqlite3.connect(db_path)
+    spent = conn.execute("SELECT spent_cost_usd FROM missions WHERE id='m1'").fetchone()[0]
+    active = conn.execute("SELECT COUNT(*) FROM budget_leases WHERE status='active'").fetchone()[0]
+    conn.close()
+    assert spent == sum(accepted) == 25.0
+    assert active == 0
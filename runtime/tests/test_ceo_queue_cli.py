@@ -6,9 +6,11 @@ Tests the CLI interface:
 - coo queue show <id>
 - coo queue approve <id> [--note]
 - coo queue reject <id> --reason
+- coo queue sweep-timeouts [--hours]
 """
 
 import json
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -18,6 +20,7 @@ from runtime.cli import (
     cmd_queue_list,
     cmd_queue_reject,
     cmd_queue_show,
+    cmd_queue_sweep_timeouts,
 )
 from runtime.orchestration.ceo_queue import (
     CEOQueue,
@@ -339,3 +342,29 @@ class TestCEOQueueCLI:
         assert output[1]["id"] == id3
         # id2 should not be in list
         assert id2 not in [e["id"] for e in output]
+
+    def test_cmd_queue_sweep_timeouts(self, cli_repo: Path, cli_queue: CEOQueue, capsys):
+        """Test the maintenance sweep times out only stale pending escalations."""
+        import argparse
+
+        stale = EscalationEntry(
+            type=EscalationType.GOVERNANCE_SURFACE_TOUCH,
+            context={"summary": "Stale"},
+            run_id="run-stale",
+            created_at=datetime.utcnow() - timedelta(hours=30),
+        )
+        stale_id = cli_queue.add_escalation(stale)
+        fresh_id = cli_queue.add_escalation(
+            EscalationEntry(
+                type=EscalationType.GOVERNANCE_SURFACE_TOUCH,
+                context={"summary": "Fresh"},
+                run_id="run-fresh",
+            )
+        )
+
+        result = cmd_queue_sweep_timeouts(argparse.Namespace(hours=24.0), cli_repo)
+
+        assert result == 0
+        assert json.loads(capsys.readouterr().out) == {"timed_out": [stale_id]}
+        assert cli_queue.get_by_id(stale_id).status == EscalationStatus.TIMEOUT
+        assert cli_queue.get_by_id(fresh_id).status == EscalationStatus.PENDING
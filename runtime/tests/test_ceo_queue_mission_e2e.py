@@ -210,6 +210,13 @@ class TestCEOQueueMissionE2E:
         )
         old_entry.created_at = datetime.utcnow() - timedelta(hours=25)
         escalation_id = queue.add_escalation(old_entry)
+        other_entry = EscalationEntry(
+            type=EscalationType.BUDGET_ESCALATION,
+            context={"reason": "Another run's escalation"},
+            run_id="other-run",
+        )
+        other_entry.created_at = datetime.utcnow() - timedelta(hours=25)
+        other_id = queue.add_escalation(other_entry)
 
         # Step 2: Verify escalation is stale
         entry = queue.get_by_id(escalation_id)
@@ -224,6 +231,8 @@ class TestCEOQueueMissionE2E:
 
         # Step 4: Verify timeout reason recorded
         assert "TIMEOUT_24H" in (checked_entry.resolution_note or "")
+        # Only this mission's escalation is timed out; sweeps are a maintenance task
+        assert queue.get_by_id(other_id).status == EscalationStatus.PENDING
 
     def test_mission_escalation_helpers_integration(
         self, e2e_repo: Path, e2e_context: MissionContext
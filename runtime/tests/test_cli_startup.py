@@ -0,0 +1,235 @@
+"""Startup-cost and warm-mode tests for the lifeos CLI."""
+
+import importlib
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from runtime import cli
+from runtime.cli_warm import forward
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Import-time budget for `import runtime.cli` (cumulative, microseconds).
+# The eager import graph used to cost ~300ms; the lazy registry is ~60ms.
+CLI_IMPORT_BUDGET_US = 250_000
+
+# Modules that must stay out of the CLI's import-time graph
+HEAVY_MODULES = (
+    "runtime.orchestration.ceo_queue",
+    "runtime.orchestration.dispatch.engine",
+    "runtime.orchestration.orchestrator",
+    "runtime.validation.evidence",
+    "runtime.agents.api",
+)
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    """Map module name -> cumulative microseconds from `-X importtime` output."""
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line[len("import time:") :].split("|", 2)
+        if cum.strip().isdigit():
+            cumulative[name.strip()] = int(cum.strip())
+    return cumulative
+
+
+def _importtime(code: str) -> dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _parse_importtime(proc.stderr)
+
+
+class TestImportBudget:
+    def test_cli_import_skips_orchestration_graph(self):
+        imported = _importtime("import runtime.cli")
+        assert "runtime.cli" in imported
+        leaked = [name for name in HEAVY_MODULES if name in imported]
+        assert leaked == []
+
+    def test_cli_import_within_budget(self):
+        # Best of three to absorb cold filesystem caches
+        samples = [_importtime("import runtime.cli")["runtime.cli"] for _ in range(3)]
+        assert min(samples) < CLI_IMPORT_BUDGET_US, samples
+
+    def test_help_does_not_import_handlers(self):
+        code = (
+            "import sys\n"
+            "from runtime.cli import main\n"
+            "try:\n    main(['--help'])\nexcept SystemExit:\n    pass\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported = _parse_importtime(proc.stderr)
+        assert [name for name in HEAVY_MODULES if name in imported] == []
+
+    def test_lazy_attribute_resolves_on_access(self):
+        module = importlib.import_module("runtime.orchestration.dispatch.engine")
+        assert cli.DispatchEngine is module.DispatchEngine
+        with pytest.raises(AttributeError):
+            cli.NotARealAttribute  # noqa: B018
+
+
+class TestSubcommandRegistry:
+    @pytest.mark.parametrize("path", sorted(cli.SUBCOMMANDS))
+    def test_every_handler_resolves(self, path):
+        target, convention = cli.SUBCOMMANDS[path]
+        module_name, func_name = target.split(":")
+        assert callable(getattr(importlib.import_module(module_name), func_name))
+        assert convention in {"config", "args", "repo"}
+
+    def test_nested_path_resolution(self):
+        import argparse
+
+        args = argparse.Namespace(subcommand="coo", coo_cmd="telegram", coo_telegram_cmd="status")
+        assert cli._subcommand_path(args) == ("coo", "telegram", "status")
+
+
+@pytest.fixture
+def warm_server(tmp_path):
+    sock_path = tmp_path / "warm.sock"
+    env = dict(os.environ)
+    env.pop(cli.WARM_SOCKET_ENV, None)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "runtime", "serve", "--socket", str(sock_path)],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if sock_path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(sock_path))
+                break
+            except OSError:
+                pass
+            finally:
+                probe.close()
+        time.sleep(0.05)
+    else:
+        proc.kill()
+        pytest.fail("warm server did not start")
+    yield sock_path
+    proc.terminate()
+    proc.wait(timeout=10)
+
+
+class TestWarmMode:
+    def test_forward_runs_command(self, warm_server, capsys, monkeypatch):
+        monkeypatch.chdir(REPO_ROOT)
+        assert forward(warm_server, ["status"]) == 0
+        out = capsys.readouterr().out
+        assert f"repo_root: {REPO_ROOT}" in out
+
+    def test_forward_propagates_exit_code_and_stderr(self, warm_server, capsys, monkeypatch):
+        monkeypatch.chdir(REPO_ROOT)
+        assert forward(warm_server, ["no-such-command"]) == 2
+        assert "invalid choice" in capsys.readouterr().err
+
+    def test_requests_are_isolated(self, warm_server, capsys, tmp_path, monkeypatch):
+        cfg = tmp_path / "cfg.yaml"
+        cfg.write_text("alpha: 1\n")
+        monkeypatch.chdir(REPO_ROOT)
+
+        assert forward(warm_server, ["--config", str(cfg), "config", "show"]) == 0
+        assert forward(warm_server, ["config", "show"]) == 0
+        first, second = capsys.readouterr().out.splitlines()
+        assert first == '{"alpha":1}'
+        assert second == "{}"
+
+    def test_main_falls_back_without_server(self, tmp_path, capsys, monkeypatch):
+        monkeypatch.setenv(cli.WARM_SOCKET_ENV, str(tmp_path / "absent.sock"))
+        monkeypatch.chdir(REPO_ROOT)
+        assert forward(tmp_path / "absent.sock", ["status"]) is None
+        assert cli.main(["status"]) == 0
+        assert "repo_root:" in capsys.readouterr().out
+
+    def test_long_running_commands_are_not_forwarded(self, tmp_path, monkeypatch):
+        import runtime.cli_warm as cli_warm
+
+        assert cli.WARM_NEVER_FORWARD <= set(cli.SUBCOMMANDS)
+        monkeypatch.setenv(cli.WARM_SOCKET_ENV, str(tmp_path / "warm.sock"))
+        monkeypatch.setattr(cli_warm, "forward", lambda *a, **k: pytest.fail("forwarded"))
+        monkeypatch.setattr(cli, "_resolve_subcommand", lambda args: lambda a, r, c: 7)
+        assert cli.main(["coo", "telegram", "run"]) == 7
+
+    def test_garbled_response_is_an_error_not_a_crash(self, tmp_path, capsys):
+        sock_path = tmp_path / "bad.sock"
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(sock_path))
+        server.listen(1)
+
+        def _respond():
+            conn, _ = server.accept()
+            conn.recv(65536)
+            conn.sendall(b'{"exit_code": 0, "stdo')
+            conn.close()
+
+        thread = threading.Thread(target=_respond)
+        thread.start()
+        try:
+            assert forward(sock_path, ["status"], timeout=10) == 1
+        finally:
+            thread.join()
+            server.close()
+        assert "warm server" in capsys.readouterr().err
+
+    def test_child_is_killed_when_client_disconnects(self, tmp_path):
+        sock_path = tmp_path / "warm.sock"
+        pid_file = tmp_path / "child.pid"
+        script = (
+            "import os, sys, time\n"
+            "import runtime.cli as cli\n"
+            "from runtime.cli_warm import serve\n"
+            "def fake_main(argv):\n"
+            f"    open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+            "    time.sleep(60)\n"
+            "cli.main = fake_main\n"
+            f"serve({str(sock_path)!r}, preload_modules=())\n"
+        )
+        server = subprocess.Popen([sys.executable, "-c", script], cwd=REPO_ROOT)
+        try:
+            deadline = time.monotonic() + 30
+            while not sock_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(str(sock_path))
+            client.sendall(b'{"argv": ["status"], "cwd": "/", "env": {}}\n')
+            while not pid_file.exists() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            child = int(pid_file.read_text())
+            client.close()
+
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                try:
+                    os.kill(child, 0)
+                except ProcessLookupError:
+                    break
+                time.sleep(0.05)
+            else:
+                pytest.fail("warm child outlived its client")
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
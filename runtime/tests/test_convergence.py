@@ -2,7 +2,10 @@
 Tests for council convergence detection.
 """
 
+import random
+
 from runtime.orchestration.council.convergence import (
+    ConvergenceMatrix,
     _extract_tokens,
     _jaccard_similarity,
     compute_convergence,
@@ -174,3 +177,82 @@ class TestComputeConvergence:
         assert "Architecture|Governance" in conv.pairwise
         assert "Architecture|Security" in conv.pairwise
         assert "Governance|Security" in conv.pairwise
+
+
+# ---------------------------------------------------------------------------
+# ConvergenceMatrix
+# ---------------------------------------------------------------------------
+
+
+def _random_outputs(rng: random.Random, seats: int, words: int) -> dict:
+    vocabulary = [f"word{i}" for i in range(300)]
+    return {
+        f"Seat{i:02d}": {
+            "verdict": rng.choice(["Accept", "Reject"]),
+            "claims": [" ".join(rng.choices(vocabulary, k=words)) for _ in range(3)],
+            "_meta": {"ignored": "metadata"},
+        }
+        for i in range(seats)
+    }
+
+
+def _set_based(outputs: dict) -> dict[str, float]:
+    names = sorted(outputs)
+    tokens = {name: _extract_tokens(outputs[name]) for name in names}
+    return {
+        f"{a}|{b}": _jaccard_similarity(tokens[a], tokens[b])
+        for i, a in enumerate(names)
+        for b in names[i + 1 :]
+    }
+
+
+class TestConvergenceMatrix:
+    def test_matches_set_based_jaccard_exactly(self):
+        rng = random.Random(7)
+        outputs = _random_outputs(rng, seats=8, words=40)
+        outputs["Seat03"] = {"verdict": ""}  # empty token set
+        outputs["Seat04"] = {"text": ""}
+        matrix = ConvergenceMatrix()
+        matrix.update(outputs)
+        for key, expected in _set_based(outputs).items():
+            a, b = key.split("|")
+            assert matrix.similarity(a, b) == expected
+
+    def test_only_changed_rows_are_recomputed(self):
+        rng = random.Random(3)
+        outputs = _random_outputs(rng, seats=6, words=30)
+        matrix = ConvergenceMatrix()
+        assert matrix.update(outputs) == set(outputs)
+        assert matrix.update(dict(outputs)) == set()
+
+        outputs["Seat02"] = {"verdict": "Reject", "claims": ["word1 word2 new_finding"]}
+        assert matrix.update(outputs) == {"Seat02"}
+        assert matrix.tokenized == 7
+        assert matrix.result().to_dict() == compute_convergence(outputs).to_dict()
+
+    def test_metadata_only_change_keeps_similarities(self):
+        outputs = {"A": {"text": "alpha beta", "_meta": 1}, "B": {"text": "beta gamma"}}
+        matrix = ConvergenceMatrix()
+        matrix.update(outputs)
+        before = matrix.matrix()
+        outputs["A"] = {"text": "alpha beta", "_meta": 2}
+        matrix.update(outputs)
+        assert matrix.matrix() == before
+
+    def test_waived_and_missing_lenses_are_dropped(self):
+        matrix = ConvergenceMatrix()
+        matrix.update({"A": {"text": "x"}, "B": {"text": "x"}, "C": {"text": "y"}})
+        matrix.update({"A": {"text": "x"}, "B": None})
+        assert matrix.names == ["A"]
+        assert matrix.result().lens_count == 1
+        matrix.update({"A": {"text": "x"}, "C": {"text": "x y"}})
+        assert matrix.similarity("A", "C") == 0.5
+
+    def test_matrix_is_symmetric_with_unit_diagonal(self):
+        matrix = ConvergenceMatrix()
+        matrix.update(_random_outputs(random.Random(1), seats=5, words=20))
+        grid = matrix.matrix()
+        for i, row in enumerate(grid):
+            assert row[i] == 1.0
+            for j, value in enumerate(row):
+                assert value == grid[j][i]
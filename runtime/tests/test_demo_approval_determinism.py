@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 
 from runtime.orchestration.ceo_queue import CEOQueue, EscalationEntry, EscalationType
+from runtime.receipts.invocation_log import InvocationReceiptReader
 from runtime.receipts.invocation_receipt import (
     finalize_run_receipts,
     reset_invocation_receipt_collectors,
@@ -53,8 +53,7 @@ def _run_roundtrip(tmp_path: Path, monkeypatch) -> tuple[dict[str, str], bytes,
 
     queue_row = _normalize_queue_row(db_path, escalation_id)
     index_bytes = index_path.read_bytes()
-    index_payload = json.loads(index_bytes.decode("utf-8"))
-    seat_ids = [receipt["seat_id"] for receipt in index_payload["receipts"]]
+    seat_ids = [receipt["seat_id"] for receipt in InvocationReceiptReader(index_path.parent)]
 
     reset_invocation_receipt_collectors()
     return queue_row, index_bytes, seat_ids
@@ -1,15 +1,21 @@
 """Tests for CND-1: Deterministic Gateway"""
 
+import http.server
 import json
 import os
+import sys
 import tempfile
+import threading
 import unittest
+from unittest import mock
 
 from runtime.gateway import (
+    CallLedger,
     CallSpec,
     DeterministicCallError,
     DeterministicGateway,
     deterministic_call,
+    read_ledger,
 )
 
 
@@ -54,12 +60,206 @@ class TestDeterministicGateway(unittest.TestCase):
             spec = CallSpec(kind="subprocess", target="test", args={})
             gateway.call(spec)
 
-            with open(ledger_path, "r") as f:
-                ledger = json.load(f)
+            gateway.close()
+            ledger = read_ledger(ledger_path)
 
             self.assertEqual(len(ledger), 1)
             self.assertIn("call_hash", ledger[0])
 
 
+def _py(code, **extra):
+    return CallSpec(kind="subprocess", target=sys.executable, args={"argv": ["-c", code], **extra})
+
+
+class TestLiveAndReplay(unittest.TestCase):
+    """Live execution records results; replay serves them without executing."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmpdir = self._tmp.name
+        self.ledger_path = os.path.join(self.tmpdir, "ledger.jsonl")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_live_subprocess_executes(self):
+        with DeterministicGateway(mode="live") as gateway:
+            result = gateway.call(_py("import sys; print(sys.stdin.read().upper())", input="hi"))
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.output["stdout"], "HI\n")
+        self.assertFalse(result.replayed)
+
+    def test_live_failure_is_reported(self):
+        gateway = DeterministicGateway(mode="live")
+        result = gateway.call(_py("raise SystemExit(3)"))
+        self.assertFalse(result.success)
+        self.assertEqual(result.output["returncode"], 3)
+
+        missing = gateway.call(CallSpec(kind="subprocess", target="/nonexistent/tool", args={}))
+        self.assertFalse(missing.success)
+        self.assertIn("failed to start", missing.error)
+
+    def test_unknown_args_rejected_in_live_mode(self):
+        gateway = DeterministicGateway(mode="live")
+        with self.assertRaises(DeterministicCallError):
+            gateway.call(CallSpec(kind="subprocess", target="echo", args={"shell": True}))
+
+    def test_replay_serves_recorded_results_without_executing(self):
+        marker = os.path.join(self.tmpdir, "ran")
+        spec = _py(f"open({marker!r}, 'a').write('x'); print('recorded')")
+
+        with DeterministicGateway(ledger_path=self.ledger_path, mode="live") as gateway:
+            live = gateway.call(spec)
+        os.remove(marker)
+
+        with DeterministicGateway(
+            ledger_path=os.path.join(self.tmpdir, "rerun.jsonl"),
+            mode="replay",
+            replay_path=self.ledger_path,
+        ) as gateway:
+            replayed = gateway.call(spec)
+
+        self.assertFalse(os.path.exists(marker))
+        self.assertTrue(replayed.replayed)
+        self.assertEqual(replayed.output, live.output)
+        self.assertEqual(replayed.call_hash, live.call_hash)
+
+    def test_replay_miss_raises(self):
+        with DeterministicGateway(ledger_path=self.ledger_path, mode="live") as gateway:
+            gateway.call(_py("print(1)"))
+        gateway = DeterministicGateway(ledger_path=self.ledger_path, mode="replay")
+        with self.assertRaises(DeterministicCallError):
+            gateway.call(_py("print(2)"))
+
+    def test_invalid_mode_rejected(self):
+        with self.assertRaises(DeterministicCallError):
+            DeterministicGateway(mode="record")
+        with self.assertRaises(DeterministicCallError):
+            DeterministicGateway(mode="replay")
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = 404 if self.path == "/missing" else 200
+        self._reply(status, json.dumps({"path": self.path}))
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self._reply(200, json.dumps({"echo": json.loads(body)}))
+
+    def _reply(self, status, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpExecutor(unittest.TestCase):
+    """HTTP calls against a local stub server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.HTTPServer(("127.0.0.1", 0), _StubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_get_and_post(self):
+        gateway = DeterministicGateway(mode="live")
+        got = gateway.call(CallSpec(kind="http", target=f"{self.base}/status", args={}))
+        self.assertTrue(got.success)
+        self.assertEqual(json.loads(got.output["body"]), {"path": "/status"})
+
+        posted = gateway.call(
+            CallSpec(kind="http", target=f"{self.base}/echo", args={"json": {"a": 1}})
+        )
+        self.assertEqual(json.loads(posted.output["body"]), {"echo": {"a": 1}})
+
+    def test_error_status_is_recorded_and_replayed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_path = os.path.join(tmpdir, "ledger.jsonl")
+            spec = CallSpec(kind="http", target=f"{self.base}/missing", args={})
+            with DeterministicGateway(ledger_path=ledger_path, mode="live") as gateway:
+                live = gateway.call(spec)
+            self.assertFalse(live.success)
+            self.assertEqual(live.output["status"], 404)
+
+            replayed = DeterministicGateway(ledger_path=ledger_path, mode="replay").call(spec)
+            self.assertEqual(replayed.output, live.output)
+            self.assertEqual(replayed.error, "HTTP 404")
+
+    def test_invalid_url_is_reported(self):
+        gateway = DeterministicGateway(mode="live")
+        for target in ("not a url", "http://127.0.0.1:notaport/"):
+            result = gateway.call(CallSpec(kind="http", target=target, args={}))
+            self.assertFalse(result.success)
+            self.assertIsNone(result.output)
+            self.assertTrue(result.error)
+
+
+class TestCallLedger(unittest.TestCase):
+    """Append-only JSONL ledger with batched fsync and legacy migration."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "ledger.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_appends_are_jsonl(self):
+        ledger = CallLedger(self.path)
+        for i in range(3):
+            ledger.append({"call_number": i})
+        ledger.close()
+
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual([json.loads(line)["call_number"] for line in lines], [0, 1, 2])
+
+    def test_fsync_is_batched(self):
+        ledger = CallLedger(self.path, fsync_every=4)
+        with mock.patch("runtime.gateway.ledger.os.fsync") as fsync:
+            for i in range(10):
+                ledger.append({"call_number": i})
+            self.assertEqual(fsync.call_count, 2)
+            ledger.close()
+            self.assertEqual(fsync.call_count, 3)
+
+    def test_legacy_array_is_read_and_migrated(self):
+        with open(self.path, "w") as f:
+            json.dump([{"call_number": 1}, {"call_number": 2}], f, indent=2)
+
+        self.assertEqual(len(read_ledger(self.path)), 2)
+        ledger = CallLedger(self.path)
+        ledger.append({"call_number": 3})
+        ledger.close()
+
+        with open(self.path) as f:
+            self.assertFalse(f.read().startswith("["))
+        self.assertEqual([e["call_number"] for e in read_ledger(self.path)], [1, 2, 3])
+
+    def test_torn_tail_is_dropped(self):
+        with open(self.path, "w") as f:
+            f.write('{"call_number": 1}\n{"call_num')
+
+        self.assertEqual(read_ledger(self.path), [{"call_number": 1}])
+        ledger = CallLedger(self.path)
+        ledger.append({"call_number": 2})
+        ledger.close()
+        self.assertEqual([e["call_number"] for e in read_ledger(self.path)], [1, 2])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,513 @@
+"""
+Tests for the in-process unified diff applier and DocVerifier overlay checks.
+
+The corpus mimics LLM-authored patches (wrong counts and line numbers,
+whitespace drift, prose around the diff, missing prefixes, ...). Each case is
+checked against a recorded git verdict, and against a live
+`git apply --recount --ignore-space-change` run when git is available.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from runtime.verifiers.doc_verifier import DocVerifier
+from runtime.verifiers.patch_apply import (
+    OverlayFS,
+    PatchApplyError,
+    apply_unified_diff,
+    parse_unified_diff,
+)
+
+BASE_INDEX = (
+    "# Index\n"
+    "\n"
+    "**Last Updated**: 2026-01-01\n"
+    "\n"
+    "## Section\n"
+    "\n"
+    "- [A](a.md)\n"
+    "- [B](b.md)\n"
+    "\tindented line\n"
+    "end  spaced\n"
+    "last\n"
+)
+
+CORPUS = {
+    "clean": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -5,4 +5,5 @@\n"
+        " ## Section\n"
+        " \n"
+        " - [A](a.md)\n"
+        "+- [C](c.md)\n"
+        " - [B](b.md)\n"
+    ),
+    "wrong_counts": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -5,9 +5,2 @@\n"
+        " ## Section\n"
+        " \n"
+        " - [A](a.md)\n"
+        "+- [C](c.md)\n"
+        " - [B](b.md)\n"
+    ),
+    "wrong_line_numbers": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -40,4 +40,5 @@\n"
+        " ## Section\n"
+        " \n"
+        " - [A](a.md)\n"
+        "+- [C](c.md)\n"
+        " - [B](b.md)\n"
+    ),
+    "ws_amount_changed": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -8,4 +8,4 @@\n"
+        " - [B](b.md)\n"
+        "     indented line\n"
+        "-end spaced\n"
+        "+end changed\n"
+        " last\n"
+    ),
+    "trailing_ws_in_context": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -7,3 +7,3 @@\n"
+        " - [A](a.md)  \n"
+        "-- [B](b.md)\n"
+        "+- [B2](b.md)\n"
+        " \tindented line\n"
+    ),
+    "no_prefix": (
+        "--- docs/INDEX.md\n"
+        "+++ docs/INDEX.md\n"
+        "@@ -7,2 +7,2 @@\n"
+        "-- [A](a.md)\n"
+        "+- [A2](a.md)\n"
+        " - [B](b.md)\n"
+    ),
+    "prose_around": (
+        "Here is the change you asked for:\n"
+        "\n"
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+        "\n"
+        "Let me know if you need anything else.\n"
+    ),
+    "fenced": (
+        "```diff\n"
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+        "```\n"
+    ),
+    "traditional_multi_file": (
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -11,2 +11,2 @@\n"
+        " end  spaced\n"
+        "-last\n"
+        "+LAST\n"
+    ),
+    "git_multi_file": (
+        "diff --git a/docs/a.md b/docs/a.md\n"
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+        "diff --git a/docs/INDEX.md b/docs/INDEX.md\n"
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -11,2 +11,2 @@\n"
+        " end  spaced\n"
+        "-last\n"
+        "+LAST\n"
+    ),
+    "new_file": ("--- /dev/null\n+++ b/docs/c.md\n@@ -0,0 +1,2 @@\n+# C\n+text\n"),
+    "new_file_exists": ("--- /dev/null\n+++ b/docs/a.md\n@@ -0,0 +1,1 @@\n+x\n"),
+    "git_new_file": (
+        "diff --git a/docs/c.md b/docs/c.md\n"
+        "new file mode 100644\n"
+        "index 0000000..1111111\n"
+        "--- /dev/null\n"
+        "+++ b/docs/c.md\n"
+        "@@ -0,0 +1 @@\n"
+        "+hello\n"
+    ),
+    "delete_file": ("--- a/docs/a.md\n+++ /dev/null\n@@ -1,3 +0,0 @@\n-alpha\n-beta\n-gamma\n"),
+    "delete_partial": ("--- a/docs/a.md\n+++ /dev/null\n@@ -1,2 +0,0 @@\n-alpha\n-beta\n"),
+    "oldpos_one_but_middle": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " - [A](a.md)\n"
+        "-- [B](b.md)\n"
+        "+- [B3](b.md)\n"
+        " \tindented line\n"
+    ),
+    "no_trailing_context_at_end": (
+        "--- a/docs/a.md\n+++ b/docs/a.md\n@@ -2,2 +2,3 @@\n beta\n gamma\n+delta\n"
+    ),
+    "no_trailing_context_middle": (
+        "--- a/docs/a.md\n+++ b/docs/a.md\n@@ -1,2 +1,3 @@\n alpha\n+inserted\n"
+    ),
+    "no_trailing_context_middle_pos2": (
+        "--- a/docs/a.md\n+++ b/docs/a.md\n@@ -2,1 +2,2 @@\n beta\n+inserted\n"
+    ),
+    "unterminated_last_line": (
+        "--- a/docs/a.md\n+++ b/docs/a.md\n@@ -1,3 +1,3 @@\n alpha\n-beta\n+BETA\n gamma"
+    ),
+    "no_newline_marker": (
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        " beta\n"
+        "-gamma\n"
+        "+gamma\n"
+        "\\ No newline at end of file\n"
+    ),
+    "bogus_header": ("--- a/docs/a.md\n+++ b/docs/a.md\n@@ @@\n alpha\n-beta\n+BETA\n"),
+    "context_mismatch": (
+        "--- a/docs/a.md\n+++ b/docs/a.md\n@@ -1,3 +1,3 @@\n alpha\n-bravo\n+BETA\n gamma\n"
+    ),
+    "blank_context_without_space": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -3,4 +3,4 @@\n"
+        " **Last Updated**: 2026-01-01\n"
+        "\n"
+        "-## Section\n"
+        "+## Renamed\n"
+    ),
+    "two_hunks_shifted": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -1,3 +1,4 @@\n"
+        " # Index\n"
+        "+intro\n"
+        " \n"
+        " **Last Updated**: 2026-01-01\n"
+        "@@ -9,3 +10,3 @@\n"
+        " \tindented line\n"
+        "-end  spaced\n"
+        "+end done\n"
+        " last\n"
+    ),
+    "context_only": ("--- a/docs/a.md\n+++ b/docs/a.md\n@@ -1,2 +1,2 @@\n alpha\n beta\n"),
+    "prose_only_dashes": ("This is --- not a diff +++ really.\n"),
+    "missing_file": ("--- a/docs/zzz.md\n+++ b/docs/zzz.md\n@@ -1,1 +1,1 @@\n-x\n+y\n"),
+    "tabs_vs_spaces_context": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -9,3 +9,3 @@\n"
+        "  indented line\n"
+        "-end  spaced\n"
+        "+end tabbed\n"
+        " last\n"
+    ),
+    "headerless_fragment": ("@@ -1,3 +1,3 @@\n alpha\n-beta\n+BETA\n gamma\n"),
+    "timestamps_in_header": (
+        "--- a/docs/a.md\t2026-01-01 00:00:00.000000000 +0000\n"
+        "+++ b/docs/a.md\t2026-01-02 00:00:00.000000000 +0000\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+    ),
+    "same_file_twice": (
+        "diff --git a/docs/a.md b/docs/a.md\n"
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+        "diff --git a/docs/a.md b/docs/a.md\n"
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-BETA\n"
+        "+B\n"
+        " gamma\n"
+    ),
+    "prose_after_wrong_counts": (
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,5 +1,5 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+        "\n"
+        "Hope this helps!\n"
+    ),
+    "header_without_counts": ("--- a/docs/a.md\n+++ b/docs/a.md\n@@ -2 +2 @@\n-beta\n+BETA\n"),
+    "crlf_patch_lines": (
+        "--- a/docs/a.md\r\n"
+        "+++ b/docs/a.md\r\n"
+        "@@ -1,3 +1,3 @@\r\n"
+        " alpha\r\n"
+        "-beta\r\n"
+        "+BETA\r\n"
+        " gamma\r\n"
+    ),
+    "git_delete": (
+        "diff --git a/docs/a.md b/docs/a.md\n"
+        "deleted file mode 100644\n"
+        "--- a/docs/a.md\n"
+        "+++ /dev/null\n"
+        "@@ -1,3 +0,0 @@\n"
+        "-alpha\n"
+        "-beta\n"
+        "-gamma\n"
+    ),
+    "garbage_between_files": (
+        "diff --git a/docs/a.md b/docs/a.md\n"
+        "--- a/docs/a.md\n"
+        "+++ b/docs/a.md\n"
+        "@@ -1,3 +1,3 @@\n"
+        " alpha\n"
+        "-beta\n"
+        "+BETA\n"
+        " gamma\n"
+        "And now the index:\n"
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -12,1 +12,1 @@\n"
+        "-last\n"
+        "+LAST\n"
+    ),
+    "leading_space_lost": (
+        "--- a/docs/INDEX.md\n"
+        "+++ b/docs/INDEX.md\n"
+        "@@ -9,3 +9,3 @@\n"
+        "indented line\n"
+        "-end  spaced\n"
+        "+end x\n"
+        " last\n"
+    ),
+}
+
+BASE_FILES = {"docs/INDEX.md": BASE_INDEX, "docs/a.md": "alpha\nbeta\ngamma\n"}
+
+# Cases git apply rejects (recorded with git 2.39)
+GIT_REJECTS = {
+    "trailing_ws_in_context",
+    "no_prefix",
+    "traditional_multi_file",
+    "new_file_exists",
+    "delete_partial",
+    "oldpos_one_but_middle",
+    "no_trailing_context_middle",
+    "no_trailing_context_middle_pos2",
+    "unterminated_last_line",
+    "bogus_header",
+    "context_mismatch",
+    "blank_context_without_space",
+    "prose_only_dashes",
+    "missing_file",
+    "headerless_fragment",
+    "prose_after_wrong_counts",
+    "header_without_counts",
+    "leading_space_lost",
+}
+
+
+def _write_tree(root: Path, files: dict) -> None:
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode("utf-8"))
+
+
+def _snapshot(root: Path) -> dict:
+    return {
+        p.relative_to(root).as_posix(): p.read_bytes().decode("utf-8")
+        for p in sorted(root.rglob("*"))
+        if p.is_file() and p.name != "changes.patch"
+    }
+
+
+def _apply_in_process(root: Path, patch: str):
+    overlay = OverlayFS(root)
+    try:
+        apply_unified_diff(patch, overlay)
+    except PatchApplyError:
+        return None
+    result = _snapshot(root)
+    for rel, data in overlay.files.items():
+        if data is None:
+            result.pop(rel, None)
+        else:
+            result[rel] = data.decode("utf-8")
+    return result
+
+
+def _apply_with_git(root: Path, patch: str):
+    (root / "changes.patch").write_bytes(patch.encode("utf-8"))
+    proc = subprocess.run(
+        ["git", "apply", "--recount", "--ignore-space-change", "changes.patch"],
+        cwd=root,
+        capture_output=True,
+    )
+    return None if proc.returncode else _snapshot(root)
+
+
+class TestCorpus:
+    @pytest.mark.parametrize("name", sorted(CORPUS))
+    def test_recorded_git_verdict(self, name, tmp_path):
+        _write_tree(tmp_path, BASE_FILES)
+        result = _apply_in_process(tmp_path, CORPUS[name])
+        assert (result is None) == (name in GIT_REJECTS)
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    @pytest.mark.parametrize("name", sorted(CORPUS))
+    def test_parity_with_git_apply(self, name, tmp_path):
+        ours_root = tmp_path / "ours"
+        git_root = tmp_path / "git"
+        _write_tree(ours_root, BASE_FILES)
+        _write_tree(git_root, BASE_FILES)
+
+        assert _apply_in_process(ours_root, CORPUS[name]) == _apply_with_git(git_root, CORPUS[name])
+
+
+class TestApplier:
+    def test_context_keeps_original_whitespace(self, tmp_path):
+        _write_tree(tmp_path, BASE_FILES)
+        result = _apply_in_process(tmp_path, CORPUS["ws_amount_changed"])
+        assert "\tindented line\n" in result["docs/INDEX.md"]
+        assert "end changed\n" in result["docs/INDEX.md"]
+
+    def test_failure_leaves_overlay_untouched(self, tmp_path):
+        _write_tree(tmp_path, BASE_FILES)
+        patch = CORPUS["git_multi_file"].replace(" end  spaced\n", " no such line\n")
+        overlay = OverlayFS(tmp_path)
+        with pytest.raises(PatchApplyError, match="patch failed: docs/INDEX.md"):
+            apply_unified_diff(patch, overlay)
+        assert overlay.files == {}
+
+    def test_undeclared_paths_are_invisible(self, tmp_path):
+        _write_tree(tmp_path, BASE_FILES)
+        with pytest.raises(PatchApplyError, match="No such file"):
+            apply_unified_diff(CORPUS["clean"], OverlayFS(tmp_path), allowed_paths={"docs/a.md"})
+
+    def test_rejects_path_traversal(self, tmp_path):
+        patch = CORPUS["new_file"].replace("b/docs/c.md", "b/../outside.md")
+        with pytest.raises(PatchApplyError, match="invalid path"):
+            apply_unified_diff(patch, OverlayFS(tmp_path))
+
+    def test_crlf_target_keeps_crlf_context(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.md").write_bytes(b"alpha\r\nbeta\r\ngamma\r\n")
+        overlay = OverlayFS(tmp_path)
+        apply_unified_diff(CORPUS["prose_around"], overlay)
+        assert overlay.files["docs/a.md"] == b"alpha\r\nBETA\ngamma\r\n"
+
+    def test_parse_reports_new_and_deleted_files(self):
+        [created] = parse_unified_diff(CORPUS["git_new_file"])
+        [deleted] = parse_unified_diff(CORPUS["git_delete"])
+        assert (created.path, created.is_new) == ("docs/c.md", True)
+        assert (deleted.path, deleted.is_delete) == ("docs/a.md", True)
+
+
+def _docs_repo(root: Path) -> Path:
+    _write_tree(
+        root,
+        {
+            "docs/INDEX.md": "# Index\n\nLast Updated: 2026-01-01\n\n## Docs\n\n- [A](a.md)\n",
+            "docs/a.md": "alpha\nbeta\ngamma\n",
+        },
+    )
+    return root / "docs"
+
+
+class TestDocVerifierOverlay:
+    def test_verifies_post_change_state_without_subprocess(self, tmp_path, monkeypatch):
+        docs = _docs_repo(tmp_path)
+
+        def _no_subprocess(*args, **kwargs):
+            raise AssertionError("verifier must not shell out")
+
+        monkeypatch.setattr(subprocess, "run", _no_subprocess)
+        files = [{"path": "docs/INDEX.md"}, {"path": "docs/b.md"}]
+        diff = (
+            "diff --git a/docs/INDEX.md b/docs/INDEX.md\n"
+            "--- a/docs/INDEX.md\n"
+            "+++ b/docs/INDEX.md\n"
+            "@@ -6,1 +6,2 @@\n"
+            " - [A](a.md)\n"
+            "+- [B](b.md)\n"
+            "diff --git a/docs/b.md b/docs/b.md\n"
+            "new file mode 100644\n"
+            "--- /dev/null\n"
+            "+++ b/docs/b.md\n"
+            "@@ -0,0 +1 @@\n"
+            "+# B\n"
+        )
+
+        outcome = DocVerifier(docs_dir=docs).verify_with_proposed_changes(files, diff)
+
+        assert outcome.passed, outcome.findings
+        # The new link target exists only in the overlay, so no broken-link warning
+        assert not [f for f in outcome.findings if f.category == "LINK_INTEGRITY"]
+        assert files[0]["after_sha256"] != files[1]["after_sha256"]
+        assert "[B](b.md)" not in (docs / "INDEX.md").read_text()
+        assert not (docs / "b.md").exists()
+
+    def test_overlay_link_check_sees_unmodified_docs(self, tmp_path):
+        docs = _docs_repo(tmp_path)
+        diff = (
+            "--- a/docs/INDEX.md\n"
+            "+++ b/docs/INDEX.md\n"
+            "@@ -6,1 +6,2 @@\n"
+            " - [A](a.md)\n"
+            "+- [Missing](missing.md)\n"
+        )
+
+        outcome = DocVerifier(docs_dir=docs).verify_with_proposed_changes(
+            [{"path": "docs/INDEX.md"}], diff
+        )
+
+        broken = [f.message for f in outcome.findings if f.category == "LINK_INTEGRITY"]
+        assert broken == ["Broken relative link: Missing -> missing.md"]
+
+    def test_failed_patch_is_reported(self, tmp_path):
+        docs = _docs_repo(tmp_path)
+        outcome = DocVerifier(docs_dir=docs).verify_with_proposed_changes(
+            [{"path": "docs/a.md"}], CORPUS["context_mismatch"]
+        )
+        assert not outcome.passed
+        assert any(
+            f.category == "PATCH_APPLICATION" and "patch failed" in f.message
+            for f in outcome.findings
+        )
@@ -7,6 +7,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from runtime.receipts.invocation_log import InvocationReceiptReader
+
 _SCRIPT = Path(__file__).parents[2] / "scripts" / "workflow" / "emit_dispatch_receipt.py"
 # Actual worktree/repo root where `runtime` package lives
 _PYTHON_ROOT = Path(__file__).parents[2]
@@ -51,9 +53,10 @@ def test_emits_receipt_index(tmp_path: Path):
 
     index = json.loads(index_files[0].read_text())
     assert index["receipt_count"] == 1
-    assert index["receipts"][0]["provider_id"] == "codex"
-    assert index["receipts"][0]["mode"] == "cli"
-    assert index["receipts"][0]["exit_status"] == 0
+    receipt = InvocationReceiptReader(index_files[0].parent).get(1)
+    assert receipt["provider_id"] == "codex"
+    assert receipt["mode"] == "cli"
+    assert receipt["exit_status"] == 0
 
 
 # ---------------------------------------------------------------------------
@@ -66,14 +69,13 @@ def test_failure_exit_code_recorded(tmp_path: Path):
     assert result.returncode == 0, result.stderr  # script itself should succeed
 
     index_file = next((tmp_path / "artifacts" / "receipts").rglob("index.json"))
-    index = json.loads(index_file.read_text())
-    receipt = index["receipts"][0]
+    receipt = InvocationReceiptReader(index_file.parent).get(1)
     assert receipt["exit_status"] == 1
     assert receipt["error"] is not None
 
 
 # ---------------------------------------------------------------------------
-# 1C-3: Receipt schema_version is consistent with invocation_index_v1
+# 1C-3: Receipt schema_version is consistent with invocation_index_v2
 # ---------------------------------------------------------------------------
 
 
@@ -81,7 +83,7 @@ def test_receipt_schema_version(tmp_path: Path):
     _run(tmp_path)
     index_file = next((tmp_path / "artifacts" / "receipts").rglob("index.json"))
     index = json.loads(index_file.read_text())
-    assert index["schema_version"] == "invocation_index_v1"
+    assert index["schema_version"] == "invocation_index_v2"
 
 
 # ---------------------------------------------------------------------------
@@ -92,5 +94,4 @@ def test_receipt_schema_version(tmp_path: Path):
 def test_seat_id_encodes_topic(tmp_path: Path):
     _run(tmp_path, topic="my-feature")
     index_file = next((tmp_path / "artifacts" / "receipts").rglob("index.json"))
-    index = json.loads(index_file.read_text())
-    assert "my-feature" in index["receipts"][0]["seat_id"]
+    assert "my-feature" in InvocationReceiptReader(index_file.parent).get(1)["seat_id"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import os
 import subprocess
 import sys
@@ -10,6 +9,8 @@ from pathlib import Path
 
 import yaml
 
+from runtime.receipts.invocation_log import InvocationReceiptReader
+
 _REPO_ROOT = Path(__file__).parents[2]
 _EMIT_SCRIPT = _REPO_ROOT / "scripts" / "workflow" / "emit_sprint_close_packet.py"
 _CODEX_WRAPPER = _REPO_ROOT / "scripts" / "workflow" / "dispatch_codex.sh"
@@ -144,8 +145,8 @@ def test_dispatch_codex_wrapper_emits_packet_and_receipt(tmp_path: Path) -> None
     assert len(closures) == 1
 
     index_file = next((tmp_path / "artifacts" / "receipts").rglob("index.json"))
-    index = json.loads(index_file.read_text(encoding="utf-8"))
-    assert index["receipts"][0]["exit_status"] == 0
+    receipts = list(InvocationReceiptReader(index_file.parent))
+    assert receipts[0]["exit_status"] == 0
 
 
 def test_dispatch_opencode_wrapper_emits_packet(tmp_path: Path) -> None:
@@ -0,0 +1,181 @@
+"""Tests for the flock-based FileLock."""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+from runtime.util.file_lock import FileLock, read_lock_owner
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _python(code: str, *args: str, **kwargs) -> subprocess.Popen:
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    return subprocess.Popen(
+        [sys.executable, "-c", textwrap.dedent(code), *args],
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+        **kwargs,
+    )
+
+
+def test_exclusive_and_shared_modes(tmp_path):
+    path = str(tmp_path / "rw.lock")
+    reader1 = FileLock(path, timeout=0.2, shared=True)
+    reader2 = FileLock(path, timeout=0.2, shared=True)
+    writer = FileLock(path, timeout=0.2)
+
+    assert reader1.acquire() and reader2.acquire()
+    assert writer.acquire() is False
+    reader1.release()
+    reader2.release()
+
+    assert writer.acquire() is True
+    assert FileLock(path, timeout=0.2, shared=True).acquire() is False
+    writer.release()
+
+
+def test_owner_record_written_and_cleared(tmp_path):
+    path = str(tmp_path / "owner.lock")
+    lock = FileLock(path)
+    with lock.acquire_ctx() as acquired:
+        assert acquired is True
+        owner = read_lock_owner(path)
+        assert owner["pid"] == os.getpid()
+        assert owner["host"] == socket.gethostname()
+        assert owner["started_at"] <= time.time()
+    assert read_lock_owner(path) == {}
+
+
+def test_blocked_acquire_wakes_on_release(tmp_path):
+    path = str(tmp_path / "wake.lock")
+    holder = FileLock(path)
+    assert holder.acquire()
+    released_at = []
+
+    def release_later():
+        time.sleep(0.3)
+        released_at.append(time.monotonic())
+        holder.release()
+
+    threading.Thread(target=release_later).start()
+    waiter = FileLock(path, timeout=5)
+    assert waiter.acquire() is True
+    assert time.monotonic() - released_at[0] < 0.05
+    waiter.release()
+
+
+def test_timeout_does_not_leak_lock(tmp_path):
+    path = str(tmp_path / "timeout.lock")
+    holder = FileLock(path)
+    assert holder.acquire()
+    assert FileLock(path, timeout=0.1).acquire() is False
+    holder.release()
+    # The abandoned waiter must not keep the lock once it gets it
+    time.sleep(0.1)
+    assert FileLock(path, timeout=0.5).acquire() is True
+
+
+def test_crashed_holder_releases_lock(tmp_path):
+    path = str(tmp_path / "crash.lock")
+    proc = _python(
+        """
+        import sys, time
+        from runtime.util.file_lock import FileLock
+        FileLock(sys.argv[1]).acquire()
+        print("locked", flush=True)
+        time.sleep(60)
+        """,
+        path,
+    )
+    assert proc.stdout.readline().strip() == "locked"
+    assert FileLock(path, timeout=0.1).acquire() is False
+    proc.send_signal(signal.SIGKILL)
+    proc.wait()
+
+    start = time.monotonic()
+    lock = FileLock(path, timeout=5)
+    assert lock.acquire() is True
+    assert time.monotonic() - start < 0.5
+    assert read_lock_owner(path)["pid"] == os.getpid()
+    lock.release()
+
+
+def test_lock_not_inherited_by_exec_children(tmp_path):
+    path = str(tmp_path / "exec.lock")
+    proc = _python(
+        """
+        import subprocess, sys
+        from runtime.util.file_lock import FileLock
+        FileLock(sys.argv[1]).acquire()
+        child = subprocess.Popen(["sleep", "60"], close_fds=False)
+        print(child.pid, flush=True)
+        """,
+        path,
+    )
+    child = int(proc.stdout.readline())
+    proc.wait()
+    try:
+        # The holder exited; its exec'd child must not keep the lock alive
+        lock = FileLock(path, timeout=1)
+        assert lock.acquire() is True
+        assert read_lock_owner(path)["pid"] == os.getpid()
+        lock.release()
+    finally:
+        os.kill(child, signal.SIGKILL)
+
+
+def test_lock_file_is_never_unlinked(tmp_path):
+    """A waiter must not break a held lock, whatever owner record it reads."""
+    path = str(tmp_path / "held.lock")
+    holder = FileLock(path)
+    assert holder.acquire()
+    # A live holder between flock() and writing its record shows a stale one
+    Path(path).write_text('{"pid": 999999999, "host": "%s"}' % socket.gethostname())
+    inode = os.stat(path).st_ino
+    assert FileLock(path, timeout=0.5).acquire() is False
+    assert os.stat(path).st_ino == inode
+    holder.release()
+
+
+def test_contending_processes_are_mutually_exclusive(tmp_path):
+    workers = 32
+    path = str(tmp_path / "counter.lock")
+    counter = tmp_path / "counter.txt"
+    counter.write_text("0")
+    iterations = 20
+    code = """
+        import sys, time
+        from runtime.util.file_lock import FileLock
+        lock_path, counter_path, n = sys.argv[1], sys.argv[2], int(sys.argv[3])
+        waits = []
+        for _ in range(n):
+            lock = FileLock(lock_path, timeout=60)
+            start = time.perf_counter()
+            assert lock.acquire()
+            waits.append(time.perf_counter() - start)
+            with open(counter_path, "r+") as f:
+                value = int(f.read())
+                f.seek(0)
+                f.write(str(value + 1))
+                f.truncate()
+            lock.release()
+        print(max(waits))
+    """
+    procs = [_python(code, path, str(counter), str(iterations)) for _ in range(workers)]
+    start = time.perf_counter()
+    max_waits = [float(p.communicate()[0]) for p in procs]
+    elapsed = time.perf_counter() - start
+
+    assert all(p.returncode == 0 for p in procs)
+    assert int(counter.read_text()) == workers * iterations
+    # Throughput sanity: 640 handoffs must not take polling-scale time (0.1 s each)
+    assert elapsed < workers * iterations * 0.05
+    assert max(max_waits) < 30
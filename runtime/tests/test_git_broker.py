@@ -0,0 +1,165 @@
+"""Tests for the persistent git plumbing broker."""
+
+import os
+import shutil
+import subprocess
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from runtime.util import git_broker
+from runtime.util.git_broker import GitBroker, GitBrokerError, get_broker
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def _commit(repo: Path, name: str, text: str) -> str:
+    (repo / name).write_text(text)
+    _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", f"add {name}")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+def _settle(repo: Path) -> None:
+    """Backdate git metadata so cache entries are outside the racy window."""
+    past = time.time() - 60
+    for root, _dirs, files in os.walk(repo / ".git"):
+        for name in files:
+            os.utime(os.path.join(root, name), (past, past))
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    _commit(tmp_path, "a.txt", "alpha\n")
+    return tmp_path
+
+
+@pytest.fixture
+def broker(repo: Path):
+    b = GitBroker(repo)
+    yield b
+    b.close()
+
+
+class TestObjectsExist:
+    def test_batch_answers_with_one_process(self, repo, broker):
+        shas = [_commit(repo, f"f{i}.txt", f"{i}\n") for i in range(5)]
+        missing = ["0" * 40, "f" * 40]
+
+        result = broker.objects_exist(shas + missing)
+        again = broker.objects_exist(shas[:2])
+
+        assert all(result[s] for s in shas)
+        assert not any(result[s] for s in missing)
+        assert all(again.values())
+        assert broker.spawn_count == 1
+
+    def test_rejects_names_with_whitespace(self, broker):
+        # A newline would inject a second request into the batch protocol
+        head = broker.head()
+        result = broker.objects_exist([f"{head}\nHEAD", " ", ""])
+        assert result == {f"{head}\nHEAD": False, " ": False, "": False}
+
+    def test_restarts_dead_process(self, repo, broker):
+        head = broker.head()
+        assert broker.objects_exist([head])[head]
+        broker._check._proc.kill()
+        broker._check._proc.wait()
+
+        assert broker.objects_exist([head])[head]
+
+    def test_non_repository_reports_missing(self, tmp_path):
+        plain = tmp_path / "plain"
+        plain.mkdir()
+        b = GitBroker(plain)
+        try:
+            assert b.objects_exist(["a" * 40]) == {"a" * 40: False}
+        finally:
+            b.close()
+
+    def test_read_object_returns_content(self, repo, broker):
+        blob = _git(repo, "rev-parse", "HEAD:a.txt")
+        assert broker.read_object(blob) == ("blob", b"alpha\n")
+        assert broker.read_object("0" * 40) is None
+
+
+class TestCachedQueries:
+    def test_head_is_cached_until_a_commit(self, repo, broker):
+        _settle(repo)
+        first = broker.head()
+        assert broker.head() == first
+        assert broker.cache_hits == 1
+
+        second = _commit(repo, "b.txt", "beta\n")
+        assert broker.head() == second
+
+    def test_racy_entries_are_not_reused(self, repo, broker):
+        broker.head()
+        broker.head()
+        assert broker.cache_hits == 0
+
+    def test_diffstat_tracks_the_index(self, repo, broker):
+        (repo / "a.txt").write_text("alpha\nmore\n")
+        _git(repo, "add", "a.txt")
+        _settle(repo)
+
+        assert broker.diffstat() == [(1, 0, "a.txt")]
+        assert broker.diffstat() == [(1, 0, "a.txt")]
+        assert broker.cache_hits == 1
+
+        (repo / "c.txt").write_text("x\ny\n")
+        _git(repo, "add", "c.txt")
+        assert broker.diffstat() == [(1, 0, "a.txt"), (2, 0, "c.txt")]
+
+    def test_status_is_never_cached(self, repo, broker):
+        _settle(repo)
+        assert broker.status() == []
+        (repo / "untracked.txt").write_text("new\n")
+        assert broker.status() == ["?? untracked.txt"]
+
+    def test_unborn_branch_raises(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        b = GitBroker(tmp_path)
+        with pytest.raises(GitBrokerError, match="git rev-parse failed"):
+            b.head()
+
+
+def test_get_broker_is_shared_per_repo(repo, monkeypatch):
+    monkeypatch.setattr(git_broker, "_brokers", OrderedDict())
+    assert get_broker(repo) is get_broker(str(repo) + "/.")
+    git_broker.close_all_brokers()
+    assert git_broker._brokers == {}
+
+
+def test_shared_brokers_are_bounded_and_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(git_broker, "_brokers", OrderedDict())
+    monkeypatch.setattr(git_broker, "MAX_SHARED_BROKERS", 2)
+    repos = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.mkdir()
+        _git(path, "init", "-q")
+        repos.append(path)
+
+    first = get_broker(repos[0])
+    first.objects_exist(["HEAD"])
+    assert first._check._proc is not None
+    get_broker(repos[1])
+    get_broker(repos[0])  # most recently used again
+    get_broker(repos[2])
+    assert [Path(k).name for k in git_broker._brokers] == ["a", "c"]
+
+    shutil.rmtree(repos[0])
+    get_broker(repos[1])
+    assert [Path(k).name for k in git_broker._brokers] == ["c", "b"]
+    assert first._check._proc is None
+    git_broker.close_all_brokers()
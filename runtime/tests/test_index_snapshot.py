@@ -0,0 +1,194 @@
+"""Tests for incremental INDEX maintenance (directory snapshot, splicing, multi-index)."""
+
+import os
+import random
+import time
+
+import pytest
+
+from runtime.index.index_updater import IndexUpdater
+from runtime.index.indexer import IndexReconciler
+from runtime.index.snapshot import (
+    DirectorySnapshot,
+    IndexSpec,
+    reconcile_indexes,
+    render_index,
+    splice_index,
+)
+from runtime.util.detsort import detsort_paths
+
+
+def _write(root, rel, text="x"):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _age_tree(root, seconds=60):
+    """Backdate every directory so snapshot records are outside the racy window."""
+    past = time.time() - seconds
+    for dirpath, _dirs, _files in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def _legacy_scan(root, index_name="INDEX.md", extensions=(".md",)):
+    files = []
+    for dirpath, dirs, filenames in os.walk(root):
+        dirs.sort()
+        for fname in sorted(filenames):
+            if fname == index_name or not fname.endswith(extensions):
+                continue
+            files.append(os.path.relpath(os.path.join(dirpath, fname), root))
+    return detsort_paths(files)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    rng = random.Random(7)
+    root = tmp_path / "docs"
+    names = ["a", "B", "c-d", "e_f", "z9", "ä"]
+    for i in range(120):
+        depth = rng.randint(0, 3)
+        parts = [rng.choice(names) for _ in range(depth)]
+        ext = rng.choice([".md", ".md", ".txt"])
+        _write(root, "/".join(parts + [f"{rng.choice(names)}{i}{ext}"]))
+    _write(root, "sub/INDEX.md", "nested index, not listed")
+    return root
+
+
+class TestScanParity:
+    def test_scan_matches_detsort_walk(self, tree):
+        updater = IndexUpdater(str(tree / "INDEX.md"), str(tree))
+        reconciler = IndexReconciler(str(tree / "INDEX.md"), str(tree))
+        expected = _legacy_scan(tree)
+        assert updater.scan_directory() == expected
+        assert reconciler.scan_directory() == expected
+        assert updater.scan_directory([".md", ".txt"]) == _legacy_scan(
+            tree, extensions=(".md", ".txt")
+        )
+
+    def test_unchanged_directories_are_not_relisted(self, tree):
+        snapshot = DirectorySnapshot()
+        _age_tree(tree)
+        first = snapshot.scan(tree)
+        listed = snapshot.dirs_listed
+
+        assert snapshot.scan(tree) == first
+        assert snapshot.dirs_listed == listed
+        assert snapshot.dirs_reused == listed
+
+    def test_deep_change_is_seen(self, tree):
+        snapshot = DirectorySnapshot()
+        _age_tree(tree)
+        snapshot.scan(tree)
+        listed = snapshot.dirs_listed
+
+        _write(tree, "new/deeper/leaf.md")
+        (tree / "a").mkdir(exist_ok=True)
+        _write(tree, "a/added.md")
+
+        assert snapshot.scan(tree) == detsort_paths(
+            [os.path.relpath(os.path.join(d, f), tree) for d, _, fs in os.walk(tree) for f in fs]
+        )
+        # only the changed directories (and the two new ones) were listed again
+        assert snapshot.dirs_listed - listed <= 4
+
+    def test_racy_directory_is_relisted(self, tmp_path):
+        snapshot = DirectorySnapshot()
+        _write(tmp_path, "one.md")
+        snapshot.scan(tmp_path)
+        snapshot.scan(tmp_path)
+        assert snapshot.dirs_reused == 0
+
+
+class TestIncrementalUpdate:
+    def test_splice_matches_full_render(self, tree):
+        updater = IndexUpdater(str(tree / "INDEX.md"), str(tree))
+        assert updater.update("Docs") is True
+
+        for rel in ["a/new.md", "zz.md", "0first.md", "c-d/c-d/x.md"]:
+            _write(tree, rel)
+        for path in sorted(tree.rglob("*.md"))[3:9]:
+            if path.name != "INDEX.md":
+                path.unlink()
+
+        assert updater.update("Docs") is True
+        expected = render_index("Docs", _legacy_scan(tree))
+        assert (tree / "INDEX.md").read_text() == expected
+        assert updater.update("Docs") is False
+
+    def test_splice_index_reuses_lines(self):
+        existing = render_index("T", ["a.md", "c.md", "e.md"])
+        content, files = splice_index(
+            existing, ["a.md", "c.md", "e.md"], ["b.md", "f.md"], {"c.md"}
+        )
+        assert files == ["a.md", "b.md", "e.md", "f.md"]
+        assert content == render_index("T", files)
+
+    def test_hand_edited_index_is_regenerated(self, tree):
+        index = tree / "INDEX.md"
+        updater = IndexUpdater(str(index), str(tree))
+        updater.update()
+        index.write_text(index.read_text() + "- [stray.md](./stray.md)\n")
+
+        assert updater.verify_coherence()[2] == ["stray.md"]
+        assert updater.update() is True
+        assert index.read_text() == render_index("Index", _legacy_scan(tree))
+
+    def test_title_change_rewrites(self, tree):
+        updater = IndexUpdater(str(tree / "INDEX.md"), str(tree))
+        updater.update("One")
+        assert updater.update("Two") is True
+        assert (tree / "INDEX.md").read_text().startswith("# Two\n")
+
+    def test_reconciler_verify_detects_orphans(self, tree):
+        index = str(tree / "INDEX.md")
+        reconciler = IndexReconciler(index, str(tree))
+        reconciler.reconcile()
+        victim = sorted(tree.rglob("*.md"))[0]
+        victim.unlink()
+
+        ok, missing, orphaned = reconciler.verify_coherence()
+        assert not ok
+        assert missing == []
+        assert orphaned == [victim.relative_to(tree).as_posix()]
+
+
+class TestPersistenceAndMultiIndex:
+    def test_snapshot_round_trips(self, tree, tmp_path):
+        path = tmp_path / "state" / "snapshot.json"
+        _age_tree(tree)
+        updater = IndexUpdater(str(tree / "INDEX.md"), str(tree), DirectorySnapshot.load(path))
+        updater.update()
+        listed = updater.snapshot.dirs_listed
+
+        reloaded = DirectorySnapshot.load(path)
+        again = IndexUpdater(str(tree / "INDEX.md"), str(tree), reloaded)
+        assert again.update() is False
+        assert reloaded.dirs_listed <= 1  # only the root, whose mtime the INDEX write bumped
+        assert listed > 1
+
+    def test_corrupt_snapshot_starts_empty(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text("{broken")
+        assert DirectorySnapshot.load(path).dirs == {}
+
+    def test_reconcile_indexes_single_walk(self, tree):
+        specs = [
+            IndexSpec(str(tree / "INDEX.md"), str(tree), "All"),
+            IndexSpec(str(tree / "a" / "INDEX.md"), str(tree / "a"), "A"),
+            IndexSpec(str(tree / "B" / "INDEX.md"), str(tree / "B"), "B", (".md", ".txt")),
+        ]
+        (tree / "a").mkdir(exist_ok=True)
+        (tree / "B").mkdir(exist_ok=True)
+        snapshot = DirectorySnapshot()
+        results = reconcile_indexes(specs, snapshot)
+
+        assert set(results.values()) == {True}
+        assert snapshot.dirs_listed == sum(1 for _ in os.walk(tree))
+        for spec in specs:
+            expected = render_index(
+                spec.title, _legacy_scan(spec.root_dir, extensions=spec.extensions)
+            )
+            assert open(spec.index_path, encoding="utf-8").read() == expected
@@ -0,0 +1,195 @@
+import os
+import random
+import sqlite3
+import threading
+
+import pytest
+
+from project_builder.database.counters import (
+    check_mission_counters,
+    ensure_mission_counters,
+    read_mission_counters,
+)
+from project_builder.database.migrations import apply_schema
+from project_builder.orchestrator.missions import check_and_apply_backpressure
+
+_MESSAGES_DDL = """
+    CREATE TABLE IF NOT EXISTS messages (
+        id TEXT PRIMARY KEY,
+        mission_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at DATETIME NOT NULL
+    )
+"""
+
+_TASK_STATUSES = ["pending", "executing", "review", "repair_retry", "approved", "failed_terminal"]
+
+
+def _add_mission(conn, mission_id):
+    conn.execute(
+        "INSERT INTO missions (id, status, description, max_cost_usd, max_loops, created_at, updated_at) VALUES (?, 'executing', 'desc', 10.0, 5, 'now', 'now')",  # noqa: E501
+        (mission_id,),
+    )
+
+
+def _add_task(conn, task_id, mission_id, order, status):
+    conn.execute(
+        "INSERT INTO mission_tasks (id, mission_id, task_order, description, status) VALUES (?, ?, ?, 'desc', ?)",  # noqa: E501
+        (task_id, mission_id, order, status),
+    )
+
+
+@pytest.fixture
+def db_conn():
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    conn.execute(_MESSAGES_DDL)
+    ensure_mission_counters(conn)
+    for mission_id in ("m1", "m2"):
+        _add_mission(conn, mission_id)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def test_triggers_keep_counters_exact(db_conn):
+    rng = random.Random(11)
+    tasks, messages = {}, {}
+    for i in range(400):
+        op = rng.random()
+        if op < 0.35 or not tasks:
+            tid = f"t{i}"
+            mid = rng.choice(["m1", "m2"])
+            _add_task(db_conn, tid, mid, i, rng.choice(_TASK_STATUSES))
+            tasks[tid] = mid
+        elif op < 0.6:
+            mid = f"msg{i}"
+            db_conn.execute(
+                "INSERT INTO messages (id, mission_id, status, created_at) VALUES (?, ?, ?, 'now')",
+                (mid, rng.choice(["m1", "m2"]), rng.choice(["pending", "delivered"])),
+            )
+            messages[mid] = True
+        elif op < 0.8:
+            tid = rng.choice(sorted(tasks))
+            db_conn.execute(
+                "UPDATE mission_tasks SET status = ? WHERE id = ?",
+                (rng.choice(_TASK_STATUSES), tid),
+            )
+        elif op < 0.9 and messages:
+            db_conn.execute(
+                "UPDATE messages SET status = ? WHERE id = ?",
+                (rng.choice(["pending", "delivered"]), rng.choice(sorted(messages))),
+            )
+        else:
+            tid = rng.choice(sorted(tasks))
+            db_conn.execute("DELETE FROM mission_tasks WHERE id = ?", (tid,))
+            del tasks[tid]
+    db_conn.commit()
+
+    assert check_mission_counters(db_conn) == []
+    task_count = db_conn.execute(
+        "SELECT COUNT(*) FROM mission_tasks WHERE mission_id = 'm1'"
+    ).fetchone()[0]
+    assert read_mission_counters(db_conn, "m1")[0] == task_count
+
+
+def test_checker_reports_and_repairs_drift(db_conn):
+    _add_task(db_conn, "t1", "m1", 1, "pending")
+    db_conn.execute("UPDATE mission_counters SET pending_tasks = 7 WHERE mission_id = 'm1'")
+    db_conn.commit()
+
+    drift = check_mission_counters(db_conn, repair=True)
+    assert drift == [{"mission_id": "m1", "pending_tasks": (7, 1)}]
+    assert check_mission_counters(db_conn) == []
+
+
+def test_migration_backfills_existing_database():
+    conn = sqlite3.connect(":memory:")
+    schema_path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "project_builder", "database", "schema.sql"
+    )
+    with open(schema_path) as f:
+        conn.executescript(f.read())
+    conn.execute(_MESSAGES_DDL)
+    _add_mission(conn, "m1")
+    _add_task(conn, "t1", "m1", 1, "pending")
+    _add_task(conn, "t2", "m1", 2, "approved")
+    conn.execute("INSERT INTO messages VALUES ('x', 'm1', 'pending', 'now')")
+    conn.commit()
+
+    assert ensure_mission_counters(conn) is True
+    assert read_mission_counters(conn, "m1") == (2, 1, 1)
+    assert ensure_mission_counters(conn) is False
+    conn.close()
+
+
+def test_messages_table_created_after_schema_gets_triggers():
+    conn = sqlite3.connect(":memory:")
+    apply_schema(conn)
+    _add_mission(conn, "m1")
+    _add_task(conn, "t1", "m1", 1, "executing")
+    conn.execute(_MESSAGES_DDL)
+    assert ensure_mission_counters(conn) is True
+    for i in range(51):
+        conn.execute("INSERT INTO messages VALUES (?, 'm1', 'pending', 'now')", (f"msg{i}",))
+    conn.commit()
+
+    check_and_apply_backpressure(conn, "m1")
+    assert read_mission_counters(conn, "m1") == (1, 0, 51)
+    status = conn.execute("SELECT status FROM missions WHERE id = 'm1'").fetchone()[0]
+    assert status == "paused_error"
+    conn.close()
+
+
+def test_install_does_not_commit_the_callers_transaction(tmp_path):
+    db_path = str(tmp_path / "pb.db")
+    conn = sqlite3.connect(db_path)
+    apply_schema(conn)
+    _add_mission(conn, "m1")
+    conn.execute(_MESSAGES_DDL)  # message triggers are now missing
+    conn.commit()
+
+    _add_task(conn, "t1", "m1", 1, "pending")
+    assert ensure_mission_counters(conn) is True
+    assert conn.in_transaction
+    conn.rollback()
+
+    other = sqlite3.connect(db_path)
+    assert other.execute("SELECT COUNT(*) FROM mission_tasks").fetchone()[0] == 0
+    other.close()
+    assert ensure_mission_counters(conn) is True  # the install was rolled back too
+    assert check_mission_counters(conn) == []
+    conn.close()
+
+
+def test_concurrent_writers_keep_counters_exact(tmp_path):
+    db_path = str(tmp_path / "pb.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    apply_schema(conn)
+    conn.execute(_MESSAGES_DDL)
+    ensure_mission_counters(conn)
+    _add_mission(conn, "m1")
+    conn.commit()
+
+    def writer(n):
+        c = sqlite3.connect(db_path, timeout=30)
+        for i in range(100):
+            _add_task(c, f"w{n}-{i}", "m1", n * 1000 + i, "pending")
+            c.execute("INSERT INTO messages VALUES (?, 'm1', 'pending', 'now')", (f"w{n}-m{i}",))
+            if i % 3 == 0:
+                c.execute(
+                    "UPDATE mission_tasks SET status = 'approved' WHERE id = ?", (f"w{n}-{i}",)
+                )
+            c.commit()
+        c.close()
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert check_mission_counters(conn) == []
+    assert read_mission_counters(conn, "m1") == (400, 264, 400)
+    conn.close()
@@ -0,0 +1,204 @@
+"""
+Tests for PytestExecutor JUnit parsing, sharding and result caching.
+"""
+
+from pathlib import Path
+
+from runtime.orchestration.test_executor import (
+    PytestExecutor,
+    parse_junit_xml,
+    split_by_durations,
+)
+from runtime.orchestration.test_result_cache import ImportGraph, TestResultCache, selection_key
+
+# pytest's rootdir-relative sys.path insertion puts tests/ on the path
+_ROOTS = (".", "tests")
+
+
+def _write_suite(root: Path) -> Path:
+    tests = root / "tests"
+    tests.mkdir()
+    (tests / "helper_mod.py").write_text("VALUE = 1\n")
+    (tests / "test_a.py").write_text(
+        "import helper_mod\n\n"
+        "def test_a1():\n    assert helper_mod.VALUE == 1\n\n"
+        "def test_a2():\n    assert True\n"
+    )
+    (tests / "test_b.py").write_text("class TestB:\n    def test_b1(self):\n        assert True\n")
+    (tests / "test_c.py").write_text("def test_c_fail():\n    assert False, 'boom'\n")
+    return tests
+
+
+class TestJUnitParsing:
+    def test_parse_counts_and_nodeids(self, tmp_path):
+        report = tmp_path / "junit.xml"
+        report.write_text(
+            """<?xml version="1.0"?>
+<testsuites><testsuite>
+  <testcase classname="tests.test_x" name="test_ok" file="tests/test_x.py" time="0.5"/>
+  <testcase classname="tests.test_x.TestK" name="test_bad" file="tests/test_x.py" time="0.1">
+    <failure message="AssertionError: nope">trace</failure>
+  </testcase>
+  <testcase classname="tests.test_x" name="test_skip" file="tests/test_x.py" time="0">
+    <skipped message="skip"/>
+  </testcase>
+</testsuite></testsuites>"""
+        )
+
+        summary = parse_junit_xml(report)
+
+        assert summary is not None
+        assert summary.counts == {"passed": 1, "failed": 1, "skipped": 1, "errors": 0}
+        assert summary.passed_tests == {"tests/test_x.py::test_ok"}
+        assert summary.failed_tests == {"tests/test_x.py::TestK::test_bad"}
+        assert summary.error_messages == ["tests/test_x.py::TestK::test_bad: AssertionError: nope"]
+        assert summary.file_results["tests/test_x.py"]["failed"] is True
+
+    def test_missing_report_returns_none(self, tmp_path):
+        assert parse_junit_xml(tmp_path / "absent.xml") is None
+
+
+class TestSplitByDurations:
+    def test_balances_longest_first(self):
+        files = [Path(f"t{i}.py") for i in range(4)]
+        durations = {"t0.py": 10.0, "t1.py": 6.0, "t2.py": 4.0, "t3.py": 1.0}
+
+        shards = split_by_durations(files, 2, durations)
+
+        loads = sorted(sum(durations[str(f)] for f in shard) for shard in shards)
+        assert loads == [10.0, 11.0]
+
+    def test_never_more_shards_than_files(self):
+        shards = split_by_durations([Path("only.py")], 8, {})
+        assert shards == [[Path("only.py")]]
+
+
+class TestShardedExecution:
+    def test_sharded_run_merges_results(self, tmp_path, monkeypatch):
+        tests = _write_suite(tmp_path)
+        monkeypatch.chdir(tmp_path)
+
+        executor = PytestExecutor(timeout=60, workers=3, use_xdist=False)
+        result = executor.run(str(tests))
+
+        assert result.status == "FAIL"
+        assert result.evidence["shards"] == 3
+        assert result.evidence["result_source"] == "junit"
+        assert result.counts["passed"] == 3
+        assert result.counts["failed"] == 1
+        assert any(t.endswith("test_c.py::test_c_fail") for t in result.failed_tests)
+        assert any(t.endswith("test_b.py::TestB::test_b1") for t in result.passed_tests)
+
+    def test_failure_details_survive_truncation(self, tmp_path, monkeypatch):
+        (tmp_path / "test_noisy.py").write_text(
+            "def test_noisy():\n    print('X' * 200_000)\n    assert False, 'DETAIL_MARKER'\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        result = PytestExecutor(timeout=60).run("test_noisy.py")
+
+        assert result.evidence["truncated"] is True
+        assert any("DETAIL_MARKER" in msg for msg in result.error_messages)
+
+
+class TestResultCaching:
+    def test_unchanged_passing_files_are_skipped(self, tmp_path, monkeypatch):
+        tests = _write_suite(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        cache_path = tmp_path / "cache.json"
+
+        cold = PytestExecutor(
+            timeout=60,
+            workers=2,
+            cache=TestResultCache(tmp_path, cache_path, _ROOTS),
+            use_xdist=False,
+        ).run(str(tests))
+        assert cold.counts["cached"] == 0
+
+        warm = PytestExecutor(
+            timeout=60,
+            workers=2,
+            cache=TestResultCache(tmp_path, cache_path, _ROOTS),
+            allow_cached=True,
+            use_xdist=False,
+        ).run(str(tests))
+
+        # test_a and test_b passed last time; test_c failed and must rerun
+        assert warm.counts["cached"] == 3
+        assert warm.counts["failed"] == 1
+        assert sorted(warm.evidence["cached_files"]) == ["tests/test_a.py", "tests/test_b.py"]
+        assert warm.passed_tests == cold.passed_tests
+
+    def test_cache_not_used_unless_allowed(self, tmp_path, monkeypatch):
+        tests = _write_suite(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        cache_path = tmp_path / "cache.json"
+
+        PytestExecutor(timeout=60, cache=TestResultCache(tmp_path, cache_path, _ROOTS)).run(
+            str(tests)
+        )
+        rerun = PytestExecutor(timeout=60, cache=TestResultCache(tmp_path, cache_path, _ROOTS)).run(
+            str(tests)
+        )
+
+        assert rerun.counts["cached"] == 0
+        assert rerun.counts["passed"] == 3
+
+    def test_filtered_run_does_not_serve_unfiltered_run(self, tmp_path, monkeypatch):
+        tests = _write_suite(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        cache_path = tmp_path / "cache.json"
+
+        def executor():
+            return PytestExecutor(
+                timeout=60,
+                cache=TestResultCache(tmp_path, cache_path, _ROOTS),
+                allow_cached=True,
+            )
+
+        filtered = executor().run(str(tests), extra_args=["-k", "test_a1"])
+        assert filtered.counts["passed"] == 1
+
+        full = executor().run(str(tests))
+        assert full.counts["cached"] == 0
+        assert full.counts["passed"] == 3
+
+        again = executor().run(str(tests), extra_args=["-k", "test_a1"])
+        assert again.counts["cached"] == 0  # full run recorded under another selection
+
+    def test_selection_key(self):
+        assert selection_key([]) == ""
+        assert selection_key(["-q", "--tb=short", "-x"]) == ""
+        assert selection_key(["-k", "a"]) == selection_key(["-k=a"]) == selection_key(["-ka"])
+        assert selection_key(["-m", "slow"]) != selection_key(["-m", "fast"])
+        assert selection_key(["--deselect", "tests/test_a.py::test_a2"]) != ""
+        assert selection_key(["--lf"]) != ""
+
+    def test_import_change_invalidates_entry(self, tmp_path):
+        tests = _write_suite(tmp_path)
+        cache = TestResultCache(tmp_path, tmp_path / "cache.json", _ROOTS)
+        cache.record(tests / "test_a.py", passed=True, tests=["a"], duration=0.1)
+        cache.record(tests / "test_b.py", passed=True, tests=["b"], duration=0.1)
+        cache.save()
+
+        (tests / "helper_mod.py").write_text("VALUE = 2\n")
+        reloaded = TestResultCache(tmp_path, tmp_path / "cache.json", _ROOTS)
+
+        assert reloaded.lookup(tests / "test_a.py") is None
+        assert reloaded.lookup(tests / "test_b.py") == ["b"]
+
+
+class TestImportGraph:
+    def test_closure_follows_packages_and_relative_imports(self, tmp_path):
+        pkg = tmp_path / "pkg"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "a.py").write_text("from . import b\n")
+        (pkg / "b.py").write_text("import os\n")
+        test_file = tmp_path / "test_x.py"
+        test_file.write_text("from pkg.a import thing\n")
+
+        closure = ImportGraph(tmp_path, (".",)).closure(test_file)
+
+        names = {p.relative_to(tmp_path.resolve()).as_posix() for p in closure}
+        assert names == {"test_x.py", "pkg/__init__.py", "pkg/a.py", "pkg/b.py"}
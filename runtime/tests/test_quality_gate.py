@@ -367,3 +367,128 @@ def test_quality_gate_main_check_json(monkeypatch, capsys) -> None:
     out = capsys.readouterr().out
     assert rc == 0
     assert json.loads(out)["passed"] is True
+
+
+def _cache_manifest() -> dict:
+    return {
+        "repo": {"python_targets": ["pkg"]},
+        "tools": {
+            "ruff_check": {
+                "enabled": True,
+                "mode": "blocking",
+                "scopes": ["changed"],
+                "autofix_allowed": True,
+                "failure_class": "ruff_error",
+            },
+            "mypy": {
+                "enabled": True,
+                "mode": "advisory",
+                "scopes": ["changed"],
+                "autofix_allowed": False,
+                "failure_class": "mypy_error",
+            },
+        },
+    }
+
+
+def _install_cache_fakes(monkeypatch, tmp_path: Path, failing: set[str] | None = None):
+    from runtime.tools import quality_cache
+
+    quality_cache.clear_tool_version_cache()
+    commands: list[list[str]] = []
+
+    def fake_run(*args, **kwargs):
+        cmd = args[0]
+        if cmd[-1] == "--version":
+            return subprocess.CompletedProcess(
+                args=cmd, returncode=0, stdout="ruff 0.6.0", stderr=""
+            )
+        commands.append(cmd)
+        bad = [part for part in cmd if part in (failing or set())]
+        return subprocess.CompletedProcess(
+            args=cmd, returncode=1 if bad else 0, stdout="", stderr=" ".join(bad)
+        )
+
+    monkeypatch.setattr(
+        "runtime.tools.workflow_pack.load_quality_manifest", lambda repo_root: _cache_manifest()
+    )
+    monkeypatch.setattr("runtime.tools.workflow_pack._git_tracked_files", lambda repo_root: [])
+    monkeypatch.setattr("runtime.tools.workflow_pack.subprocess.run", fake_run)
+    monkeypatch.setattr("runtime.tools.quality_cache.subprocess.run", fake_run)
+    (tmp_path / "pkg").mkdir()
+    for name in ("a.py", "b.py", "c.py"):
+        (tmp_path / "pkg" / name).write_text(f"# {name}\n")
+    return commands
+
+
+def test_run_quality_gates_cache_skips_unchanged_files(monkeypatch, tmp_path: Path) -> None:
+    commands = _install_cache_fakes(monkeypatch, tmp_path)
+    files = ["pkg/a.py", "pkg/b.py", "pkg/c.py"]
+
+    cold = run_quality_gates(tmp_path, files, scope="changed", use_cache=True)
+    assert cold["cache_hits"] == 0
+    assert ["ruff", "check", *files] in commands
+
+    (tmp_path / "pkg" / "b.py").write_text("# edited\n")
+    commands.clear()
+    warm = run_quality_gates(tmp_path, files, scope="changed", use_cache=True)
+
+    ruff_row = next(row for row in warm["results"] if row["tool"] == "ruff_check")
+    assert ruff_row["passed"] is True
+    assert ruff_row["files"] == files
+    assert ruff_row["cached_files"] == ["pkg/a.py", "pkg/c.py"]
+    assert ["ruff", "check", "pkg/b.py"] in commands
+    # mypy verdicts depend on the import graph, so they are never cached
+    assert ["mypy", *files] in commands
+
+
+def test_run_quality_gates_cache_does_not_store_failures(monkeypatch, tmp_path: Path) -> None:
+    commands = _install_cache_fakes(monkeypatch, tmp_path, failing={"pkg/c.py"})
+    files = ["pkg/a.py", "pkg/c.py"]
+
+    first = run_quality_gates(tmp_path, files, scope="changed", use_cache=True)
+    assert first["passed"] is False
+
+    commands.clear()
+    second = run_quality_gates(tmp_path, files, scope="changed", use_cache=True)
+    assert second["passed"] is False
+    assert second["cache_hits"] == 0
+    assert ["ruff", "check", *files] in commands
+
+
+def test_run_quality_gates_cache_invalidated_by_config_change(monkeypatch, tmp_path: Path) -> None:
+    commands = _install_cache_fakes(monkeypatch, tmp_path)
+    files = ["pkg/a.py"]
+
+    run_quality_gates(tmp_path, files, scope="changed", use_cache=True)
+    (tmp_path / "pyproject.toml").write_text("[tool.ruff]\nline-length = 80\n")
+    commands.clear()
+    rerun = run_quality_gates(tmp_path, files, scope="changed", use_cache=True)
+
+    assert rerun["cache_hits"] == 0
+    assert ["ruff", "check", "pkg/a.py"] in commands
+
+
+def test_run_quality_gates_cache_keys_verdicts_by_path(monkeypatch, tmp_path: Path) -> None:
+    commands = _install_cache_fakes(monkeypatch, tmp_path)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "a.py").write_text("# a.py\n")  # same content as pkg/a.py
+
+    run_quality_gates(tmp_path, ["pkg/a.py"], scope="changed", use_cache=True)
+    commands.clear()
+    moved = run_quality_gates(tmp_path, ["tests/a.py"], scope="changed", use_cache=True)
+
+    # Path-dependent settings (per-file-ignores, isort sections) may judge it differently
+    assert moved["cache_hits"] == 0
+    assert ["ruff", "check", "tests/a.py"] in commands
+
+
+def test_run_quality_gates_parallel_results_keep_manifest_order(
+    monkeypatch, tmp_path: Path
+) -> None:
+    _install_cache_fakes(monkeypatch, tmp_path)
+
+    result = run_quality_gates(tmp_path, ["pkg/a.py"], scope="changed", max_workers=4)
+
+    assert [row["tool"] for row in result["results"]] == ["ruff_check", "mypy"]
+    assert "cache_hits" not in result
@@ -5,7 +5,13 @@ import pytest
 
 from project_builder.config.settings import TASK_LOCK_TIMEOUT_SECONDS
 from project_builder.database.migrations import apply_schema
-from project_builder.orchestrator.reclaim import WorkerRegistry, attempt_reclaim_task
+from project_builder.orchestrator.budget_txn import reserve_budget, settle_lease
+from project_builder.orchestrator.reclaim import (
+    WorkerRegistry,
+    attempt_reclaim_lease,
+    attempt_reclaim_task,
+    reclaim_stale_tasks,
+)
 
 
 class MockRegistry(WorkerRegistry):
@@ -87,3 +93,112 @@ def test_reclaim_not_stale(db_conn):
 
     registry = MockRegistry(alive_pids={})
     assert not attempt_reclaim_task(db_conn, "t1", registry)
+
+
+def _stale_lease(db_conn, holder, task_id=None):
+    lease = reserve_budget(db_conn, "m1", task_id, 4.0, False, holder=holder)
+    stale_time = datetime.utcnow() - timedelta(seconds=TASK_LOCK_TIMEOUT_SECONDS + 10)
+    db_conn.execute("UPDATE budget_leases SET leased_at = ? WHERE id = ?", (stale_time, lease.id))
+    db_conn.commit()
+    return lease
+
+
+def test_reclaim_lease_dead_holder_charges_reservation(db_conn):
+    lease = _stale_lease(db_conn, "123")
+    assert attempt_reclaim_lease(db_conn, lease.id, MockRegistry(alive_pids={}))
+
+    cur = db_conn.execute("SELECT spent_cost_usd FROM missions WHERE id='m1'")
+    assert cur.fetchone()[0] == 4.0
+    cur = db_conn.execute("SELECT status, used_usd FROM budget_leases WHERE id = ?", (lease.id,))
+    assert cur.fetchone() == ("reclaimed", 4.0)
+    # The crashed worker can no longer settle
+    assert not settle_lease(db_conn, lease)
+
+
+def test_reclaim_lease_skipped_alive(db_conn):
+    lease = _stale_lease(db_conn, "123")
+    assert not attempt_reclaim_lease(db_conn, lease.id, MockRegistry(alive_pids={123}))
+    cur = db_conn.execute("SELECT status FROM budget_leases WHERE id = ?", (lease.id,))
+    assert cur.fetchone()[0] == "active"
+
+
+def test_reclaim_task_reclaims_its_leases(db_conn):
+    stale_time = datetime.utcnow() - timedelta(seconds=TASK_LOCK_TIMEOUT_SECONDS + 10)
+    db_conn.execute(
+        "INSERT INTO mission_tasks (id, mission_id, task_order, description, status, locked_at, locked_by) VALUES (?, ?, ?, ?, ?, ?, ?)",  # noqa: E501
+        ("t1", "m1", 1, "desc", "executing", stale_time, "123"),
+    )
+    db_conn.commit()
+    lease = reserve_budget(db_conn, "m1", "t1", 2.0, False, holder="123")
+
+    assert attempt_reclaim_task(db_conn, "t1", MockRegistry(alive_pids={}))
+    cur = db_conn.execute("SELECT status FROM budget_leases WHERE id = ?", (lease.id,))
+    assert cur.fetchone()[0] == "reclaimed"
+
+
+def _locked_task(db_conn, task_id, order, locked_by, stale=True):
+    locked_at = datetime.utcnow()
+    if stale:
+        locked_at -= timedelta(seconds=TASK_LOCK_TIMEOUT_SECONDS + 10)
+    db_conn.execute(
+        "INSERT INTO mission_tasks (id, mission_id, task_order, description, status, locked_at, locked_by) VALUES (?, 'm1', ?, 'desc', 'executing', ?, ?)",  # noqa: E501
+        (task_id, order, locked_at, locked_by),
+    )
+
+
+def test_reclaim_sweep_matches_single_task_rule(db_conn):
+    _locked_task(db_conn, "dead1", 1, "101")
+    _locked_task(db_conn, "dead2", 2, "102")
+    _locked_task(db_conn, "alive", 3, "200")
+    _locked_task(db_conn, "unknown", 4, "orchestrator")
+    _locked_task(db_conn, "fresh", 5, "103", stale=False)
+    db_conn.commit()
+    lease = reserve_budget(db_conn, "m1", "dead1", 1.0, False, holder="101")
+
+    reclaimed = reclaim_stale_tasks(db_conn, MockRegistry(alive_pids={200}))
+
+    assert sorted(reclaimed) == ["dead1", "dead2"]
+    rows = dict(db_conn.execute("SELECT id, status FROM mission_tasks").fetchall())
+    assert rows == {
+        "dead1": "pending",
+        "dead2": "pending",
+        "alive": "executing",
+        "unknown": "executing",
+        "fresh": "executing",
+    }
+    events = db_conn.execute(
+        "SELECT task_id, event_type FROM timeline_events ORDER BY task_id"
+    ).fetchall()
+    # A non-PID holder can never be reclaimed and is skipped without an event
+    assert events == [
+        ("alive", "task_reclaim_skipped_alive_or_unknown"),
+        ("dead1", "task_reclaimed"),
+        ("dead2", "task_reclaimed"),
+    ]
+    cur = db_conn.execute("SELECT status FROM budget_leases WHERE id = ?", (lease.id,))
+    assert cur.fetchone()[0] == "reclaimed"
+
+    # A second sweep only re-logs the live owners, with fresh event ids
+    assert reclaim_stale_tasks(db_conn, MockRegistry(alive_pids={200})) == []
+    cur = db_conn.execute("SELECT COUNT(*), COUNT(DISTINCT id) FROM timeline_events")
+    assert cur.fetchone() == (4, 4)
+
+
+def test_reclaim_ignores_tasks_that_are_not_executing(db_conn):
+    _locked_task(db_conn, "t1", 1, "101")
+    db_conn.execute("UPDATE mission_tasks SET status = 'review' WHERE id = 't1'")
+    db_conn.commit()
+
+    assert not attempt_reclaim_task(db_conn, "t1", MockRegistry(alive_pids={}))
+    assert reclaim_stale_tasks(db_conn, MockRegistry(alive_pids={})) == []
+    cur = db_conn.execute("SELECT status, locked_by FROM mission_tasks WHERE id = 't1'")
+    assert cur.fetchone() == ("review", "101")
+
+
+def test_posix_registry_bulk_probe():
+    import os
+
+    from project_builder.orchestrator.reclaim import PosixWorkerRegistry
+
+    registry = PosixWorkerRegistry()
+    assert registry.filter_alive([os.getpid(), 2**22 + 7]) == {os.getpid()}
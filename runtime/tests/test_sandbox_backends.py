@@ -0,0 +1,186 @@
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from project_builder.sandbox import SandboxError, SecurityViolation, backends
+from project_builder.sandbox.backends import (
+    DockerWarmPoolBackend,
+    LocalNamespaceBackend,
+    close_backends,
+    get_backend,
+    parse_memory_limit,
+)
+from project_builder.sandbox.runner import run_sandbox
+
+needs_namespaces = pytest.mark.skipif(
+    not LocalNamespaceBackend.available(), reason="unprivileged user namespaces unavailable"
+)
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    workspace = tmp_path / "workspace"
+    output = tmp_path / "output"
+    workspace.mkdir()
+    output.mkdir()
+    (workspace / "input.txt").write_text("hello\n")
+    return workspace, output
+
+
+def test_parse_memory_limit():
+    assert parse_memory_limit("1g") == 1024**3
+    assert parse_memory_limit("512m") == 512 * 1024**2
+    assert parse_memory_limit("4096") == 4096
+
+
+def test_get_backend_rejects_unknown_name():
+    with pytest.raises(SandboxError, match="unknown sandbox backend"):
+        get_backend("vm")
+
+
+def test_get_backend_is_shared_until_closed(monkeypatch):
+    closed = []
+    monkeypatch.setattr(DockerWarmPoolBackend, "close", lambda self: closed.append(self))
+    close_backends()
+    pool = get_backend(DockerWarmPoolBackend.name)
+    assert get_backend(DockerWarmPoolBackend.name) is pool
+
+    close_backends()
+    assert closed == [pool]
+    assert get_backend(DockerWarmPoolBackend.name) is not pool
+    close_backends()
+
+
+@needs_namespaces
+def test_local_backend_runs_with_readonly_workspace(dirs):
+    workspace, output = dirs
+    entrypoint = (
+        'cp input.txt "$SANDBOX_OUTPUT/copy.txt"; '
+        'echo x > input.txt && touch "$SANDBOX_OUTPUT/workspace_writable"; '
+        'ln input.txt "$SANDBOX_OUTPUT/link" 2>/dev/null && touch "$SANDBOX_OUTPUT/hardlinked"; '
+        "exit 3"
+    )
+    code = run_sandbox(workspace, output, entrypoint, 30, backend=LocalNamespaceBackend())
+    assert code == 3
+    assert (output / "copy.txt").read_text() == "hello\n"
+    assert (workspace / "input.txt").read_text() == "hello\n"
+    assert not (output / "workspace_writable").exists()
+    assert not (output / "hardlinked").exists()
+
+
+@needs_namespaces
+def test_local_backend_has_no_network_and_readonly_host(dirs, tmp_path):
+    workspace, output = dirs
+    entrypoint = (
+        f'echo x > {tmp_path}/escape || touch "$SANDBOX_OUTPUT/host_readonly"; '
+        "python3 -c \"import socket; socket.create_connection(('1.1.1.1', 80), timeout=2)\" "
+        '2>/dev/null || touch "$SANDBOX_OUTPUT/no_network"'
+    )
+    assert run_sandbox(workspace, output, entrypoint, 30, backend=LocalNamespaceBackend()) == 0
+    assert not (tmp_path / "escape").exists()
+    assert (output / "host_readonly").exists()
+    assert (output / "no_network").exists()
+
+
+@needs_namespaces
+def test_local_backend_applies_rlimits(dirs):
+    workspace, output = dirs
+    entrypoint = 'ulimit -t > "$SANDBOX_OUTPUT/cpu"; ulimit -c > "$SANDBOX_OUTPUT/core"'
+    assert run_sandbox(workspace, output, entrypoint, 17, backend=LocalNamespaceBackend()) == 0
+    assert (output / "cpu").read_text().strip() == "17"
+    assert (output / "core").read_text().strip() == "0"
+
+
+@needs_namespaces
+def test_local_backend_kills_on_timeout(dirs):
+    workspace, output = dirs
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_sandbox(
+            workspace,
+            output,
+            'sleep 30 & sleep 30; touch "$SANDBOX_OUTPUT/late"',
+            1,
+            backend=LocalNamespaceBackend(),
+        )
+    assert not (output / "late").exists()
+
+
+@needs_namespaces
+def test_symlink_in_output_is_a_violation(dirs):
+    workspace, output = dirs
+    with pytest.raises(SecurityViolation, match="symlink"):
+        run_sandbox(
+            workspace,
+            output,
+            'ln -s /etc/passwd "$SANDBOX_OUTPUT/leak"',
+            30,
+            backend=LocalNamespaceBackend(),
+        )
+
+
+class FakeDocker:
+    """Records docker invocations; `exec ... bash -c` runs the entrypoint on the slot dirs."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.calls = []
+        self.real_run = subprocess.run
+
+    def __call__(self, cmd, **kwargs):
+        assert cmd[0] == "docker"
+        self.calls.append(cmd[1:])
+        if cmd[1] == "exec" and cmd[-3:-1] == ["bash", "-c"]:
+            slot = int(cmd[-4].rsplit("-", 1)[1])
+            ws, out = self.pool._slot_dirs(slot)
+            self.real_run(
+                ["bash", "-c", cmd[-1]], cwd=ws, env={"SANDBOX_OUTPUT": str(out)}, check=False
+            )
+        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+
+@pytest.fixture
+def pool_dirs(tmp_path):
+    shm = Path("/dev/shm")
+    if not shm.is_dir() or shm.stat().st_dev == tmp_path.stat().st_dev:
+        pytest.skip("needs a second filesystem for the pool output slots")
+    with tempfile.TemporaryDirectory(dir=shm) as out:
+        yield tmp_path / "pool-ws", Path(out)
+
+
+def test_warm_pool_reuses_paused_containers(dirs, pool_dirs, monkeypatch):
+    workspace, output = dirs
+    pool = DockerWarmPoolBackend(
+        size=2, workspace_dir=pool_dirs[0], output_dir=pool_dirs[1], prefix="pool"
+    )
+    fake = FakeDocker(pool)
+    monkeypatch.setattr(backends.subprocess, "run", fake)
+
+    with pool:
+        for i in range(3):
+            code = pool.run(
+                workspace, output, f'cp input.txt "$SANDBOX_OUTPUT/out{i}.txt"', 30, f"task{i}"
+            )
+            assert code == 0
+
+    assert sorted(p.name for p in output.iterdir()) == ["out0.txt", "out1.txt", "out2.txt"]
+    creates = [c for c in fake.calls if c[0] == "create"]
+    assert len(creates) == 2
+    for create in creates:
+        assert "--network=none" in create and "--cap-drop=ALL" in create
+        assert any(arg.endswith(":/workspace:ro") for arg in create)
+    assert sum(c[0] == "unpause" for c in fake.calls) == 3
+    assert [c[:3] for c in fake.calls if c[0] == "rm"][-2:] == [
+        ["rm", "-f", "pool-0"],
+        ["rm", "-f", "pool-1"],
+    ]
+
+
+def test_warm_pool_rejects_symlinked_workspace(dirs, pool_dirs, monkeypatch):
+    workspace, output = dirs
+    (workspace / "link").symlink_to("/etc/passwd")
+    pool = DockerWarmPoolBackend(size=1, workspace_dir=pool_dirs[0], output_dir=pool_dirs[1])
+    monkeypatch.setattr(backends.subprocess, "run", FakeDocker(pool))
+    with pytest.raises(SecurityViolation, match="sandbox_invalid_symlink"):
+        pool.run(workspace, output, "true", 30, "task")
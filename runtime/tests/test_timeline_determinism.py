@@ -1,6 +1,16 @@
+import os
+import sqlite3
+import subprocess
+import sys
 from datetime import datetime
+from pathlib import Path
 
-from project_builder.database.timeline import generate_timeline_event_id, reset_counters_for_testing
+from project_builder.database.migrations import apply_schema
+from project_builder.database.timeline import (
+    generate_timeline_event_id,
+    log_event,
+    reset_counters_for_testing,
+)
 
 
 def test_timeline_event_id_determinism():
@@ -42,3 +52,77 @@ def test_timeline_event_id_uniqueness_sequential():
     id2 = generate_timeline_event_id(mid, tid, event_type, created_at)
 
     assert id1 != id2, "Sequential IDs must differ"
+
+
+_LOGGER = """
+import sqlite3, sys
+from datetime import datetime
+from project_builder.database.timeline import log_event
+
+conn = sqlite3.connect(sys.argv[1], timeout=30.0)
+created_at = datetime(2023, 1, 1, 12, 0, 0)
+for i in range(50):
+    log_event(conn, "m1", "t1", "test_event", {"i": i}, created_at)
+    log_event(conn, "m1", None, "mission_event", {"i": i}, created_at)
+    conn.commit()
+"""
+
+
+def _timeline_db(path):
+    conn = sqlite3.connect(str(path))
+    apply_schema(conn)
+    conn.execute(
+        "INSERT INTO missions (id, status, description, max_cost_usd, max_loops, created_at, updated_at) VALUES ('m1', 'executing', 'desc', 10.0, 5, 'now', 'now')"  # noqa: E501
+    )
+    conn.execute(
+        "INSERT INTO mission_tasks (id, mission_id, task_order, description) VALUES ('t1', 'm1', 1, 'desc')"  # noqa: E501
+    )
+    conn.commit()
+    return conn
+
+
+def test_event_ids_unique_across_processes(tmp_path):
+    """Identical events from several processes (and restarts) get distinct ids."""
+    db_path = tmp_path / "timeline.db"
+    conn = _timeline_db(db_path)
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[2])}
+    runs = [
+        subprocess.Popen([sys.executable, "-c", _LOGGER, str(db_path)], env=env) for _ in range(4)
+    ]
+    assert all(p.wait(timeout=120) == 0 for p in runs)
+    # A "restarted" process: fresh in-memory state
+    assert subprocess.run([sys.executable, "-c", _LOGGER, str(db_path)], env=env).returncode == 0
+
+    total, distinct = conn.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT id) FROM timeline_events"
+    ).fetchone()
+    assert total == distinct == 500
+    seq = conn.execute("SELECT timeline_seq FROM mission_tasks WHERE id = 't1'").fetchone()[0]
+    assert seq == 250
+    conn.close()
+
+
+def test_log_event_uses_persisted_sequence(tmp_path):
+    conn = _timeline_db(tmp_path / "timeline.db")
+    created_at = datetime(2023, 1, 1, 12, 0, 0)
+    log_event(conn, "m1", "t1", "test_event", {}, created_at)
+    conn.commit()
+
+    expected = generate_timeline_event_id("m1", "t1", "test_event", created_at, counter=0)
+    assert conn.execute("SELECT id FROM timeline_events").fetchone()[0] == expected
+    conn.close()
+
+
+def test_migration_seeds_sequence_from_existing_events(tmp_path):
+    conn = _timeline_db(tmp_path / "timeline.db")
+    for i in range(3):
+        log_event(conn, "m1", "t1", "test_event", {"i": i}, datetime(2023, 1, 1))
+    conn.commit()
+    # Simulate a database from before timeline_seq existed
+    conn.execute("ALTER TABLE mission_tasks DROP COLUMN timeline_seq")
+    conn.commit()
+
+    apply_schema(conn)
+    seq = conn.execute("SELECT timeline_seq FROM mission_tasks WHERE id = 't1'").fetchone()[0]
+    assert seq == 3
+    conn.close()
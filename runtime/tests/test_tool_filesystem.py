@@ -11,6 +11,7 @@ Per Plan_Tool_Invoke_MVP_v0.2:
 """
 
 import hashlib
+import os
 
 import pytest
 
@@ -274,3 +275,180 @@ class TestListDir:
         assert result.ok is False
         assert result.error is not None
         assert result.error.type == ToolErrorType.POLICY_DENIED
+
+
+class TestReadFileRanges:
+    """Tests for ranged filesystem.read_file reads."""
+
+    def test_byte_range(self, tmp_path):
+        (tmp_path / "data.txt").write_text("0123456789")
+
+        result = handle_read_file({"path": "data.txt", "offset": 2, "length": 5}, tmp_path)
+
+        assert result.ok is True
+        assert result.output.stdout == "23456"
+        assert result.output.truncated is True
+        effect = result.effects.files_read[0]
+        assert effect.size_bytes == 5
+        assert effect.sha256 == hashlib.sha256(b"23456").hexdigest()
+
+    def test_byte_range_to_eof(self, tmp_path):
+        (tmp_path / "data.txt").write_text("0123456789")
+
+        result = handle_read_file({"path": "data.txt", "offset": 7}, tmp_path)
+
+        assert result.output.stdout == "789"
+        assert result.output.truncated is False
+
+    def test_line_range(self, tmp_path, monkeypatch):
+        import runtime.tools.filesystem as filesystem
+
+        monkeypatch.setattr(filesystem, "READ_CHUNK_BYTES", 7)  # force chunk boundaries
+        lines = [f"line {i}\n" for i in range(1, 21)]
+        (tmp_path / "lines.txt").write_text("".join(lines))
+
+        result = handle_read_file({"path": "lines.txt", "start_line": 5, "end_line": 8}, tmp_path)
+        assert result.output.stdout == "".join(lines[4:8])
+        assert result.output.truncated is True
+
+        result = handle_read_file({"path": "lines.txt", "start_line": 19}, tmp_path)
+        assert result.output.stdout == "".join(lines[18:])
+        assert result.output.truncated is False
+
+        result = handle_read_file({"path": "lines.txt", "end_line": 1}, tmp_path)
+        assert result.output.stdout == "line 1\n"
+
+    def test_line_checkpoints_let_later_reads_skip_the_scan(self, tmp_path, monkeypatch):
+        import runtime.tools.filesystem as filesystem
+
+        monkeypatch.setattr(filesystem, "READ_CHUNK_BYTES", 64)
+        lines = [f"{i:09d}\n" for i in range(1, 201)]
+        (tmp_path / "lines.txt").write_text("".join(lines))
+        reads = []
+        real_pread = os.pread
+        monkeypatch.setattr(
+            filesystem.os, "pread", lambda fd, n, off: reads.append(off) or real_pread(fd, n, off)
+        )
+
+        args = {"path": "lines.txt", "start_line": 150, "end_line": 151}
+        first = handle_read_file(args, tmp_path)
+        scanned = len(reads)
+        reads.clear()
+        second = handle_read_file({**args, "start_line": 151, "end_line": 152}, tmp_path)
+
+        assert first.output.stdout == "".join(lines[149:151])
+        assert second.output.stdout == "".join(lines[150:152])
+        assert len(reads) < scanned / 4
+
+    def test_line_range_past_eof_and_unterminated_last_line(self, tmp_path):
+        (tmp_path / "short.txt").write_text("a\nb\nc")
+
+        result = handle_read_file({"path": "short.txt", "start_line": 3, "end_line": 9}, tmp_path)
+        assert result.output.stdout == "c"
+
+        result = handle_read_file({"path": "short.txt", "start_line": 10}, tmp_path)
+        assert result.ok is True
+        assert result.output.stdout == ""
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            {"offset": 0, "start_line": 1},
+            {"offset": -1},
+            {"length": "5"},
+            {"start_line": 0},
+            {"start_line": 5, "end_line": 2},
+        ],
+    )
+    def test_invalid_range_returns_schema_error(self, tmp_path, extra):
+        (tmp_path / "data.txt").write_text("x")
+
+        result = handle_read_file({"path": "data.txt", **extra}, tmp_path)
+
+        assert result.ok is False
+        assert result.error.type == ToolErrorType.SCHEMA_ERROR
+
+
+class TestListDirPagination:
+    """Tests for filtered, cursor-paginated filesystem.list_dir."""
+
+    def test_pages_cover_directory_in_order(self, tmp_path):
+        names = [f"f{i:03d}.txt" for i in range(25)]
+        for name in reversed(names):
+            (tmp_path / name).write_text("")
+
+        seen, cursor = [], None
+        while True:
+            args = {"path": ".", "limit": 10}
+            if cursor is not None:
+                args["cursor"] = cursor
+            result = handle_list_dir(args, tmp_path)
+            page = result.output.stdout.split("\n")
+            seen.extend(page)
+            cursor = page[-1]
+            if not result.output.truncated:
+                break
+
+        assert seen == names
+
+    def test_pattern_and_type_filters(self, tmp_path):
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        (sub / "a.py").write_text("")
+        (sub / "b.txt").write_text("")
+        (sub / "c.py").mkdir()
+
+        result = handle_list_dir({"path": "sub", "pattern": "*.py", "type": "file"}, tmp_path)
+        assert result.output.stdout == "sub/a.py"
+
+        result = handle_list_dir({"path": "sub", "type": "dir"}, tmp_path)
+        assert result.output.stdout == "sub/c.py"
+
+    def test_invalid_arguments_return_schema_error(self, tmp_path):
+        for args in ({"limit": 0}, {"type": "socket"}, {"cursor": 3}):
+            result = handle_list_dir({"path": ".", **args}, tmp_path)
+            assert result.error.type == ToolErrorType.SCHEMA_ERROR
+
+
+class TestSymlinkCheckCache:
+    """Tests for the per-request symlink-check cache."""
+
+    def test_cached_ancestors_skip_restat(self, tmp_path, monkeypatch):
+        import runtime.tools.filesystem as filesystem
+
+        deep = tmp_path / "a" / "b" / "c"
+        deep.mkdir(parents=True)
+        for name in ("x.txt", "y.txt"):
+            (deep / name).write_text(name)
+
+        calls = []
+        real_lstat = os.lstat
+        monkeypatch.setattr(filesystem.os, "lstat", lambda p: calls.append(p) or real_lstat(p))
+
+        with filesystem.symlink_check_cache():
+            assert filesystem._has_symlink_in_path(deep / "x.txt") is False
+            first = len(calls)
+            calls.clear()
+            assert filesystem._has_symlink_in_path(deep / "y.txt") is False
+
+        assert len(calls) == 2  # the file and its (cached) parent directory
+        assert first > len(calls)
+
+    def test_swapped_in_symlink_detected_with_cache(self, tmp_path):
+        import runtime.tools.filesystem as filesystem
+
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "f.txt").write_text("f")
+        outside = tmp_path.parent / f"{tmp_path.name}_outside"
+        outside.mkdir()
+        (outside / "f.txt").write_text("secret")
+
+        with filesystem.symlink_check_cache():
+            check_containment("real/f.txt", tmp_path)
+            (tmp_path / "real").rename(tmp_path / "moved")
+            try:
+                (tmp_path / "real").symlink_to(outside)
+            except OSError:
+                pytest.skip("Symlinks not supported on this platform")
+            with pytest.raises(ContainmentError):
+                check_containment("real/f.txt", tmp_path)
@@ -274,3 +274,67 @@ class TestGovernanceUnavailable:
             assert result.ok is False
             assert result.error is not None
             assert result.error.type == "GovernanceUnavailable"
+
+
+class TestDispatchBatch:
+    """Tests for ToolRegistry.dispatch_batch."""
+
+    @pytest.fixture
+    def sandbox(self, tmp_path):
+        reset_global_registry()
+        (tmp_path / "a.txt").write_text("alpha")
+        (tmp_path / "b.txt").write_text("beta")
+        return tmp_path
+
+    def test_results_in_request_order_with_per_request_policy(self, sandbox):
+        registry = get_registry(sandbox_root=sandbox)
+        requests = [
+            ToolInvokeRequest("filesystem", "read_file", {"path": "a.txt"}, {"request_id": "r0"}),
+            ToolInvokeRequest("filesystem", "read_file", {"path": "../x.txt"}),
+            ToolInvokeRequest("git", "commit", {}),
+            ToolInvokeRequest("filesystem", "list_dir", {"path": "."}),
+            ToolInvokeRequest("filesystem", "read_file", {"path": "b.txt"}),
+        ]
+
+        results = registry.dispatch_batch(requests)
+
+        assert [r.ok for r in results] == [True, False, False, True, True]
+        assert results[0].output.stdout == "alpha"
+        assert results[0].request_id == "r0"
+        assert results[1].error.type == "PolicyDenied"
+        assert results[2].error.type == "PolicyDenied"
+        assert results[3].output.stdout == "a.txt\nb.txt"
+        assert results[4].output.stdout == "beta"
+
+    def test_write_is_a_barrier_between_reads(self, sandbox):
+        registry = get_registry(sandbox_root=sandbox)
+        requests = [
+            ToolInvokeRequest("filesystem", "read_file", {"path": "a.txt"}),
+            ToolInvokeRequest("filesystem", "write_file", {"path": "a.txt", "content": "new"}),
+            ToolInvokeRequest("filesystem", "read_file", {"path": "a.txt"}),
+        ]
+
+        results = registry.dispatch_batch(requests)
+
+        assert [r.output.stdout for r in (results[0], results[2])] == ["alpha", "new"]
+
+    def test_read_only_requests_run_concurrently(self, sandbox):
+        import threading
+
+        registry = get_registry(sandbox_root=sandbox)
+        barrier = threading.Barrier(3, timeout=5)
+        read_file = registry._handlers[("filesystem", "read_file")]
+
+        def gated_read(args, root):
+            barrier.wait()  # only passes if all three reads are in flight at once
+            return read_file(args, root)
+
+        registry.register("filesystem", "read_file", gated_read, read_only=True)
+        requests = [
+            ToolInvokeRequest("filesystem", "read_file", {"path": name})
+            for name in ("a.txt", "b.txt", "a.txt")
+        ]
+
+        results = registry.dispatch_batch(requests)
+
+        assert [r.output.stdout for r in results] == ["alpha", "beta", "alpha"]
@@ -0,0 +1,124 @@
+"""Tests for the shared YAML loader and document cache."""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from runtime.util import yaml_io
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    yaml_io.clear_yaml_cache()
+    yield
+    yaml_io.clear_yaml_cache()
+
+
+def _age(path, seconds=60):
+    """Backdate mtime so the entry is outside the racy window."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class TestLoaders:
+    def test_uses_c_loader_when_available(self):
+        assert yaml_io.HAS_LIBYAML == hasattr(yaml, "CSafeLoader")
+        if yaml_io.HAS_LIBYAML:
+            assert yaml_io.SafeLoader is yaml.CSafeLoader
+
+    def test_safe_load_matches_pyyaml(self):
+        text = "a: 1\nb: [x, {c: true}]\nd: 2024-01-01\n"
+        assert yaml_io.safe_load(text) == yaml.safe_load(text)
+
+    def test_safe_load_rejects_python_tags(self):
+        with pytest.raises(yaml.YAMLError):
+            yaml_io.safe_load("!!python/object/apply:os.system ['true']")
+
+    def test_safe_dump_round_trips(self):
+        data = {"b": [1, 2], "a": {"x": "y"}}
+        assert yaml_io.safe_load(yaml_io.safe_dump(data, sort_keys=False)) == data
+
+
+class TestDocumentCache:
+    def test_second_load_is_a_hit(self, tmp_path):
+        path = tmp_path / "doc.yaml"
+        path.write_text("key: value\n")
+
+        assert yaml_io.load_yaml_file(path) == {"key": "value"}
+        assert yaml_io.load_yaml_file(str(path)) == {"key": "value"}
+
+        stats = yaml_io.yaml_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_same_size_rewrite_is_detected(self, tmp_path):
+        # Same size and (likely) same mtime tick: only the content hash differs
+        path = tmp_path / "doc.yaml"
+        path.write_text("key: aaa\n")
+        assert yaml_io.load_yaml_file(path) == {"key": "aaa"}
+
+        path.write_text("key: bbb\n")
+        assert yaml_io.load_yaml_file(path) == {"key": "bbb"}
+
+    def test_settled_entry_skips_reading(self, tmp_path, monkeypatch):
+        path = tmp_path / "doc.yaml"
+        path.write_text("key: value\n")
+        _age(path)
+        yaml_io.load_yaml_file(path)
+
+        def _no_open(*args, **kwargs):
+            raise AssertionError("settled cache entry should not be re-read")
+
+        monkeypatch.setattr(yaml_io, "open", _no_open, raising=False)
+        assert yaml_io.load_yaml_file(path) == {"key": "value"}
+
+    def test_mtime_change_forces_reverification(self, tmp_path):
+        path = tmp_path / "doc.yaml"
+        path.write_text("key: old\n")
+        _age(path, 120)
+        yaml_io.load_yaml_file(path)
+
+        path.write_text("key: new\n")
+        _age(path, 60)
+        assert yaml_io.load_yaml_file(path) == {"key": "new"}
+
+    def test_returned_documents_are_isolated(self, tmp_path):
+        path = tmp_path / "doc.yaml"
+        path.write_text("items: [1, 2]\nnested: {a: 1}\n")
+
+        first = yaml_io.load_yaml_file(path)
+        first["items"].append(3)
+        first["nested"]["a"] = 99
+
+        assert yaml_io.load_yaml_file(path) == {"items": [1, 2], "nested": {"a": 1}}
+
+    def test_frozen_view_is_read_only(self, tmp_path):
+        path = tmp_path / "doc.yaml"
+        path.write_text("items: [1, 2]\nnested: {a: 1}\n")
+
+        view = yaml_io.load_yaml_file(path, frozen=True)
+
+        assert view["items"] == (1, 2)
+        with pytest.raises(TypeError):
+            view["nested"]["a"] = 2  # type: ignore[index]
+        assert yaml_io.load_yaml_file(path)["nested"] == {"a": 1}
+
+    def test_errors_are_not_cached(self, tmp_path):
+        path = tmp_path / "doc.yaml"
+        path.write_text("key: [unclosed\n")
+        with pytest.raises(yaml.YAMLError):
+            yaml_io.load_yaml_file(path)
+        assert yaml_io.yaml_cache_stats()["size"] == 0
+
+        with pytest.raises(FileNotFoundError):
+            yaml_io.load_yaml_file(tmp_path / "absent.yaml")
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(yaml_io, "MAX_CACHED_DOCUMENTS", 3)
+        for i in range(5):
+            path = tmp_path / f"doc{i}.yaml"
+            path.write_text(f"n: {i}\n")
+            yaml_io.load_yaml_file(path)
+        assert yaml_io.yaml_cache_stats()["size"] == 3
@@ -17,10 +17,19 @@ See: docs/02_protocols/Filesystem_Error_Boundary_Protocol_v1.0.md
 
 from __future__ import annotations
 
+import bisect
+import contextlib
+import contextvars
+import fnmatch
 import hashlib
+import heapq
 import os
+import re
+import stat
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from runtime.tools.schemas import (
     Effects,
@@ -43,41 +52,64 @@ class ContainmentError(Exception):
     pass
 
 
+# Per-request cache for _has_symlink_in_path: directory path -> (st_dev, st_ino)
+# it had when it and all its ancestors were seen to be symlink-free.
+_symlink_cache: contextvars.ContextVar[Optional[Dict[str, Tuple[int, int]]]] = (
+    contextvars.ContextVar("filesystem_symlink_cache", default=None)
+)
+
+
+@contextlib.contextmanager
+def symlink_check_cache() -> Iterator[Dict[str, Tuple[int, int]]]:
+    """
+    Share symlink checks between containment checks for one request.
+
+    Inside the block a directory already seen to be symlink-free up to
+    the root is trusted again after one lstat confirms the same inode is
+    still there, instead of re-checking every ancestor. Scope this to a
+    single request (or batch): the cache is not invalidated if an
+    ancestor is swapped for a symlink to the same directory.
+    """
+    cache: Dict[str, Tuple[int, int]] = {}
+    token = _symlink_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _symlink_cache.reset(token)
+
+
 def _has_symlink_in_path(path: Path) -> bool:
     """
     Check if any component of path is a symlink.
 
-    Includes the path itself and all parent components up to root.
+    Includes the path itself and all parent components up to root;
+    components that do not exist yet are skipped.
 
     Returns:
         True if any component is a symlink
     """
-    if not path.exists():
-        # For non-existent paths, check parent components
-        parent = path.parent
-        if parent.exists():
-            return _has_symlink_in_path(parent)
-        return False
-
-    # Check the path itself
-    if path.is_symlink():
-        return True
-
-    # Check all parent components
+    cache = _symlink_cache.get()
+    clean_dirs = []
     current = path
-    checked = set()
-
-    while current != current.parent:
-        current_str = str(current)
-        if current_str in checked:
+    while True:
+        try:
+            st = os.lstat(current)
+        except FileNotFoundError:
+            st = None
+        if st is not None:
+            if stat.S_ISLNK(st.st_mode):
+                return True
+            key = (st.st_dev, st.st_ino)
+            if cache is not None and stat.S_ISDIR(st.st_mode):
+                if cache.get(str(current)) == key:
+                    break
+                clean_dirs.append((str(current), key))
+        if current == current.parent:
             break
-        checked.add(current_str)
-
-        if current.exists() and current.is_symlink():
-            return True
-
         current = current.parent
 
+    if cache is not None:
+        cache.update(clean_dirs)
     return False
 
 
@@ -141,6 +173,128 @@ def compute_file_hash(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+# =============================================================================
+# Ranged Reads
+# =============================================================================
+
+READ_CHUNK_BYTES = 1024 * 1024
+LINE_CHECKPOINT_FILES = 64  # files whose line checkpoints are kept (LRU)
+
+_LINE_CHECKPOINTS: "OrderedDict[Tuple[int, int, int, int], List[Tuple[int, int]]]" = OrderedDict()
+_line_checkpoints_lock = threading.Lock()
+
+
+def _parse_read_range(args: Dict[str, Any]) -> Tuple[Optional[Dict[str, Optional[int]]], str]:
+    """
+    Validate optional range arguments of read_file.
+
+    Returns ({"offset", "length"} or {"start_line", "end_line"}, "") for a
+    ranged read, (None, "") for a whole-file read, or (None, message) if
+    the arguments are invalid.
+    """
+    byte_keys = [k for k in ("offset", "length") if args.get(k) is not None]
+    line_keys = [k for k in ("start_line", "end_line") if args.get(k) is not None]
+    if byte_keys and line_keys:
+        return None, "offset/length and start_line/end_line are mutually exclusive"
+    for key in byte_keys + line_keys:
+        value = args[key]
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            return None, f"{key} must be a non-negative integer"
+    if byte_keys:
+        return {"offset": args.get("offset") or 0, "length": args.get("length")}, ""
+    if line_keys:
+        start_line = args.get("start_line")
+        start_line = 1 if start_line is None else start_line
+        end_line = args.get("end_line")
+        if start_line < 1 or (end_line is not None and end_line < start_line):
+            return None, "start_line must be >= 1 and end_line >= start_line"
+        return {"start_line": start_line, "end_line": end_line}, ""
+    return None, ""
+
+
+def _pread_exact(fd: int, offset: int, length: int) -> bytes:
+    """pread until length bytes or EOF."""
+    parts = []
+    while length > 0:
+        chunk = os.pread(fd, min(length, READ_CHUNK_BYTES), offset)
+        if not chunk:
+            break
+        parts.append(chunk)
+        offset += len(chunk)
+        length -= len(chunk)
+    return b"".join(parts)
+
+
+def _skip_lines(chunk: bytes, start: int, count: int) -> int:
+    """Index just past the count-th newline in chunk from start (caller checked it exists)."""
+    for _ in range(count):
+        start = chunk.index(b"\n", start) + 1
+    return start
+
+
+def _line_checkpoints(st: os.stat_result) -> List[Tuple[int, int]]:
+    """Known (line number, byte offset) line starts for this version of a file."""
+    key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    with _line_checkpoints_lock:
+        checkpoints = _LINE_CHECKPOINTS.pop(key, None)
+        if checkpoints is None:
+            checkpoints = [(1, 0)]
+        _LINE_CHECKPOINTS[key] = checkpoints
+        while len(_LINE_CHECKPOINTS) > LINE_CHECKPOINT_FILES:
+            _LINE_CHECKPOINTS.popitem(last=False)
+    return checkpoints
+
+
+def _record_checkpoint(checkpoints: List[Tuple[int, int]], line: int, offset: int) -> None:
+    with _line_checkpoints_lock:
+        if offset - checkpoints[-1][1] >= READ_CHUNK_BYTES:
+            checkpoints.append((line, offset))
+
+
+def _line_span(
+    fd: int, st: os.stat_result, start_line: int, end_line: Optional[int]
+) -> Tuple[int, int]:
+    """
+    Byte span [start, end) of 1-based lines start_line..end_line (inclusive).
+
+    Scans forward with pread only as far as end_line, starting from the
+    nearest line start recorded by earlier scans of the same file version
+    (one checkpoint per READ_CHUNK_BYTES), so paging through a large file
+    does not rescan it from the top each time.
+    """
+    size = st.st_size
+    checkpoints = _line_checkpoints(st)
+    line, pos = checkpoints[bisect.bisect_right(checkpoints, (start_line, size)) - 1]
+    start = pos if line == start_line else None
+    at_line_start = True
+    while pos < size:
+        if at_line_start:
+            _record_checkpoint(checkpoints, line, pos)
+        chunk = os.pread(fd, READ_CHUNK_BYTES, pos)
+        if not chunk:
+            break
+        idx = 0
+        if start is None:
+            if chunk.count(b"\n") >= start_line - line:
+                idx = _skip_lines(chunk, 0, start_line - line)
+                line, start = start_line, pos + idx
+        if start is not None:
+            if end_line is None:
+                return start, size
+            if chunk.count(b"\n", idx) >= end_line - line + 1:
+                return start, pos + _skip_lines(chunk, idx, end_line - line + 1)
+        # Advance to the line start after the chunk's last newline
+        cut = chunk.rfind(b"\n") + 1
+        if cut <= idx:
+            pos += len(chunk)
+            at_line_start = False
+        else:
+            line += chunk.count(b"\n", idx, cut)
+            pos += cut
+            at_line_start = True
+    return (size if start is None else start), size
+
+
 # =============================================================================
 # Filesystem Handlers
 # =============================================================================
@@ -152,6 +306,13 @@ def handle_read_file(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResu
 
     Args:
         args.path: File path to read (relative or absolute)
+        args.offset, args.length: Optional byte range (length defaults to EOF)
+        args.start_line, args.end_line: Optional 1-based inclusive line range
+
+    Ranged reads use pread and touch only the requested span (line ranges
+    scan forward to end_line). Their effects record describes the bytes
+    returned, and output.truncated is True when the file continues past
+    the range.
 
     Returns:
         ToolInvokeResult with file content in output.stdout
@@ -173,6 +334,17 @@ def handle_read_file(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResu
             policy_reason="ALLOWED",
         )
 
+    read_range, range_error = _parse_read_range(args)
+    if range_error:
+        return make_error_result(
+            tool="filesystem",
+            action="read_file",
+            error_type=ToolErrorType.SCHEMA_ERROR,
+            message=f"Invalid read range: {range_error}",
+            policy_allowed=True,
+            policy_reason="ALLOWED",
+        )
+
     # Containment check
     try:
         target_path = check_containment(path_str, sandbox_root)
@@ -209,8 +381,27 @@ def handle_read_file(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResu
         )
 
     # Read and decode
+    truncated = False
     try:
-        content_bytes = target_path.read_bytes()
+        if read_range is None:
+            content_bytes = target_path.read_bytes()
+        else:
+            fd = os.open(target_path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                # _parse_read_range already filled in offset and start_line
+                if "offset" in read_range:
+                    start = min(read_range["offset"] or 0, size)
+                    length = read_range["length"]
+                    end = size if length is None else min(size, start + length)
+                else:
+                    start, end = _line_span(
+                        fd, os.fstat(fd), read_range["start_line"] or 1, read_range["end_line"]
+                    )
+                content_bytes = _pread_exact(fd, start, end - start)
+                truncated = start + len(content_bytes) < size
+            finally:
+                os.close(fd)
     except OSError as e:
         return make_error_result(
             tool="filesystem",
@@ -249,7 +440,7 @@ def handle_read_file(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResu
     return make_success_result(
         tool="filesystem",
         action="read_file",
-        output=ToolOutput(stdout=content, stderr="", truncated=False),
+        output=ToolOutput(stdout=content, stderr="", truncated=truncated),
         effects=effects,
         matched_rules=["filesystem.read_file"],
     )
@@ -357,6 +548,15 @@ def handle_list_dir(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResul
 
     Args:
         args.path: Directory path to list (relative or absolute, defaults to root)
+        args.pattern: Optional glob matched against entry names
+        args.type: Optional "file" or "dir" filter
+        args.cursor: Optional entry name; only names sorting after it are listed
+        args.limit: Optional page size
+
+    Entries are streamed from scandir and only the current page is kept
+    (a bounded heap), so large directories are never materialized. When
+    more entries follow the page, output.truncated is True and the next
+    page starts at cursor = the last name returned.
 
     Returns:
         ToolInvokeResult with sorted entries in output.stdout (one per line)
@@ -369,6 +569,29 @@ def handle_list_dir(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResul
     """
     path_str = args.get("path", ".")  # Default to sandbox root
 
+    pattern = args.get("pattern")
+    entry_type = args.get("type")
+    cursor = args.get("cursor")
+    limit = args.get("limit")
+    arg_error = None
+    if pattern is not None and not isinstance(pattern, str):
+        arg_error = "pattern must be a string"
+    elif entry_type not in (None, "file", "dir"):
+        arg_error = "type must be 'file' or 'dir'"
+    elif cursor is not None and not isinstance(cursor, str):
+        arg_error = "cursor must be a string"
+    elif limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 1):
+        arg_error = "limit must be a positive integer"
+    if arg_error:
+        return make_error_result(
+            tool="filesystem",
+            action="list_dir",
+            error_type=ToolErrorType.SCHEMA_ERROR,
+            message=f"Invalid list_dir arguments: {arg_error}",
+            policy_allowed=True,
+            policy_reason="ALLOWED",
+        )
+
     # Containment check
     try:
         target_path = check_containment(path_str, sandbox_root)
@@ -404,9 +627,32 @@ def handle_list_dir(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResul
             policy_reason="ALLOWED",
         )
 
+    name_matches = re.compile(fnmatch.translate(pattern)).match if pattern is not None else None
+
+    def matching_names() -> Iterator[str]:
+        with os.scandir(target_path) as it:
+            for entry in it:
+                name = entry.name
+                if cursor is not None and name <= cursor:
+                    continue
+                if name_matches is not None and not name_matches(name):
+                    continue
+                if entry_type is not None:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if is_dir != (entry_type == "dir"):
+                        continue
+                yield name
+
     # List entries with deterministic ordering (lexicographic)
     try:
-        entries = list(target_path.iterdir())
+        if limit is None:
+            names = sorted(matching_names())
+            truncated = False
+        else:
+            # One extra entry tells whether another page follows
+            names = heapq.nsmallest(limit + 1, matching_names())
+            truncated = len(names) > limit
+            names = names[:limit]
     except OSError as e:
         return make_error_result(
             tool="filesystem",
@@ -417,24 +663,22 @@ def handle_list_dir(args: Dict[str, Any], sandbox_root: Path) -> ToolInvokeResul
             policy_reason="ALLOWED",
         )
 
-    # Sort entries lexicographically by name
-    entries = sorted(entries, key=lambda p: p.name)
-
     # Format as relative paths from sandbox root (documented convention)
-    entry_lines = []
-    for entry in entries:
-        try:
-            rel_path = entry.relative_to(sandbox_root)
-            entry_lines.append(str(rel_path).replace("\\", "/"))
-        except ValueError:
-            # Should not happen due to containment, but fail safely
-            entry_lines.append(entry.name)
+    try:
+        prefix = str(target_path.relative_to(sandbox_root)).replace("\\", "/")
+    except ValueError:
+        # Should not happen due to containment, but fail safely
+        prefix = "."
+    if prefix == ".":
+        entry_lines = names
+    else:
+        entry_lines = [f"{prefix}/{name}" for name in names]
 
     content = "\n".join(entry_lines)
 
     return make_success_result(
         tool="filesystem",
         action="list_dir",
-        output=ToolOutput(stdout=content, stderr="", truncated=False),
+        output=ToolOutput(stdout=content, stderr="", truncated=truncated),
         matched_rules=["filesystem.list_dir"],
     )
@@ -0,0 +1,167 @@
+"""Content-hash verdict cache for per-file quality gate tools.
+
+A cached verdict is keyed by (tool, tool version, config hash, repo-relative
+file path, file content hash). The path is part of the key because tool
+settings can depend on it (ruff's per-file-ignores, excludes and isort
+first-party detection), so the same content elsewhere may get a different
+verdict. Only passing verdicts are stored: a failing batch cannot be attributed
+to individual files reliably, so its files are simply re-linted next time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import threading
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from runtime.util.atomic_write import atomic_write_json
+
+QUALITY_CACHE_RELATIVE_PATH = Path(".quality_cache/verdicts.json")
+QUALITY_CACHE_SCHEMA_VERSION = 2
+QUALITY_CACHE_MAX_ENTRIES = 50_000
+
+# Tools whose verdict for a file depends only on that file and the tool config.
+# mypy is deliberately absent: its verdict depends on the rest of the import graph.
+QUALITY_CACHEABLE_TOOL_CONFIGS: dict[str, tuple[str, ...]] = {
+    "ruff_check": ("pyproject.toml", "ruff.toml", ".ruff.toml"),
+    "ruff_format": ("pyproject.toml", "ruff.toml", ".ruff.toml"),
+    "biome": ("biome.json", "biome.jsonc"),
+    "markdownlint": (".markdownlint.json", ".markdownlint.yaml", ".markdownlint.yml"),
+    "yamllint": (".yamllint", ".yamllint.yml", ".yamllint.yaml"),
+    "shellcheck": (".shellcheckrc",),
+}
+
+_VERSION_CACHE: dict[str, str | None] = {}
+_VERSION_LOCK = threading.Lock()
+
+
+def tool_version(executable: str) -> str | None:
+    """Return `<executable> --version` output, memoized per process (None if absent)."""
+    with _VERSION_LOCK:
+        if executable in _VERSION_CACHE:
+            return _VERSION_CACHE[executable]
+    try:
+        proc = subprocess.run(
+            [executable, "--version"],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        version = (proc.stdout or proc.stderr or "").strip() if proc.returncode == 0 else None
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        version = None
+    with _VERSION_LOCK:
+        _VERSION_CACHE[executable] = version
+    return version
+
+
+def clear_tool_version_cache() -> None:
+    """Forget memoized tool versions (tests, tool upgrades within one process)."""
+    with _VERSION_LOCK:
+        _VERSION_CACHE.clear()
+
+
+def _sha256_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class QualityVerdictCache:
+    """Local store of passing per-file quality verdicts."""
+
+    def __init__(self, repo_root: Path, path: Path | None = None):
+        self.repo_root = Path(repo_root)
+        self.path = path or self.repo_root / QUALITY_CACHE_RELATIVE_PATH
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = self._load()
+        self._file_hashes: dict[str, str | None] = {}
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        if payload.get("version") != QUALITY_CACHE_SCHEMA_VERSION:
+            return {}
+        entries = payload.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def config_hash(self, tool_name: str, tool_cfg: dict, flags: Sequence[str]) -> str:
+        """Hash the tool's config files, manifest entry and non-file command flags."""
+        hasher = hashlib.sha256()
+        hasher.update(json.dumps(tool_cfg, sort_keys=True, default=str).encode("utf-8"))
+        hasher.update(b"\0" + "\0".join(flags).encode("utf-8"))
+        for name in QUALITY_CACHEABLE_TOOL_CONFIGS.get(tool_name, ()):
+            digest = _sha256_file(self.repo_root / name)
+            hasher.update(f"\0{name}={digest or '-'}".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def file_hash(self, file_path: str) -> str | None:
+        with self._lock:
+            if file_path in self._file_hashes:
+                return self._file_hashes[file_path]
+        digest = _sha256_file(self.repo_root / file_path)
+        with self._lock:
+            self._file_hashes[file_path] = digest
+        return digest
+
+    @staticmethod
+    def _key(
+        tool_name: str, version: str, config_hash: str, file_path: str, content_hash: str
+    ) -> str:
+        material = "\0".join(
+            (tool_name, version, config_hash, Path(file_path).as_posix(), content_hash)
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def partition(
+        self, tool_name: str, version: str, config_hash: str, files: Sequence[str]
+    ) -> tuple[list[str], list[str]]:
+        """Split files into (cached passing, needs run)."""
+        hits: list[str] = []
+        misses: list[str] = []
+        for file_path in files:
+            content_hash = self.file_hash(file_path)
+            if content_hash is None:
+                misses.append(file_path)
+                continue
+            key = self._key(tool_name, version, config_hash, file_path, content_hash)
+            with self._lock:
+                hit = key in self._entries
+            (hits if hit else misses).append(file_path)
+        return hits, misses
+
+    def record_passed(
+        self, tool_name: str, version: str, config_hash: str, files: Iterable[str]
+    ) -> None:
+        for file_path in files:
+            content_hash = self.file_hash(file_path)
+            if content_hash is None:
+                continue
+            key = self._key(tool_name, version, config_hash, file_path, content_hash)
+            with self._lock:
+                self._entries.pop(key, None)
+                self._entries[key] = {"tool": tool_name, "file": file_path}
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            overflow = len(self._entries) - QUALITY_CACHE_MAX_ENTRIES
+            if overflow > 0:
+                # Oldest-recorded first (dict preserves insertion order)
+                for key in list(self._entries)[:overflow]:
+                    del self._entries[key]
+            payload = {"version": QUALITY_CACHE_SCHEMA_VERSION, "entries": self._entries}
+            self._dirty = False
+        atomic_write_json(self.path, payload, indent=0, sort_keys=False)
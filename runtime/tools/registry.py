@@ -6,18 +6,22 @@ Per Plan_Tool_Invoke_MVP_v0.2:
 - Schema validation before policy gate
 - Policy gate before dispatch
 - Deterministic registration and dispatch order
+- Batched dispatch: read-only handlers run concurrently, results in request order
 """
 
 from __future__ import annotations
 
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from runtime.api.governance_api import (
     GovernanceUnavailable,
     check_tool_action_allowed,
     resolve_sandbox_root,
 )
+from runtime.tools.filesystem import symlink_check_cache
 from runtime.tools.schemas import (
     ToolErrorType,
     ToolInvokeRequest,
@@ -28,6 +32,9 @@ from runtime.tools.schemas import (
 # Type alias for handler functions
 HandlerFn = Callable[[Dict[str, Any], Path], ToolInvokeResult]
 
+# Upper bound on concurrently running read-only handlers in dispatch_batch
+BATCH_MAX_WORKERS = 8
+
 
 class ToolRegistry:
     """
@@ -45,11 +52,12 @@ class ToolRegistry:
                          If None, resolved from environment.
         """
         self._handlers: Dict[Tuple[str, str], HandlerFn] = {}
+        self._read_only: Set[Tuple[str, str]] = set()
         self._sandbox_root = sandbox_root
         self._sandbox_root_resolved = False
         self._sandbox_root_error: Optional[str] = None
 
-    def register(self, tool: str, action: str, handler: HandlerFn) -> None:
+    def register(self, tool: str, action: str, handler: HandlerFn, read_only: bool = False) -> None:
         """
         Register a handler for a tool/action pair.
 
@@ -57,8 +65,14 @@ class ToolRegistry:
             tool: Tool name
             action: Action name
             handler: Handler function(args, sandbox_root) -> ToolInvokeResult
+            read_only: Handler has no side effects; dispatch_batch may run it
+                concurrently with other read-only requests
         """
         self._handlers[(tool, action)] = handler
+        if read_only:
+            self._read_only.add((tool, action))
+        else:
+            self._read_only.discard((tool, action))
 
     def _resolve_sandbox_root(self) -> Tuple[Optional[Path], Optional[str]]:
         """
@@ -84,60 +98,67 @@ class ToolRegistry:
             self._sandbox_root_resolved = True
             return None, self._sandbox_root_error
 
-    def dispatch(self, request: ToolInvokeRequest) -> ToolInvokeResult:
+    def _admit(
+        self, request: ToolInvokeRequest
+    ) -> Tuple[Optional[HandlerFn], Optional[Path], Optional[ToolInvokeResult]]:
         """
-        Dispatch a tool invocation request.
-
-        Order of operations:
-        1. Schema validation
-        2. Sandbox root resolution
-        3. Policy gate check
-        4. Handler lookup
-        5. Handler execution
+        Run the pre-dispatch checks for one request.
 
-        Returns:
-            ToolInvokeResult with appropriate status and fields
+        Returns (handler, sandbox_root, None) if the request may run, or
+        (None, None, error_result) if it was rejected.
         """
         request_id = request.get_request_id()
 
         # 1. Schema validation
         validation = request.validate()
         if not validation.ok:
-            return make_error_result(
-                tool=request.tool or "",
-                action=request.action or "",
-                error_type=ToolErrorType.SCHEMA_ERROR,
-                message=f"Schema validation failed: {', '.join(validation.errors)}",
-                policy_allowed=False,
-                policy_reason="DENIED: Schema validation failed",
-                request_id=request_id,
-                details={"errors": validation.errors},
+            return (
+                None,
+                None,
+                make_error_result(
+                    tool=request.tool or "",
+                    action=request.action or "",
+                    error_type=ToolErrorType.SCHEMA_ERROR,
+                    message=f"Schema validation failed: {', '.join(validation.errors)}",
+                    policy_allowed=False,
+                    policy_reason="DENIED: Schema validation failed",
+                    request_id=request_id,
+                    details={"errors": validation.errors},
+                ),
             )
 
         # 2. Sandbox root resolution
         sandbox_root, root_error = self._resolve_sandbox_root()
         if sandbox_root is None:
-            return make_error_result(
-                tool=request.tool,
-                action=request.action,
-                error_type=ToolErrorType.GOVERNANCE_UNAVAILABLE,
-                message=root_error or "Sandbox root unavailable",
-                policy_allowed=False,
-                policy_reason="DENIED: Governance unavailable",
-                request_id=request_id,
+            return (
+                None,
+                None,
+                make_error_result(
+                    tool=request.tool,
+                    action=request.action,
+                    error_type=ToolErrorType.GOVERNANCE_UNAVAILABLE,
+                    message=root_error or "Sandbox root unavailable",
+                    policy_allowed=False,
+                    policy_reason="DENIED: Governance unavailable",
+                    request_id=request_id,
+                ),
             )
 
         # 3. Policy gate check
         allowed, policy = check_tool_action_allowed(request)
         if not allowed:
-            return make_error_result(
-                tool=request.tool,
-                action=request.action,
-                error_type=ToolErrorType.POLICY_DENIED,
-                message=policy.decision_reason,
-                policy_allowed=False,
-                policy_reason=policy.decision_reason,
-                request_id=request_id,
+            return (
+                None,
+                None,
+                make_error_result(
+                    tool=request.tool,
+                    action=request.action,
+                    error_type=ToolErrorType.POLICY_DENIED,
+                    message=policy.decision_reason,
+                    policy_allowed=False,
+                    policy_reason=policy.decision_reason,
+                    request_id=request_id,
+                ),
             )
 
         # 4. Handler lookup
@@ -146,17 +167,28 @@ class ToolRegistry:
 
         if handler is None:
             # This should not happen if policy gate is correct, but fail-closed
-            return make_error_result(
-                tool=request.tool,
-                action=request.action,
-                error_type=ToolErrorType.POLICY_DENIED,
-                message=f"No handler registered for {request.tool}.{request.action}",
-                policy_allowed=False,
-                policy_reason="DENIED: No handler registered",
-                request_id=request_id,
+            return (
+                None,
+                None,
+                make_error_result(
+                    tool=request.tool,
+                    action=request.action,
+                    error_type=ToolErrorType.POLICY_DENIED,
+                    message=f"No handler registered for {request.tool}.{request.action}",
+                    policy_allowed=False,
+                    policy_reason="DENIED: No handler registered",
+                    request_id=request_id,
+                ),
             )
 
-        # 5. Handler execution
+        return handler, sandbox_root, None
+
+    @staticmethod
+    def _execute(
+        handler: HandlerFn, request: ToolInvokeRequest, sandbox_root: Path
+    ) -> ToolInvokeResult:
+        """5. Handler execution; exceptions become IOError results."""
+        request_id = request.get_request_id()
         try:
             result = handler(request.args, sandbox_root)
             # Ensure request_id is echoed back
@@ -175,6 +207,69 @@ class ToolRegistry:
                 details={"exception_type": type(e).__name__},
             )
 
+    def dispatch(self, request: ToolInvokeRequest) -> ToolInvokeResult:
+        """
+        Dispatch a tool invocation request.
+
+        Order of operations:
+        1. Schema validation
+        2. Sandbox root resolution
+        3. Policy gate check
+        4. Handler lookup
+        5. Handler execution
+
+        Returns:
+            ToolInvokeResult with appropriate status and fields
+        """
+        handler, sandbox_root, rejected = self._admit(request)
+        if rejected is not None:
+            return rejected
+        assert handler is not None and sandbox_root is not None
+        with symlink_check_cache():
+            return self._execute(handler, request, sandbox_root)
+
+    def dispatch_batch(
+        self, requests: Sequence[ToolInvokeRequest], max_workers: int = BATCH_MAX_WORKERS
+    ) -> List[ToolInvokeResult]:
+        """
+        Dispatch several requests in one call.
+
+        Every request gets the same checks as dispatch() (steps 1-4), in
+        request order. Consecutive admitted read-only requests then run
+        concurrently; any other request waits for the reads before it and
+        finishes before later requests start, so a read after a write in
+        the same batch sees the write. Symlink checks are shared across
+        the batch.
+
+        Returns:
+            One ToolInvokeResult per request, in request order
+        """
+        results: List[Optional[ToolInvokeResult]] = [None] * len(requests)
+        with symlink_check_cache(), ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            pending: List[Tuple[int, Future[ToolInvokeResult]]] = []  # running read-only group
+
+            def drain() -> None:
+                for index, future in pending:
+                    results[index] = future.result()
+                pending.clear()
+
+            for index, request in enumerate(requests):
+                handler, sandbox_root, rejected = self._admit(request)
+                if rejected is not None:
+                    results[index] = rejected
+                    continue
+                assert handler is not None and sandbox_root is not None
+                if (request.tool, request.action) in self._read_only:
+                    # Workers inherit this context, and with it the symlink cache
+                    context = contextvars.copy_context()
+                    future = pool.submit(context.run, self._execute, handler, request, sandbox_root)
+                    pending.append((index, future))
+                else:
+                    drain()
+                    results[index] = self._execute(handler, request, sandbox_root)
+            drain()
+        return results  # type: ignore[return-value]
+
     def get_registered_handlers(self) -> list[Tuple[str, str]]:
         """Return list of registered (tool, action) pairs (sorted for determinism)."""
         return sorted(self._handlers.keys())
@@ -222,9 +317,9 @@ def _register_builtins(registry: ToolRegistry) -> None:
     from runtime.tools.pytest_runner import handle_pytest_run
 
     # Register filesystem handlers
-    registry.register("filesystem", "read_file", handle_read_file)
+    registry.register("filesystem", "read_file", handle_read_file, read_only=True)
     registry.register("filesystem", "write_file", handle_write_file)
-    registry.register("filesystem", "list_dir", handle_list_dir)
+    registry.register("filesystem", "list_dir", handle_list_dir, read_only=True)
 
     # Register pytest handler
     registry.register("pytest", "run", handle_pytest_run)
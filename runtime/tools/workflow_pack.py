@@ -9,6 +9,7 @@ import shlex
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -26,16 +27,22 @@ from runtime.tools.closure_policy import (
     classify_paths,
     get_tier_execution_policy,
 )
+from runtime.tools.quality_cache import (
+    QUALITY_CACHEABLE_TOOL_CONFIGS,
+    QualityVerdictCache,
+    tool_version,
+)
 from runtime.util.atomic_write import atomic_write_text
+from runtime.util.yaml_io import load_yaml_file
 from scripts.workflow.git_lock_health import ensure_git_lock_health
 
 # Import for BACKLOG parsing (will handle import error gracefully)
 try:
     from recursive_kernel.backlog_parser import ItemStatus, mark_item_done, parse_backlog
 except ImportError:
-    parse_backlog = None
-    mark_item_done = None
-    ItemStatus = None
+    parse_backlog = None  # type: ignore[assignment]
+    mark_item_done = None  # type: ignore[assignment]
+    ItemStatus = None  # type: ignore[assignment, misc]
 
 
 ACTIVE_WORK_RELATIVE_PATH = Path(".context/active_work.yaml")
@@ -56,6 +63,7 @@ QUALITY_TOOL_EXECUTABLES = {
     "doc_authority_manifest": "python3",
     "derived_outputs": "python3",
 }
+QUALITY_DEFAULT_MAX_WORKERS = 4
 QUALITY_PYTHON_CONFIG_FILES = {"pyproject.toml", "requirements.txt", "requirements-dev.txt"}
 QUALITY_BIOME_EXTENSIONS = {".js", ".jsx", ".ts", ".tsx", ".json", ".jsonc"}
 QUALITY_BIOME_CONFIG_FILES = {"biome.json"}
@@ -217,7 +225,7 @@ def load_quality_manifest(repo_root: Path) -> dict:
     manifest_path = Path(repo_root) / QUALITY_MANIFEST_RELATIVE_PATH
     if not manifest_path.exists():
         raise FileNotFoundError(f"quality manifest not found: {manifest_path}")
-    loaded = yaml.safe_load(manifest_path.read_text(encoding="utf-8")) or {}
+    loaded = load_yaml_file(manifest_path) or {}
     if not isinstance(loaded, dict):
         raise ValueError("quality manifest must be a mapping")
     return loaded
@@ -587,24 +595,115 @@ def _build_quality_command(
     return None
 
 
+def _execute_quality_tool(
+    repo_root: Path,
+    manifest: dict,
+    tool_name: str,
+    files: Sequence[str],
+    command: list[str],
+    *,
+    scope: str,
+    fix: bool,
+    cache: QualityVerdictCache | None,
+) -> tuple[list[str], dict[str, object]]:
+    """Run one quality tool, consulting the verdict cache for per-file tools."""
+    tool_cfg = manifest["tools"][tool_name]
+    cached_files: list[str] = []
+    cache_context: tuple[str, str] | None = None
+
+    if cache is not None and files and tool_name in QUALITY_CACHEABLE_TOOL_CONFIGS:
+        version = tool_version(QUALITY_TOOL_EXECUTABLES.get(tool_name, tool_name))
+        if version is not None:
+            flags = [part for part in command if part not in set(files)]
+            cache_context = (version, cache.config_hash(tool_name, tool_cfg, flags))
+            cached_files, misses = cache.partition(tool_name, *cache_context, files)
+            if cached_files:
+                command = (
+                    _build_quality_command(repo_root, manifest, tool_name, misses, scope, fix)
+                    or []
+                    if misses
+                    else []
+                )
+
+    commands_run: list[str] = []
+    if command:
+        commands_run.append(shlex.join(command))
+        try:
+            proc = subprocess.run(
+                command,
+                check=False,
+                cwd=Path(repo_root),
+                capture_output=True,
+                text=True,
+            )
+            passed = proc.returncode == 0
+            details = (proc.stderr or "").strip() or (proc.stdout or "").strip()
+            missing_executable = False
+        except FileNotFoundError as exc:
+            passed = False
+            details = str(exc)
+            missing_executable = True
+    else:
+        # Every routed file has a cached passing verdict
+        passed = True
+        details = ""
+        missing_executable = False
+
+    if cache is not None and cache_context is not None and passed:
+        cache.record_passed(
+            tool_name, *cache_context, [f for f in files if f not in set(cached_files)]
+        )
+
+    result: dict[str, object] = {
+        "tool": tool_name,
+        "failure_class": str(tool_cfg.get("failure_class", "quality_error")),
+        "passed": passed,
+        "auto_fixed": bool(fix and tool_cfg.get("autofix_allowed") and passed),
+        "files": list(files),
+        "details": details,
+    }
+    if cache is not None:
+        result["cached_files"] = cached_files
+    result["mode"], result["waived"], waiver_reason = _resolve_quality_result_mode(
+        manifest,
+        tool_name,
+        str(result["failure_class"]),
+        list(files),
+        passed,
+        details,
+        scope=scope,
+        missing_executable=missing_executable,
+    )
+    if waiver_reason:
+        result["waiver_reason"] = waiver_reason
+    return commands_run, result
+
+
 def run_quality_gates(
     repo_root: Path,
     changed_files: Sequence[str],
     scope: str = "changed",
     fix: bool = False,
     tool_names: Sequence[str] | None = None,
+    max_workers: int = QUALITY_DEFAULT_MAX_WORKERS,
+    use_cache: bool = False,
 ) -> dict:
-    """Run manifest-driven code quality gates."""
+    """Run manifest-driven code quality gates.
+
+    Independent tools run concurrently (at most ``max_workers`` at a time).
+    With ``use_cache`` (ignored for ``fix``), per-file tools skip files whose
+    content, tool version and tool config match a cached passing verdict.
+    Results keep manifest order regardless of completion order.
+    """
     effective_changed_files = list(changed_files)
     if scope == "changed" and not effective_changed_files:
         effective_changed_files = discover_changed_files(repo_root)
 
     manifest = load_quality_manifest(repo_root)
     routed = route_quality_tools(repo_root, effective_changed_files, scope=scope)
-    commands_run: list[str] = []
-    results: list[dict[str, object]] = []
-    auto_fixed = False
+    cache = QualityVerdictCache(repo_root) if use_cache and not fix else None
 
+    planned: list[tuple[str, list[str], list[str]]] = []
     allowed_tools = set(tool_names or [])
     for tool_name in manifest.get("tools", {}):
         if allowed_tools and tool_name not in allowed_tools:
@@ -626,46 +725,34 @@ def run_quality_gates(
         )
         if not command:
             continue
+        planned.append((tool_name, list(files), command))
+
+    outcomes: list[tuple[list[str], dict[str, object]]] = []
+    if planned:
+        # Fix mode rewrites files in place, so tools must not race on them.
+        workers = 1 if fix else max(1, min(max_workers, len(planned)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _execute_quality_tool,
+                    repo_root,
+                    manifest,
+                    tool_name,
+                    files,
+                    command,
+                    scope=scope,
+                    fix=fix,
+                    cache=cache,
+                )
+                for tool_name, files, command in planned
+            ]
+            outcomes = [future.result() for future in futures]
+    if cache is not None:
+        cache.save()
 
-        commands_run.append(shlex.join(command))
-        try:
-            proc = subprocess.run(
-                command,
-                check=False,
-                cwd=Path(repo_root),
-                capture_output=True,
-                text=True,
-            )
-            passed = proc.returncode == 0
-            details = (proc.stderr or "").strip() or (proc.stdout or "").strip()
-            missing_executable = False
-        except FileNotFoundError as exc:
-            passed = False
-            details = str(exc)
-            missing_executable = True
-
-        result = {
-            "tool": tool_name,
-            "failure_class": str(tool_cfg.get("failure_class", "quality_error")),
-            "passed": passed,
-            "auto_fixed": bool(fix and tool_cfg.get("autofix_allowed") and passed),
-            "files": list(files),
-            "details": details,
-        }
-        result["mode"], result["waived"], waiver_reason = _resolve_quality_result_mode(
-            manifest,
-            tool_name,
-            str(result["failure_class"]),
-            list(files),
-            passed,
-            details,
-            scope=scope,
-            missing_executable=missing_executable,
-        )
-        if waiver_reason:
-            result["waiver_reason"] = waiver_reason
-        results.append(result)
-        auto_fixed = auto_fixed or bool(result["auto_fixed"])
+    commands_run = [command for commands, _ in outcomes for command in commands]
+    results = [result for _, result in outcomes]
+    auto_fixed = any(bool(result["auto_fixed"]) for result in results)
 
     blocking_failures = [r for r in results if (not r["passed"]) and r["mode"] == "blocking"]
     advisory_failures = [r for r in results if (not r["passed"]) and r["mode"] == "advisory"]
@@ -675,7 +762,7 @@ def run_quality_gates(
         f"{len(advisory_failures)} advisory failure(s)."
     )
 
-    return {
+    payload = {
         "passed": not blocking_failures,
         "scope": scope,
         "summary": summary,
@@ -686,6 +773,11 @@ def run_quality_gates(
         "results": results,
         "auto_fixed": auto_fixed,
     }
+    if cache is not None:
+        payload["cache_hits"] = sum(
+            len(cached) for r in results if isinstance(cached := r.get("cached_files"), list)
+        )
+    return payload
 
 
 def doctor_quality_tools(repo_root: Path) -> dict:
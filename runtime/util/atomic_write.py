@@ -7,7 +7,7 @@ import json
 import os
 import tempfile
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 
 def atomic_write_text(path: Union[Path, str], text: str, encoding: str = "utf-8") -> None:
@@ -44,7 +44,7 @@ def atomic_write_text(path: Union[Path, str], text: str, encoding: str = "utf-8"
 
 
 def atomic_write_json(
-    path: Union[Path, str], data: Any, indent: int = 2, sort_keys: bool = True
+    path: Union[Path, str], data: Any, indent: Optional[int] = 2, sort_keys: bool = True
 ) -> None:
     """
     Atomically write JSON to a file.
@@ -52,7 +52,7 @@ def atomic_write_json(
     Args:
         path: Target file path.
         data: JSON-serializable data.
-        indent: JSON indentation (default: 2).
+        indent: JSON indentation (default: 2); None for compact output.
         sort_keys: Sort dictionary keys for determinism (default: True).
     """
     text = json.dumps(data, indent=indent, sort_keys=sort_keys)
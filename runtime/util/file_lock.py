@@ -1,43 +1,146 @@
+"""
+Kernel-backed inter-process file lock.
+
+FileLock takes an flock(2) lock on lock_path: exclusive by default, shared
+with shared=True. Contended acquires block in the kernel (in a helper
+thread, so the timeout works from any thread) instead of polling, and the
+kernel drops the lock when its holder exits, so a crashed holder cannot
+leave it stuck.
+
+Exclusive holders write {pid, host, started_at} into the lock file and
+clear it on release; the record is diagnostic only. The lock descriptor is
+opened O_CLOEXEC, so programs a holder execs do not inherit the lock and
+keep it after the holder dies. The lock file is never unlinked: a waiter
+cannot tell a dead owner's record from a live holder that has just locked
+and not yet rewritten it, and breaking the lock on that guess would let
+two processes hold it.
+"""
+
 import contextlib
+import fcntl
+import json
 import os
+import socket
+import threading
 import time
+from typing import Any, Dict, Optional
+
+
+def read_lock_owner(lock_path: str) -> Dict[str, Any]:
+    """Owner record of an exclusively held lock; {} if none was recorded."""
+    try:
+        with open(lock_path, "r", encoding="utf-8") as handle:
+            payload = json.loads(handle.read() or "{}")
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+class _Waiter(threading.Thread):
+    """Blocks in flock() for a caller that may give up; cleans up if abandoned."""
+
+    def __init__(self, fd: int, operation: int):
+        super().__init__(daemon=True, name="file-lock-waiter")
+        self.fd = fd
+        self.operation = operation
+        self.done = threading.Event()
+        self.error: Optional[OSError] = None
+        self._guard = threading.Lock()
+        self._abandoned = False
+
+    def run(self):
+        try:
+            fcntl.flock(self.fd, self.operation)
+        except OSError as exc:
+            self.error = exc
+        with self._guard:
+            if self._abandoned:
+                os.close(self.fd)  # closing also drops a lock we got too late
+                return
+            self.done.set()
+
+    def abandon(self) -> bool:
+        """Gives up on the lock; False if it was acquired meanwhile (caller owns fd)."""
+        with self._guard:
+            if self.done.is_set():
+                return False
+            self._abandoned = True
+            return True
 
 
 class FileLock:
     """
-    A simple file-based lock for process capabilities.
-    Not robust against crashes leaving stale locks (needs TTL or manual cleanup),
-    but sufficient for single-run/short-lived contention tests.
+    A file-based lock for process capabilities (flock-based, crash-safe).
+
+    acquire() returns False once `timeout` seconds pass without getting
+    the lock. poll_interval is accepted for compatibility; waiting no
+    longer polls.
     """
 
-    def __init__(self, lock_path: str, timeout: float = 10.0, poll_interval: float = 0.1):
+    def __init__(
+        self,
+        lock_path: str,
+        timeout: float = 10.0,
+        poll_interval: float = 0.1,
+        shared: bool = False,
+    ):
         self.lock_path = lock_path
         self.timeout = timeout
         self.poll_interval = poll_interval
+        self.shared = shared
         self._acquired = False
+        self._fd: Optional[int] = None
 
-    def acquire(self):
-        start_time = time.time()
-        while True:
-            try:
-                # Exclusive creation - fails if file exists
-                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-                os.close(fd)
-                self._acquired = True
+    @property
+    def _operation(self) -> int:
+        return fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+
+    def _wait(self, fd: int, deadline: float) -> bool:
+        """Blocks for the lock on fd until deadline; False on timeout or error."""
+        waiter = _Waiter(fd, self._operation)
+        waiter.start()
+        if waiter.done.wait(max(0.0, deadline - time.monotonic())) or not waiter.abandon():
+            if waiter.error is None:
                 return True
-            except FileExistsError:
-                if time.time() - start_time >= self.timeout:
-                    return False
-                time.sleep(self.poll_interval)
-            except OSError:
+            os.close(fd)
+        return False
+
+    def _record_owner(self, fd: int) -> None:
+        record = {"pid": os.getpid(), "host": socket.gethostname(), "started_at": time.time()}
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, json.dumps(record, sort_keys=True).encode("utf-8"), 0)
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        try:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+        except OSError:
+            return False
+        try:
+            fcntl.flock(fd, self._operation | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # An abandoned waiter closes fd itself once flock() returns
+            if not self._wait(fd, deadline):
                 return False
+        except OSError:
+            os.close(fd)
+            return False
+        if not self.shared:
+            self._record_owner(fd)
+        self._fd = fd
+        self._acquired = True
+        return True
 
     def release(self):
         if self._acquired:
             try:
-                os.remove(self.lock_path)
+                if not self.shared:
+                    os.ftruncate(self._fd, 0)
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
             except OSError:
                 pass  # Already gone?
+            os.close(self._fd)
+            self._fd = None
             self._acquired = False
 
     @contextlib.contextmanager
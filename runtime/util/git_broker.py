@@ -0,0 +1,393 @@
+"""
+Git plumbing broker - long-lived ``git cat-file`` processes per repository.
+
+Verifiers and missions ask git small questions many times per run (does this
+SHA exist, what is HEAD, is the tree clean, how big is the staged diff).
+Spawning one ``git`` process per question dominates their latency, so this
+module keeps, per repository:
+
+- a ``git cat-file --batch-check`` process for object existence
+  (``objects_exist``) and a lazily started ``--batch`` process for object
+  reads (``read_object``). Both are restarted transparently if they die.
+- a cache for ``head()`` and ``diffstat(cached=True)`` keyed on the stat of
+  ``HEAD``, the checked-out ref, ``packed-refs`` and ``index``. Entries whose
+  mtime is within the filesystem timestamp granularity of when they were
+  cached are not trusted ("racy", as git treats its own index).
+
+``status()`` is deliberately not cached: worktree edits do not touch the index
+or HEAD, so no cheap key can prove a cached status still holds.
+
+Obtain a broker with ``get_broker(repo_root)``; brokers are shared process-wide
+and their child processes are closed at interpreter exit. The registry keeps
+at most ``MAX_SHARED_BROKERS`` (least recently used are closed first) and
+closes brokers whose repository has been deleted, so temporary repositories
+do not leave ``cat-file`` children behind.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# Entries whose key mtime is this close to their cache time are not reused
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Requests written to a batch process before reading its answers back; keeps
+# both pipe buffers well under their capacity so neither side can block
+_BATCH_CHUNK = 256
+
+DEFAULT_TIMEOUT = 10.0
+
+# Shared brokers kept alive at once (each holds up to two cat-file children)
+MAX_SHARED_BROKERS = 8
+
+_StatKey = Optional[Tuple[int, int, int]]
+
+
+class GitBrokerError(RuntimeError):
+    """A git command issued through the broker failed."""
+
+    def __init__(self, message: str, stderr: str = ""):
+        super().__init__(message)
+        self.stderr = stderr
+
+
+def _stat_key(path: Optional[str]) -> _StatKey:
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _find_git_dirs(repo_root: str) -> Tuple[Optional[str], Optional[str]]:
+    """Locate (git_dir, common_dir) without spawning git."""
+    current = os.path.abspath(repo_root)
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git, dot_git
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git, encoding="utf-8") as handle:
+                    line = handle.readline().strip()
+            except OSError:
+                return None, None
+            if not line.startswith("gitdir:"):
+                return None, None
+            git_dir = os.path.normpath(os.path.join(current, line[len("gitdir:") :].strip()))
+            common_dir = git_dir
+            try:
+                with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as handle:
+                    common_dir = os.path.normpath(os.path.join(git_dir, handle.read().strip()))
+            except OSError:
+                pass
+            return git_dir, common_dir
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None, None
+        current = parent
+
+
+class _BatchProcess:
+    """One ``git cat-file --batch*`` child, restarted on death."""
+
+    def __init__(self, broker: "GitBroker", mode: str):
+        self._broker = broker
+        self._mode = mode
+        self._proc: Optional[subprocess.Popen] = None
+        self._pid = os.getpid()
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._pid != os.getpid():
+            # Forked child: the pipes belong to the parent's process
+            self._proc = None
+            self._pid = os.getpid()
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = self._broker._popen(["cat-file", self._mode])
+        return self._proc
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or self._pid != os.getpid():
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+    def exchange(self, requests: Sequence[str], read_body: bool, timeout: float) -> list:
+        """Send ``requests`` and return one parsed answer per request.
+
+        Answers are ``None`` for missing/ambiguous objects, otherwise
+        ``(oid, type, size, body_or_None)``. Raises ``OSError`` if the child
+        dies mid-exchange.
+        """
+        proc = self._ensure()
+        assert proc.stdin is not None and proc.stdout is not None
+        # A hung child must not hang the caller: kill it at the deadline
+        watchdog = threading.Timer(timeout, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            answers: list = []
+            for start in range(0, len(requests), _BATCH_CHUNK):
+                chunk = requests[start : start + _BATCH_CHUNK]
+                proc.stdin.write("".join(f"{r}\n" for r in chunk).encode("utf-8"))
+                proc.stdin.flush()
+                for _ in chunk:
+                    header = proc.stdout.readline()
+                    if not header.endswith(b"\n"):
+                        raise OSError(f"git cat-file {self._mode} exited")
+                    parts = header.decode("utf-8", "replace").split()
+                    if len(parts) != 3:
+                        answers.append(None)  # "<name> missing" / "<name> ambiguous"
+                        continue
+                    body = None
+                    if read_body:
+                        size = int(parts[2])
+                        body = proc.stdout.read(size + 1)[:-1]
+                        if len(body) != size:
+                            raise OSError(f"git cat-file {self._mode} exited")
+                    answers.append((parts[0], parts[1], int(parts[2]), body))
+            return answers
+        except (OSError, ValueError):
+            self._proc = None
+            proc.kill()
+            proc.wait()
+            raise OSError(f"git cat-file {self._mode} failed") from None
+        finally:
+            watchdog.cancel()
+
+
+class GitBroker:
+    """Shared git access for one repository. Thread-safe."""
+
+    def __init__(self, repo_root: Union[str, Path], git: str = "git"):
+        self.repo_root = os.path.abspath(os.fspath(repo_root))
+        self._git = git
+        self._git_dir, self._common_dir = _find_git_dirs(self.repo_root)
+        self._lock = threading.RLock()
+        self._check = _BatchProcess(self, "--batch-check")
+        self._read = _BatchProcess(self, "--batch")
+        self._cache: Dict[str, Tuple[tuple, int, object]] = {}
+        self.spawn_count = 0
+        self.cache_hits = 0
+
+    # -- process management ------------------------------------------------
+
+    def _popen(self, args: Sequence[str]) -> subprocess.Popen:
+        self.spawn_count += 1
+        return subprocess.Popen(
+            [self._git, *args],
+            cwd=self.repo_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def run(
+        self, args: Sequence[str], timeout: Optional[float] = DEFAULT_TIMEOUT
+    ) -> subprocess.CompletedProcess:
+        """Run a one-shot ``git <args>`` in the repository (text mode)."""
+        self.spawn_count += 1
+        return subprocess.run(
+            [self._git, *args],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+    def close(self) -> None:
+        """Terminate the long-lived cat-file processes and drop caches."""
+        with self._lock:
+            self._check.close()
+            self._read.close()
+            self._cache.clear()
+
+    # -- cache -------------------------------------------------------------
+
+    def _state_key(self, include_index: bool) -> Optional[tuple]:
+        """Stat fingerprint of HEAD (and optionally the index), or None."""
+        if self._git_dir is None or self._common_dir is None:
+            return None
+        head_path = os.path.join(self._git_dir, "HEAD")
+        try:
+            with open(head_path, encoding="utf-8") as handle:
+                head = handle.read().strip()
+        except OSError:
+            return None
+        ref_key: _StatKey = None
+        packed_key = _stat_key(os.path.join(self._common_dir, "packed-refs"))
+        if head.startswith("ref:"):
+            ref = head[4:].strip()
+            ref_key = _stat_key(os.path.join(self._common_dir, *ref.split("/")))
+            if ref_key is None and packed_key is None:
+                return None  # unborn branch: nothing on disk to key on
+        key: tuple = (head, _stat_key(head_path), ref_key, packed_key)
+        if include_index:
+            key += (_stat_key(os.path.join(self._git_dir, "index")),)
+        return key
+
+    @staticmethod
+    def _is_racy(key: tuple, now_ns: int) -> bool:
+        for part in key:
+            if isinstance(part, tuple) and now_ns - part[2] < _RACY_WINDOW_NS:
+                return True
+        return False
+
+    def _cached(self, name: str, include_index: bool, compute):
+        key = self._state_key(include_index)
+        if key is not None:
+            entry = self._cache.get(name)
+            if entry is not None and entry[0] == key and not self._is_racy(key, entry[1]):
+                self.cache_hits += 1
+                return entry[2]
+        value = compute()
+        if key is not None:
+            self._cache[name] = (key, time.time_ns(), value)
+        return value
+
+    # -- queries -----------------------------------------------------------
+
+    def objects_exist(
+        self, names: Iterable[str], timeout: float = DEFAULT_TIMEOUT
+    ) -> Dict[str, bool]:
+        """Map each object name to whether it resolves in the repository.
+
+        Accepts anything ``git cat-file -e`` would (full or abbreviated SHAs,
+        revision expressions); names with embedded whitespace are rejected.
+        """
+        result: Dict[str, bool] = {}
+        pending: List[str] = []
+        for name in names:
+            if name in result:
+                continue
+            result[name] = False
+            if name and not any(ch.isspace() for ch in name):
+                pending.append(name)
+        if not pending:
+            return result
+        with self._lock:
+            answers = self._exchange(self._check, pending, False, timeout)
+        for name, answer in zip(pending, answers, strict=True):
+            result[name] = answer is not None
+        return result
+
+    def read_object(
+        self, name: str, timeout: float = DEFAULT_TIMEOUT
+    ) -> Optional[Tuple[str, bytes]]:
+        """Return ``(type, content)`` for an object, or None if it is missing."""
+        if not name or any(ch.isspace() for ch in name):
+            return None
+        with self._lock:
+            (answer,) = self._exchange(self._read, [name], True, timeout)
+        if answer is None:
+            return None
+        return answer[1], answer[3]
+
+    def _exchange(
+        self, proc: _BatchProcess, requests: List[str], read_body: bool, timeout: float
+    ) -> list:
+        # One restart for a child that died between calls; if a fresh child
+        # also fails (not a repository, git missing) every object is absent
+        for _ in range(2):
+            try:
+                return proc.exchange(requests, read_body, timeout)
+            except OSError:
+                continue
+        return [None] * len(requests)
+
+    def head(self) -> str:
+        """Return the commit id HEAD points at."""
+        with self._lock:
+            return self._cached("head", False, self._compute_head)
+
+    def _compute_head(self) -> str:
+        proc = self.run(["rev-parse", "HEAD"])
+        if proc.returncode != 0:
+            raise GitBrokerError(f"git rev-parse failed: {proc.stderr.strip()}", proc.stderr)
+        return proc.stdout.strip()
+
+    def status(self, untracked: str = "all") -> List[str]:
+        """Return ``git status --porcelain`` lines (never cached)."""
+        proc = self.run(["status", "--porcelain", f"--untracked-files={untracked}"])
+        if proc.returncode != 0:
+            raise GitBrokerError(f"git status failed: {proc.stderr}", proc.stderr)
+        return [line for line in proc.stdout.split("\n") if line.strip()]
+
+    def diffstat(self, cached: bool = True) -> List[Tuple[int, int, str]]:
+        """Return ``(added, deleted, path)`` per file from ``git diff --numstat``.
+
+        Binary files count as 0/0. Only the staged diff (``cached=True``) is
+        memoized, since only it is fully determined by the index and HEAD.
+        """
+        if not cached:
+            return self._compute_diffstat(False)
+        with self._lock:
+            return list(self._cached("diffstat", True, lambda: self._compute_diffstat(True)))
+
+    def _compute_diffstat(self, cached: bool) -> List[Tuple[int, int, str]]:
+        args = ["diff", "--numstat"] + (["--cached"] if cached else [])
+        proc = self.run(args)
+        if proc.returncode != 0:
+            raise GitBrokerError(f"git diff failed: {proc.stderr.strip()}", proc.stderr)
+        rows: List[Tuple[int, int, str]] = []
+        for line in proc.stdout.split("\n"):
+            parts = line.split("\t", 2)
+            if len(parts) < 3:
+                continue
+            added = int(parts[0]) if parts[0] != "-" else 0
+            deleted = int(parts[1]) if parts[1] != "-" else 0
+            rows.append((added, deleted, parts[2]))
+        return rows
+
+
+_brokers: "OrderedDict[str, GitBroker]" = OrderedDict()
+_brokers_lock = threading.Lock()
+
+
+def get_broker(repo_root: Union[str, Path, None] = None) -> GitBroker:
+    """Return the shared broker for ``repo_root`` (default: current directory)."""
+    key = os.path.realpath(os.fspath(repo_root) if repo_root is not None else os.getcwd())
+    evicted: List[GitBroker] = []
+    with _brokers_lock:
+        broker = _brokers.get(key)
+        if broker is None:
+            broker = _brokers[key] = GitBroker(key)
+            for other in [k for k in _brokers if k != key and not os.path.isdir(k)]:
+                evicted.append(_brokers.pop(other))
+            while len(_brokers) > MAX_SHARED_BROKERS:
+                evicted.append(_brokers.popitem(last=False)[1])
+        else:
+            _brokers.move_to_end(key)
+    for old in evicted:
+        old.close()
+    return broker
+
+
+def close_all_brokers() -> None:
+    """Close every shared broker (test isolation, interpreter exit)."""
+    with _brokers_lock:
+        brokers = list(_brokers.values())
+        _brokers.clear()
+    for broker in brokers:
+        broker.close()
+
+
+atexit.register(close_all_brokers)
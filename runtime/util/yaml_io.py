@@ -0,0 +1,169 @@
+"""
+Shared YAML I/O - libyaml-backed parsing with a per-process document cache.
+
+All runtime YAML parsing should go through this module:
+
+- ``safe_load`` / ``safe_dump`` use ``CSafeLoader`` / ``CSafeDumper`` when
+  PyYAML was built with libyaml, falling back to the pure-Python classes.
+- ``load_yaml_file`` memoizes parsed documents keyed by
+  (path, size, mtime_ns, content sha256). A stat match is trusted unless the
+  file was modified within the filesystem timestamp granularity of when it was
+  cached ("racy" entries are re-verified by content hash, as git does).
+- Cached documents are never handed out directly: callers receive a private
+  copy (default) or a read-only frozen view, so no caller can corrupt the
+  cache for another.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import IO, Any, Optional, Union
+
+import yaml
+
+SafeLoader: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper: Any = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+HAS_LIBYAML = SafeLoader is not yaml.SafeLoader
+
+# Maximum number of parsed documents kept per process
+MAX_CACHED_DOCUMENTS = 256
+
+# Entries whose mtime is this close to their cache time are re-hashed on hit
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def safe_load(stream: Union[str, bytes, IO[Any]]) -> Any:
+    """Drop-in for ``yaml.safe_load`` using the C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_load_all(stream: Union[str, bytes, IO[Any]]) -> list:
+    """Drop-in for ``list(yaml.safe_load_all(...))`` using the C loader."""
+    return list(yaml.load_all(stream, Loader=SafeLoader))
+
+
+def safe_dump(data: Any, stream: Optional[IO[Any]] = None, **kwargs: Any) -> Any:
+    """Drop-in for ``yaml.safe_dump`` using the C dumper when available."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+@dataclass
+class _Entry:
+    size: int
+    mtime_ns: int
+    digest: str
+    cached_at_ns: int
+    document: Any
+
+
+_cache: "OrderedDict[str, _Entry]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached documents (test isolation, explicit invalidation)."""
+    with _lock:
+        _cache.clear()
+        _stats["hits"] = 0
+        _stats["misses"] = 0
+
+
+def yaml_cache_stats() -> dict:
+    """Return hit/miss counters and current cache size."""
+    with _lock:
+        return {**_stats, "size": len(_cache)}
+
+
+def _copy(value: Any) -> Any:
+    # Safe-loaded YAML only yields plain containers and immutable scalars,
+    # so a structural copy is equivalent to deepcopy and much cheaper.
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def load_yaml_file(path: Union[str, Path], *, frozen: bool = False) -> Any:
+    """
+    Parse a YAML file through the shared document cache.
+
+    Args:
+        path: File to load.
+        frozen: Return a read-only view (mappings become MappingProxyType,
+            lists become tuples) instead of a private mutable copy.
+
+    Returns:
+        The parsed document (a fresh copy, or a frozen view).
+
+    Raises:
+        OSError: If the file cannot be read.
+        yaml.YAMLError: If the content is not valid YAML.
+    """
+    key = os.path.realpath(path)
+    st = os.stat(key)
+
+    with _lock:
+        entry = _cache.get(key)
+        if (
+            entry is not None
+            and entry.size == st.st_size
+            and entry.mtime_ns == st.st_mtime_ns
+            and entry.cached_at_ns - entry.mtime_ns > _RACY_WINDOW_NS
+        ):
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            document = entry.document
+            return _freeze(document) if frozen else _copy(document)
+
+    with open(key, "rb") as handle:
+        raw = handle.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None and entry.digest == digest:
+            entry.size = st.st_size
+            entry.mtime_ns = st.st_mtime_ns
+            entry.cached_at_ns = time.time_ns()
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            document = entry.document
+            return _freeze(document) if frozen else _copy(document)
+
+    document = safe_load(raw)
+
+    with _lock:
+        _cache[key] = _Entry(
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            digest=digest,
+            cached_at_ns=time.time_ns(),
+            document=document,
+        )
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_DOCUMENTS:
+            _cache.popitem(last=False)
+        _stats["misses"] += 1
+
+    return _freeze(document) if frozen else _copy(document)
@@ -14,14 +14,14 @@ Usage:
     outcome = verifier.verify_with_proposed_changes(files_modified, diffs)
 """
 
+import hashlib
 import re
-import shutil
-import subprocess
-import tempfile
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from .patch_apply import OverlayFS, PatchApplyError, apply_unified_diff
 
 
 @dataclass
@@ -55,8 +55,16 @@ class VerifierOutcome:
 class DocVerifier:
     """Semantic verifier for doc stewardship with proposed changes support."""
 
-    def __init__(self, docs_dir: Path = None):
+    def __init__(self, docs_dir: Path = None, fs: Optional[OverlayFS] = None):
         self.docs_dir = Path(docs_dir) if docs_dir else Path(__file__).parent.parent.parent / "docs"
+        # Optional overlay view; when set, hygiene checks see patched content
+        self.fs = fs
+
+    def _exists(self, path: Path) -> bool:
+        return self.fs.exists(path) if self.fs else path.exists()
+
+    def _read_text(self, path: Path) -> str:
+        return self.fs.read_text(path) if self.fs else path.read_text(encoding="utf-8")
 
     def verify(self, result=None) -> VerifierOutcome:
         """Run all verification checks on current state."""
@@ -85,7 +93,7 @@ class DocVerifier:
         self, files_modified: List[Dict], proposed_diffs: str, constraints: Dict[str, Any] = None
     ) -> VerifierOutcome:
         """
-        Verify proposed changes by applying them to a temp workspace.
+        Verify proposed changes by applying them to an in-memory overlay.
         This validates the POST-change state, not current state.
         Returns outcome and populates after_sha256 in files_modified if successful.
 
@@ -165,76 +173,36 @@ class DocVerifier:
             if any(f.severity == "ERROR" for f in diff_findings):
                 return VerifierOutcome(False, findings, "Invalid diff format", {"error_count": 1})
 
-        # Create temp workspace and apply patch
+        # Apply patch to an in-memory overlay of the repo (real files plus patched ones)
+        # Only files declared in files_modified are visible to the patch.
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                temp_docs = temp_path / "docs"
-                temp_docs.mkdir()
+            overlay = OverlayFS(self.docs_dir.parent)
+            declared = {path for fm in files_modified if (path := fm.get("path"))}
+            try:
+                apply_unified_diff(proposed_diffs, overlay, allowed_paths=declared)
+            except PatchApplyError as e:
+                findings.append(
+                    Finding(
+                        severity="ERROR",
+                        category="PATCH_APPLICATION",
+                        message=f"Patch apply failed: {e}",
+                        location="proposed_diffs",
+                    )
+                )
+            else:
+                findings.append(Finding("INFO", "PATCH_APPLICATION", "Patch applied successfully"))
 
-                # Copy current files to temp
+                # Compute after_sha256 for modified files
                 for fm in files_modified:
                     path = fm.get("path")
-                    if path and (self.docs_dir.parent / path).exists():
-                        src = self.docs_dir.parent / path
-                        dst = temp_path / path
-                        dst.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(src, dst)
-
-                # Apply patch
-                patch_file = temp_path / "changes.patch"
-                patch_file.write_text(proposed_diffs, encoding="utf-8")
-
-                # Attempt git apply with robustness flags
-                # --recount: Fix incorrect line counts in hunk headers (common LLM error)
-                # --ignore-space-change: Ignore whitespace differences in context
-                # --verbose: Get more detail on failure
-                cmd = [
-                    "git",
-                    "apply",
-                    "--recount",
-                    "--ignore-space-change",
-                    "--verbose",
-                    str(patch_file),
-                ]
-                res = subprocess.run(cmd, cwd=str(temp_path), capture_output=True, text=True)
-
-                if res.returncode != 0:
-                    findings.append(
-                        Finding(
-                            severity="ERROR",
-                            category="PATCH_APPLICATION",
-                            message=f"Git apply failed: {res.stderr}",
-                            location="proposed_diffs",
-                        )
-                    )
-                else:
-                    findings.append(
-                        Finding("INFO", "PATCH_APPLICATION", "Patch applied successfully")
-                    )
-
-                    # Compute after_sha256 for modified files
-                    for fm in files_modified:
-                        path = fm.get("path")
-                        target = temp_path / path
-                        if target.exists():
-                            import hashlib
+                    if path and overlay.is_file(Path(path)):
+                        fm["after_sha256"] = hashlib.sha256(
+                            overlay.read_bytes(Path(path))
+                        ).hexdigest()
 
-                            sha = hashlib.sha256(target.read_bytes()).hexdigest()
-                            fm["after_sha256"] = sha
-
-                    # Run verification on temp state
-                    # Create a new verifier pointing to temp docs
-                    # Note: we need to handle if docs root is different in temp
-                    temp_verifier = DocVerifier(docs_dir=temp_docs)
-
-                    # Run checks on temp verifier
-                    hygiene_findings = temp_verifier.check_index_hygiene()
-                    # Re-map findings locations from temp to original
-                    for f in hygiene_findings:
-                        f.location = f.location.replace(str(temp_docs), str(self.docs_dir))
-
-                    findings.extend(hygiene_findings)
+                # Run hygiene checks against the post-change overlay view
+                overlay_verifier = DocVerifier(docs_dir=self.docs_dir, fs=overlay)
+                findings.extend(overlay_verifier.check_index_hygiene())
 
         except Exception as e:
             findings.append(Finding("ERROR", "VERIFICATION_SYSTEM", f"Verifier exception: {e}"))
@@ -262,7 +230,7 @@ class DocVerifier:
         findings = []
         index_path = self.docs_dir / "INDEX.md"
 
-        if not index_path.exists():
+        if not self._exists(index_path):
             findings.append(
                 Finding(
                     severity="ERROR",
@@ -273,7 +241,7 @@ class DocVerifier:
             )
             return findings
 
-        content = index_path.read_text(encoding="utf-8")
+        content = self._read_text(index_path)
 
         # Check for Last Updated timestamp
         if "Last Updated" not in content and "last updated" not in content.lower():
@@ -317,7 +285,7 @@ class DocVerifier:
             if link_target.startswith("file://"):
                 # Absolute file link - check if exists
                 target_path = link_target.replace("file:///", "").replace("file://", "")
-                if not Path(target_path).exists():
+                if not self._exists(Path(target_path)):
                     findings.append(
                         Finding(
                             severity="WARNING",
@@ -332,7 +300,7 @@ class DocVerifier:
                 clean_target = link_target.split("#")[0]
                 if clean_target:
                     target_path = self.docs_dir / clean_target
-                    if not target_path.exists():
+                    if not self._exists(target_path):
                         findings.append(
                             Finding(
                                 severity="WARNING",
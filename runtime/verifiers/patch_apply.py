@@ -0,0 +1,486 @@
+"""
+Patch Apply
+===========
+
+Pure-Python unified diff application onto an in-memory overlay of the repo.
+
+The applier reproduces ``git apply --recount --ignore-space-change`` closely
+enough to predict whether git will accept an LLM-authored patch, without a
+temp workspace or subprocess:
+
+- Hunk line counts in ``@@`` headers are recounted from the body when it
+  ends at EOF, another ``@@`` or a ``diff`` line. As in git, ``---``/``+++``
+  lines count as body lines, so a traditional multi-file diff without
+  ``diff --git`` separators swallows the next file header and fails. When
+  the body ends in any other line (trailing prose), git falls back to the
+  header counts, and so does this module.
+- Context and removed lines match when equal after collapsing whitespace
+  runs (leading and trailing whitespace still count). Matched context keeps
+  the file's original text.
+- Each hunk is searched for outward from its header position; a hunk with
+  old start 0/1 must match at the top and one without trailing context must
+  match at the end. There is no context fuzz.
+- All files apply or none do.
+
+Usage:
+    overlay = OverlayFS(repo_root)
+    changed = apply_unified_diff(diff_text, overlay, allowed_paths={"docs/INDEX.md"})
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+DEV_NULL = "/dev/null"
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+# git's isspace(): space, tab, LF, CR
+_WS_RUN = re.compile(r"[ \t\n\r]+")
+_TIMESTAMP_SUFFIX = re.compile(r"\s+\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}.*$")
+
+
+class PatchApplyError(Exception):
+    """Raised when a patch is malformed or does not apply."""
+
+
+@dataclass
+class Hunk:
+    """One ``@@`` fragment: position from the header, body lines recounted."""
+
+    old_start: int
+    new_start: int
+    lines: List[Tuple[str, str]]  # (" " | "-" | "+", text including newline)
+    header_line: int
+
+    @property
+    def preimage(self) -> List[str]:
+        return [text for op, text in self.lines if op != "+"]
+
+    @property
+    def trailing(self) -> int:
+        count = 0
+        for op, _ in reversed(self.lines):
+            if op != " ":
+                break
+            count += 1
+        return count
+
+
+@dataclass
+class FilePatch:
+    """All hunks for one file, with creation/deletion flags."""
+
+    path: str
+    is_new: Optional[bool] = None  # None: unknown (traditional diff, decided at apply time)
+    is_delete: Optional[bool] = None
+    hunks: List[Hunk] = field(default_factory=list)
+
+
+def _split_lines(text: str) -> List[str]:
+    """Split on LF only, keeping line endings (str.splitlines also splits on \\f etc)."""
+    parts = text.split("\n")
+    lines = [p + "\n" for p in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def _fuzzy_equal(a: str, b: str) -> bool:
+    """git's fuzzy_matchlines: ignore line endings and changes in whitespace amount."""
+    a = a.rstrip("\r\n")
+    b = b.rstrip("\r\n")
+    if a == b:
+        return True
+    return _WS_RUN.sub(" ", a) == _WS_RUN.sub(" ", b)
+
+
+def _strip_name(raw: str, strip: int = 1) -> Optional[str]:
+    """Turn a ---/+++ operand into a repo-relative path (git apply -p1)."""
+    name = raw.rstrip("\n").rstrip("\r").split("\t", 1)[0]
+    name = _TIMESTAMP_SUFFIX.sub("", name).strip()
+    if len(name) >= 2 and name[0] == name[-1] == '"':
+        name = name[1:-1].encode("utf-8").decode("unicode_escape").encode("latin-1").decode("utf-8")
+    if name == DEV_NULL:
+        return DEV_NULL
+    parts = [p for p in name.split("/") if p]
+    if len(parts) <= strip:
+        return None
+    return "/".join(parts[strip:])
+
+
+def _recount(lines: List[str], start: int) -> Optional[Tuple[int, int]]:
+    """
+    Recount a fragment body the way ``git apply --recount`` does.
+
+    Returns None when the body ends in an unexpected line (anything but EOF,
+    another ``@@ `` or a ``diff `` line); git then keeps the header counts.
+    """
+    old = new = 0
+    for line in lines[start:]:
+        lead = line[:1]
+        if lead in (" ", "\n"):
+            old += 1
+            new += 1
+        elif lead == "-":
+            old += 1
+        elif lead == "+":
+            new += 1
+        elif lead == "\\":
+            continue
+        elif line.startswith(("@@ ", "diff ")):
+            break
+        else:
+            return None
+    return old, new
+
+
+def _parse_hunks(lines: List[str], i: int, file_patch: FilePatch) -> int:
+    """Parse consecutive ``@@`` fragments starting at lines[i]; return next index."""
+    while i < len(lines) and lines[i].startswith("@@ -"):
+        match = _HUNK_HEADER.match(lines[i])
+        if not match:
+            raise PatchApplyError(f"corrupt patch at line {i + 1}")
+        header_line = i + 1
+        counts = _recount(lines, i + 1)
+        if counts is None:
+            counts = (int(match.group(2) or 1), int(match.group(4) or 1))
+        old, new = counts
+        i += 1
+
+        body: List[Tuple[str, str]] = []
+        while old > 0 or new > 0:
+            if i >= len(lines) or not lines[i].endswith("\n"):
+                raise PatchApplyError(f"corrupt patch at line {i + 1}")
+            line = lines[i]
+            lead = line[:1]
+            if lead in (" ", "\n"):
+                body.append((" ", line[1:] if lead == " " else line))
+                old -= 1
+                new -= 1
+            elif lead == "-":
+                body.append(("-", line[1:]))
+                old -= 1
+            elif lead == "+":
+                body.append(("+", line[1:]))
+                new -= 1
+            elif lead == "\\":
+                _drop_newline(body)
+            else:
+                raise PatchApplyError(f"corrupt patch at line {i + 1}")
+            if old < 0 or new < 0:
+                raise PatchApplyError(f"corrupt patch at line {i + 1}")
+            i += 1
+        # A trailing "\ No newline at end of file" belongs to this fragment
+        if i < len(lines) and lines[i].startswith("\\ "):
+            _drop_newline(body)
+            i += 1
+
+        file_patch.hunks.append(
+            Hunk(
+                old_start=int(match.group(1)),
+                new_start=int(match.group(3)),
+                lines=body,
+                header_line=header_line,
+            )
+        )
+    return i
+
+
+def _drop_newline(body: List[Tuple[str, str]]) -> None:
+    """Apply a "\\ No newline at end of file" marker to the preceding line."""
+    if body:
+        op, text = body[-1]
+        body[-1] = (op, text[:-1] if text.endswith("\n") else text)
+
+
+def parse_unified_diff(diff_text: str) -> List[FilePatch]:
+    """
+    Parse git-style and traditional unified diffs, skipping surrounding prose.
+
+    Raises:
+        PatchApplyError: On a corrupt hunk, a headerless fragment, an
+            unresolvable file name, or when no patch is found at all.
+    """
+    lines = _split_lines(diff_text)
+    patches: List[FilePatch] = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if line.startswith("diff --git "):
+            is_new = is_delete = False
+            old_name = new_name = None
+            i += 1
+            while i < len(lines) and not lines[i].startswith(("@@ -", "diff --git ")):
+                ext = lines[i]
+                if ext.startswith("new file mode"):
+                    is_new = True
+                elif ext.startswith("deleted file mode"):
+                    is_delete = True
+                elif ext.startswith("--- "):
+                    old_name = _strip_name(ext[4:])
+                elif ext.startswith("+++ "):
+                    new_name = _strip_name(ext[4:])
+                elif not ext.startswith(
+                    ("index ", "old mode", "new mode", "similarity", "dissimilarity", "Binary")
+                ):
+                    break
+                i += 1
+            if old_name == DEV_NULL:
+                is_new = True
+            if new_name == DEV_NULL:
+                is_delete = True
+            if old_name is None and new_name is None:
+                # Mode-only or otherwise content-free header: nothing to apply
+                continue
+            path = old_name if is_delete else new_name
+            if not path or path == DEV_NULL:
+                raise PatchApplyError(f"unable to find filename in patch at line {i}")
+            file_patch = FilePatch(path=path, is_new=is_new, is_delete=is_delete)
+            i = _parse_hunks(lines, i, file_patch)
+            patches.append(file_patch)
+            continue
+
+        if (
+            line.startswith("--- ")
+            and i + 2 < len(lines)
+            and lines[i + 1].startswith("+++ ")
+            and lines[i + 2].startswith("@@ -")
+        ):
+            first = _strip_name(line[4:])
+            second = _strip_name(lines[i + 1][4:])
+            if first == DEV_NULL:
+                file_patch = FilePatch(path=second or "", is_new=True, is_delete=False)
+            elif second == DEV_NULL:
+                file_patch = FilePatch(path=first or "", is_new=False, is_delete=True)
+            else:
+                file_patch = FilePatch(path=second or first or "")
+            if not file_patch.path or file_patch.path == DEV_NULL:
+                raise PatchApplyError(f"unable to find filename in patch at line {i + 1}")
+            i = _parse_hunks(lines, i + 2, file_patch)
+            patches.append(file_patch)
+            continue
+
+        if line.startswith("@@ -"):
+            raise PatchApplyError(f"patch fragment without header at line {i + 1}: {line.rstrip()}")
+        i += 1
+
+    if not patches:
+        raise PatchApplyError("No valid patches in input")
+    for file_patch in patches:
+        _settle_new_delete(file_patch)
+    return patches
+
+
+def _settle_new_delete(file_patch: FilePatch) -> None:
+    """Apply git's consistency rules between header flags and hunk contents."""
+    old_lines = sum(1 for h in file_patch.hunks for op, _ in h.lines if op != "+")
+    new_lines = sum(1 for h in file_patch.hunks for op, _ in h.lines if op != "-")
+    multiple = len(file_patch.hunks) > 1
+    if file_patch.is_new is None and (old_lines or multiple):
+        file_patch.is_new = False
+    if file_patch.is_delete is None and (new_lines or multiple):
+        file_patch.is_delete = False
+    if file_patch.is_new and old_lines:
+        raise PatchApplyError(f"new file {file_patch.path} depends on old contents")
+    if file_patch.is_delete and new_lines:
+        raise PatchApplyError(f"deleted file {file_patch.path} still has contents")
+
+
+def _find_position(image: List[str], hunk: Hunk, preimage: List[str]) -> int:
+    """Search outward from the header position (git find_pos); -1 if no match."""
+    match_beginning = hunk.old_start <= 1
+    match_end = hunk.trailing == 0
+    size = len(preimage)
+
+    if match_beginning:
+        start = 0
+    elif match_end:
+        start = len(image) - size
+    else:
+        start = hunk.new_start - 1 if hunk.new_start else 0
+    start = min(max(start, 0), len(image))
+
+    def matches(pos: int) -> bool:
+        if pos + size > len(image):
+            return False
+        if match_end and pos + size != len(image):
+            return False
+        if match_beginning and pos != 0:
+            return False
+        return all(_fuzzy_equal(image[pos + k], preimage[k]) for k in range(size))
+
+    backwards = forwards = start
+    candidate = start
+    step = 0
+    while True:
+        if matches(candidate):
+            return candidate
+        while True:
+            if backwards == 0 and forwards == len(image):
+                return -1
+            if step & 1:
+                if backwards == 0:
+                    step += 1
+                    continue
+                backwards -= 1
+                candidate = backwards
+            else:
+                if forwards == len(image):
+                    step += 1
+                    continue
+                forwards += 1
+                candidate = forwards
+            break
+        step += 1
+
+
+def _apply_hunks(path: str, image: List[str], hunks: List[Hunk]) -> List[str]:
+    for hunk in hunks:
+        preimage = hunk.preimage
+        pos = _find_position(image, hunk, preimage)
+        if pos < 0:
+            raise PatchApplyError(f"patch failed: {path}:{hunk.old_start}")
+        # Matched context keeps the file's text; only '+' lines come from the patch
+        postimage: List[str] = []
+        k = pos
+        for op, text in hunk.lines:
+            if op == " ":
+                postimage.append(image[k])
+                k += 1
+            elif op == "-":
+                k += 1
+            else:
+                postimage.append(text)
+        image = image[:pos] + postimage + image[pos + len(preimage) :]
+    return image
+
+
+class OverlayFS:
+    """
+    Read-through view of a directory tree with in-memory file replacements.
+
+    Overlay entries map repo-relative POSIX paths to new bytes, or None for a
+    deleted file. Everything else is read from disk under ``root``.
+    """
+
+    def __init__(self, root: Path, files: Optional[Dict[str, Optional[bytes]]] = None):
+        self.root = Path(root)
+        self._root_prefix = os.path.join(os.path.normpath(os.fspath(root)), "")
+        self.files: Dict[str, Optional[bytes]] = {}
+        self._dirs: Set[str] = set()
+        for rel, data in (files or {}).items():
+            self.write_bytes(rel, data)
+
+    # String path handling: hygiene checks probe dozens of links per call,
+    # and pathlib construction would dominate the cost.
+    def _rel(self, path: Union[str, Path]) -> Tuple[Optional[str], str]:
+        """Return (repo-relative key or None if outside root, absolute disk path)."""
+        raw = os.path.normpath(os.fspath(path))
+        if not os.path.isabs(raw):
+            return raw.replace(os.sep, "/"), os.path.join(self._root_prefix, raw)
+        if raw.startswith(self._root_prefix):
+            return raw[len(self._root_prefix) :].replace(os.sep, "/"), raw
+        return None, raw
+
+    def is_file(self, path: Union[str, Path]) -> bool:
+        rel, disk = self._rel(path)
+        if rel is not None and rel in self.files:
+            return self.files[rel] is not None
+        return os.path.isfile(disk)
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        rel, disk = self._rel(path)
+        if rel is not None:
+            if rel in self.files:
+                return self.files[rel] is not None
+            if rel in self._dirs:
+                return True
+        return os.path.exists(disk)
+
+    def read_bytes(self, path: Union[str, Path]) -> bytes:
+        rel, disk = self._rel(path)
+        if rel is not None and rel in self.files:
+            data = self.files[rel]
+            if data is None:
+                raise FileNotFoundError(path)
+            return data
+        with open(disk, "rb") as handle:
+            return handle.read()
+
+    def read_text(self, path: Union[str, Path], encoding: str = "utf-8") -> str:
+        return self.read_bytes(path).decode(encoding)
+
+    def write_bytes(self, rel: str, data: Optional[bytes]) -> None:
+        self.files[rel] = data
+        if data is not None:
+            parent = rel.rpartition("/")[0]
+            while parent:
+                self._dirs.add(parent)
+                parent = parent.rpartition("/")[0]
+
+
+def _safe_relpath(path: str) -> bool:
+    parts = path.split("/")
+    return bool(path) and not path.startswith("/") and ".." not in parts and "" not in parts
+
+
+def apply_unified_diff(
+    diff_text: str,
+    overlay: OverlayFS,
+    allowed_paths: Optional[Iterable[str]] = None,
+) -> Dict[str, Optional[bytes]]:
+    """
+    Apply a unified diff to an overlay, atomically.
+
+    Args:
+        diff_text: Patch text (may contain surrounding prose).
+        overlay: Overlay to update on success.
+        allowed_paths: If given, only these repo-relative paths are visible to
+            the patch; anything else behaves as a missing file.
+
+    Returns:
+        Mapping of changed repo-relative path -> new bytes (None if deleted).
+
+    Raises:
+        PatchApplyError: If the patch is malformed or any hunk fails.
+    """
+    allowed = set(allowed_paths) if allowed_paths is not None else None
+
+    def current(path: str) -> Optional[bytes]:
+        if allowed is not None and path not in allowed:
+            return None
+        if not overlay.is_file(path):
+            return None
+        return overlay.read_bytes(path)
+
+    results: Dict[str, Optional[bytes]] = {}
+    for file_patch in parse_unified_diff(diff_text):
+        path = file_patch.path
+        if not _safe_relpath(path):
+            raise PatchApplyError(f"invalid path '{path}'")
+
+        data = results[path] if path in results else current(path)
+        if data is None:
+            if file_patch.is_new is False:
+                raise PatchApplyError(f"{path}: No such file or directory")
+            image: List[str] = []
+        else:
+            if file_patch.is_new:
+                raise PatchApplyError(f"{path}: already exists in working directory")
+            image = _split_lines(data.decode("utf-8", errors="surrogateescape"))
+
+        image = _apply_hunks(path, image, file_patch.hunks)
+        content = "".join(image)
+        if file_patch.is_delete:
+            if content:
+                raise PatchApplyError(f"removal patch leaves file contents: {path}")
+            results[path] = None
+        else:
+            results[path] = content.encode("utf-8", errors="surrogateescape")
+
+    for path, data in results.items():
+        overlay.write_bytes(path, data)
+    return results
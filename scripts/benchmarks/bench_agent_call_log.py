@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Agent call log benchmark: persistent logging throughput and indexed usage queries.
+
+Logs --calls agent calls (default 1M) through a persistent AgentCallLogger
+whose clock is replaced by a synthetic one spreading the calls evenly over
+a year, across a handful of roles and models. Reports log_call throughput
+(entries queued, then flushed by the group-committing background thread),
+the time to reopen the store (chain tip recovery), and usage totals for a
+day, a month and the whole year from the index versus a full scan of the
+segments, checking that both give the same numbers.
+
+Usage:
+    python scripts/benchmarks/bench_agent_call_log.py --calls 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import runtime.agents.logging as call_logging  # noqa: E402
+from runtime.agents.call_log_store import CallLogStore  # noqa: E402
+from runtime.agents.logging import AgentCallLogger  # noqa: E402
+
+ROLES = ["designer", "builder", "reviewer_architect", "reviewer_security", "steward", "council"]
+MODELS = ["anthropic/claude-sonnet-4", "openai/gpt-5", "minimax-m2.1-free", "zen/glm-4.6"]
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+YEAR = timedelta(days=365)
+
+
+class _SyntheticClock:
+    """Stands in for datetime in runtime.agents.logging: now() advances per call."""
+
+    def __init__(self, step: timedelta):
+        self.current = START
+        self.step = step
+
+    def now(self, tz=None):
+        self.current += self.step
+        return self.current
+
+
+def _store(logger: AgentCallLogger) -> CallLogStore:
+    assert logger.store is not None, "benchmark loggers are persistent"
+    return logger.store
+
+
+def _scan_usage(logger: AgentCallLogger, since: datetime, until: datetime) -> dict:
+    totals: dict = {}
+    for record in _store(logger).iter_records():
+        ts = datetime.fromisoformat(record["timestamp"])
+        if since <= ts < until:
+            row = totals.setdefault((record["role"], record["model_used"]), [0, 0, 0])
+            row[0] += 1
+            row[1] += record["input_tokens"]
+            row[2] += record["output_tokens"]
+    return totals
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, round(time.perf_counter() - start, 4)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    parser.add_argument("--verify", action="store_true", help="also time a full chain verify")
+    args = parser.parse_args()
+
+    report: dict = {"calls": args.calls}
+    with tempfile.TemporaryDirectory() as tmp:
+        clock = _SyntheticClock(YEAR / args.calls)
+        logger = AgentCallLogger(tmp, persist=True, queue_size=args.queue_size)
+        with mock.patch.object(call_logging, "datetime", clock):
+            start = time.perf_counter()
+            for i in range(args.calls):
+                logger.log_call(
+                    call_id_deterministic=f"sha256:{i:064x}",
+                    call_id_audit=f"audit-{i}",
+                    role=ROLES[i % len(ROLES)],
+                    model_requested="auto",
+                    model_used=MODELS[(i // 7) % len(MODELS)],
+                    model_version="v1",
+                    input_packet_hash="sha256:input",
+                    prompt_hash="sha256:prompt",
+                    input_tokens=1000 + i % 3000,
+                    output_tokens=200 + i % 800,
+                    latency_ms=500 + i % 9000,
+                    output_packet_hash="sha256:output",
+                    status="success",
+                    run_id=f"run-{i // 1000}",
+                )
+            queued = time.perf_counter() - start
+            logger.close()
+            total = time.perf_counter() - start
+        store = _store(logger)
+        report["log"] = {
+            "queued_s": round(queued, 3),
+            "flushed_s": round(total, 3),
+            "calls_per_s": round(args.calls / total),
+            "segments": len(store.segments()),
+            "segment_bytes": sum(p.stat().st_size for p in store.segments()),
+            "index_bytes": store.index_path.stat().st_size,
+        }
+
+        reopened, report["reopen_s"] = _timed(AgentCallLogger, tmp, True)
+        assert reopened.prev_hash == logger.prev_hash
+
+        mid = START + YEAR / 2
+        ranges = {
+            "day": (mid, mid + timedelta(days=1)),
+            "month": (mid, mid + timedelta(days=30)),
+            "year": (START, START + YEAR + timedelta(days=1)),
+        }
+        for name, (since, until) in ranges.items():
+            indexed, indexed_s = _timed(_store(reopened).usage, since, until)
+            scanned, scanned_s = _timed(_scan_usage, reopened, since, until)
+            got = {
+                (r["role"], r["model"]): [r["calls"], r["input_tokens"], r["output_tokens"]]
+                for r in indexed
+            }
+            assert got == scanned, name
+            report[f"usage_{name}"] = {
+                "calls": sum(row[0] for row in scanned.values()),
+                "index_ms": round(indexed_s * 1000, 3),
+                "scan_s": scanned_s,
+            }
+
+        if args.verify:
+            (valid, _), report["verify_s"] = _timed(reopened.verify_chain)
+            assert valid
+        _store(reopened).close()
+        store.close()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
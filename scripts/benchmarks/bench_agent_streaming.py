@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Agent streaming benchmark: time to first decision on a council seat response.
+
+Serves the recorded seat responses from runtime/tests/fixtures/agent_streams
+through a local stub server that paces the stream at --chunk-ms per SSE
+event (about one event per model token batch). Times OpenCodeClient.call
+without streaming (the stub answers with the whole JSON body once the
+equivalent stream would have finished) against the streamed call with the
+seat envelope detector, which stops reading once the required fields have
+parsed ("complete") or one of them is invalid ("invalid").
+
+Usage:
+    python scripts/benchmarks/bench_agent_streaming.py --chunk-ms 20 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.agents.opencode_client import LLMCall, OpenCodeClient  # noqa: E402
+from runtime.agents.streaming import iter_sse_events  # noqa: E402
+from runtime.orchestration.council.seat_output_parser import seat_envelope_detector  # noqa: E402
+
+RECORDINGS = REPO_ROOT / "runtime" / "tests" / "fixtures" / "agent_streams"
+MODEL = "openrouter/anthropic/claude-sonnet-4"
+
+
+def _events(recording: bytes) -> list[bytes]:
+    return [event + b"\n\n" for event in recording.split(b"\n\n")[:-1]]
+
+
+def _whole_body(recording: bytes) -> bytes:
+    """The non-streamed chat completion equivalent to a recorded stream."""
+    text, usage = [], {}
+    for _, data in iter_sse_events(recording.splitlines()):
+        if data == "[DONE]":
+            continue
+        chunk = json.loads(data)
+        usage.update(chunk.get("usage") or {})
+        text.extend((c.get("delta") or {}).get("content") or "" for c in chunk["choices"])
+    message = {"role": "assistant", "content": "".join(text)}
+    return json.dumps(
+        {"model": MODEL.split("/", 1)[1], "choices": [{"message": message}], "usage": usage}
+    ).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        events = _events(self.server.recording)
+        self.close_connection = True
+        try:
+            if not payload.get("stream"):
+                time.sleep(len(events) * self.server.delay)
+                body = _whole_body(self.server.recording)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for event in events:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+                self.wfile.flush()
+                time.sleep(self.server.delay)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _timed_plain(client: OpenCodeClient) -> float:
+    start = time.perf_counter()
+    client.call(LLMCall(prompt="review", model=MODEL))
+    return time.perf_counter() - start
+
+
+def _timed_stream(client: OpenCodeClient) -> dict:
+    detector = seat_envelope_detector()
+    marks: dict = {}
+    start = time.perf_counter()
+
+    def on_delta(delta: str):
+        marks.setdefault("first_delta", time.perf_counter() - start)
+        decision = detector.feed(delta)
+        if decision:
+            marks["decision"] = time.perf_counter() - start
+        return decision
+
+    response = client.call(LLMCall(prompt="review", model=MODEL), on_delta=on_delta)
+    decision = detector.finish()
+    return {
+        "first_delta_s": marks["first_delta"],
+        "decision_s": marks.get("decision", time.perf_counter() - start),
+        "status": decision.status,
+        "chars_read": len(response.content),
+    }
+
+
+def _summary(samples: list[float]) -> float:
+    return round(statistics.median(samples), 4)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chunk-ms", type=float, default=20.0, help="delay per SSE event")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.delay = args.chunk_ms / 1000
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}/openrouter/v1"
+
+    report: dict = {"chunk_ms": args.chunk_ms, "runs": args.runs}
+    with mock.patch.object(OpenCodeClient, "_load_api_key_for_role", return_value="bench"):
+        client = OpenCodeClient(upstream_base_url=base, log_calls=False)
+        for name in ("openrouter_seat.sse", "openrouter_seat_invalid.sse"):
+            server.recording = (RECORDINGS / name).read_bytes()
+            plain = [_timed_plain(client) for _ in range(args.runs)]
+            streamed = [_timed_stream(client) for _ in range(args.runs)]
+            report[name.removesuffix(".sse")] = {
+                "events": len(_events(server.recording)),
+                "response_chars": len(
+                    json.loads(_whole_body(server.recording))["choices"][0]["message"]["content"]
+                ),
+                "blocking_call_s": _summary(plain),
+                "stream_first_delta_s": _summary([s["first_delta_s"] for s in streamed]),
+                "stream_decision_s": _summary([s["decision_s"] for s in streamed]),
+                "stream_chars_read": streamed[-1]["chars_read"],
+                "decision": streamed[-1]["status"],
+            }
+
+    server.shutdown()
+    server.server_close()
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
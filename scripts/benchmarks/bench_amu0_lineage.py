@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+AMU0 lineage benchmark: whole-file JSON rewrite vs append-only segment log.
+
+Appends N entries (default 100k) to AMU0Lineage and reports append
+throughput, reopen time, full and incremental verify_chain time and
+indexed get_entry_by_id latency. The legacy layout (one JSON document
+rewritten through atomic_write_json on every append) is O(n) per append,
+so it is measured at --legacy-entries and its per-append cost at N is
+extrapolated linearly from the last tenth of that run.
+
+Usage:
+    python scripts/benchmarks/bench_amu0_lineage.py --entries 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.amu0.lineage import AMU0Lineage, compute_entry_hash  # noqa: E402
+from runtime.util.atomic_write import atomic_write_json  # noqa: E402
+
+TIMESTAMP = "2026-01-01T00:00:00Z"
+ATTESTATION = {"attestor": "bench", "decision": "approved"}
+
+
+def _entry_args(i: int) -> tuple:
+    return (f"E{i:07d}", TIMESTAMP, f"{i:064x}", ATTESTATION, {"step": i})
+
+
+def _bench_legacy(path: Path, entries: int) -> dict:
+    """Previous layout: every append re-serialises the whole chain."""
+    chain: list = []
+    parent = None
+    times = []
+    for i in range(entries):
+        entry_id, timestamp, artefact_hash, attestation, delta = _entry_args(i)
+        start = time.perf_counter()
+        data = {
+            "entry_id": entry_id,
+            "timestamp": timestamp,
+            "artefact_hash": artefact_hash,
+            "attestation": attestation,
+            "state_delta": delta,
+        }
+        parent = compute_entry_hash(data, parent)
+        chain.append({**data, "entry_hash": parent})
+        atomic_write_json(str(path), {"version": "1.0", "entries": chain})
+        times.append(time.perf_counter() - start)
+    tail = times[-max(1, entries // 10) :]
+    return {
+        "entries": entries,
+        "elapsed_s": sum(times),
+        "tail_append_ms": sum(tail) / len(tail) * 1000,
+    }
+
+
+def _bench_log(path: Path, entries: int, fsync_sample: int, lookups: int) -> dict:
+    lineage = AMU0Lineage(str(path))
+    start = time.perf_counter()
+    for i in range(entries):
+        lineage.append_entry(*_entry_args(i), fsync=False)
+    append_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(entries, entries + fsync_sample):
+        lineage.append_entry(*_entry_args(i))
+    fsync_ms = (time.perf_counter() - start) / max(1, fsync_sample) * 1000
+
+    start = time.perf_counter()
+    lineage = AMU0Lineage(str(path))
+    reopen_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    valid, _ = lineage.verify_chain(full=True)
+    full_verify_s = time.perf_counter() - start
+
+    lineage.append_entry(*_entry_args(entries + fsync_sample), fsync=False)
+    start = time.perf_counter()
+    incremental_valid, _ = lineage.verify_chain()
+    incremental_verify_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(7)
+    ids = [_entry_args(rng.randrange(entries))[0] for _ in range(lookups)]
+    start = time.perf_counter()
+    found = sum(lineage.get_entry_by_id(entry_id) is not None for entry_id in ids)
+    lookup_us = (time.perf_counter() - start) / max(1, lookups) * 1e6
+
+    return {
+        "entries": len(lineage),
+        "append_per_s": round(entries / append_s, 1),
+        "append_fsync_ms": round(fsync_ms, 3),
+        "reopen_s": round(reopen_s, 3),
+        "verify_full_s": round(full_verify_s, 3),
+        "verify_incremental_ms": round(incremental_verify_ms, 3),
+        "lookup_us": round(lookup_us, 2),
+        "valid": valid and incremental_valid and found == lookups,
+        "log_bytes": path.stat().st_size,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--legacy-entries", type=int, default=1_000)
+    parser.add_argument("--fsync-sample", type=int, default=200, help="fsync'd appends timed")
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+
+    report: dict = {"entries": args.entries}
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = _bench_legacy(Path(tmp) / "legacy.json", args.legacy_entries)
+        scale = args.entries / args.legacy_entries
+        report["legacy"] = {
+            "entries": legacy["entries"],
+            "elapsed_s": round(legacy["elapsed_s"], 3),
+            "tail_append_ms": round(legacy["tail_append_ms"], 3),
+            "extrapolated_append_ms_at_n": round(legacy["tail_append_ms"] * scale, 1),
+        }
+        report["segment_log"] = _bench_log(
+            Path(tmp) / "lineage.json", args.entries, args.fsync_sample, args.lookups
+        )
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+AMU0 baseline benchmark: copy-and-hash snapshots vs the content-addressed store.
+
+Builds a tree of N files (default 20k), captures a baseline, rewrites a
+share of the files (default 1%) and captures again, then verifies the
+second baseline. The "copy" variant is the previous AMU0Manager
+behaviour (shutil.copy2 per file, whole-file reads, sequential verify);
+the "store" variant is AMU0Manager with its object store, where the
+second capture only hashes the churned files and verify hashes in
+parallel. Also times a fail-fast verify of a baseline with one corrupt
+file.
+
+Usage:
+    python scripts/benchmarks/bench_amu0_store.py --files 20000 --churn 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.state.amu0 import AMU0Manager  # noqa: E402
+
+TIMESTAMP = "2026-01-01T00:00:00Z"
+OLD_MTIME_NS = 1_700_000_000 * 10**9
+
+
+def _build_tree(root: Path, files: int, size: int, rng: random.Random) -> list[Path]:
+    paths = []
+    for i in range(files):
+        path = root / f"d{i % 100:02d}" / f"f{i:06d}.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(rng.randbytes(size))
+        os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+        paths.append(path)
+    return paths
+
+
+def _churn(paths: list[Path], share: float, rng: random.Random) -> int:
+    changed = rng.sample(paths, max(1, int(len(paths) * share)))
+    for path in changed:
+        path.write_bytes(rng.randbytes(path.stat().st_size))
+        os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+    return len(changed)
+
+
+def _copy_capture(state: Path, name: str, paths: list[Path]) -> list[dict]:
+    """Previous layout: copy every file, then read it back whole to hash it."""
+    files_dir = state / name / "files"
+    files_dir.mkdir(parents=True)
+    manifest = []
+    for path in paths:
+        dest = files_dir / path.name
+        shutil.copy2(path, dest)
+        manifest.append(
+            {"path": path.name, "sha256": hashlib.sha256(dest.read_bytes()).hexdigest()}
+        )
+    return manifest
+
+
+def _copy_verify(state: Path, name: str, manifest: list[dict]) -> bool:
+    files_dir = state / name / "files"
+    return all(
+        hashlib.sha256((files_dir / e["path"]).read_bytes()).hexdigest() == e["sha256"]
+        for e in manifest
+    )
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, round(time.perf_counter() - start, 3)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--size", type=int, default=8192, help="bytes per file")
+    parser.add_argument("--churn", type=float, default=0.01, help="share of files rewritten")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report: dict = {"files": args.files, "size": args.size}
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "src"
+        paths = _build_tree(src, args.files, args.size, rng)
+
+        copy_state = Path(tmp) / "copy_state"
+        _, first = _timed(_copy_capture, copy_state, "ONE", paths)
+        store_mgr = AMU0Manager(str(Path(tmp) / "store_state"))
+        _, store_first = _timed(store_mgr.create_amu0_baseline, "ONE", [str(src)], TIMESTAMP)
+
+        report["churned"] = _churn(paths, args.churn, rng)
+        manifest, second = _timed(_copy_capture, copy_state, "TWO", paths)
+        copy_ok, copy_verify = _timed(_copy_verify, copy_state, "TWO", manifest)
+
+        hashed_before = store_mgr.store.stats["hashed"]
+        baseline, store_second = _timed(
+            store_mgr.create_amu0_baseline, "TWO", [str(src)], TIMESTAMP
+        )
+        hashed = store_mgr.store.stats["hashed"] - hashed_before
+        store_ok, store_verify = _timed(store_mgr.verify_baseline, "TWO")
+
+        # Corrupt one file (a private copy, so other baselines keep theirs)
+        victim = Path(baseline) / "files" / paths[len(paths) // 2].name
+        data = victim.read_bytes()
+        victim.unlink()
+        victim.write_bytes(data[:-1] + b"\x00")
+        bad_fast, fail_fast = _timed(store_mgr.verify_baseline, "TWO", True)
+        bad_full, fail_full = _timed(store_mgr.verify_baseline, "TWO", False)
+
+        report["copy"] = {
+            "capture_first_s": first,
+            "capture_churned_s": second,
+            "verify_s": copy_verify,
+            "valid": copy_ok,
+        }
+        report["store"] = {
+            "capture_first_s": store_first,
+            "capture_churned_s": store_second,
+            "hashed_on_churned_capture": hashed,
+            "verify_s": store_verify,
+            "verify_corrupt_fail_fast_s": fail_fast,
+            "verify_corrupt_full_s": fail_full,
+            "valid": store_ok and not bad_fast and not bad_full,
+            "workers": store_mgr.store.workers,
+        }
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Budget charging benchmark: per-charge BEGIN IMMEDIATE vs escrow leases.
+
+Starts N worker processes against one WAL-mode project_builder database.
+Each worker makes M small charges, either with try_charge_budget (one write
+transaction per charge) or through BudgetEscrow (one transaction per
+reserved slice). Reports charges/second over the slowest worker's charging
+loop and verifies that
+spent_cost_usd equals the accepted charges and never exceeds max_cost_usd.
+
+Usage:
+    python scripts/benchmarks/bench_budget_escrow.py --workers 8 --charges 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from project_builder.database.migrations import apply_schema  # noqa: E402
+
+_WORKER = """
+import sqlite3, sys, time
+from project_builder.orchestrator.budget_txn import BudgetEscrow, try_charge_budget
+
+db_path, mode, charges, cost, slice_usd = sys.argv[1:6]
+charges, cost, slice_usd = int(charges), float(cost), float(slice_usd)
+conn = sqlite3.connect(db_path, timeout=60.0)
+accepted = 0
+start = time.perf_counter()
+if mode == "per_charge":
+    for _ in range(charges):
+        accepted += try_charge_budget(conn, "m1", None, cost, False)
+else:
+    with BudgetEscrow(conn, "m1", None, False, slice_usd) as escrow:
+        for _ in range(charges):
+            accepted += escrow.charge(cost)
+print(accepted, time.perf_counter() - start)
+"""
+
+
+def _run(
+    tmp: str, mode: str, workers: int, charges: int, cost: float, slice_usd: float, max_cost: float
+) -> dict:
+    db_path = str(Path(tmp) / f"{mode}.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    apply_schema(conn)
+    conn.execute(
+        "INSERT INTO missions (id, status, description, max_cost_usd, max_loops, created_at,"
+        " updated_at) VALUES ('m1', 'executing', 'bench', ?, 1, 'now', 'now')",
+        (max_cost,),
+    )
+    conn.commit()
+
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    argv = [sys.executable, "-c", _WORKER, db_path, mode, str(charges), str(cost), str(slice_usd)]
+    procs = [
+        subprocess.Popen(argv, stdout=subprocess.PIPE, text=True, env=env) for _ in range(workers)
+    ]
+    results = [p.communicate()[0].split() for p in procs]
+    accepted = sum(int(r[0]) for r in results)
+    # Slowest worker's charging loop (excludes interpreter startup)
+    elapsed = max(float(r[1]) for r in results)
+
+    spent, cap = conn.execute(
+        "SELECT spent_cost_usd, max_cost_usd FROM missions WHERE id = 'm1'"
+    ).fetchone()
+    leases = conn.execute("SELECT COUNT(*) FROM budget_leases").fetchone()[0]
+    conn.close()
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "charges_per_s": round(workers * charges / elapsed, 1),
+        "accepted": accepted,
+        "spent_usd": spent,
+        "within_cap": spent <= cap,
+        "matches_accepted": spent == accepted * cost,
+        "lease_transactions": leases,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--charges", type=int, default=500, help="charges per worker")
+    parser.add_argument("--cost", type=float, default=0.0078125, help="USD per charge")
+    parser.add_argument("--slice", type=float, default=0.25, help="escrow slice USD")
+    parser.add_argument(
+        "--max-cost", type=float, default=None, help="mission cap (default: 80%% of demand)"
+    )
+    args = parser.parse_args()
+
+    max_cost = args.max_cost
+    if max_cost is None:
+        max_cost = args.workers * args.charges * args.cost * 0.8
+    report: dict = {"workers": args.workers, "charges": args.charges, "max_cost_usd": max_cost}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("per_charge", "escrow"):
+            report[mode] = _run(
+                tmp, mode, args.workers, args.charges, args.cost, args.slice, max_cost
+            )
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
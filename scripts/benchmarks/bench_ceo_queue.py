@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Reader/writer contention benchmark for CEOQueue.
+
+Spawns W writer processes (add_escalation then approve, so the pending set
+stays small and reader cost reflects lock contention rather than result size)
+and R reader processes (get_pending + get_by_id, as the COO context builder
+and CLI do) against one database for a fixed duration, in two configurations:
+
+    legacy   connect-per-call, rollback journal, default 5s busy wait
+             (reimplemented here to reproduce the previous behaviour)
+    pooled   CEOQueue: per-thread WAL connections with busy_timeout
+
+Reports throughput, p50/p95 latency and "database is locked" errors.
+
+Usage:
+    python scripts/benchmarks/bench_ceo_queue.py --writers 2 --readers 4 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.orchestration.ceo_queue import (  # noqa: E402
+    CEOQueue,
+    EscalationEntry,
+    EscalationType,
+)
+
+
+class _LegacyQueue:
+    """The previous access pattern: a fresh rollback-journal connection per call."""
+
+    def __init__(self, db_path: Path):
+        self._db_path = db_path
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("PRAGMA journal_mode = DELETE")
+
+    def add(self, run_id: str) -> str:
+        with sqlite3.connect(self._db_path) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM escalations").fetchone()[0]
+        esc_id = f"ESC-{count + 1:04d}-{run_id}"
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute(
+                "INSERT INTO escalations VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, NULL)",
+                (esc_id, "ambiguous_task", "pending", "{}", run_id, time.time()),
+            )
+            conn.commit()
+        return esc_id
+
+    def approve(self, esc_id: str) -> None:
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute(
+                "UPDATE escalations SET status = 'approved' WHERE id = ?",
+                (esc_id,),
+            )
+            conn.commit()
+
+    def read(self) -> None:
+        with sqlite3.connect(self._db_path) as conn:
+            rows = conn.execute(
+                "SELECT * FROM escalations WHERE status = 'pending' ORDER BY created_at"
+            ).fetchall()
+        if rows:
+            with sqlite3.connect(self._db_path) as conn:
+                conn.execute("SELECT * FROM escalations WHERE id = ?", (rows[0][0],)).fetchone()
+
+
+def _worker(mode: str, role: str, db_path: str, seconds: float, idx: int, out: mp.Queue) -> None:
+    latencies: list[float] = []
+    locked = 0
+    path = Path(db_path)
+    queue = CEOQueue(path) if mode == "pooled" else None
+    legacy = _LegacyQueue(path) if mode == "legacy" else None
+    deadline = time.perf_counter() + seconds
+    n = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            if role == "writer":
+                run_id = f"w{idx}-{n}"
+                if queue is not None:
+                    esc_id = queue.add_escalation(
+                        EscalationEntry(
+                            type=EscalationType.AMBIGUOUS_TASK, context={}, run_id=run_id
+                        )
+                    )
+                    queue.approve(esc_id, "bench", "bench")
+                else:
+                    esc_id = legacy.add(run_id)
+                    legacy.approve(esc_id)
+            else:
+                if queue is not None:
+                    pending = queue.get_pending()
+                    if pending:
+                        queue.get_by_id(pending[0].id)
+                else:
+                    legacy.read()
+        except sqlite3.OperationalError as exc:
+            if "locked" not in str(exc):
+                raise
+            locked += 1
+            continue
+        except sqlite3.IntegrityError:
+            locked += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+        n += 1
+    out.put((role, latencies, locked))
+
+
+def _run(mode: str, writers: int, readers: int, seconds: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "escalations.db"
+        CEOQueue(db_path).close()
+        if mode == "legacy":
+            _LegacyQueue(db_path)
+        ctx = mp.get_context("fork" if sys.platform != "win32" else "spawn")
+        out: mp.Queue = ctx.Queue()
+        procs = [
+            ctx.Process(target=_worker, args=(mode, role, str(db_path), seconds, i, out))
+            for i, role in enumerate(["writer"] * writers + ["reader"] * readers)
+        ]
+        for proc in procs:
+            proc.start()
+        results = [out.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+
+    report: dict = {}
+    for role in ("writer", "reader"):
+        lat = sorted(x for r, lats, _ in results if r == role for x in lats)
+        errors = sum(locked for r, _, locked in results if r == role)
+        report[role] = {
+            "ops_per_s": round(len(lat) / seconds, 1),
+            "p50_ms": round(statistics.median(lat) * 1000, 3) if lat else None,
+            "p95_ms": round(lat[int(len(lat) * 0.95) - 1] * 1000, 3) if lat else None,
+            "lock_errors": errors,
+        }
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    report = {
+        "writers": args.writers,
+        "readers": args.readers,
+        "seconds": args.seconds,
+        "legacy": _run("legacy", args.writers, args.readers, args.seconds),
+        "pooled": _run("pooled", args.writers, args.readers, args.seconds),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Cold vs warm invocation latency for the lifeos CLI, per subcommand.
+
+For each subcommand this measures the median of N runs of:
+
+    cold         python -m runtime <cmd>                 (fresh interpreter)
+    warm_cli     LIFEOS_WARM_SOCKET=... python -m runtime <cmd>
+                 (fresh interpreter, lightweight client, forked server child)
+    warm_socket  runtime.cli_warm.forward(...) from an already-running client
+                 (what a tight agent loop pays per call)
+
+Usage:
+    python scripts/benchmarks/bench_cli_startup.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.cli import WARM_SOCKET_ENV  # noqa: E402
+from runtime.cli_warm import forward  # noqa: E402
+
+SUBCOMMANDS = (
+    ["--help"],
+    ["status"],
+    ["config", "show"],
+    ["mission", "list"],
+    ["queue", "list"],
+    ["dispatch", "status"],
+)
+
+
+def _median_ms(samples: list[float]) -> float:
+    return round(statistics.median(samples) * 1000, 1)
+
+
+def _run_cli(argv: list[str], env: dict) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "runtime", *argv],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return time.perf_counter() - start
+
+
+def _wait_for_socket(path: Path, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+            return
+        except OSError:
+            time.sleep(0.05)
+        finally:
+            probe.close()
+    raise RuntimeError("warm server did not start")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cold_env = dict(os.environ)
+    cold_env.pop(WARM_SOCKET_ENV, None)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        sock = Path(tmp) / "warm.sock"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "runtime", "serve", "--socket", str(sock)],
+            cwd=REPO_ROOT,
+            env=cold_env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for_socket(sock)
+            warm_env = dict(cold_env, **{WARM_SOCKET_ENV: str(sock)})
+            os.chdir(REPO_ROOT)
+            for argv in SUBCOMMANDS:
+                cold = [_run_cli(argv, cold_env) for _ in range(args.repeat)]
+                warm_cli = [_run_cli(argv, warm_env) for _ in range(args.repeat)]
+                warm_socket = []
+                for _ in range(args.repeat):
+                    sink = io.StringIO()
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                        forward(sock, argv)
+                    warm_socket.append(time.perf_counter() - start)
+                rows.append(
+                    {
+                        "subcommand": " ".join(argv),
+                        "cold_ms": _median_ms(cold),
+                        "warm_cli_ms": _median_ms(warm_cli),
+                        "warm_socket_ms": _median_ms(warm_socket),
+                    }
+                )
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print(json.dumps({"repeat": args.repeat, "results": rows}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Council convergence benchmark: ConvergenceMatrix vs. per-call token sets.
+
+Builds --seats lens outputs of about --output-kb KB each (a shared body of
+findings plus seat-specific text over a Zipf-like vocabulary), then runs
+--rounds council rounds in which --changed seats rewrite their output and
+the rest resubmit it unchanged. Times, per round, the previous
+compute_convergence (replicated inline: re-extract every seat's token set,
+then an O(k^2) loop of set intersections and unions) against one
+ConvergenceMatrix.update() plus result(), and checks both give identical
+scores and pairwise values.
+
+Usage:
+    python scripts/benchmarks/bench_convergence.py --seats 20 --output-kb 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.orchestration.council.convergence import (  # noqa: E402
+    ConvergenceMatrix,
+    _extract_tokens,
+    _jaccard_similarity,
+)
+
+VOCABULARY = [f"term{i}" for i in range(40_000)]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def _text(rng: random.Random, kb: int) -> str:
+    words = rng.choices(VOCABULARY, weights=WEIGHTS, k=kb * 1024 // 8)
+    return " ".join(words)
+
+
+def _output(rng: random.Random, shared: str, kb: int, round_no: int) -> dict:
+    return {
+        "verdict": rng.choice(["Accept", "Go with Fixes", "Reject"]),
+        "findings": [shared, _text(rng, kb // 2)],
+        "notes": f"round {round_no}",
+        "_meta": {"round": round_no},
+    }
+
+
+def _legacy(outputs: dict) -> tuple[float, dict[str, float]]:
+    """The previous compute_convergence: token sets rebuilt on every call."""
+    token_sets = {name: _extract_tokens(output) for name, output in outputs.items()}
+    names = sorted(token_sets)
+    pairwise, total = {}, 0.0
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            sim = _jaccard_similarity(token_sets[names[i]], token_sets[names[j]])
+            pairwise[f"{names[i]}|{names[j]}"] = round(sim, 4)
+            total += sim
+    return round(total / len(pairwise), 4), pairwise
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seats", type=int, default=20)
+    parser.add_argument("--output-kb", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--changed", type=int, default=3, help="seats rewritten per round")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    shared = _text(rng, args.output_kb // 2)
+    outputs = {f"Seat{i:02d}": _output(rng, shared, args.output_kb, 0) for i in range(args.seats)}
+    report: dict = {
+        "seats": args.seats,
+        "output_bytes_mean": round(statistics.mean(len(json.dumps(o)) for o in outputs.values())),
+        "changed_per_round": args.changed,
+    }
+
+    matrix = ConvergenceMatrix()
+    legacy_times, matrix_times = [], []
+    for round_no in range(args.rounds + 1):
+        if round_no:
+            for name in rng.sample(sorted(outputs), args.changed):
+                outputs[name] = _output(rng, shared, args.output_kb, round_no)
+
+        start = time.perf_counter()
+        score, pairwise = _legacy(outputs)
+        legacy_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        matrix.update(outputs)
+        result = matrix.result()
+        matrix_times.append(time.perf_counter() - start)
+
+        assert (result.score, result.pairwise) == (score, pairwise)
+
+    report["first_round_ms"] = {
+        "legacy": round(legacy_times[0] * 1000, 2),
+        "matrix": round(matrix_times[0] * 1000, 2),
+    }
+    report["later_round_ms"] = {
+        "legacy": round(statistics.mean(legacy_times[1:]) * 1000, 2),
+        "matrix": round(statistics.mean(matrix_times[1:]) * 1000, 2),
+    }
+    start = time.perf_counter()
+    matrix.update(outputs)
+    matrix.result()
+    report["unchanged_round_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    report["vocabulary"] = len(matrix._vocab)
+    report["tokenized_outputs"] = matrix.tokenized
+    report["score"] = result.score
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Transport benchmark for invoke_coo_reasoning across COO context sizes.
+
+Installs a local fake `openclaw` (echoes a task_proposal.v1 envelope, no
+model call) on PATH and times invocations with contexts from 1 KB to 1 MB
+over each transport:
+
+    argv     previous behaviour: whole message as one --message argument
+    stdin    --message - with the message streamed on stdin
+    auto     argv up to the argv limit, stdin above it (the default)
+
+argv entries report "E2BIG" where the kernel rejects the argument.
+
+Usage:
+    python scripts/benchmarks/bench_coo_invoke.py --iterations 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.orchestration.coo import invoke as invoke_mod  # noqa: E402
+
+_FAKE = """#!{python}
+import json, sys
+
+args = sys.argv[1:]
+message = args[args.index("--message") + 1]
+if message == "-":
+    message = sys.stdin.read()
+text = "schema_version: task_proposal.v1\\nbytes: %d\\n" % len(message)
+print(json.dumps({{"status": "ok", "result": {{"payloads": [{{"text": text}}]}}}}))
+"""
+
+_SIZES = {"1KB": 1024, "16KB": 16 * 1024, "128KB": 128 * 1024, "1MB": 1024 * 1024}
+
+
+def _time(transport: str, context: dict, iterations: int) -> dict | str:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        try:
+            invoke_mod.invoke_coo_reasoning(
+                context, "propose", None, transport=transport, _retry_delays=()
+            )
+        except OSError as exc:
+            return "E2BIG" if exc.errno == 7 else f"error: {exc}"
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples) * 1000, 2),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)] * 1000, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    report: dict = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        fake = Path(tmp) / "openclaw"
+        fake.write_text(_FAKE.format(python=sys.executable), encoding="utf-8")
+        fake.chmod(0o755)
+        os.environ["PATH"] = f"{tmp}{os.pathsep}{os.environ['PATH']}"
+        for label, size in _SIZES.items():
+            context = {"backlog": "x" * size}
+            report[label] = {
+                transport: _time(transport, context, args.iterations)
+                for transport in ("argv", "stdin", "auto")
+            }
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for DocVerifier.verify_with_proposed_changes.
+
+Verifies the same proposal against the repo's real docs/ tree two ways:
+
+    git_tempdir   previous behaviour: TemporaryDirectory, copy touched files,
+                  write the patch, `git apply --recount --ignore-space-change`,
+                  rehash, and a second DocVerifier over the temp docs tree
+                  (reimplemented here for comparison)
+    overlay       current behaviour: in-process applier + in-memory overlay
+
+The proposal edits docs/INDEX.md (two hunks with deliberately wrong line
+counts) and optionally N additional docs files.
+
+Usage:
+    python scripts/benchmarks/bench_doc_verifier.py --iterations 50 --extra-files 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.verifiers.doc_verifier import DocVerifier  # noqa: E402
+
+
+def _file_diff(rel: str, before: str, after: str) -> str:
+    lines = difflib.unified_diff(
+        before.splitlines(keepends=True),
+        after.splitlines(keepends=True),
+        fromfile=f"a/{rel}",
+        tofile=f"b/{rel}",
+        n=3,
+    )
+    return f"diff --git a/{rel} b/{rel}\n" + "".join(lines)
+
+
+def _build_proposal(extra_files: int) -> tuple[list[dict], str]:
+    files = [{"path": "docs/INDEX.md"}]
+    index = (REPO_ROOT / "docs" / "INDEX.md").read_text(encoding="utf-8")
+    lines = index.splitlines(keepends=True)
+    edited = list(lines)
+    edited.insert(10, "<!-- benchmark edit -->\n")
+    edited.insert(len(edited) - 5, "<!-- benchmark tail edit -->\n")
+    diffs = [_file_diff("docs/INDEX.md", index, "".join(edited))]
+
+    candidates = sorted(
+        p
+        for p in (REPO_ROOT / "docs").glob("0[2-9]_*/**/*.md")
+        if p.is_file() and p.stat().st_size > 200
+    )
+    for path in candidates[:extra_files]:
+        rel = path.relative_to(REPO_ROOT).as_posix()
+        text = path.read_text(encoding="utf-8")
+        files.append({"path": rel})
+        diffs.append(_file_diff(rel, text, text + "\nBenchmark footer.\n"))
+
+    # LLM-style damage: hunk counts that do not match the body
+    patch = "".join(diffs).replace("@@ -1,", "@@ -1,9").replace(" +1,", " +1,9")
+    return files, patch
+
+
+def _legacy_verify(docs_dir: Path, files: list[dict], patch: str) -> bool:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        (temp_path / "docs").mkdir()
+        for fm in files:
+            src = docs_dir.parent / fm["path"]
+            if src.exists():
+                dst = temp_path / fm["path"]
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(src, dst)
+        patch_file = temp_path / "changes.patch"
+        patch_file.write_text(patch, encoding="utf-8")
+        res = subprocess.run(
+            ["git", "apply", "--recount", "--ignore-space-change", "--verbose", str(patch_file)],
+            cwd=str(temp_path),
+            capture_output=True,
+            text=True,
+        )
+        if res.returncode != 0:
+            return False
+        for fm in files:
+            target = temp_path / fm["path"]
+            if target.exists():
+                fm["after_sha256"] = hashlib.sha256(target.read_bytes()).hexdigest()
+        DocVerifier(docs_dir=temp_path / "docs").check_index_hygiene()
+        return True
+
+
+def _time(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples) * 1000, 3),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)] * 1000, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--extra-files", type=int, default=5)
+    args = parser.parse_args()
+
+    docs_dir = REPO_ROOT / "docs"
+    files, patch = _build_proposal(args.extra_files)
+    constraints = {"allowed_paths": ["docs/"], "forbidden_paths": []}
+    verifier = DocVerifier(docs_dir=docs_dir)
+
+    overlay_outcome = verifier.verify_with_proposed_changes(
+        [dict(f) for f in files], patch, constraints
+    )
+    report = {
+        "files": len(files),
+        "patch_bytes": len(patch),
+        "applies": {
+            "git_tempdir": _legacy_verify(docs_dir, [dict(f) for f in files], patch),
+            "overlay": not any(
+                f.category == "PATCH_APPLICATION" and f.severity == "ERROR"
+                for f in overlay_outcome.findings
+            ),
+        },
+        "git_tempdir": _time(
+            lambda: _legacy_verify(docs_dir, [dict(f) for f in files], patch), args.iterations
+        ),
+        "overlay": _time(
+            lambda: verifier.verify_with_proposed_changes(
+                [dict(f) for f in files], patch, constraints
+            ),
+            args.iterations,
+        ),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+DeterministicGateway benchmark: ledger append cost and live vs replay reruns.
+
+Ledger: N stub-mode calls logged through the previous load-array/append/
+rewrite ledger (reimplemented here) vs the JSONL CallLedger.
+
+Reruns: M subprocess calls (python -c) executed live and recorded, then the
+same calls served from the recording in replay mode.
+
+Usage:
+    python scripts/benchmarks/bench_gateway_ledger.py --calls 2000 --subprocess-calls 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.gateway import CallSpec, DeterministicGateway  # noqa: E402
+from runtime.util.atomic_write import atomic_write_json  # noqa: E402
+
+
+def _legacy_log(path: Path, entry: dict) -> None:
+    ledger = []
+    if path.exists():
+        with open(path, "r") as f:
+            ledger = json.load(f)
+    ledger.append(entry)
+    atomic_write_json(path, ledger)
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--subprocess-calls", type=int, default=50)
+    args = parser.parse_args()
+
+    specs = [CallSpec("subprocess", "echo", {"argv": [str(i)]}) for i in range(args.calls)]
+    runs = [
+        CallSpec("subprocess", sys.executable, {"argv": ["-c", f"print({i})"]})
+        for i in range(args.subprocess_calls)
+    ]
+    report: dict = {"calls": args.calls, "subprocess_calls": args.subprocess_calls}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy.json"
+
+        def legacy():
+            for n, spec in enumerate(specs, 1):
+                entry = {"call_number": n, "call_hash": spec.compute_hash()}
+                _legacy_log(legacy_path, {**entry, "spec": spec.to_dict()})
+
+        def jsonl():
+            with DeterministicGateway(ledger_path=str(Path(tmp) / "ledger.jsonl")) as gateway:
+                for spec in specs:
+                    gateway.call(spec)
+
+        report["ledger_legacy_ms"] = _timed(legacy)
+        report["ledger_jsonl_ms"] = _timed(jsonl)
+
+        recording = str(Path(tmp) / "recording.jsonl")
+
+        def live():
+            with DeterministicGateway(ledger_path=recording, mode="live") as gateway:
+                for spec in runs:
+                    gateway.call(spec)
+
+        def replay():
+            with DeterministicGateway(mode="replay", replay_path=recording) as gateway:
+                for spec in runs:
+                    assert gateway.call(spec).replayed
+
+        report["live_ms"] = _timed(live)
+        report["replay_ms"] = _timed(replay)
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Process-spawn and latency benchmark for claim verification via the git broker.
+
+Builds COO output mentioning N commit SHAs (up to half real commits from this
+repo, the rest fabricated) and runs the claim verifier's SHA check two ways:
+
+    per_sha   previous behaviour: one `git cat-file -e <sha>` per SHA
+              (reimplemented here for comparison)
+    broker    verify_claims: one batch to a persistent `git cat-file --batch-check`
+
+Spawns are counted by wrapping subprocess.Popen. The broker is measured cold
+(first pass, includes starting its process) and warm (subsequent passes).
+
+Usage:
+    python scripts/benchmarks/bench_git_broker.py --shas 200 --iterations 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.orchestration.coo.claim_verifier import EvidenceSnapshot, verify_claims  # noqa: E402
+from runtime.util import git_broker  # noqa: E402
+
+_spawns = 0
+_RealPopen = subprocess.Popen
+
+
+class _CountingPopen(_RealPopen):  # type: ignore[misc, valid-type]
+    def __init__(self, *args, **kwargs):
+        global _spawns
+        _spawns += 1
+        super().__init__(*args, **kwargs)
+
+
+def _claimed_shas(n: int) -> list[str]:
+    real = subprocess.run(
+        ["git", "-C", str(REPO_ROOT), "rev-list", f"--max-count={n - n // 2}", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    fake = [f"{i:040x}" for i in range(1, n - len(real) + 1)]
+    return real + fake
+
+
+def _per_sha(shas: list[str]) -> int:
+    missing = 0
+    for sha in shas:
+        proc = subprocess.run(
+            ["git", "-C", str(REPO_ROOT), "cat-file", "-e", sha], capture_output=True, timeout=5
+        )
+        missing += proc.returncode != 0
+    return missing
+
+
+def _broker(output: str, snapshot: EvidenceSnapshot) -> int:
+    return sum(v.claim_type == "commit" for v in verify_claims(output, snapshot, REPO_ROOT))
+
+
+def _measure(fn, iterations: int) -> dict:
+    global _spawns
+    _spawns = 0
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "spawns_per_pass": round(_spawns / iterations, 2),
+        "p50_ms": round(statistics.median(samples) * 1000, 3),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)] * 1000, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shas", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    shas = _claimed_shas(args.shas)
+    output = "\n".join(f"Landed commit {sha}." for sha in shas)
+    snapshot = EvidenceSnapshot(
+        tasks=[],
+        inbox_orders=[],
+        active_orders=[],
+        completed_orders={},
+        manifest_entries=[],
+        escalation_ids=[],
+    )
+
+    subprocess.Popen = _CountingPopen  # type: ignore[misc]
+    try:
+        git_broker.close_all_brokers()
+        report = {
+            "shas": len(shas),
+            "missing": {"per_sha": _per_sha(shas), "broker": _broker(output, snapshot)},
+            "per_sha": _measure(lambda: _per_sha(shas), args.iterations),
+        }
+        git_broker.close_all_brokers()
+        report["broker_cold"] = _measure(lambda: _broker(output, snapshot), 1)
+        report["broker_warm"] = _measure(lambda: _broker(output, snapshot), args.iterations)
+    finally:
+        subprocess.Popen = _RealPopen  # type: ignore[misc]
+        git_broker.close_all_brokers()
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
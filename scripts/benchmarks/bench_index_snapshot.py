@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+INDEX maintenance benchmark: full os.walk regeneration vs directory snapshot.
+
+Builds a synthetic docs tree (default 100k files over 1k directories), backdates
+its directories past the racy window and times, per scenario:
+
+    legacy      os.walk + detsort + full render + read/compare (previous behaviour)
+    cold        snapshot with no prior state (full listing, INDEX written)
+    warm        snapshot reloaded from disk, tree unchanged
+    delta       snapshot reloaded from disk, a few files added/removed
+
+Also reports directories listed vs reused by the snapshot in each run.
+
+Usage:
+    python scripts/benchmarks/bench_index_snapshot.py --files 100000 --dirs 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.index.snapshot import DirectorySnapshot, IndexSpec, reconcile_indexes  # noqa: E402
+from runtime.util.detsort import detsort_paths  # noqa: E402
+
+
+def _build_tree(root: Path, n_files: int, n_dirs: int) -> None:
+    dirs = [root / f"area{i % 10:02d}" / f"topic{i:04d}" for i in range(n_dirs)]
+    for d in dirs:
+        d.mkdir(parents=True, exist_ok=True)
+    for i in range(n_files):
+        (dirs[i % n_dirs] / f"doc{i:06d}.md").write_text("x")
+    past = time.time() - 60
+    for dirpath, _dirs, _files in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def _legacy_update(root: Path, index_path: Path) -> bool:
+    files = []
+    for dirpath, _dirs, filenames in os.walk(root):
+        for fname in filenames:
+            if fname.endswith(".md") and fname != "INDEX.md":
+                files.append(os.path.relpath(os.path.join(dirpath, fname), root))
+    files = detsort_paths(files)
+    lines = ["# Index", ""] + [f"- [{f}](./{f})" for f in files] + [""]
+    content = "\n".join(lines)
+    if index_path.exists() and index_path.read_text(encoding="utf-8") == content:
+        return False
+    index_path.write_text(content, encoding="utf-8")
+    return True
+
+
+def _timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return round((time.perf_counter() - start) * 1000, 1), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--dirs", type=int, default=1000)
+    args = parser.parse_args()
+
+    report: dict = {"files": args.files, "dirs": args.dirs}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "docs"
+        _build_tree(root, args.files, args.dirs)
+        legacy_index = Path(tmp) / "LEGACY_INDEX.md"
+        snapshot_path = Path(tmp) / "snapshot.json"
+        spec = IndexSpec(str(root / "INDEX.md"), str(root))
+
+        ms, _ = _timed(lambda: _legacy_update(root, legacy_index))
+        report["legacy_first_ms"] = ms
+        ms, _ = _timed(lambda: _legacy_update(root, legacy_index))
+        report["legacy_unchanged_ms"] = ms
+
+        def _run(label: str) -> None:
+            def go():
+                snapshot = DirectorySnapshot.load(snapshot_path)
+                changed = reconcile_indexes([spec], snapshot)[spec.index_path]
+                return snapshot, changed
+
+            ms, (snapshot, changed) = _timed(go)
+            report[label] = {
+                "ms": ms,
+                "written": changed,
+                "dirs_listed": snapshot.dirs_listed,
+                "dirs_reused": snapshot.dirs_reused,
+            }
+
+        _run("snapshot_cold")
+        # INDEX write bumped the root mtime; age it so the next run can reuse it
+        past = time.time() - 60
+        os.utime(root, (past, past))
+        _run("snapshot_warm")
+
+        for i in range(5):
+            (root / "area00" / "topic0000" / f"new{i}.md").write_text("x")
+        (root / "area01" / "topic0001" / "doc000001.md").unlink()
+        _run("snapshot_delta")
+
+        ms, _ = _timed(lambda: _legacy_update(root, legacy_index))
+        report["legacy_delta_ms"] = ms
+        report["parity"] = legacy_index.read_text(encoding="utf-8") == (
+            root / "INDEX.md"
+        ).read_text(encoding="utf-8")
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Invocation receipt benchmark: streaming segment log vs. the buffered collector.
+
+Records --receipts invocation receipts (default 10k) two ways and reports
+record throughput, finalize time and what survives a crash:
+
+- buffered: the previous design, replicated inline. Receipts are held in
+  memory and finalize writes one JSON file per receipt plus an index.json
+  repeating all of them, so finalize is O(n) and a crash before it loses
+  the whole run.
+- streaming: InvocationReceiptCollector with an output_dir. Receipts are
+  group-committed to receipts.jsonl as they are recorded and finalize only
+  writes the fixed-size seal.
+
+Crash survival is measured by recording in a subprocess that SIGKILLs
+itself right after the last record call (no flush), then counting the
+receipts a fresh process can read back.
+
+Usage:
+    python scripts/benchmarks/bench_invocation_receipts.py --receipts 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.receipts.invocation_receipt import (  # noqa: E402
+    InvocationReceiptCollector,
+    read_run_receipts,
+)
+from runtime.util.atomic_write import atomic_write_json  # noqa: E402
+
+_CRASH_SCRIPT = """
+import os, signal, sys
+sys.path.insert(0, {repo!r})
+from runtime.receipts.invocation_receipt import InvocationReceiptCollector
+
+output_dir = {output_dir!r} or None
+collector = InvocationReceiptCollector("run_crash", output_dir=output_dir)
+for i in range({n}):
+    collector.record(
+        provider_id="zen", mode="api", seat_id=f"seat_{{i % 20}}",
+        start_ts="2026-01-01T00:00:00+00:00", end_ts="2026-01-01T00:00:01+00:00",
+        exit_status=0, output_content="x" * 2000 + str(i),
+        token_usage={{"prompt_tokens": 1200, "completion_tokens": 300, "total_tokens": 1500}},
+    )
+os.kill(os.getpid(), signal.SIGKILL)
+"""
+
+
+def _record(collector: InvocationReceiptCollector, n: int) -> None:
+    for i in range(n):
+        collector.record(
+            provider_id="zen",
+            mode="api",
+            seat_id=f"seat_{i % 20}",
+            start_ts="2026-01-01T00:00:00+00:00",
+            end_ts="2026-01-01T00:00:01+00:00",
+            exit_status=0,
+            output_content="x" * 2000 + str(i),
+            token_usage={"prompt_tokens": 1200, "completion_tokens": 300, "total_tokens": 1500},
+        )
+
+
+def _legacy_finalize(collector: InvocationReceiptCollector, output_dir: Path) -> Path:
+    """The pre-segment finalize: a file per receipt plus a full index."""
+    receipts = collector.receipts
+    receipts_dir = output_dir / "artifacts" / "receipts" / collector.run_id
+    receipts_dir.mkdir(parents=True, exist_ok=True)
+    for receipt in receipts:
+        provider = re.sub(r"[^a-zA-Z0-9._-]+", "_", receipt.provider_id.strip()) or "unknown"
+        atomic_write_json(receipts_dir / f"{receipt.seq:04d}_{provider}.json", asdict(receipt))
+    index_path = receipts_dir / "index.json"
+    atomic_write_json(
+        index_path,
+        {
+            "schema_version": "invocation_index_v1",
+            "run_id": collector.run_id,
+            "receipt_count": len(receipts),
+            "receipts": [asdict(r) for r in receipts],
+        },
+    )
+    return index_path
+
+
+def _crash_survivors(n: int, output_dir: Path, streaming: bool) -> int:
+    script = _CRASH_SCRIPT.format(
+        repo=str(REPO_ROOT), output_dir=str(output_dir) if streaming else "", n=n
+    )
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(script)])
+    assert result.returncode == -signal.SIGKILL, result.returncode
+    return sum(1 for _ in read_run_receipts(output_dir, "run_crash"))
+
+
+def _run(n: int, output_dir: Path, streaming: bool) -> dict:
+    collector = InvocationReceiptCollector(
+        "run_bench", output_dir=output_dir if streaming else None
+    )
+    start = time.perf_counter()
+    _record(collector, n)
+    recorded = time.perf_counter() - start
+    start = time.perf_counter()
+    if streaming:
+        index_path = collector.finalize(output_dir)
+    else:
+        index_path = _legacy_finalize(collector, output_dir)
+    finalized = time.perf_counter() - start
+    run_dir = index_path.parent
+    return {
+        "record_s": round(recorded, 3),
+        "receipts_per_s": round(n / recorded),
+        "finalize_s": round(finalized, 4),
+        "total_s": round(recorded + finalized, 3),
+        "files": sum(1 for _ in run_dir.iterdir()),
+        "bytes": sum(p.stat().st_size for p in run_dir.iterdir()),
+        "index_bytes": index_path.stat().st_size,
+        "readback": sum(1 for _ in read_run_receipts(output_dir, "run_bench")),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--receipts", type=int, default=10_000)
+    parser.add_argument("--skip-crash", action="store_true", help="skip the SIGKILL runs")
+    args = parser.parse_args()
+
+    report: dict = {"receipts": args.receipts}
+    for name, streaming in (("buffered", False), ("streaming", True)):
+        with tempfile.TemporaryDirectory() as tmp:
+            report[name] = _run(args.receipts, Path(tmp), streaming)
+            assert report[name]["readback"] == args.receipts
+        if not args.skip_crash:
+            with tempfile.TemporaryDirectory() as tmp:
+                report[name]["survived_sigkill"] = _crash_survivors(
+                    args.receipts, Path(tmp), streaming
+                )
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
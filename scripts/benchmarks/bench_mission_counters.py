@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Backpressure benchmark: COUNT(*) scans vs trigger-maintained mission_counters.
+
+Builds a project_builder database with one large mission (default 100k tasks
+and 100k messages) and times check_and_apply_backpressure's count reads the
+old way (three COUNT(*) queries) and the new way (one primary-key read).
+Then measures write throughput with and without the counter triggers while
+several writer threads insert and update tasks/messages concurrently, and
+verifies the counters with check_mission_counters afterwards.
+
+Usage:
+    python scripts/benchmarks/bench_mission_counters.py --rows 100000 --writers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from project_builder.database.counters import (  # noqa: E402
+    check_mission_counters,
+    ensure_mission_counters,
+)
+from project_builder.database.migrations import apply_schema  # noqa: E402
+from project_builder.orchestrator.missions import check_and_apply_backpressure  # noqa: E402
+
+_MESSAGES_DDL = """
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY, mission_id TEXT NOT NULL, status TEXT NOT NULL,
+    created_at DATETIME NOT NULL
+)
+"""
+_STATUSES = ("pending", "executing", "approved", "repair_retry")
+
+
+def _open(path: str, triggers: bool) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=60)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(_MESSAGES_DDL)
+    apply_schema(conn)
+    ensure_mission_counters(conn)
+    if not triggers:
+        for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        ).fetchall():
+            conn.execute(f"DROP TRIGGER {name}")
+    conn.execute(
+        "INSERT OR IGNORE INTO missions (id, status, description, max_cost_usd, max_loops,"
+        " created_at, updated_at) VALUES ('m1', 'completed', 'bench', 1, 1, 'now', 'now')"
+    )
+    conn.commit()
+    return conn
+
+
+def _fill(conn: sqlite3.Connection, rows: int) -> None:
+    conn.executemany(
+        "INSERT INTO mission_tasks (id, mission_id, task_order, description, status)"
+        " VALUES (?, 'm1', ?, 'd', ?)",
+        ((f"t{i}", i, _STATUSES[i % 4]) for i in range(rows)),
+    )
+    conn.executemany(
+        "INSERT INTO messages VALUES (?, 'm1', ?, 'now')",
+        ((f"msg{i}", "pending" if i % 2 else "delivered") for i in range(rows)),
+    )
+    conn.commit()
+
+
+def _legacy_counts(conn: sqlite3.Connection) -> int:
+    cur = conn.cursor()
+    cur.execute("SELECT COUNT(*) FROM mission_tasks WHERE mission_id = 'm1'")
+    cur.fetchone()
+    cur.execute(
+        "SELECT COUNT(*) FROM mission_tasks WHERE mission_id = 'm1'"
+        " AND status IN ('pending', 'repair_retry')"
+    )
+    pending = cur.fetchone()[0]
+    cur.execute("SELECT COUNT(*) FROM messages WHERE mission_id = 'm1' AND status = 'pending'")
+    return pending + cur.fetchone()[0]
+
+
+def _median_ms(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return round(statistics.median(samples) * 1000, 3)
+
+
+def _concurrent_writes(path: str, writers: int, ops: int) -> float:
+    def work(n: int) -> None:
+        conn = sqlite3.connect(path, timeout=60)
+        for i in range(ops):
+            conn.execute(
+                "INSERT INTO mission_tasks (id, mission_id, task_order, description, status)"
+                " VALUES (?, 'm1', ?, 'd', 'pending')",
+                (f"w{n}-{i}", 10_000_000 + n * ops + i),
+            )
+            conn.execute("INSERT INTO messages VALUES (?, 'm1', 'pending', 'now')", (f"w{n}-{i}",))
+            conn.execute(
+                "UPDATE mission_tasks SET status = 'approved' WHERE id = ?", (f"w{n}-{i}",)
+            )
+            conn.commit()
+        conn.close()
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(writers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return round(writers * ops / (time.perf_counter() - start), 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=250, help="transactions per writer")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    report: dict = {"rows": args.rows, "writers": args.writers}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, triggers in (("without_triggers", False), ("with_triggers", True)):
+            path = str(Path(tmp) / f"{label}.db")
+            conn = _open(path, triggers)
+            start = time.perf_counter()
+            _fill(conn, args.rows)
+            fill_ms = round((time.perf_counter() - start) * 1000, 1)
+            result = {"bulk_fill_ms": fill_ms}
+            if triggers:
+                result["backpressure_read_ms"] = _median_ms(
+                    lambda c=conn: check_and_apply_backpressure(c, "m1"), args.iterations
+                )
+            else:
+                result["count_star_read_ms"] = _median_ms(
+                    lambda c=conn: _legacy_counts(c), args.iterations
+                )
+            result["concurrent_txn_per_s"] = _concurrent_writes(path, args.writers, args.ops)
+            if triggers:
+                result["counter_drift"] = check_mission_counters(conn)
+            conn.close()
+            report[label] = result
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
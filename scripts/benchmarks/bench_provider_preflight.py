@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Wall-clock benchmark for council provider preflight.
+
+Uses a fake echo probe with fixed latency (no network) over N providers and
+times three runs:
+
+    sequential    previous behaviour: check_provider for each provider in turn
+                  (reimplemented here for comparison)
+    concurrent    run_preflight, cold health cache
+    cached        run_preflight again against the warm health cache
+
+Usage:
+    python scripts/benchmarks/bench_provider_preflight.py --providers 5 --latency 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.orchestration.council.provider_preflight import (  # noqa: E402
+    ProviderHealthCache,
+    check_provider,
+    run_preflight,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--providers", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+
+    calls = 0
+
+    def probe(model: str, timeout: float) -> tuple[bool, str | None]:
+        nonlocal calls
+        calls += 1
+        time.sleep(min(args.latency, timeout))
+        return True, None
+
+    models = {f"provider-{i}": f"model-{i}" for i in range(args.providers)}
+    os.environ.setdefault("ZEN_REVIEWER_KEY", "bench-key")
+    report: dict = {"providers": args.providers, "probe_latency_s": args.latency}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ProviderHealthCache(Path(tmp) / "provider_health_cache.json")
+        runs = {
+            "sequential": lambda: {
+                p: check_provider(p, m, echo_probe=probe) for p, m in models.items()
+            },
+            "concurrent": lambda: run_preflight(models, echo_probe=probe, health_cache=cache),
+            "cached": lambda: run_preflight(models, echo_probe=probe, health_cache=cache),
+        }
+        for name, fn in runs.items():
+            calls = 0
+            start = time.perf_counter()
+            fn()
+            report[name] = {
+                "seconds": round(time.perf_counter() - start, 3),
+                "probe_calls": calls,
+            }
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Wall-clock benchmark for PytestExecutor sharding and result caching.
+
+Runs the repo's own suite (or any target) in four configurations and prints a
+JSON table of wall-clock seconds and test counts:
+
+    serial       workers=1, no cache
+    sharded      workers=N, no cache
+    cache_cold   workers=N, fresh cache (records verdicts)
+    cache_warm   workers=N, same cache with allow_cached=True
+
+Usage:
+    python scripts/benchmarks/bench_pytest_executor.py
+    python scripts/benchmarks/bench_pytest_executor.py --target runtime/tests --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.orchestration.test_executor import PytestExecutor  # noqa: E402
+from runtime.orchestration.test_result_cache import TestResultCache  # noqa: E402
+
+
+def _measure(label: str, executor: PytestExecutor, target: str) -> dict:
+    start = time.perf_counter()
+    result = executor.run(target, extra_args=["-q"])
+    elapsed = time.perf_counter() - start
+    return {
+        "config": label,
+        "wall_seconds": round(elapsed, 2),
+        "status": result.status,
+        "shards": result.evidence.get("shards"),
+        "counts": result.counts,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", default="runtime/tests")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--timeout", type=int, default=1800)
+    parser.add_argument("--skip-serial", action="store_true")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    rows = []
+    if not args.skip_serial:
+        rows.append(_measure("serial", PytestExecutor(timeout=args.timeout), args.target))
+    rows.append(
+        _measure(
+            "sharded",
+            PytestExecutor(timeout=args.timeout, workers=args.workers, use_xdist=False),
+            args.target,
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "results.json"
+        rows.append(
+            _measure(
+                "cache_cold",
+                PytestExecutor(
+                    timeout=args.timeout,
+                    workers=args.workers,
+                    cache=TestResultCache(REPO_ROOT, cache_path),
+                    use_xdist=False,
+                ),
+                args.target,
+            )
+        )
+        rows.append(
+            _measure(
+                "cache_warm",
+                PytestExecutor(
+                    timeout=args.timeout,
+                    workers=args.workers,
+                    cache=TestResultCache(REPO_ROOT, cache_path),
+                    allow_cached=True,
+                    use_xdist=False,
+                ),
+                args.target,
+            )
+        )
+
+    print(json.dumps({"target": args.target, "workers": args.workers, "runs": rows}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
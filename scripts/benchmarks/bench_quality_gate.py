@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Cold vs warm benchmark for the parallel, cached quality gate runner.
+
+Builds a throwaway repo with a synthetic change set (default 500 files: 80%
+Python, 20% YAML) and times run_quality_gates in these configurations:
+
+    serial_uncached    max_workers=1, use_cache=False (previous behaviour)
+    parallel_uncached  max_workers=N, use_cache=False
+    parallel_cold      max_workers=N, empty verdict cache
+    parallel_warm      max_workers=N, fully populated cache
+    parallel_churn     max_workers=N, cache populated, 1% of files edited
+
+Only tools whose executables are installed are enabled (ruff, yamllint).
+
+Usage:
+    python scripts/benchmarks/bench_quality_gate.py --files 500 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.tools.workflow_pack import (  # noqa: E402
+    QUALITY_MANIFEST_RELATIVE_PATH,
+    run_quality_gates,
+)
+
+_TOOL_EXECUTABLES = {"ruff_check": "ruff", "ruff_format": "ruff", "yamllint": "yamllint"}
+
+
+def _build_repo(root: Path, count: int) -> list[str]:
+    tools = {
+        name: {
+            "enabled": True,
+            "mode": "blocking",
+            "scopes": ["changed"],
+            "autofix_allowed": False,
+            "failure_class": f"{name}_error",
+        }
+        for name, exe in _TOOL_EXECUTABLES.items()
+        if shutil.which(exe)
+    }
+    manifest_path = root / QUALITY_MANIFEST_RELATIVE_PATH
+    manifest_path.parent.mkdir(parents=True)
+    manifest_path.write_text(yaml.safe_dump({"repo": {"python_targets": ["pkg"]}, "tools": tools}))
+    (root / "pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+
+    files = []
+    for i in range(count):
+        if i % 5 == 4:
+            rel = f"cfg/file_{i:04d}.yaml"
+            body = f"---\nname: item-{i}\nvalues:\n  - {i}\n  - {i + 1}\n"
+        else:
+            rel = f"pkg/mod_{i:04d}.py"
+            body = f'"""Module {i}."""\n\n\ndef value_{i}() -> int:\n    return {i}\n'
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+        files.append(rel)
+    return files
+
+
+def _time(repo: Path, files: list[str], workers: int, use_cache: bool) -> dict:
+    start = time.perf_counter()
+    result = run_quality_gates(
+        repo, files, scope="changed", max_workers=workers, use_cache=use_cache
+    )
+    return {
+        "wall_seconds": round(time.perf_counter() - start, 3),
+        "passed": result["passed"],
+        "tools": len(result["results"]),
+        "cache_hits": result.get("cache_hits", 0),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp)
+        files = _build_repo(repo, args.files)
+        rows = {
+            "serial_uncached": _time(repo, files, 1, False),
+            "parallel_uncached": _time(repo, files, args.workers, False),
+            "parallel_cold": _time(repo, files, args.workers, True),
+            "parallel_warm": _time(repo, files, args.workers, True),
+        }
+        for rel in files[:: max(1, len(files) // max(1, args.files // 100))][: args.files // 100]:
+            path = repo / rel
+            path.write_text(
+                path.read_text().replace("  - ", "  - 1", 1).replace("return", "return 1 +")
+            )
+        rows["parallel_churn"] = _time(repo, files, args.workers, True)
+
+    print(json.dumps({"files": args.files, "workers": args.workers, "runs": rows}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
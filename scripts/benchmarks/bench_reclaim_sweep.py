@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Stale-task reclaim benchmark: per-task attempt_reclaim_task vs reclaim_stale_tasks.
+
+Builds a project_builder database with N stale-locked tasks (default 10k),
+half owned by a live PID (this process) and half by PIDs that cannot exist,
+plus N fresh locked tasks that must be left alone. Times reclaiming them
+with one attempt_reclaim_task call per task id (the previous caller loop)
+and with the batched sweep, using PosixWorkerRegistry in both cases.
+
+Usage:
+    python scripts/benchmarks/bench_reclaim_sweep.py --tasks 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from project_builder.config.settings import TASK_LOCK_TIMEOUT_SECONDS  # noqa: E402
+from project_builder.database.migrations import apply_schema  # noqa: E402
+from project_builder.orchestrator.reclaim import (  # noqa: E402
+    PosixWorkerRegistry,
+    attempt_reclaim_task,
+    reclaim_stale_tasks,
+)
+
+_DEAD_PID_BASE = 2**22 + 1  # above Linux pid_max
+
+
+def _build(path: str, tasks: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    apply_schema(conn)
+    conn.execute(
+        "INSERT INTO missions (id, status, description, max_cost_usd, max_loops, created_at,"
+        " updated_at) VALUES ('m1', 'executing', 'bench', 1, 1, 'now', 'now')"
+    )
+    stale = datetime.utcnow() - timedelta(seconds=TASK_LOCK_TIMEOUT_SECONDS + 60)
+    fresh = datetime.utcnow()
+    rows = []
+    for i in range(tasks):
+        owner = str(os.getpid()) if i % 2 else str(_DEAD_PID_BASE + i)
+        rows.append((f"s{i}", i, stale, owner))
+        rows.append((f"f{i}", tasks + i, fresh, str(_DEAD_PID_BASE + i)))
+    conn.executemany(
+        "INSERT INTO mission_tasks (id, mission_id, task_order, description, status, locked_at,"
+        " locked_by) VALUES (?, 'm1', ?, 'd', 'executing', ?, ?)",
+        rows,
+    )
+    conn.commit()
+    return conn
+
+
+def _summary(conn: sqlite3.Connection, elapsed: float) -> dict:
+    reclaimed = conn.execute(
+        "SELECT COUNT(*) FROM mission_tasks WHERE status = 'pending'"
+    ).fetchone()[0]
+    events, distinct = conn.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT id) FROM timeline_events"
+    ).fetchone()
+    return {
+        "ms": round(elapsed * 1000, 1),
+        "reclaimed": reclaimed,
+        "events": events,
+        "distinct_event_ids": distinct,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=10_000, help="stale-locked tasks")
+    args = parser.parse_args()
+
+    registry = PosixWorkerRegistry()
+    report: dict = {"stale_tasks": args.tasks, "fresh_tasks": args.tasks}
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = _build(str(Path(tmp) / "loop.db"), args.tasks)
+        ids = [row[0] for row in conn.execute("SELECT id FROM mission_tasks ORDER BY id")]
+        start = time.perf_counter()
+        for task_id in ids:
+            attempt_reclaim_task(conn, task_id, registry)
+            conn.commit()  # skip events are left uncommitted by attempt_reclaim_task
+        report["per_task_loop"] = _summary(conn, time.perf_counter() - start)
+        conn.close()
+
+        conn = _build(str(Path(tmp) / "sweep.db"), args.tasks)
+        start = time.perf_counter()
+        reclaim_stale_tasks(conn, registry)
+        report["sweep"] = _summary(conn, time.perf_counter() - start)
+        conn.close()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
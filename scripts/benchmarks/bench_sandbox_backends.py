@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Sandbox backend benchmark: per-task overhead of each available backend.
+
+Runs N trivial tasks (default 50, entrypoint copies one input file to the
+output) through run_sandbox with every backend this host supports and
+reports median and p95 wall time per task. A bare `bash -c` subprocess is
+included as the floor. The Docker backends are skipped when `docker info`
+fails; the warm pool's start-up cost is reported separately from its
+per-task times.
+
+Usage:
+    python scripts/benchmarks/bench_sandbox_backends.py --tasks 50 --pool-size 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from project_builder.sandbox.backends import (  # noqa: E402
+    DockerRunBackend,
+    DockerWarmPoolBackend,
+    LocalNamespaceBackend,
+)
+from project_builder.sandbox.runner import run_sandbox  # noqa: E402
+
+_ENTRYPOINT = 'cp input.txt "$SANDBOX_OUTPUT/result.txt"'
+
+
+def _docker_available() -> bool:
+    if not shutil.which("docker"):
+        return False
+    return subprocess.run(["docker", "info"], capture_output=True).returncode == 0
+
+
+def _stats(samples: list[float]) -> dict:
+    samples = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 2),
+        "p95_ms": round(samples[int(0.95 * (len(samples) - 1))] * 1000, 2),
+    }
+
+
+def _time_tasks(tmp: Path, tasks: int, run_one) -> dict:
+    workspace = tmp / "workspace"
+    workspace.mkdir(exist_ok=True)
+    (workspace / "input.txt").write_text("payload\n")
+    samples = []
+    for i in range(tasks):
+        output = tmp / f"output-{i}"
+        start = time.perf_counter()
+        code = run_one(workspace, output)
+        samples.append(time.perf_counter() - start)
+        if code != 0 or not (output / "result.txt").exists():
+            raise RuntimeError(f"task {i} failed (exit {code})")
+    return _stats(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument(
+        "--pool-output-dir",
+        default="/dev/shm",
+        help="parent for pool output slots; must be another filesystem than the temp dir",
+    )
+    args = parser.parse_args()
+
+    report: dict = {"tasks": args.tasks}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        def bare(workspace, output):
+            output.mkdir()
+            env = {"SANDBOX_OUTPUT": str(output), "PATH": "/usr/bin:/bin"}
+            return subprocess.run(["bash", "-c", _ENTRYPOINT], cwd=workspace, env=env).returncode
+
+        (tmp / "bare").mkdir()
+        report["bare_subprocess"] = _time_tasks(tmp / "bare", args.tasks, bare)
+
+        if LocalNamespaceBackend.available():
+            backend = LocalNamespaceBackend()
+            (tmp / "local").mkdir()
+            report["local_namespace"] = _time_tasks(
+                tmp / "local",
+                args.tasks,
+                lambda w, o: run_sandbox(w, o, _ENTRYPOINT, 60, backend=backend),
+            )
+        else:
+            report["local_namespace"] = "skipped: user namespaces unavailable"
+
+        if not _docker_available():
+            report["docker"] = report["docker_pool"] = "skipped: docker unavailable"
+        else:
+            backend = DockerRunBackend()
+            (tmp / "docker").mkdir()
+            report["docker"] = _time_tasks(
+                tmp / "docker",
+                args.tasks,
+                lambda w, o: run_sandbox(w, o, _ENTRYPOINT, 60, backend=backend),
+            )
+            with tempfile.TemporaryDirectory(dir=args.pool_output_dir) as pool_out:
+                pool = DockerWarmPoolBackend(
+                    size=args.pool_size, workspace_dir=tmp / "pool-ws", output_dir=pool_out
+                )
+                start = time.perf_counter()
+                pool.start()
+                startup_ms = round((time.perf_counter() - start) * 1000, 1)
+                (tmp / "pool").mkdir()
+                with pool:
+                    result = _time_tasks(
+                        tmp / "pool",
+                        args.tasks,
+                        lambda w, o: run_sandbox(w, o, _ENTRYPOINT, 60, backend=pool),
+                    )
+                report["docker_pool"] = {"startup_ms": startup_ms, **result}
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tool registry benchmark: ranged reads, paginated listings and batched dispatch.
+
+Creates a large text file (default 1 GiB of ~100-byte lines) and a
+directory with many entries (default 100k) in a temporary sandbox, then
+times filesystem.read_file for the whole file versus 50-line and byte
+ranges at the head, middle and tail (plus a second tail page, which
+reuses the line checkpoints of the first scan); filesystem.list_dir for the full
+listing versus 100-entry pages; and N small reads through dispatch()
+one by one versus a single dispatch_batch().
+
+Usage:
+    python scripts/benchmarks/bench_tool_registry.py --file-mb 1024 --dir-entries 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.tools.filesystem import handle_list_dir, handle_read_file  # noqa: E402
+from runtime.tools.registry import get_registry  # noqa: E402
+from runtime.tools.schemas import ToolInvokeRequest  # noqa: E402
+
+LINE_BYTES = 100
+
+
+def _write_big_file(path: Path, megabytes: int) -> int:
+    lines = (megabytes * 1024 * 1024) // LINE_BYTES
+    block = 10_000
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, lines, block):
+            f.write(
+                "".join(
+                    f"{i:012d} ".ljust(LINE_BYTES - 1, "x") + "\n"
+                    for i in range(start, min(lines, start + block))
+                )
+            )
+    return lines
+
+
+def _timed_ms(fn, *args) -> tuple:
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, round((time.perf_counter() - start) * 1000, 3)
+
+
+def _bench_reads(root: Path, lines: int, full_read: bool) -> dict:
+    report = {}
+    if full_read:
+        result, report["whole_file_ms"] = _timed_ms(handle_read_file, {"path": "big.txt"}, root)
+        assert result.ok
+        del result
+    for label, start_line in (("head", 1), ("middle", lines // 2), ("tail", lines - 49)):
+        args = {"path": "big.txt", "start_line": start_line, "end_line": start_line + 49}
+        result, report[f"lines_50_{label}_ms"] = _timed_ms(handle_read_file, args, root)
+        assert result.ok and result.output.stdout.count("\n") == 50
+    # Next page near the tail: resumes from line checkpoints left by the scan above
+    args = {"path": "big.txt", "start_line": lines - 99, "end_line": lines - 50}
+    _, report["lines_50_tail_previous_page_ms"] = _timed_ms(handle_read_file, args, root)
+    for label, offset in (("head", 0), ("middle", lines // 2 * LINE_BYTES)):
+        args = {"path": "big.txt", "offset": offset, "length": 50 * LINE_BYTES}
+        _, report[f"bytes_5k_{label}_ms"] = _timed_ms(handle_read_file, args, root)
+    return report
+
+
+def _bench_listing(root: Path) -> dict:
+    report = {}
+    result, report["full_listing_ms"] = _timed_ms(handle_list_dir, {"path": "many"}, root)
+    names = result.output.stdout.split("\n")
+    _, report["first_page_100_ms"] = _timed_ms(
+        handle_list_dir, {"path": "many", "limit": 100}, root
+    )
+    cursor = names[len(names) // 2].rsplit("/", 1)[-1]
+    args = {"path": "many", "limit": 100, "cursor": cursor}
+    _, report["middle_page_100_ms"] = _timed_ms(handle_list_dir, args, root)
+    args = {"path": "many", "limit": 100, "pattern": "e0000*"}
+    _, report["filtered_page_100_ms"] = _timed_ms(handle_list_dir, args, root)
+    return report
+
+
+def _bench_batch(root: Path, requests: int) -> dict:
+    registry = get_registry(sandbox_root=root)
+    batch = [
+        ToolInvokeRequest("filesystem", "read_file", {"path": f"many/e{i:07d}.txt"})
+        for i in range(requests)
+    ]
+    start = time.perf_counter()
+    single = [registry.dispatch(request) for request in batch]
+    one_by_one = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = registry.dispatch_batch(batch)
+    elapsed = time.perf_counter() - start
+    assert [r.output.stdout for r in single] == [r.output.stdout for r in batched]
+    return {
+        "requests": requests,
+        "dispatch_loop_ms": round(one_by_one * 1000, 3),
+        "dispatch_batch_ms": round(elapsed * 1000, 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--file-mb", type=int, default=1024)
+    parser.add_argument("--dir-entries", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=200, help="requests per batch")
+    parser.add_argument("--skip-full-read", action="store_true", help="skip whole-file read")
+    args = parser.parse_args()
+
+    report: dict = {"file_mb": args.file_mb, "dir_entries": args.dir_entries}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).resolve()
+        lines = _write_big_file(root / "big.txt", args.file_mb)
+        many = root / "many"
+        many.mkdir()
+        for i in range(args.dir_entries):
+            (many / f"e{i:07d}.txt").write_text(str(i))
+        os.sync()
+
+        report["read_file"] = _bench_reads(root, lines, not args.skip_full_read)
+        report["list_dir"] = _bench_listing(root)
+        report["batch"] = _bench_batch(root, min(args.batch, args.dir_entries))
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
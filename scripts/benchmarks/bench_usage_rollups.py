@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Usage rollup benchmark: incremental ingestion and rollup-backed reports.
+
+Writes a year of synthetic agent call records (--calls-per-day, spread
+over the day with a few roles and models) into call log segments, then
+times: a report computed by rescanning every segment (what usage_report
+did before), the first ingest into empty rollups, reports for the year, a
+month and a day answered from the rollups, an ingest after one more day of
+calls is appended (only the new bytes are read), a no-op ingest, a rebuild,
+and the rescan correctness check.
+
+Usage:
+    python scripts/benchmarks/bench_usage_rollups.py --calls-per-day 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.agents.call_log_store import SEGMENT_MAX_BYTES, segment_paths  # noqa: E402
+from runtime.agents.usage_rollups import UsageRollups  # noqa: E402
+
+ROLES = ["designer", "builder", "reviewer_architect", "reviewer_security", "steward", "council"]
+MODELS = ["claude-sonnet-4-5", "opencode/glm-5-free", "opencode/minimax-m2.5-free"]
+PRICING = {"claude-sonnet-4-5": {"input_per_mtok": 3.0, "output_per_mtok": 15.0}}
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _SegmentWriter:
+    def __init__(self, root: Path):
+        self.dir = root / "segments"
+        self.dir.mkdir(parents=True)
+        self.number, self.size = 1, 0
+
+    def write(self, lines: list[str]) -> None:
+        data = "".join(lines).encode()
+        if self.size and self.size + len(data) > SEGMENT_MAX_BYTES:
+            self.number, self.size = self.number + 1, 0
+        with open(self.dir / f"calls-{self.number:08d}.jsonl", "ab") as f:
+            f.write(data)
+        self.size += len(data)
+
+
+def _day_of_calls(day: datetime, calls: int, rng: random.Random) -> list[str]:
+    offsets = sorted(rng.randrange(86_400_000_000) for _ in range(calls))
+    return [
+        json.dumps(
+            {
+                "call_id_deterministic": f"sha256:{rng.getrandbits(256):064x}",
+                "timestamp": (day + timedelta(microseconds=offset)).isoformat(),
+                "role": rng.choice(ROLES),
+                "model_used": rng.choice(MODELS),
+                "input_tokens": rng.randint(500, 12_000),
+                "output_tokens": rng.randint(50, 4000),
+                "latency_ms": int(rng.lognormvariate(8, 0.8)),
+                "status": "success",
+                "prev_log_hash": "0" * 64,
+                "entry_hash": "0" * 64,
+            },
+            separators=(",", ":"),
+        )
+        + "\n"
+        for offset in offsets
+    ]
+
+
+def _rescan(root: Path) -> dict:
+    totals: dict = {}
+    for path in segment_paths(root):
+        with open(path, "rb") as f:
+            for line in f:
+                record = json.loads(line)
+                row = totals.setdefault((record["role"], record["model_used"]), [0, 0, 0, 0])
+                row[0] += 1
+                row[1] += record["input_tokens"]
+                row[2] += record["output_tokens"]
+                row[3] += record["latency_ms"]
+    return totals
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, round(time.perf_counter() - start, 4)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls-per-day", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report: dict = {"days": args.days, "calls": args.days * args.calls_per_day}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        writer = _SegmentWriter(root)
+        for day in range(args.days):
+            writer.write(_day_of_calls(START + timedelta(days=day), args.calls_per_day, rng))
+        report["log_bytes"] = sum(p.stat().st_size for p in segment_paths(root))
+
+        scanned, report["full_rescan_s"] = _timed(_rescan, root)
+        rollups = UsageRollups(root, pricing=PRICING)
+        ingested, report["first_ingest_s"] = _timed(rollups.ingest)
+        assert ingested == report["calls"]
+        report["rollup_bytes"] = sum(
+            p.stat().st_size for p in root.glob(rollups.db_path.name + "*")
+        )
+
+        year, report["report_year_ms"] = _timed(rollups.report)
+        assert {(r["role"], r["model"]): r["calls"] for r in year} == {
+            key: row[0] for key, row in scanned.items()
+        }
+        mid = START + timedelta(days=args.days // 2, hours=7, minutes=30)
+        _, report["report_month_ms"] = _timed(rollups.report, mid, mid + timedelta(days=30))
+        _, report["report_day_ms"] = _timed(rollups.report, mid, mid + timedelta(days=1))
+        for key in ("report_year_ms", "report_month_ms", "report_day_ms"):
+            report[key] = round(report[key] * 1000, 3)
+
+        writer.write(_day_of_calls(START + timedelta(days=args.days), args.calls_per_day, rng))
+        ingested, report["incremental_ingest_one_day_s"] = _timed(rollups.ingest)
+        assert ingested == args.calls_per_day
+        _, report["noop_ingest_ms"] = _timed(rollups.ingest)
+        report["noop_ingest_ms"] = round(report["noop_ingest_ms"] * 1000, 3)
+
+        _, report["rebuild_s"] = _timed(rollups.rebuild)
+        mismatches, report["check_s"] = _timed(rollups.check)
+        report["check_mismatches"] = len(mismatches)
+        rollups.close()
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
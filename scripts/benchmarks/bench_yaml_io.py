@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+YAML parsing benchmark over the repo's own config/ and artifacts/ documents.
+
+Times three ways of loading every *.yaml / *.yml file under the given roots:
+
+    pure_python   yaml.load(..., Loader=yaml.SafeLoader)  (previous behaviour)
+    libyaml       runtime.util.yaml_io.safe_load           (CSafeLoader)
+    cached        runtime.util.yaml_io.load_yaml_file       (warm document cache)
+
+Files that fail to parse are skipped so every mode loads the same set.
+
+Usage:
+    python scripts/benchmarks/bench_yaml_io.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.util import yaml_io  # noqa: E402
+
+
+def _collect(roots: list[Path]) -> list[Path]:
+    files: list[Path] = []
+    for root in roots:
+        if root.is_dir():
+            files.extend(
+                p for p in root.rglob("*") if p.suffix in {".yaml", ".yml"} and p.is_file()
+            )
+    parseable = []
+    for path in sorted(files):
+        try:
+            yaml_io.safe_load(path.read_bytes())
+        except (yaml.YAMLError, OSError):
+            continue
+        parseable.append(path)
+    return parseable
+
+
+def _time(fn, files: list[Path], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for path in files:
+            fn(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--root", action="append", type=Path, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    roots = args.root or [REPO_ROOT / "config", REPO_ROOT / "artifacts"]
+    files = _collect(roots)
+    total_bytes = sum(p.stat().st_size for p in files)
+
+    results = {
+        "pure_python": _time(
+            lambda p: yaml.load(p.read_bytes(), Loader=yaml.SafeLoader), files, args.repeat
+        ),
+        "libyaml": _time(lambda p: yaml_io.safe_load(p.read_bytes()), files, args.repeat),
+    }
+    yaml_io.clear_yaml_cache()
+    for path in files:
+        yaml_io.load_yaml_file(path)
+    results["cached"] = _time(yaml_io.load_yaml_file, files, args.repeat)
+
+    report = {
+        "files": len(files),
+        "bytes": total_bytes,
+        "libyaml_available": yaml_io.HAS_LIBYAML,
+        "seconds": {k: round(v, 4) for k, v in results.items()},
+        "speedup_vs_pure_python": {
+            k: round(results["pure_python"] / v, 1) if v else None for k, v in results.items()
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,80 +3,224 @@
 Usage Report Generator for LifeOS Agent Calls.
 
 Reads logs from logs/agent_calls/ and generates a summary by role and model.
+When the directory holds a call log store (segments/, written by the
+persistent AgentCallLogger), call counts, tokens, latency totals and cost
+for the exact --since/--until range come from the store's index
+(index.sqlite3), and latency percentiles from hourly/daily rollups
+(runtime.agents.usage_rollups) that are first brought up to date with only
+the log bytes appended since the last run. Otherwise the per-call JSON
+files written by OpenCodeClient are scanned.
 
 Usage:
     python scripts/usage_report.py
+    python scripts/usage_report.py --since 2026-01-01 --until 2026-02-01
+    python scripts/usage_report.py --pricing pricing.yaml --check
+    python scripts/usage_report.py --rebuild
+
+--pricing takes a YAML file of USD per million tokens:
+    models:
+      claude-sonnet-4-5: {input_per_mtok: 3.0, output_per_mtok: 15.0}
 """
+import argparse
 import json
-import os
+import sys
 from collections import defaultdict
+from datetime import datetime, timezone
 from pathlib import Path
-
-
-def generate_report(logs_dir: str = "logs/agent_calls") -> None:
-    """Generate and print usage report from agent call logs."""
-    logs_path = Path(logs_dir)
-    if not logs_path.exists():
-        print(f"Logs directory not found: {logs_dir}")
-        return
-
-    # Aggregate data
-    by_role = defaultdict(lambda: {"calls": 0, "total_latency_ms": 0})
-    by_model = defaultdict(lambda: {"calls": 0, "total_latency_ms": 0})
-    by_role_model = defaultdict(lambda: {"calls": 0, "total_latency_ms": 0})
-
+from typing import Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.agents.call_log_store import CallLogStore  # noqa: E402
+from runtime.agents.logging import HASH_CHAIN_GENESIS, _record_hash  # noqa: E402
+from runtime.agents.usage_rollups import UsageRollups  # noqa: E402
+
+
+def _parse_time(value: str) -> datetime:
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _load_pricing(path: Optional[str]) -> dict:
+    if not path:
+        return {}
+    from runtime.util.yaml_io import load_yaml_file
+
+    return (load_yaml_file(path) or {}).get("models", {})
+
+
+def _indexed_usage(
+    logs_path: Path,
+    rollups: UsageRollups,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    rebuild: bool = False,
+) -> list[dict]:
+    """Index totals for the exact range, priced, with percentiles from the rollups."""
+    store = CallLogStore(logs_path, HASH_CHAIN_GENESIS, _record_hash)
+    try:
+        if rebuild:
+            store.rebuild_index()
+        rows = store.usage(since, until)
+    finally:
+        store.close()
+    percentiles = {(row["role"], row["model"]): row for row in rollups.report(since, until)}
+    for row in rows:
+        row["cost_usd"] = rollups.cost(row["model"], row["input_tokens"], row["output_tokens"])
+        rolled = percentiles.get((row["role"], row["model"]))
+        if rolled is not None:
+            row["latency_p50_ms"] = rolled["latency_p50_ms"]
+            row["latency_p95_ms"] = rolled["latency_p95_ms"]
+    return rows
+
+
+def _scanned_usage(
+    logs_path: Path, since: Optional[datetime], until: Optional[datetime]
+) -> list[dict]:
+    totals = defaultdict(lambda: {"calls": 0, "total_latency_ms": 0})
     for f in logs_path.glob("*.json"):
         try:
             with open(f) as fp:
                 entry = json.load(fp)
+            if since or until:
+                ts = _parse_time(entry["timestamp"])
+                if (since and ts < since) or (until and ts >= until):
+                    continue
             role = entry.get("role", "unknown")
             model = entry.get("response", {}).get("model_used", "unknown")
-            latency = entry.get("response", {}).get("latency_ms", 0)
-
-            by_role[role]["calls"] += 1
-            by_role[role]["total_latency_ms"] += latency
-
-            by_model[model]["calls"] += 1
-            by_model[model]["total_latency_ms"] += latency
-
-            key = f"{role} -> {model}"
-            by_role_model[key]["calls"] += 1
-            by_role_model[key]["total_latency_ms"] += latency
+            stats = totals[(role, model)]
+            stats["calls"] += 1
+            stats["total_latency_ms"] += entry.get("response", {}).get("latency_ms", 0)
         except Exception:
             pass
+    return [{"role": role, "model": model, **stats} for (role, model), stats in totals.items()]
+
+
+def generate_report(
+    logs_dir: str = "logs/agent_calls",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    pricing: Optional[dict] = None,
+    rebuild: bool = False,
+    check: bool = False,
+) -> int:
+    """Generate and print usage report from agent call logs; returns an exit code."""
+    logs_path = Path(logs_dir)
+    if not logs_path.exists():
+        print(f"Logs directory not found: {logs_dir}")
+        return 0
+
+    rolled = (logs_path / "segments").is_dir()
+    mismatches: list[str] = []
+    if rolled:
+        rollups = UsageRollups(logs_path, pricing=pricing)
+        try:
+            rollups.rebuild() if rebuild else rollups.ingest()
+            rows = _indexed_usage(logs_path, rollups, since, until, rebuild)
+            if check:
+                mismatches = rollups.check(since, until)
+        finally:
+            rollups.close()
+    else:
+        rows = _scanned_usage(logs_path, since, until)
+
+    # Aggregate data
+    fields = ("calls", "total_latency_ms", "input_tokens", "output_tokens", "cost_usd")
+    by_role = defaultdict(lambda: dict.fromkeys(fields, 0))
+    by_model = defaultdict(lambda: dict.fromkeys(fields, 0))
+
+    for row in rows:
+        for group, name in ((by_role, row["role"]), (by_model, row["model"])):
+            for field in fields:
+                group[name][field] += row.get(field, 0)
+    by_role_model = {f"{row['role']} -> {row['model']}": row for row in rows}
+
+    def header(label: str, width: int, percentiles: bool = False) -> None:
+        text = f"{label:<{width}} {'Calls':>8} {'Avg Latency':>12}"
+        if rolled:
+            text += f" {'Input Tok':>12} {'Output Tok':>12} {'Cost USD':>10}"
+            if percentiles:
+                text += f" {'p50':>9} {'p95':>9}"
+        print(text)
+        print("-" * len(text))
+
+    def line(label: str, width: int, stats: dict) -> None:
+        avg = stats["total_latency_ms"] / stats["calls"] if stats["calls"] else 0
+        text = f"{label:<{width}} {stats['calls']:>8} {avg:>10.0f}ms"
+        if rolled:
+            text += f" {stats['input_tokens']:>12} {stats['output_tokens']:>12}"
+            text += f" {stats['cost_usd']:>10.4f}"
+            if "latency_p95_ms" in stats:
+                text += f" {stats['latency_p50_ms']:>7.0f}ms {stats['latency_p95_ms']:>7.0f}ms"
+        print(text)
 
     # Print report
     print()
     print("=" * 70)
     print("LIFEOS USAGE REPORT")
     print("=" * 70)
+    if since or until:
+        bounds = [bound.isoformat() if bound else "-" for bound in (since, until)]
+        note = " (percentiles widened to whole hours)" if rolled else ""
+        print(f"Range: {bounds[0]} .. {bounds[1]}{note}")
 
     print("\n--- BY ROLE ---")
-    print(f"{'Role':<30} {'Calls':>8} {'Avg Latency':>12}")
-    print("-" * 52)
+    header("Role", 30)
     for role, stats in sorted(by_role.items()):
-        avg = stats["total_latency_ms"] / stats["calls"] if stats["calls"] else 0
-        print(f"{role:<30} {stats['calls']:>8} {avg:>10.0f}ms")
+        line(role, 30, stats)
 
     print("\n--- BY MODEL ---")
-    print(f"{'Model':<40} {'Calls':>8} {'Avg Latency':>12}")
-    print("-" * 62)
+    header("Model", 40)
     for model, stats in sorted(by_model.items()):
-        avg = stats["total_latency_ms"] / stats["calls"] if stats["calls"] else 0
-        print(f"{model:<40} {stats['calls']:>8} {avg:>10.0f}ms")
+        line(model, 40, stats)
 
     print("\n--- BY ROLE + MODEL ---")
-    print(f"{'Role -> Model':<50} {'Calls':>8} {'Avg Latency':>12}")
-    print("-" * 72)
+    header("Role -> Model", 50, percentiles=True)
     for combo, stats in sorted(by_role_model.items()):
-        avg = stats["total_latency_ms"] / stats["calls"] if stats["calls"] else 0
-        print(f"{combo:<50} {stats['calls']:>8} {avg:>10.0f}ms")
+        line(combo, 50, stats)
 
     total = sum(s["calls"] for s in by_model.values())
     print("-" * 72)
     print(f"Total calls: {total}")
     print()
 
+    if check:
+        if not rolled:
+            print("Check skipped: no call log store to compare rollups against")
+        elif mismatches:
+            print(f"Rollup check FAILED against a full rescan ({len(mismatches)} mismatches):")
+            for mismatch in mismatches:
+                print(f"  {mismatch}")
+            return 1
+        else:
+            print("Rollup check passed: matches a full rescan")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Summarise agent calls by role and model.")
+    parser.add_argument("--logs-dir", default="logs/agent_calls")
+    parser.add_argument("--since", type=_parse_time, help="include calls at or after (ISO 8601)")
+    parser.add_argument("--until", type=_parse_time, help="include calls before (ISO 8601)")
+    parser.add_argument("--pricing", help="YAML of USD per million tokens per model")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="rebuild the index and rollups from the logs"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="verify the rollups against a full rescan"
+    )
+    args = parser.parse_args()
+    return generate_report(
+        args.logs_dir,
+        args.since,
+        args.until,
+        pricing=_load_pricing(args.pricing),
+        rebuild=args.rebuild,
+        check=args.check,
+    )
+
 
 if __name__ == "__main__":
-    generate_report()
+    raise SystemExit(main())
@@ -87,9 +87,12 @@ def run_gate(repo_root: Path, branch: str | None = None) -> dict:
             scope="changed",
             fix=False,
             tool_names=policy["quality_tools"],
+            use_cache=True,
         )
     elif policy["run_general_quality_gate"]:
-        quality_result = run_quality_gates(repo_root, changed_files, scope="changed", fix=False)
+        quality_result = run_quality_gates(
+            repo_root, changed_files, scope="changed", fix=False, use_cache=True
+        )
     else:
         quality_result = {"passed": True, "summary": "Quality checks skipped.", "results": []}
 
@@ -41,6 +41,11 @@ def main() -> int:
             help="Explicit changed file path. Repeatable.",
         )
         sub.add_argument("--json", action="store_true", help="Emit JSON output.")
+        sub.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Re-lint every file instead of reusing cached passing verdicts.",
+        )
 
     args = parser.parse_args()
     repo_root = Path(args.repo_root).resolve()
@@ -54,6 +59,7 @@ def main() -> int:
             changed_files=args.changed_files,
             scope=args.scope,
             fix=args.command == "fix",
+            use_cache=not args.no_cache,
         )
 
     if getattr(args, "json", False):
@@ -36,6 +36,7 @@ _FORBIDDEN_FAMILIES = {"anthropic", "openai"}
 
 DEFAULT_CCP = REPO_ROOT / "artifacts" / "council_reviews" / "coo_dispatch_phase1.ccp.yaml"
 DEFAULT_ARCHIVE_ROOT = REPO_ROOT / "artifacts" / "council_reviews"
+DEFAULT_PROVIDER_HEALTH_CACHE = DEFAULT_ARCHIVE_ROOT / "provider_health_cache.json"
 DEFAULT_SEAT_TIMEOUT = 120
 DEFAULT_PREFLIGHT_TIMEOUT = 30
 
@@ -198,6 +199,11 @@ def main(argv: list[str] | None = None) -> int:
         default=DEFAULT_PREFLIGHT_TIMEOUT,
         help=f"Provider echo-check timeout in seconds (default: {DEFAULT_PREFLIGHT_TIMEOUT})",
     )
+    parser.add_argument(
+        "--no-provider-health-cache",
+        action="store_true",
+        help="Probe every provider even if a recent preflight result is cached",
+    )
     args = parser.parse_args(argv)
 
     policy_path = REPO_ROOT / "config" / "policy" / "council_policy.yaml"
@@ -257,6 +263,7 @@ def main(argv: list[str] | None = None) -> int:
     # -- Provider preflight (auth + echo check) --------------------------------
     _log_stage(run_log_path, "preflight", "started")
     from runtime.orchestration.council.provider_preflight import (
+        ProviderHealthCache,
         is_run_blocked,
         provider_health_to_dict,
         run_preflight,
@@ -271,6 +278,11 @@ def main(argv: list[str] | None = None) -> int:
         provider_models,
         timeout=float(args.preflight_timeout_seconds),
         skip_echo=args.dry_run,  # dry-run skips network echo probe (no LLM calls)
+        health_cache=(
+            None
+            if args.no_provider_health_cache
+            else ProviderHealthCache(DEFAULT_PROVIDER_HEALTH_CACHE)
+        ),
     )
 
     health_dict = provider_health_to_dict(health_results)